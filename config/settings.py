@@ -22,6 +22,52 @@ con las siguientes variables:
 - ORIGINS
 - SALT
 
+Opcionalmente puede ajustar el pool de conexiones a la base de datos con:
+
+- DB_POOL_SIZE: conexiones que se mantienen abiertas por worker (por defecto 5)
+- DB_MAX_OVERFLOW: conexiones adicionales permitidas en picos (por defecto 10)
+- DB_POOL_PRE_PING: verificar la conexión antes de usarla (por defecto true)
+- DB_POOL_RECYCLE: segundos tras los cuales se renueva una conexión (por defecto 1800)
+- DB_POOL_TIMEOUT: segundos de espera por una conexión libre (por defecto 30)
+- DB_STATEMENT_TIMEOUT: milisegundos máximos por consulta (por defecto 30000)
+
+Y el cache de autentificaciones por api_key con:
+
+- AUTH_CACHE_MAXSIZE: cantidad máxima de api_keys en el cache (por defecto 1024)
+- AUTH_CACHE_TTL: segundos que dura una autentificación en el cache (por defecto 60)
+
+Y el cache de los totales de los listados paginados con:
+
+- PAGINATION_COUNT_CACHE_MAXSIZE: cantidad máxima de totales en el cache (por defecto 1024)
+- PAGINATION_COUNT_CACHE_TTL: segundos que dura un total en el cache (por defecto 30)
+
+Y la recarga de los catálogos de autoridades, distritos, materias, oficinas y salas con:
+
+- CATALOG_CACHE_TTL: segundos que duran los catálogos en memoria (por defecto 300)
+
+Y el cache de las respuestas de los catálogos de sólo lectura con:
+
+- RESPONSE_CACHE_MAXSIZE: cantidad máxima de respuestas por catálogo, 0 lo desactiva (por defecto 256)
+
+Todos estos caches están en la memoria de cada worker, para compartirlos entre workers con Redis
+(el de respuestas con local dura a lo más CACHE_L1_TTL segundos, con redis o l1l2 al borrarlas dejan de verse en todos los workers):
+
+- CACHE_BACKEND: local, redis o l1l2 que usa la memoria unos segundos y luego Redis (por defecto local)
+- CACHE_L1_TTL: segundos máximos en la memoria con l1l2 y de las respuestas con local (por defecto 5)
+- REDIS_URL: servidor Redis (por defecto redis://localhost:6379/0)
+- REDIS_TIMEOUT: segundos de espera por Redis (por defecto 1.0)
+
+Cada respuesta lleva el encabezado Server-Timing con las consultas y los tiempos,
+para escribir además una línea JSON por petición en la salida estándar:
+
+- REQUEST_LOG: true para escribir la línea de cada petición (por defecto false)
+
+Y las consultas lentas se guardan con su plan para la ruta /v3/consultas_lentas con:
+
+- SLOW_QUERY_THRESHOLD: milisegundos desde los cuales una consulta es lenta, 0 lo desactiva (por defecto 1000)
+- SLOW_QUERY_EXPLAIN: off, plan con EXPLAIN o analyze con EXPLAIN ANALYZE (por defecto plan)
+- SLOW_QUERY_LOG_FILE: archivo que rota donde se escriben, vacío para sólo guardarlas en memoria (por defecto vacío)
+
 Para producción vaya a Google Secret Manager en
 https://console.cloud.google.com/security/secret-manager
 y cree como secretos las siguientes variable de entorno
@@ -43,54 +89,168 @@ Y en el archivo app.yaml agregue las siguientes variables de entorno
 
 - PROJECT_ID: justicia-digital-gob-mx
 - SERVICE_PREFIX: pjecz_plataforma_web_api_key
+
+Los secretos se consultan al llamar get_settings por primera vez, no al importar,
+todos al mismo tiempo con un solo cliente, y sólo los que no estén en las variables de entorno.
+
+Para que un reinicio no los vuelva a consultar, se pueden guardar cifrados en disco con:
+
+- SECRETS_CACHE_FILE: ruta del archivo, por ejemplo /tmp/secrets.bin (por defecto no se guardan)
+- SECRETS_CACHE_KEY: llave de Fernet, se crea con Fernet.generate_key()
+- SECRETS_CACHE_TTL: segundos que se usa el archivo antes de consultar otra vez (por defecto 3600)
+
+Las librerías de Google Cloud y de cifrado se importan hasta que se necesitan,
+en modo local no se cargan, ver tests/test_import_time.py
 """
+import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
+from typing import Literal, Optional
 
-from google.cloud import secretmanager
 from pydantic_settings import BaseSettings
 
 PROJECT_ID = os.getenv("PROJECT_ID", "")  # Por defecto esta vacio, esto significa estamos en modo local
 SERVICE_PREFIX = os.getenv("SERVICE_PREFIX", "pjecz_plataforma_web_api_key")
+SECRETS_CACHE_FILE = os.getenv("SECRETS_CACHE_FILE", "")  # Por defecto esta vacio, no se guardan en disco
+SECRETS_CACHE_KEY = os.getenv("SECRETS_CACHE_KEY", "")
+SECRETS_CACHE_TTL = int(os.getenv("SECRETS_CACHE_TTL", "3600"))
 
+SECRETS = (
+    "db_host",
+    "db_port",
+    "db_name",
+    "db_pass",
+    "db_user",
+    "gcp_bucket",
+    "gcp_bucket_edictos",
+    "gcp_bucket_glosas",
+    "gcp_bucket_listas_de_acuerdos",
+    "gcp_bucket_sentencias",
+    "origins",
+    "salt",
+)
 
-def get_secret(secret_id: str) -> str:
-    """Get secret from google cloud secret manager"""
 
-    # If not in google cloud, return environment variable
-    if PROJECT_ID == "":
-        return os.getenv(secret_id.upper(), "")
+class GoogleSecretProvider:
+    """Secretos de Google Cloud Secret Manager, con un solo cliente para todos"""
+
+    def __init__(self, project_id: str, prefix: str, client=None, max_workers: int = 12):
+        self.project_id = project_id
+        self.prefix = prefix
+        self.max_workers = max_workers
+        self._client = client
+
+    @property
+    def client(self):
+        """Crear el cliente la primera vez que se necesita"""
+        if self._client is None:
+            from google.cloud import secretmanager  # pylint: disable=import-outside-toplevel
+
+            self._client = secretmanager.SecretManagerServiceClient()
+        return self._client
+
+    def _access(self, client, secret_id: str) -> str:
+        """Consultar la última versión de un secreto con el cliente"""
+        name = client.secret_version_path(self.project_id, f"{self.prefix}_{secret_id}", "latest")
+        response = client.access_secret_version(name=name)
+        return response.payload.data.decode("UTF-8")
+
+    def get(self, secret_id: str) -> str:
+        """Consultar un secreto"""
+        return self._access(self.client, secret_id)
+
+    def get_many(self, secret_ids: list[str]) -> dict[str, str]:
+        """Consultar varios secretos al mismo tiempo"""
+        if not secret_ids:
+            return {}
+        client = self.client  # Se crea antes de repartir las consultas entre los hilos
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(secret_ids))) as executor:
+            valores = executor.map(lambda secret_id: self._access(client, secret_id), secret_ids)
+        return dict(zip(secret_ids, valores))
 
-    # Create the secret manager client
-    client = secretmanager.SecretManagerServiceClient()
 
-    # Build the resource name of the secret version
-    secret = f"{SERVICE_PREFIX}_{secret_id}"
-    name = client.secret_version_path(PROJECT_ID, secret, "latest")
+def read_secrets_cache(path: str, key: str, ttl: int) -> Optional[dict[str, str]]:
+    """Leer los secretos del archivo cifrado, None si no existe, no se puede descifrar o ya caducó"""
+    from cryptography.fernet import Fernet, InvalidToken  # pylint: disable=import-outside-toplevel
 
-    # Access the secret version
-    response = client.access_secret_version(name=name)
+    try:
+        with open(path, "rb") as archivo:
+            return json.loads(Fernet(key).decrypt(archivo.read(), ttl=ttl))
+    except (OSError, ValueError, InvalidToken):
+        return None
 
-    # Return the decoded payload
-    return response.payload.data.decode("UTF-8")
+
+def write_secrets_cache(path: str, key: str, secrets: dict[str, str]) -> None:
+    """Guardar los secretos en un archivo cifrado que sólo puede leer el usuario del proceso"""
+    from cryptography.fernet import Fernet  # pylint: disable=import-outside-toplevel
+
+    temporal = f"{path}.{os.getpid()}"
+    try:
+        descriptor = os.open(temporal, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(descriptor, "wb") as archivo:
+            archivo.write(Fernet(key).encrypt(json.dumps(secrets).encode("utf-8")))
+        os.replace(temporal, path)
+    except (OSError, ValueError):
+        if os.path.exists(temporal):
+            os.remove(temporal)
+
+
+def load_secrets(provider: GoogleSecretProvider, secret_ids: list[str]) -> dict[str, str]:
+    """Cargar los secretos del archivo cifrado si se configuró y está vigente, si no del proveedor"""
+    usar_cache = SECRETS_CACHE_FILE != "" and SECRETS_CACHE_KEY != ""
+    if usar_cache:
+        guardados = read_secrets_cache(SECRETS_CACHE_FILE, SECRETS_CACHE_KEY, SECRETS_CACHE_TTL)
+        if guardados is not None and all(secret_id in guardados for secret_id in secret_ids):
+            return {secret_id: guardados[secret_id] for secret_id in secret_ids}
+    secrets = provider.get_many(secret_ids)
+    if usar_cache:
+        write_secrets_cache(SECRETS_CACHE_FILE, SECRETS_CACHE_KEY, secrets)
+    return secrets
+
+
+@lru_cache()
+def get_secret_provider() -> GoogleSecretProvider:
+    """Proveedor de secretos del proceso"""
+    return GoogleSecretProvider(PROJECT_ID, SERVICE_PREFIX)
 
 
 class Settings(BaseSettings):
     """Settings"""
 
-    db_host: str = get_secret("db_host")
-    db_port: int = get_secret("db_port")
-    db_name: str = get_secret("db_name")
-    db_pass: str = get_secret("db_pass")
-    db_user: str = get_secret("db_user")
-    gcp_bucket: str = get_secret("gcp_bucket")
-    gcp_bucket_edictos: str = get_secret("gcp_bucket_edictos")
-    gcp_bucket_glosas: str = get_secret("gcp_bucket_glosas")
-    gcp_bucket_listas_de_acuerdos: str = get_secret("gcp_bucket_listas_de_acuerdos")
-    gcp_bucket_sentencias: str = get_secret("gcp_bucket_sentencias")
-    origins: str = get_secret("origins")
-    salt: str = get_secret("salt")
+    db_host: str = ""
+    db_port: int = 5432
+    db_name: str = ""
+    db_pass: str = ""
+    db_user: str = ""
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_pre_ping: bool = True
+    db_pool_recycle: int = 1800
+    db_pool_timeout: int = 30
+    db_statement_timeout: int = 30000
+    gcp_bucket: str = ""
+    gcp_bucket_edictos: str = ""
+    gcp_bucket_glosas: str = ""
+    gcp_bucket_listas_de_acuerdos: str = ""
+    gcp_bucket_sentencias: str = ""
+    origins: str = ""
+    salt: str = ""
     tz: str = "America/Mexico_City"
+    auth_cache_maxsize: int = 1024
+    auth_cache_ttl: int = 60
+    pagination_count_cache_maxsize: int = 1024
+    pagination_count_cache_ttl: int = 30
+    catalog_cache_ttl: int = 300
+    response_cache_maxsize: int = 256
+    cache_backend: Literal["local", "redis", "l1l2"] = "local"
+    cache_l1_ttl: int = 5
+    redis_url: str = "redis://localhost:6379/0"
+    redis_timeout: float = 1.0
+    request_log: bool = False
+    slow_query_threshold: int = 1000
+    slow_query_explain: Literal["off", "plan", "analyze"] = "plan"
+    slow_query_log_file: str = ""
 
     class Config:
         """Load configuration"""
@@ -103,5 +263,8 @@ class Settings(BaseSettings):
 
 @lru_cache()
 def get_settings() -> Settings:
-    """Get Settings"""
-    return Settings()
+    """Get Settings, en Google Cloud se consultan al mismo tiempo los secretos que no estén en las variables de entorno"""
+    if PROJECT_ID == "":
+        return Settings()
+    faltantes = [secret_id for secret_id in SECRETS if secret_id.upper() not in os.environ]
+    return Settings(**load_secrets(get_secret_provider(), faltantes))
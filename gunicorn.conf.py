@@ -0,0 +1,26 @@
+"""
+Gunicorn
+
+Ganchos para las métricas de Prometheus con varios workers, ver lib/fastapi_metrics.py
+
+- Al arrancar se vacía el directorio PROMETHEUS_MULTIPROC_DIR, para no sumar los valores de una ejecución anterior
+- Al terminar un worker se marca como muerto, para quitar sus valores de los gauges
+"""
+import os
+import shutil
+
+
+def on_starting(server):
+    """Vaciar el directorio de las métricas antes de crear los workers"""
+    directorio = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if directorio:
+        shutil.rmtree(directorio, ignore_errors=True)
+        os.makedirs(directorio, exist_ok=True)
+
+
+def child_exit(server, worker):
+    """Marcar como muerto al worker que termina"""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess  # pylint: disable=import-outside-toplevel
+
+        multiprocess.mark_process_dead(worker.pid)
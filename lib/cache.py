@@ -0,0 +1,261 @@
+"""
+Caches con caducidad (TTL)
+
+Hay tres formas de guardar, todas con los mismos métodos get, set, delete y clear:
+
+- TTLCache: en la memoria del proceso, LRU con tamaño máximo, cada worker tiene el suyo
+- RedisCache: en un servidor Redis (o compatible) compartido por todos los workers
+- TwoLevelCache: primero en la memoria del proceso y si no está en el compartido
+
+Con get_cache se crea el que indique CACHE_BACKEND (local, redis o l1l2),
+así los caches de autentificaciones, totales y catálogos usan el mismo.
+El de respuestas se crea con compartido, usa sólo Redis y con local dura a lo más CACHE_L1_TTL segundos.
+
+Usage:
+
+    from lib.cache import get_cache
+
+    cache = get_cache("ejemplos", maxsize=1024, ttl=60)
+    cache.set("llave", valor)
+    cache.set("otra", valor, ttl=10)  # Caducidad menor para esta entrada
+    valor = cache.get("llave")  # None si no existe o ya caducó
+    cache.delete("llave")
+    cache.clear()
+
+Los valores se guardan en Redis con pickle, sólo debe usarse un servidor Redis propio.
+Un valor que no se puede leer, por ejemplo de una versión anterior de un esquema, cuenta como fallo y se borra.
+Si el servidor Redis no responde, get entrega None y set no guarda, así la API sigue funcionando.
+
+Cada get de un cache con nombre cuenta un acierto o un fallo en las métricas de lib/fastapi_metrics.py,
+con TwoLevelCache se cuenta una sola vez aunque busque en los dos.
+
+"""
+import hashlib
+import logging
+import pickle
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Optional
+
+import redis
+
+from config.settings import get_settings
+
+from .fastapi_metrics import record_cache_get
+
+CACHE_PREFIX = "pjecz_plataforma_web_api_key"
+
+logger = logging.getLogger(__name__)
+
+
+class BaseCache(ABC):
+    """Base de los caches, get cuenta los aciertos y fallos de los que tienen nombre"""
+
+    nombre = ""
+
+    @abstractmethod
+    def _get(self, key: str) -> Optional[Any]:
+        """Entregar el valor o None, sin contarlo en las métricas"""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Guardar un valor, si se da ttl se usa el menor entre éste y el del cache"""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Eliminar una entrada"""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Eliminar todas las entradas"""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Cantidad de entradas"""
+
+    def get(self, key: str) -> Optional[Any]:
+        """Entregar el valor o None si no existe o ya caducó"""
+        valor = self._get(key)
+        if self.nombre:
+            record_cache_get(self.nombre, valor is not None)
+        return valor
+
+    def exists(self, key: str) -> bool:
+        """Revisar si existe sin contarlo en las métricas"""
+        return self._get(key) is not None
+
+
+class TTLCache(BaseCache):
+    """Cache LRU en memoria donde cada entrada caduca tras ttl segundos"""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60, nombre: str = ""):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.nombre = nombre
+        self._datos = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entrada = self._datos.get(key)
+            if entrada is None:
+                return None
+            valor, caduca = entrada
+            if caduca <= time.monotonic():
+                del self._datos[key]
+                return None
+            self._datos.move_to_end(key)
+            return valor
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Guardar un valor, si se da ttl se usa el menor entre éste y el del cache"""
+        if ttl is None or ttl > self.ttl:
+            ttl = self.ttl
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+        with self._lock:
+            self._datos[key] = (value, time.monotonic() + ttl)
+            self._datos.move_to_end(key)
+            while len(self._datos) > self.maxsize:
+                self._datos.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Eliminar una entrada"""
+        with self._lock:
+            self._datos.pop(key, None)
+
+    def clear(self) -> None:
+        """Eliminar todas las entradas"""
+        with self._lock:
+            self._datos.clear()
+
+    def __len__(self) -> int:
+        return len(self._datos)
+
+
+class RedisCache(BaseCache):
+    """Cache compartido en un servidor Redis, las llaves llevan el prefijo del nombre"""
+
+    def __init__(self, client: redis.Redis, nombre: str, ttl: float = 60):
+        self.client = client
+        self.nombre = nombre
+        self.prefijo = f"{CACHE_PREFIX}:{nombre}:"
+        self.ttl = ttl
+
+    def _llave(self, key: str) -> str:
+        """Llave en Redis, se resume para que no sean muy largas"""
+        return self.prefijo + hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _get(self, key: str) -> Optional[Any]:
+        """Entregar el valor o None si no existe, ya caducó, no se puede leer o Redis no responde"""
+        try:
+            guardado = self.client.get(self._llave(key))
+        except redis.RedisError as error:
+            logger.warning("Cache %s no disponible: %s", self.prefijo, error)
+            return None
+        if guardado is None:
+            return None
+        try:
+            return pickle.loads(guardado)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            logger.warning("Cache %s con un valor que no se puede leer: %s", self.prefijo, error)
+            self.delete(key)
+            return None
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Guardar un valor, si se da ttl se usa el menor entre éste y el del cache"""
+        if ttl is None or ttl > self.ttl:
+            ttl = self.ttl
+        if ttl <= 0:
+            return
+        try:
+            self.client.set(self._llave(key), pickle.dumps(value), px=int(ttl * 1000))
+        except redis.RedisError as error:
+            logger.warning("Cache %s no disponible: %s", self.prefijo, error)
+
+    def delete(self, key: str) -> None:
+        """Eliminar una entrada"""
+        try:
+            self.client.delete(self._llave(key))
+        except redis.RedisError as error:
+            logger.warning("Cache %s no disponible: %s", self.prefijo, error)
+
+    def clear(self) -> None:
+        """Eliminar todas las entradas con el prefijo"""
+        try:
+            llaves = list(self.client.scan_iter(match=f"{self.prefijo}*", count=1000))
+            for inicio in range(0, len(llaves), 1000):
+                self.client.unlink(*llaves[inicio : inicio + 1000])
+        except redis.RedisError as error:
+            logger.warning("Cache %s no disponible: %s", self.prefijo, error)
+
+    def __len__(self) -> int:
+        try:
+            return sum(1 for _ in self.client.scan_iter(match=f"{self.prefijo}*", count=1000))
+        except redis.RedisError:
+            return 0
+
+
+class TwoLevelCache(BaseCache):
+    """Cache local (L1) de pocos segundos frente a un cache compartido (L2)"""
+
+    def __init__(self, local: TTLCache, compartido: RedisCache):
+        self.local = local
+        self.compartido = compartido
+        self.nombre = compartido.nombre
+
+    def _get(self, key: str) -> Optional[Any]:
+        """Buscar en el local y luego en el compartido, lo que se encuentra en el compartido se guarda en el local"""
+        valor = self.local._get(key)  # pylint: disable=protected-access
+        if valor is None:
+            valor = self.compartido._get(key)  # pylint: disable=protected-access
+            if valor is not None:
+                self.local.set(key, valor)
+        return valor
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Guardar en los dos"""
+        self.local.set(key, value, ttl)
+        self.compartido.set(key, value, ttl)
+
+    def delete(self, key: str) -> None:
+        """Eliminar de los dos, los locales de los otros workers caducan en CACHE_L1_TTL segundos"""
+        self.local.delete(key)
+        self.compartido.delete(key)
+
+    def clear(self) -> None:
+        """Eliminar todo de los dos, los locales de los otros workers caducan en CACHE_L1_TTL segundos"""
+        self.local.clear()
+        self.compartido.clear()
+
+    def __len__(self) -> int:
+        return len(self.compartido)
+
+
+@lru_cache()
+def get_redis_client() -> redis.Redis:
+    """Cliente de Redis del proceso, con su pool de conexiones"""
+    settings = get_settings()
+    return redis.Redis.from_url(settings.redis_url, socket_timeout=settings.redis_timeout, socket_connect_timeout=settings.redis_timeout)
+
+
+def get_cache(nombre: str, maxsize: int = 1024, ttl: float = 60, compartido: bool = False) -> TTLCache | RedisCache | TwoLevelCache:
+    """Crear el cache según CACHE_BACKEND: local, redis o l1l2, con maxsize 0 no guarda nada
+
+    Con compartido sólo se guarda en Redis, para lo que al borrarse debe dejar de verse en todos los workers,
+    y con CACHE_BACKEND local se guarda en el worker a lo más CACHE_L1_TTL segundos, lo que tardan los otros en verlo.
+    """
+    settings = get_settings()
+    if maxsize <= 0:
+        return TTLCache(maxsize=0, ttl=ttl, nombre=nombre)
+    if compartido and settings.cache_backend == "local":
+        return TTLCache(maxsize=maxsize, ttl=min(ttl, settings.cache_l1_ttl), nombre=nombre)
+    if settings.cache_backend == "redis" or compartido:
+        return RedisCache(get_redis_client(), nombre, ttl=ttl)
+    if settings.cache_backend == "l1l2":
+        local = TTLCache(maxsize=maxsize, ttl=min(ttl, settings.cache_l1_ttl))
+        return TwoLevelCache(local, RedisCache(get_redis_client(), nombre, ttl=ttl))
+    return TTLCache(maxsize=maxsize, ttl=ttl, nombre=nombre)
@@ -1,38 +1,242 @@
 """
 Database
+
+Se usa un solo engine por proceso (por cada worker de gunicorn) con su pool de conexiones,
+se crea la primera vez que se necesita y se libera al apagar la aplicación.
+
+Además del engine con psycopg2 hay uno asíncrono con asyncpg para las rutas que usan get_async_db,
+así las esperas de la base de datos ceden el event loop en lugar de bloquearlo.
+
+Los dos engines miden las consultas y la espera por una conexión de cada petición,
+ver lib/fastapi_server_timing.py, y guardan las que tardan más de SLOW_QUERY_THRESHOLD
+milisegundos, ver lib/slow_query_log.py
 """
-from typing import Annotated
+import time
+from functools import lru_cache, wraps
+from typing import Any, Callable
 
-from fastapi import Depends
-from sqlalchemy import Engine, create_engine
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.exc import DataError, IntegrityError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from config.settings import get_settings
 
-from config.settings import Settings, get_settings
+from .exceptions import MyNotValidParamError
+from .fastapi_server_timing import add_pool_wait, listen_sql_timing
+from .slow_query_log import listen_slow_queries
 
 Base = declarative_base()
 
+# Contadores del pool, se acumulan durante la vida del proceso
+pool_counters = {
+    "connects": 0,
+    "checkouts": 0,
+    "checkins": 0,
+    "invalidations": 0,
+}
+
+
+def _on_connect(dbapi_connection, connection_record):
+    """Contar las conexiones nuevas hacia la base de datos"""
+    pool_counters["connects"] += 1
+
+
+def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+    """Contar las conexiones que se toman del pool"""
+    pool_counters["checkouts"] += 1
+
+
+def _on_checkin(dbapi_connection, connection_record):
+    """Contar las conexiones que regresan al pool"""
+    pool_counters["checkins"] += 1
+
+
+def _on_invalidate(dbapi_connection, connection_record, exception):
+    """Contar las conexiones invalidadas"""
+    pool_counters["invalidations"] += 1
+
 
-def get_engine(settings: Annotated[Settings, Depends(get_settings)]) -> Engine:
-    """Database engine"""
+def _listen_pool_counters(engine: Engine) -> None:
+    """Agregar los eventos del pool para los contadores"""
+    event.listen(engine, "connect", _on_connect)
+    event.listen(engine, "checkout", _on_checkout)
+    event.listen(engine, "checkin", _on_checkin)
+    event.listen(engine, "invalidate", _on_invalidate)
+
+
+class TimedPoolMixin:
+    """Medir la espera por una conexión del pool, incluye crearla cuando hace falta"""
+
+    def _do_get(self):
+        inicio = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            add_pool_wait(time.perf_counter() - inicio)
+
+
+class TimedQueuePool(TimedPoolMixin, QueuePool):
+    """QueuePool que mide la espera por una conexión"""
+
+
+class TimedAsyncAdaptedQueuePool(TimedPoolMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool que mide la espera por una conexión"""
+
+
+@lru_cache()
+def get_engine() -> Engine:
+    """Database engine, uno por proceso"""
+    settings = get_settings()
 
     # Create engine
-    engine = create_engine(f"postgresql+psycopg2://{settings.db_user}:{settings.db_pass}@{settings.db_host}:{settings.db_port}/{settings.db_name}")
+    engine = create_engine(
+        f"postgresql+psycopg2://{settings.db_user}:{settings.db_pass}@{settings.db_host}:{settings.db_port}/{settings.db_name}",
+        poolclass=TimedQueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        pool_recycle=settings.db_pool_recycle,
+        pool_timeout=settings.db_pool_timeout,
+        connect_args={"options": f"-c statement_timeout={settings.db_statement_timeout}"},
+    )
+
+    # Eventos del pool para los contadores y de las consultas para los tiempos de cada petición
+    _listen_pool_counters(engine)
+    listen_sql_timing(engine)
+    if settings.slow_query_threshold > 0:
+        listen_slow_queries(engine, settings.slow_query_threshold / 1000, settings.slow_query_explain)
 
     return engine
 
 
-async def get_db(settings: Annotated[Settings, Depends(get_settings)]) -> Session:
-    """Database session"""
+@lru_cache()
+def get_async_engine() -> AsyncEngine:
+    """Database engine asíncrono con asyncpg, uno por proceso"""
+    settings = get_settings()
 
     # Create engine
-    engine = get_engine(settings)
+    engine = create_async_engine(
+        f"postgresql+asyncpg://{settings.db_user}:{settings.db_pass}@{settings.db_host}:{settings.db_port}/{settings.db_name}",
+        poolclass=TimedAsyncAdaptedQueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        pool_recycle=settings.db_pool_recycle,
+        pool_timeout=settings.db_pool_timeout,
+        connect_args={"server_settings": {"statement_timeout": str(settings.db_statement_timeout)}},
+    )
+
+    # Eventos del pool para los contadores y de las consultas para los tiempos de cada petición
+    _listen_pool_counters(engine.sync_engine)
+    listen_sql_timing(engine.sync_engine)
+    if settings.slow_query_threshold > 0:
+        listen_slow_queries(engine.sync_engine, settings.slow_query_threshold / 1000, settings.slow_query_explain)
+
+    return engine
+
+
+@lru_cache()
+def get_session_local() -> sessionmaker:
+    """Fabrica de sesiones ligada al engine del proceso"""
+    return sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
+
+
+@lru_cache()
+def get_async_session_local() -> async_sessionmaker:
+    """Fabrica de sesiones asíncronas ligada al engine asíncrono del proceso"""
+    return async_sessionmaker(autoflush=False, expire_on_commit=False, bind=get_async_engine())
+
+
+def dispose_engine() -> None:
+    """Cerrar las conexiones del pool y olvidar el engine"""
+    if get_engine.cache_info().currsize > 0:
+        get_engine().dispose()
+    get_session_local.cache_clear()
+    get_engine.cache_clear()
+
+
+async def dispose_async_engine() -> None:
+    """Cerrar las conexiones del pool asíncrono y olvidar el engine"""
+    if get_async_engine.cache_info().currsize > 0:
+        await get_async_engine().dispose()
+    get_async_session_local.cache_clear()
+    get_async_engine.cache_clear()
+
+
+def get_pool_status() -> dict:
+    """Entregar el estado de los pools y sus contadores"""
+    estado = dict(pool_counters)
+    if get_engine.cache_info().currsize > 0:
+        pool = get_engine().pool
+        estado["size"] = pool.size()
+        estado["checked_in"] = pool.checkedin()
+        estado["checked_out"] = pool.checkedout()
+        estado["overflow"] = pool.overflow()
+    if get_async_engine.cache_info().currsize > 0:
+        async_pool = get_async_engine().pool
+        estado["async_size"] = async_pool.size()
+        estado["async_checked_in"] = async_pool.checkedin()
+        estado["async_checked_out"] = async_pool.checkedout()
+        estado["async_overflow"] = async_pool.overflow()
+    return estado
+
+
+async def get_db() -> Session:
+    """Database session"""
 
     # Create session
-    session_local = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    session_local = get_session_local()
 
     try:
         db = session_local()
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncSession:
+    """Database session asíncrona"""
+    async with get_async_session_local()() as db:
+        yield db
+
+
+def async_variant(funcion: Callable) -> Callable:
+    """Variante async de una función del crud que recibe la sesión como primer argumento
+
+    La función se ejecuta con la sesión síncrona de la AsyncSession dentro de un greenlet,
+    cada consulta espera a asyncpg sin bloquear el event loop.
+    """
+
+    @wraps(funcion)
+    async def variante(db: AsyncSession, *args, **kwargs) -> Any:
+        return await db.run_sync(funcion, *args, **kwargs)
+
+    return variante
+
+
+def insert_all(db: Session, registros: list) -> list[int | MyNotValidParamError]:
+    """Insertar los registros con un solo flush, entrega el id de cada uno o el error que tuvo
+
+    Se insertan en un savepoint, si la base de datos rechaza alguno se deshace y se inserta
+    cada uno en su propio savepoint, así los demás se guardan y el rechazado entrega su error.
+    """
+    try:
+        with db.begin_nested():
+            db.add_all(registros)
+        return [registro.id for registro in registros]
+    except (DataError, IntegrityError):
+        pass
+    resultados = []
+    for registro in registros:
+        try:
+            with db.begin_nested():
+                db.add(registro)
+            resultados.append(registro.id)
+        except IntegrityError:
+            resultados.append(MyNotValidParamError("No se pudo guardar porque no cumple una restricción de la base de datos"))
+        except DataError:
+            resultados.append(MyNotValidParamError("No se pudo guardar porque un valor no es válido para la base de datos"))
+    return resultados
@@ -0,0 +1,143 @@
+"""
+FastAPI Conditional
+
+Provides ETag and Last-Modified validators and answers If-None-Match and If-Modified-Since with 304 Not Modified.
+
+The ETag is a hash of the serialized body, so it changes with any field of the output,
+including those that come from related rows like autoridad_descripcion or distrito_nombre.
+The body is built to get it, a 304 saves the transfer and the work of the client, not the queries.
+
+Last-Modified is the latest modificado (from UniversalMixin) of the record and of the related rows
+loaded to serialize it. The records of the catalogs are not mapped and only have the ETag.
+
+Example of the headers of a detail:
+
+    ETag: W/"3f2a9c1b7d04e6a5"
+    Last-Modified: Tue, 18 Jul 2023 17:02:44 GMT
+    Cache-Control: private, no-cache
+
+Usage:
+
+    from fastapi import Request
+
+    from lib.fastapi_conditional import detail_response
+
+    @examples.get("/{example_id}", response_model=OneExampleOut)
+    async def detail_example(
+        request: Request,
+        db: Annotated[Session, Depends(get_db)],
+        example_id: int,
+    ):
+        example = get_example(db, example_id)
+        return detail_response(request, example, OneExampleOut)
+
+The pages of the listings get the ETag of their body in paginate, see lib/fastapi_pagination_custom_paginate.py
+
+"""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Optional, Type
+
+import pytz
+from fastapi import Request, Response, status
+from pydantic import BaseModel
+from sqlalchemy import inspect
+from sqlalchemy.exc import NoInspectionAvailable
+
+from config.settings import get_settings
+
+from .fastapi_orjson_response import CustomORJSONResponse
+from .fastapi_server_timing import measure_serialization
+
+CACHE_CONTROL = "private, no-cache"
+RELATED_DEPTH = 3
+
+
+def body_etag(body: bytes) -> str:
+    """Weak ETag of the serialized body"""
+    return f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def latest_modificado(item: Any) -> Optional[datetime]:
+    """Latest modificado of a mapped instance and its loaded related rows, None if it is not mapped or has not modificado"""
+    try:
+        inspect(item)
+    except NoInspectionAvailable:
+        return None
+    if getattr(item, "modificado", None) is None:
+        return None
+    modificados = []
+    vistos = set()
+    pendientes = [(item, 0)]
+    while pendientes:
+        registro, profundidad = pendientes.pop()
+        if id(registro) in vistos:
+            continue
+        vistos.add(id(registro))
+        estado = inspect(registro)
+        if getattr(registro, "modificado", None) is not None:
+            modificados.append(registro.modificado)
+        if profundidad >= RELATED_DEPTH:
+            continue
+        for relacion in estado.mapper.relationships:
+            if relacion.key in estado.unloaded:
+                continue  # Not used by the output, do not load it
+            valor = estado.dict.get(relacion.key)
+            for relacionado in valor if isinstance(valor, (list, set, tuple)) else [valor]:
+                if relacionado is not None:
+                    pendientes.append((relacionado, profundidad + 1))
+    return max(modificados)
+
+
+def http_date(modificado: datetime) -> str:
+    """HTTP date of modificado, the naive datetimes are in the time zone of the server"""
+    if modificado.tzinfo is None:
+        modificado = pytz.timezone(get_settings().tz).localize(modificado)
+    return format_datetime(modificado.astimezone(timezone.utc), usegmt=True)
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[str] = None) -> bool:
+    """Check If-None-Match, or If-Modified-Since when there is not If-None-Match"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        etags = [valor.strip().removeprefix("W/") for valor in if_none_match.split(",")]
+        return "*" in etags or etag.removeprefix("W/") in etags
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is not None and last_modified is not None:
+        try:
+            return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def validator_headers(etag: str, last_modified: Optional[str] = None) -> dict:
+    """Headers with the validators"""
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if last_modified is not None:
+        headers["Last-Modified"] = last_modified
+    return headers
+
+
+def not_modified_response(etag: str, last_modified: Optional[str] = None) -> Response:
+    """Empty 304 Not Modified response with the validators"""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=validator_headers(etag, last_modified))
+
+
+def conditional_response(request: Request, response: Response, last_modified: Optional[str] = None) -> Response:
+    """Add the validators to a rendered response, or answer 304 if the client already has it"""
+    etag = body_etag(response.body)
+    if is_not_modified(request, etag, last_modified):
+        return not_modified_response(etag, last_modified)
+    response.headers.update(validator_headers(etag, last_modified))
+    return response
+
+
+def detail_response(request: Request, item: Any, schema: Type[BaseModel]) -> Response:
+    """Response of a detail with ETag and Last-Modified, or 304 if the client already has it"""
+    with measure_serialization():
+        contenido = schema.model_validate(item)
+    response = CustomORJSONResponse(contenido)
+    modificado = latest_modificado(item)
+    return conditional_response(request, response, None if modificado is None else http_date(modificado))
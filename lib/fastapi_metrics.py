@@ -0,0 +1,141 @@
+"""
+FastAPI Metrics
+
+Prometheus metrics of the API, exposed in /metrics
+
+- http_request_duration_seconds: histogram of the latency by router, method and status
+- http_requests_in_progress: requests being served
+- db_pool_size, db_pool_checked_out, db_pool_overflow: connections of the pools by engine
+- cache_requests_total: hits and misses by cache
+- auth_failures_total: failed authentications by reason
+
+With gunicorn every worker is a process with its own values, so set PROMETHEUS_MULTIPROC_DIR
+to an empty directory before starting it. Each worker writes its values there and /metrics
+adds them up, whichever worker answers. The gunicorn.conf.py hooks empty the directory
+on start and mark the dead workers, so their gauges are dropped.
+
+The gauges of the pools are updated by each worker at the end of each request.
+
+Usage:
+
+    from lib.fastapi_metrics import MetricsMiddleware, metrics_response
+
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/metrics")
+    async def metrics():
+        return metrics_response()
+
+"""
+import os
+import time
+
+from fastapi import Response
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, generate_latest, multiprocess
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .database import get_async_engine, get_engine
+from .fastapi_server_timing import router_name
+
+MULTIPROC_DIR_VARIABLE = "PROMETHEUS_MULTIPROC_DIR"
+
+request_duration = Histogram(
+    "http_request_duration_seconds",
+    "Latency of the HTTP requests",
+    ["router", "method", "status"],
+)
+requests_in_progress = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests being served",
+    multiprocess_mode="livesum",
+)
+pool_size = Gauge(
+    "db_pool_size",
+    "Connections kept open by the pools",
+    ["engine"],
+    multiprocess_mode="livesum",
+)
+pool_checked_out = Gauge(
+    "db_pool_checked_out",
+    "Connections of the pools in use",
+    ["engine"],
+    multiprocess_mode="livesum",
+)
+pool_overflow = Gauge(
+    "db_pool_overflow",
+    "Connections opened beyond the size of the pools",
+    ["engine"],
+    multiprocess_mode="livesum",
+)
+cache_requests = Counter(
+    "cache_requests",
+    "Lookups in the caches",
+    ["cache", "result"],
+)
+auth_failures = Counter(
+    "auth_failures",
+    "Failed authentications",
+    ["reason"],
+)
+
+
+def record_cache_get(cache: str, encontrado: bool) -> None:
+    """Count a hit or a miss of a cache"""
+    cache_requests.labels(cache, "hit" if encontrado else "miss").inc()
+
+
+def record_auth_failure(motivo: str) -> None:
+    """Count a failed authentication"""
+    auth_failures.labels(motivo).inc()
+
+
+def update_pool_gauges() -> None:
+    """Set the gauges of the pools of this worker, only the engines already created"""
+    engines = []
+    if get_engine.cache_info().currsize > 0:
+        engines.append(("sync", get_engine().pool))
+    if get_async_engine.cache_info().currsize > 0:
+        engines.append(("async", get_async_engine().pool))
+    for nombre, pool in engines:
+        pool_size.labels(nombre).set(pool.size())
+        pool_checked_out.labels(nombre).set(pool.checkedout())
+        pool_overflow.labels(nombre).set(max(pool.overflow(), 0))
+
+
+def metrics_response() -> Response:
+    """Response with the metrics, of all the workers if PROMETHEUS_MULTIPROC_DIR is set"""
+    if os.environ.get(MULTIPROC_DIR_VARIABLE):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
+
+
+class MetricsMiddleware:
+    """Measure the latency of each HTTP request and the requests in progress"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        inicio = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        requests_in_progress.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            requests_in_progress.dec()
+            router = router_name(scope) or "unmatched"
+            request_duration.labels(router, scope["method"], str(status_code)).observe(time.perf_counter() - inicio)
+            update_pool_gauges()
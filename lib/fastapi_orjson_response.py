@@ -0,0 +1,37 @@
+"""
+FastAPI ORJSON Response
+
+Provides the default response class of the application, it encodes with orjson instead of the stdlib json.
+
+When the content is a Pydantic model, like the CustomPage from paginate, it is encoded by pydantic-core
+directly to JSON bytes, without the second validation and the jsonable_encoder of FastAPI.
+The JSON is the same as the one from the response_model.
+
+Usage:
+
+    from lib.fastapi_orjson_response import CustomORJSONResponse
+
+    app = FastAPI(default_response_class=CustomORJSONResponse)
+
+"""
+from typing import Any
+
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+from .fastapi_server_timing import measure_serialization
+
+
+class CustomORJSONResponse(ORJSONResponse):
+    """
+    Custom ORJSON Response
+    """
+
+    def render(self, content: Any) -> bytes:
+        """
+        Encode the Pydantic models with pydantic-core and everything else with orjson
+        """
+        with measure_serialization():
+            if isinstance(content, BaseModel):
+                return content.__pydantic_serializer__.to_json(content, by_alias=True)
+            return super().render(content)
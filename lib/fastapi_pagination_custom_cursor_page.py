@@ -0,0 +1,161 @@
+"""
+FastAPI Pagination Custom Cursor Page
+
+Provides a keyset (cursor) pagination class to be used with FastAPI 0.100.0, Pydantic 2.0.2, SQLAlchemy and sqlakeyset.
+
+Instead of OFFSET, each page continues from the ordering key of the last item of the previous one,
+so walking a large table end to end costs the same on the last page as on the first.
+The query must end its order in a unique key, paginate adds the primary key when it does not.
+
+Example of the output JSON:
+
+    {
+      "success": true,
+      "message": "Success",
+      "items": [
+        { ... },
+        { ... },
+        ...
+      ],
+      "limit": 10,
+      "next_cursor": "Pmk6MTIzNA%3D%3D"
+    }
+
+Send next_cursor as the cursor parameter to get the next page, when it is null there are no more pages.
+
+Usage:
+
+    from typing import Annotated
+
+    from fastapi import APIRouter, Depends
+    from fastapi_pagination.ext.sqlalchemy import paginate
+
+    from lib.fastapi_pagination_custom_cursor_page import CustomCursorPage
+
+    from .crud import get_examples
+    from .schemas import ExampleOut
+
+    examples = APIRouter(prefix="/examples")
+
+    @examples.get("/cursor", response_model=CustomCursorPage[ExampleOut])
+    async def list_examples(
+        db: Annotated[Session, Depends(get_db)],
+    ):
+        query = get_examples(db=db)
+        return paginate(query)
+
+Or call add_cursor_pagination(app) before add_pagination(app) to get a /cursor twin of every CustomPage listing.
+
+"""
+from typing import Any, Generic, Optional, Sequence, TypeVar
+
+from fastapi import FastAPI, HTTPException, Query, status
+from fastapi.routing import APIRoute
+from fastapi.utils import lenient_issubclass
+from fastapi_pagination.bases import AbstractPage, AbstractParams, CursorRawParams
+from fastapi_pagination.cursor import decode_cursor, encode_cursor
+from fastapi_pagination.types import Cursor, GreaterEqualOne
+from pydantic import BaseModel
+from sqlakeyset import BadBookmark, unserialize_bookmark
+from typing_extensions import Self
+
+from lib.fastapi_pagination_custom_page import LIMIT_DEFAULT, LIMIT_MAX, CustomPage, validate_items
+
+
+class CustomCursorParams(BaseModel, AbstractParams):
+    """
+    Custom Cursor Params
+    """
+
+    cursor: Optional[str] = Query(None, description="Cursor for the next page")
+    limit: int = Query(LIMIT_DEFAULT, ge=1, le=LIMIT_MAX, description="Page size limit")
+
+    def to_raw_params(self) -> CursorRawParams:
+        """
+        Decode and validate the cursor
+        """
+        try:
+            cursor = decode_cursor(self.cursor, to_str=True)
+            if cursor is not None:
+                unserialize_bookmark(cursor)
+        except (BadBookmark, ValueError) as error:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="El cursor no es válido") from error
+        return CursorRawParams(cursor=cursor, size=self.limit)
+
+
+T = TypeVar("T")
+
+
+class CustomCursorPage(AbstractPage[T], Generic[T]):
+    """
+    Custom Cursor Page
+    """
+
+    success: bool
+    message: str
+
+    items: Sequence[T] = []
+    limit: Optional[GreaterEqualOne] = None
+    next_cursor: Optional[str] = None
+
+    __params_type__ = CustomCursorParams
+
+    @classmethod
+    def create(
+        cls,
+        items: Sequence[T],
+        params: AbstractParams,
+        *,
+        next_: Optional[Cursor] = None,
+        **kwargs: Any,
+    ) -> Self:
+        """
+        Create Custom Cursor Page
+        """
+        raw_params = params.to_raw_params().as_cursor()
+
+        if len(items) == 0:
+            return cls(
+                success=True,
+                message="No se encontraron registros",
+            )
+
+        return cls.model_construct(
+            success=True,
+            message="Success",
+            items=validate_items(cls, items),
+            limit=raw_params.size,
+            next_cursor=encode_cursor(next_),
+        )
+
+
+def add_cursor_pagination(app: FastAPI) -> FastAPI:
+    """
+    Add a GET {path}/cursor route with CustomCursorPage after every GET route with CustomPage
+
+    The twin route uses the same endpoint, so it accepts the same filters.
+    It is placed before the detail routes so that /cursor does not match as an id or clave.
+    """
+    routes = []
+    for route in app.router.routes:
+        routes.append(route)
+        if not isinstance(route, APIRoute) or "GET" not in route.methods or not lenient_issubclass(route.response_model, CustomPage):
+            continue
+        item_type = route.response_model.__pydantic_generic_metadata__["args"][0]
+        routes.append(
+            APIRoute(
+                path=f"{route.path}/cursor",
+                endpoint=route.endpoint,
+                response_model=CustomCursorPage[item_type],
+                methods=["GET"],
+                name=f"{route.name}_cursor",
+                summary=f"{route.summary or route.name.replace('_', ' ').capitalize()} por cursor",
+                description=route.description,
+                tags=route.tags,
+                dependencies=list(route.dependencies),
+                response_class=route.response_class,
+                dependency_overrides_provider=route.dependency_overrides_provider,
+            )
+        )
+    app.router.routes = routes
+    return app
@@ -22,11 +22,10 @@ Usage:
     from typing import Annotated
 
     from fastapi import APIRouter, Depends
-    from fastapi_pagination.ext.sqlalchemy import paginate
-
     from lib.database import Session, get_db
     from lib.exceptions import MyAnyError
     from lib.fastapi_pagination_custom_list import CustomList
+    from lib.fastapi_pagination_custom_paginate import paginate
 
     from .crud import get_examples
     from .schemas import AutoridadOut
@@ -53,6 +52,9 @@ from fastapi_pagination.default import Params
 from fastapi_pagination.types import GreaterEqualOne, GreaterEqualZero
 from typing_extensions import Self
 
+from .fastapi_pagination_custom_page import validate_items
+from .fastapi_pagination_custom_paginate import TotalMode
+
 
 class CustomListParams(Params):
     """
@@ -61,6 +63,7 @@ class CustomListParams(Params):
 
     page: int = Query(1, ge=1, description="Page number")
     size: int = Query(200, ge=1, le=400, description="Page size")
+    total: TotalMode = Query("exact", description="How to calculate the total: exact, estimate or none")
 
 
 T = TypeVar("T")
@@ -96,21 +99,21 @@ class CustomList(AbstractPage[T], Generic[T]):
         if not isinstance(params, Params):
             raise TypeError("Page should be used with Params")
 
-        if total is None or total == 0:
+        if total == 0 or (total is None and len(items) == 0):
             return cls(
                 success=True,
                 message="No se encontraron registros",
             )
 
-        size = params.size if params.size is not None else total
+        size = params.size if params.size is not None else len(items)
         page = params.page if params.page is not None else 1
         pages = ceil(total / size) if total is not None else None
 
-        return cls(
+        return cls.model_construct(
             success=True,
             message="Success",
             total=total,
-            items=items,
+            items=validate_items(cls, items),
             page=page,
             size=size,
             pages=pages,
@@ -23,9 +23,8 @@ Usage:
     from typing import Annotated
 
     from fastapi import APIRouter, Depends
-    from fastapi_pagination.ext.sqlalchemy import paginate
-
     from lib.fastapi_pagination_custom_page import CustomPage
+    from lib.fastapi_pagination_custom_paginate import paginate
 
     from .crud import get_examples
     from .schemas import ExampleOut
@@ -39,16 +38,30 @@ Usage:
         query = get_examples(db=db)
         return paginate(query)
 
+Add total=estimate or total=none to the request to skip the count, see lib/fastapi_pagination_custom_paginate.py
+
+The items are validated from the ORM rows in one pass with a TypeAdapter of list[ExampleOut],
+and paginate returns the page already in a CustomORJSONResponse, so FastAPI does not validate it again.
+
 """
 from abc import ABC
-from typing import Any, Generic, Optional, Sequence, TypeVar
+from functools import lru_cache
+from typing import Any, Generic, Optional, Sequence, Type, TypeVar
 
 from fastapi import Query
 from fastapi_pagination.bases import AbstractPage, AbstractParams
 from fastapi_pagination.limit_offset import LimitOffsetParams
 from fastapi_pagination.types import GreaterEqualOne, GreaterEqualZero
+from pydantic import BaseModel, TypeAdapter
 from typing_extensions import Self
 
+from .fastapi_pagination_custom_paginate import TotalMode
+from .fastapi_server_timing import measure_serialization
+
+# Default and maximum page size, shared with the cursor pages
+LIMIT_DEFAULT = 10
+LIMIT_MAX = 10
+
 
 class CustomPageParams(LimitOffsetParams):
     """
@@ -56,12 +69,32 @@ class CustomPageParams(LimitOffsetParams):
     """
 
     offset: int = Query(0, ge=0, description="Page offset")
-    limit: int = Query(10, ge=1, le=10, description="Page size limit")
+    limit: int = Query(LIMIT_DEFAULT, ge=1, le=LIMIT_MAX, description="Page size limit")
+    total: TotalMode = Query("exact", description="How to calculate the total: exact, estimate or none")
 
 
 T = TypeVar("T")
 
 
+@lru_cache()
+def items_adapter(item_type: Any) -> TypeAdapter:
+    """
+    TypeAdapter of the list of items, one per item type
+    """
+    return TypeAdapter(list[item_type])
+
+
+def validate_items(page_type: Type[BaseModel], items: Sequence[Any]) -> list:
+    """
+    Validate the items of a page, from ORM rows or dicts, in one pass
+    """
+    args = page_type.__pydantic_generic_metadata__["args"]
+    if not args or isinstance(args[0], TypeVar):
+        return list(items)
+    with measure_serialization():
+        return items_adapter(args[0]).validate_python(items, from_attributes=True)
+
+
 class CustomPage(AbstractPage[T], Generic[T], ABC):
     """
     Custom Page
@@ -90,17 +123,17 @@ class CustomPage(AbstractPage[T], Generic[T], ABC):
         """
         raw_params = params.to_raw_params().as_limit_offset()
 
-        if total is None or total == 0:
+        if total == 0 or (total is None and len(items) == 0):
             return cls(
                 success=True,
                 message="No se encontraron registros",
             )
 
-        return cls(
+        return cls.model_construct(
             success=True,
             message="Success",
             total=total,
-            items=items,
+            items=validate_items(cls, items),
             limit=raw_params.limit,
             offset=raw_params.offset,
             **kwargs,
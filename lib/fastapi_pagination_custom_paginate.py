@@ -0,0 +1,177 @@
+"""
+FastAPI Pagination Custom Paginate
+
+Replaces paginate from fastapi_pagination.ext.sqlalchemy for the SQLAlchemy ORM queries,
+so that the client can choose how the total is calculated with the total parameter:
+
+- exact: SELECT count(*) of the filtered query, cached for a few seconds per query and filters (default)
+- estimate: rows estimated by the PostgreSQL planner with EXPLAIN, without running the count
+- none: the total is not calculated and it is returned as null
+
+In any mode except none, when the page is not full the total is known without counting.
+
+The page is returned in a CustomORJSONResponse, so FastAPI sends it without validating it again.
+It has the ETag of its body, when the client sends it in If-None-Match and the page has not changed
+the response is 304 Not Modified; the queries and the serialization still run, it saves the transfer.
+
+The cursor pagination keeps the order of the query when it is by columns, adding the primary key
+at the end when the last one is not unique; a query ordered by a computed value, like the rank
+of a search, is ordered by its primary key instead.
+
+Usage:
+
+    from lib.fastapi_pagination_custom_page import CustomPage
+    from lib.fastapi_pagination_custom_paginate import paginate
+
+    @examples.get("", response_model=CustomPage[ExampleOut])
+    async def list_examples(
+        db: Annotated[Session, Depends(get_db)],
+    ):
+        query = get_examples(db=db)
+        return paginate(query)
+
+Then request /examples?total=estimate or /examples?total=none
+
+With an AsyncSession from get_async_db, build the query with the async variant of the crud function
+and use paginate_async, the queries run in a greenlet so the event loop is not blocked:
+
+    @examples.get("", response_model=CustomPage[ExampleOut])
+    async def list_examples(
+        db: Annotated[AsyncSession, Depends(get_async_db)],
+    ):
+        query = await get_examples_async(db=db)
+        return await paginate_async(db, query)
+
+"""
+import json
+from functools import lru_cache
+from typing import Any, Literal, Optional
+
+from fastapi_pagination.api import create_page, request
+from fastapi_pagination.bases import AbstractParams, RawParams, is_cursor
+from fastapi_pagination.ext.sqlalchemy import count_query
+from fastapi_pagination.ext.sqlalchemy import paginate as sqlalchemy_paginate
+from fastapi_pagination.utils import verify_params
+from sqlalchemy import Column, Select, UniqueConstraint, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Query, Session
+
+from config.settings import get_settings
+
+from .cache import BaseCache, get_cache
+from .fastapi_conditional import conditional_response
+from .fastapi_orjson_response import CustomORJSONResponse
+
+TotalMode = Literal["exact", "estimate", "none"]
+
+
+@lru_cache()
+def get_count_cache() -> BaseCache:
+    """Cache of the totals, created on the first use"""
+    settings = get_settings()
+    return get_cache("pagination_count", maxsize=settings.pagination_count_cache_maxsize, ttl=settings.pagination_count_cache_ttl)
+
+
+def count_total(db: Session, statement: Select) -> int:
+    """Count the records of the statement, the result is kept in the cache for a few seconds"""
+    count_statement = count_query(statement)
+    compiled = count_statement.compile(dialect=db.get_bind().dialect, compile_kwargs={"render_postcompile": True})
+    key = f"{compiled}|{sorted(compiled.params.items())!r}"
+    total = get_count_cache().get(key)
+    if total is None:
+        total = db.scalar(count_statement)
+        get_count_cache().set(key, total)
+    return total
+
+
+def estimate_total(db: Session, statement: Select) -> Optional[int]:
+    """Estimate the records of the statement with the PostgreSQL planner, None with other databases"""
+    dialect = db.get_bind().dialect
+    if dialect.name != "postgresql":
+        return None
+    compiled = statement.order_by(None).compile(dialect=dialect, compile_kwargs={"render_postcompile": True})
+    parameters = compiled.params
+    if compiled.positional:
+        # asyncpg uses $1, $2... and takes the values in that order
+        parameters = tuple(parameters[name] for name in compiled.positiontup)
+    plan = db.connection().exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", parameters).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def known_total(raw_params: RawParams, size: int) -> Optional[int]:
+    """Total when the page is not full, None if it can not be known without counting"""
+    if raw_params.limit is None or size >= raw_params.limit:
+        return None
+    if size == 0 and raw_params.offset:
+        return None
+    return (raw_params.offset or 0) + size
+
+
+def is_unique(column: Column) -> bool:
+    """True if the column is the primary key or has a unique constraint of its own"""
+    if column.primary_key or column.unique:
+        return True
+    table = getattr(column, "table", None)
+    constraints = getattr(table, "constraints", ())
+    return any(isinstance(constraint, UniqueConstraint) and list(constraint.columns.keys()) == [column.key] for constraint in constraints)
+
+
+def keyset_query(query: Query) -> Query:
+    """Order the query for the cursor pagination by a unique key
+
+    The cursor keeps the values of the last row to compare them in the next page, a rank like
+    ts_rank or similarity is not a column, so the search listings go by id in cursor mode.
+    When the last column of the order is not unique, like nombre or fecha, the primary key is
+    added at the end, otherwise the rows tied at the end of a page would be skipped or repeated.
+    """
+    primary_key = inspect(query.column_descriptions[0]["entity"]).primary_key
+    columns = [getattr(clause, "element", clause) for clause in query.statement._order_by_clauses]  # pylint: disable=protected-access
+    if not all(isinstance(column, Column) for column in columns):
+        return query.order_by(None).order_by(*primary_key)
+    if columns and is_unique(columns[-1]):
+        return query
+    return query.order_by(*primary_key)
+
+
+def paginate(query: Query, params: Optional[AbstractParams] = None) -> Any:
+    """Paginate an ORM query calculating the total as requested by the total parameter"""
+    params, raw_params = verify_params(params, "limit-offset", "cursor")
+
+    # The cursor pagination does not have total
+    if is_cursor(raw_params):
+        return CustomORJSONResponse(sqlalchemy_paginate(keyset_query(query), params))
+
+    if query.session is None:
+        raise ValueError("query.session is None")
+    db = query.session
+    raw_params = raw_params.as_limit_offset()
+
+    # Items of the page, the legacy Query applies unique for the joined eager loads
+    page_query = query
+    if raw_params.limit is not None:
+        page_query = page_query.limit(raw_params.limit)
+    if raw_params.offset is not None:
+        page_query = page_query.offset(raw_params.offset)
+    items = page_query.all()
+
+    # Total
+    mode = getattr(params, "total", "exact")
+    total = None
+    if mode != "none":
+        total = known_total(raw_params, len(items))
+    if total is None and mode == "estimate":
+        total = estimate_total(db, query.statement)
+        if total is not None:
+            total = max(total, (raw_params.offset or 0) + len(items))
+    if total is None and mode != "none":
+        total = count_total(db, query.statement)
+
+    # Validators, the body is not sent if the client already has it
+    return conditional_response(request(), CustomORJSONResponse(create_page(items, total=total, params=params)))
+
+
+async def paginate_async(db: AsyncSession, query: Query, params: Optional[AbstractParams] = None) -> Any:
+    """Paginate an ORM query made with the sync session of the AsyncSession, without blocking the event loop"""
+    return await db.run_sync(lambda _: paginate(query, params))
@@ -0,0 +1,164 @@
+"""
+FastAPI Response Cache
+
+Keeps the encoded JSON bodies of the read-only routers, so a repeated request
+does not touch the database nor serialize again.
+
+The key is the path, the query string and the permission level of the user in the module,
+so users with different permissions do not share responses. Only the responses with status 200
+returned as a Response (paginate, detail_response) are kept, the errors are not.
+
+The responses are kept only in the shared Redis (CACHE_BACKEND redis or l1l2), so removing them
+reaches every worker at once. With CACHE_BACKEND local every worker keeps its own for up to
+CACHE_L1_TTL seconds, the time the other workers may go on serving the responses removed by one of them.
+
+The responses are removed when their TTL is over, when a commit changes one of the tables
+of the router, or with invalidate (see the DELETE /v3/cache route).
+The changes made with UPDATE or DELETE statements without the ORM do not invalidate.
+
+The functions registered with on_invalidate receive the tables of the removed responses,
+the in-memory catalogs use it to load again. The other workers keep their catalogs for up to
+CACHE_L1_TTL seconds, so for that time after an invalidation no response is kept.
+
+Usage:
+
+    from lib.fastapi_response_cache import ResponseCache
+
+    examples = APIRouter(prefix="/examples")
+    examples_cache = ResponseCache("examples", modulo="EXAMPLES", ttl=3600, tablas=["examples"])
+
+    @examples.get("", response_model=CustomPage[ExampleOut])
+    @examples_cache
+    async def list_examples(
+        current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
+        db: Annotated[Session, Depends(get_db)],
+    ):
+        query = get_examples(db=db)
+        return paginate(query)
+
+"""
+import functools
+import inspect
+from typing import Callable, Iterable
+
+from fastapi import Request, Response
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from config.settings import get_settings
+
+from .cache import BaseCache, get_cache
+from .fastapi_conditional import is_not_modified, not_modified_response
+
+REQUEST_PARAMETER = "response_cache_request"
+VALIDATOR_HEADERS = ("etag", "last-modified", "cache-control")
+
+# Caches of the responses by name
+response_caches = {}
+
+# Functions called with the tables of the responses that are removed
+invalidation_listeners = []
+
+
+def on_invalidate(listener: Callable[[set[str]], None]) -> Callable[[set[str]], None]:
+    """Register a function to call with the tables of the responses that are removed"""
+    invalidation_listeners.append(listener)
+    return listener
+
+
+def _notify(tablas: set[str]) -> None:
+    """Call the registered functions with the tables"""
+    for listener in invalidation_listeners:
+        listener(tablas)
+
+
+class ResponseCache:
+    """Responses of a router kept by path, query string and permission level"""
+
+    def __init__(self, nombre: str, modulo: str, ttl: int, tablas: Iterable[str]):
+        self.nombre = nombre
+        self.modulo = modulo
+        self.tablas = set(tablas)
+        self.ttl = ttl
+        response_caches[nombre] = self
+
+    @functools.cached_property
+    def cache(self) -> BaseCache:
+        """Cache of the responses, created on the first use"""
+        return get_cache(f"response:{self.nombre}", maxsize=get_settings().response_cache_maxsize, ttl=self.ttl, compartido=True)
+
+    @functools.cached_property
+    def invalidated(self) -> BaseCache:
+        """Mark of a recent invalidation, lasts CACHE_L1_TTL seconds"""
+        return get_cache(f"response_invalidated:{self.nombre}", maxsize=1, ttl=get_settings().cache_l1_ttl, compartido=True)
+
+    def key(self, request: Request, nivel: int) -> str:
+        """Key of the response"""
+        return f"{request.url.path}|{sorted(request.query_params.multi_items())!r}|{nivel}"
+
+    def invalidate(self) -> int:
+        """Remove all the responses and do not keep new ones for CACHE_L1_TTL seconds, return how many there were"""
+        _notify(self.tablas)
+        self.invalidated.set("invalidated", True)
+        cantidad = len(self.cache)
+        self.cache.clear()
+        return cantidad
+
+    def __call__(self, endpoint: Callable) -> Callable:
+        """Decorate an endpoint that has the current_user parameter"""
+        signature = inspect.signature(endpoint)
+        if "current_user" not in signature.parameters:
+            raise ValueError(f"{endpoint.__name__} does not have the current_user parameter")
+        request_parameter = next((name for name, parameter in signature.parameters.items() if parameter.annotation is Request), None)
+
+        @functools.wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            request = kwargs[request_parameter] if request_parameter else kwargs.pop(REQUEST_PARAMETER)
+            llave = self.key(request, kwargs["current_user"].permissions.get(self.modulo, 0))
+            guardado = self.cache.get(llave)
+            if guardado is not None:
+                body, media_type, headers = guardado
+                if "etag" in headers and is_not_modified(request, headers["etag"], headers.get("last-modified")):
+                    return not_modified_response(headers["etag"], headers.get("last-modified"))
+                return Response(body, media_type=media_type, headers=headers)
+            respuesta = await endpoint(*args, **kwargs)
+            if isinstance(respuesta, Response) and respuesta.status_code == 200 and not self.invalidated.exists("invalidated"):
+                headers = {name: respuesta.headers[name] for name in VALIDATOR_HEADERS if name in respuesta.headers}
+                self.cache.set(llave, (respuesta.body, respuesta.media_type, headers))
+            return respuesta
+
+        if request_parameter is None:
+            parameter = inspect.Parameter(REQUEST_PARAMETER, inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=Request)
+            wrapper.__signature__ = signature.replace(parameters=[parameter, *signature.parameters.values()])
+        return wrapper
+
+
+def invalidate_tablas(tablas: Iterable[str]) -> None:
+    """Remove the responses of the routers that use any of the tables"""
+    tablas = set(tablas)
+    _notify(tablas)
+    for response_cache in response_caches.values():
+        if response_cache.tablas & tablas:
+            response_cache.invalidate()
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_tablas(session: Session, flush_context) -> None:
+    """Remember the tables changed in the transaction"""
+    tablas = session.info.setdefault("response_cache_tablas", set())
+    for instancia in (*session.new, *session.dirty, *session.deleted):
+        tablas.add(instancia.__table__.name)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session: Session) -> None:
+    """Invalidate the responses that use the changed tables"""
+    tablas = session.info.pop("response_cache_tablas", None)
+    if tablas:
+        invalidate_tablas(tablas)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_on_rollback(session: Session) -> None:
+    """Forget the changed tables when the transaction is rolled back"""
+    session.info.pop("response_cache_tablas", None)
@@ -0,0 +1,182 @@
+"""
+FastAPI Server Timing
+
+Measures each request: the SQL statements and their time, the wait for a connection of the pool,
+the serialization (the validation of the Out schemas, with the lazy loads of their properties,
+and the JSON encoding) and the total. They are sent in the Server-Timing header
+
+    Server-Timing: db;dur=12.4;desc="7 queries", pool;dur=0.3, serialize;dur=3.2, total;dur=20.1
+
+and in a JSON log line tagged with the router, where queries much greater than distinct
+means the same statement ran once per item (N+1)
+
+    {"router": "inv_equipos", "method": "GET", "path": "/v3/inv_equipos", "status": 200, "queries": 7, "distinct": 3, ...}
+
+The measurements are kept in a ContextVar, so they follow the request into the threadpool
+and into the greenlets of the AsyncSession.
+
+Usage:
+
+    from lib.fastapi_server_timing import ServerTimingMiddleware, listen_sql_timing
+
+    listen_sql_timing(engine)
+    app.add_middleware(ServerTimingMiddleware)
+
+The time of the pool is measured by the pool classes of lib/database.py
+
+"""
+import json
+import logging
+import sys
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+from sqlalchemy import Engine, event
+from starlette.datastructures import MutableHeaders
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RequestTiming:
+    """Measurements of a request, the times in seconds"""
+
+    queries: int = 0
+    db: float = 0.0
+    pool: float = 0.0
+    serialize: float = 0.0
+    statements: set = field(default_factory=set)
+    scope: Optional[dict] = field(default=None, repr=False)
+
+    def header(self, total: float) -> str:
+        """Value of the Server-Timing header"""
+        return f'db;dur={self.db * 1000:.1f};desc="{self.queries} queries", pool;dur={self.pool * 1000:.1f}, serialize;dur={self.serialize * 1000:.1f}, total;dur={total * 1000:.1f}'
+
+
+current_timing: ContextVar[Optional[RequestTiming]] = ContextVar("current_timing", default=None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    """Remember when the statement started"""
+    conn.info["server_timing_start"] = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    """Add the statement and its time to the request"""
+    inicio = conn.info.pop("server_timing_start", None)
+    timing = current_timing.get()
+    if timing is not None and inicio is not None:
+        timing.queries += 1
+        timing.db += time.perf_counter() - inicio
+        timing.statements.add(statement)
+
+
+def listen_sql_timing(engine: Engine) -> None:
+    """Add the events that measure the SQL statements of the engine"""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def add_pool_wait(segundos: float) -> None:
+    """Add the wait for a connection of the pool to the request"""
+    timing = current_timing.get()
+    if timing is not None:
+        timing.pool += segundos
+
+
+@contextmanager
+def measure_serialization() -> Iterator[None]:
+    """Add the time of the block to the serialization of the request"""
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        timing = current_timing.get()
+        if timing is not None:
+            timing.serialize += time.perf_counter() - inicio
+
+
+def router_name(scope: Scope) -> Optional[str]:
+    """Name of the router of the endpoint, the package of its paths module"""
+    endpoint = scope.get("endpoint")
+    if endpoint is None:
+        return None
+    modulo = endpoint.__module__.split(".")
+    return modulo[-2] if len(modulo) > 1 and modulo[-1] == "paths" else modulo[-1]
+
+
+def route_path(scope: Scope) -> Optional[str]:
+    """Method and path of the route of the endpoint, with the path parameters as placeholders"""
+    endpoint = scope.get("endpoint")
+    app = scope.get("app")
+    if endpoint is None or app is None:
+        return None
+    for route in app.routes:
+        if getattr(route, "endpoint", None) is endpoint and route.matches(scope)[0] == Match.FULL:
+            return f"{scope['method']} {route.path}"
+    return None
+
+
+def current_route() -> Optional[str]:
+    """Route of the request being measured, None outside of a request"""
+    timing = current_timing.get()
+    if timing is None or timing.scope is None:
+        return None
+    return route_path(timing.scope)
+
+
+def configure_request_log() -> None:
+    """Write the log lines of the requests to stdout"""
+    if not logger.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
+class ServerTimingMiddleware:
+    """Measure each HTTP request, add the Server-Timing header and write the log line"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        timing = RequestTiming(scope=scope)
+        token = current_timing.set(timing)
+        inicio = time.perf_counter()
+        status_code = 500
+
+        async def send_with_header(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message).append("Server-Timing", timing.header(time.perf_counter() - inicio))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_header)
+        finally:
+            current_timing.reset(token)
+            if logger.isEnabledFor(logging.INFO):
+                linea = {
+                    "router": router_name(scope),
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "status": status_code,
+                    "queries": timing.queries,
+                    "distinct": len(timing.statements),
+                    "db_ms": round(timing.db * 1000, 1),
+                    "pool_ms": round(timing.pool * 1000, 1),
+                    "serialize_ms": round(timing.serialize * 1000, 1),
+                    "total_ms": round((time.perf_counter() - inicio) * 1000, 1),
+                }
+                logger.info(json.dumps(linea))
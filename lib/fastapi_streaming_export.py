@@ -0,0 +1,81 @@
+"""
+FastAPI Streaming Export
+
+Provides a StreamingResponse that writes every record of a SQLAlchemy ORM query as NDJSON or CSV.
+
+The rows are read from a server-side cursor with yield_per and sent in blocks,
+so the memory stays constant no matter how many records are exported.
+
+Example of the NDJSON output, one JSON object per line:
+
+    {"id": 1, "descripcion": "...", ...}
+    {"id": 2, "descripcion": "...", ...}
+
+Usage:
+
+    from typing import Annotated
+
+    from fastapi import APIRouter, Depends
+
+    from lib.fastapi_streaming_export import ExportFormat, export_response
+
+    from .crud import get_examples
+    from .schemas import ExampleOut
+
+    examples = APIRouter(prefix="/examples")
+
+    @examples.get("/export")
+    async def export_examples(
+        db: Annotated[Session, Depends(get_db)],
+        formato: ExportFormat = "ndjson",
+    ):
+        query = get_examples(db=db)
+        return export_response(query, ExampleOut, formato, "examples")
+
+"""
+import csv
+import io
+from typing import Iterator, Literal, Type
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy.orm import Query
+
+ExportFormat = Literal["ndjson", "csv"]
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def export_rows(query: Query, schema: Type[BaseModel], formato: ExportFormat, yield_per: int = 1000) -> Iterator[str]:
+    """Yield the records of the query as NDJSON or CSV in blocks of yield_per records"""
+    buffer = io.StringIO()
+    writer = None
+    if formato == "csv":
+        writer = csv.DictWriter(buffer, fieldnames=list(schema.model_fields))
+        writer.writeheader()
+    for numero, item in enumerate(query.yield_per(yield_per), start=1):
+        registro = schema.model_validate(item)
+        if writer is None:
+            buffer.write(registro.model_dump_json())
+            buffer.write("\n")
+        else:
+            writer.writerow(registro.model_dump(mode="json"))
+        if numero % yield_per == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+    if buffer.tell() > 0:
+        yield buffer.getvalue()
+
+
+def export_response(query: Query, schema: Type[BaseModel], formato: ExportFormat, nombre: str) -> StreamingResponse:
+    """StreamingResponse with the records of the query as a file to download"""
+    extension = "ndjson" if formato == "ndjson" else "csv"
+    return StreamingResponse(
+        export_rows(query, schema, formato),
+        media_type=MEDIA_TYPES[formato],
+        headers={"Content-Disposition": f'attachment; filename="{nombre}.{extension}"'},
+    )
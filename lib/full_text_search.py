@@ -0,0 +1,116 @@
+"""
+Búsqueda de texto completo
+
+En PostgreSQL la tabla tiene una columna tsvector generada con la configuración spanish
+y un índice GIN, las consultas usan websearch_to_tsquery, se ordenan con ts_rank
+y los fragmentos con las coincidencias se marcan con ts_headline.
+
+En SQLite, para las pruebas locales, se usa una tabla virtual FTS5 con el contenido
+de la tabla y triggers para mantenerla, se ordena con bm25 y los fragmentos se hacen con snippet.
+
+El fragmento es HTML: el texto se escapa y las coincidencias quedan entre <mark> y </mark>,
+ts_headline y snippet las marcan con caracteres de control que se cambian por <mark> después de escapar.
+
+Las dos se crean con create_all por medio del evento after_create de la tabla,
+para la base de datos de producción están los archivos de la carpeta migrations.
+
+Uso:
+
+    ejemplos_busqueda = FullTextSearch(Ejemplo.__table__, {"titulo": "A", "texto": "C"}, fragmento="texto")
+
+    consulta, rango, fragmento = ejemplos_busqueda.search(consulta, "texto a buscar", db.get_bind().dialect.name)
+    consulta = consulta.order_by(rango.desc())
+
+"""
+import re
+from typing import Optional
+
+from sqlalchemy import DDL, Column, Integer, MetaData, Table, Text, event, func, literal_column
+from sqlalchemy.dialects.postgresql import REGCONFIG, TSVECTOR
+from sqlalchemy.orm import Query
+from sqlalchemy.sql import ColumnElement, cast
+
+# Pesos de ts_rank por defecto en PostgreSQL, se usan también con bm25
+PESOS = {"A": 1.0, "B": 0.4, "C": 0.2, "D": 0.1}
+MARCA_INICIO = "\x02"
+MARCA_FIN = "\x03"
+HEADLINE_OPTIONS = f"StartSel={MARCA_INICIO}, StopSel={MARCA_FIN}, MaxFragments=2, MaxWords=30, MinWords=10, FragmentDelimiter= … "
+HTML_REEMPLAZOS = (("&", "&amp;"), ("<", "&lt;"), (">", "&gt;"), ('"', "&quot;"), ("'", "&#x27;"), (MARCA_INICIO, "<mark>"), (MARCA_FIN, "</mark>"))
+SNIPPET_TOKENS = 32
+TERMINO_REGEXP = re.compile(r"\w+")
+TEXTO_MAX_LENGTH = 256
+
+
+def safe_search_text(texto: str) -> Optional[str]:
+    """Texto a buscar sin espacios de más, None si no tiene al menos una palabra de tres letras"""
+    texto = " ".join(texto.split())[:TEXTO_MAX_LENGTH]
+    if not any(len(termino) >= 3 for termino in TERMINO_REGEXP.findall(texto)):
+        return None
+    return texto
+
+
+def html_fragmento(fragmento: ColumnElement) -> ColumnElement:
+    """Escapar el fragmento para HTML y cambiar las marcas de las coincidencias por <mark> y </mark>"""
+    for caracter, reemplazo in HTML_REEMPLAZOS:
+        fragmento = func.replace(fragmento, caracter, reemplazo)
+    return fragmento
+
+
+class FullTextSearch:
+    """Búsqueda de texto completo en las columnas de una tabla con sus pesos A, B, C o D"""
+
+    def __init__(self, table: Table, columnas: dict[str, str], fragmento: str, configuracion: str = "spanish", columna: str = "busqueda"):
+        self.table = table
+        self.columnas = columnas
+        self.fragmento = fragmento
+        self.configuracion = configuracion
+        self.columna = columna
+        self.fts = f"{table.name}_fts"
+        self.fts_table = Table(self.fts, MetaData(), Column("rowid", Integer), *(Column(nombre, Text) for nombre in columnas))
+        for sentencia in self.postgresql_ddl():
+            event.listen(table, "after_create", DDL(sentencia).execute_if(dialect="postgresql"))
+        for sentencia in self.sqlite_ddl():
+            event.listen(table, "after_create", DDL(sentencia).execute_if(dialect="sqlite"))
+
+    def postgresql_ddl(self, concurrently: bool = False) -> list[str]:
+        """Sentencias para agregar la columna tsvector generada y su índice GIN"""
+        vector = " || ".join(f"setweight(to_tsvector('{self.configuracion}', coalesce({nombre}, '')), '{peso}')" for nombre, peso in self.columnas.items())
+        indice = "CREATE INDEX CONCURRENTLY" if concurrently else "CREATE INDEX"
+        return [
+            f"ALTER TABLE {self.table.name} ADD COLUMN IF NOT EXISTS {self.columna} tsvector GENERATED ALWAYS AS ({vector}) STORED",
+            f"{indice} IF NOT EXISTS {self.table.name}_{self.columna}_idx ON {self.table.name} USING gin ({self.columna})",
+        ]
+
+    def sqlite_ddl(self) -> list[str]:
+        """Sentencias para crear la tabla virtual FTS5 y los triggers que la mantienen"""
+        nombres = ", ".join(self.columnas)
+        nuevos = ", ".join(f"new.{nombre}" for nombre in self.columnas)
+        anteriores = ", ".join(f"old.{nombre}" for nombre in self.columnas)
+        borrar = f"INSERT INTO {self.fts}({self.fts}, rowid, {nombres}) VALUES ('delete', old.id, {anteriores});"
+        insertar = f"INSERT INTO {self.fts}(rowid, {nombres}) VALUES (new.id, {nuevos});"
+        return [
+            f"CREATE VIRTUAL TABLE {self.fts} USING fts5({nombres}, content='{self.table.name}', content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+            f"CREATE TRIGGER {self.fts}_ai AFTER INSERT ON {self.table.name} BEGIN {insertar} END",
+            f"CREATE TRIGGER {self.fts}_ad AFTER DELETE ON {self.table.name} BEGIN {borrar} END",
+            f"CREATE TRIGGER {self.fts}_au AFTER UPDATE ON {self.table.name} BEGIN {borrar} {insertar} END",
+        ]
+
+    def search(self, consulta: Query, texto: str, dialect_name: str) -> tuple[Query, ColumnElement, ColumnElement]:
+        """Filtrar la consulta con el texto, entrega la consulta, el rango (mayor es mejor) y el fragmento en HTML"""
+        if dialect_name == "sqlite":
+            return self._search_sqlite(consulta, texto)
+        configuracion = cast(self.configuracion, REGCONFIG)
+        vector = literal_column(f"{self.table.name}.{self.columna}", TSVECTOR)
+        tsquery = func.websearch_to_tsquery(configuracion, texto)
+        rango = func.ts_rank(vector, tsquery)
+        fragmento = func.ts_headline(configuracion, self.table.c[self.fragmento], tsquery, HEADLINE_OPTIONS)
+        return consulta.filter(vector.op("@@")(tsquery)), rango, html_fragmento(fragmento)
+
+    def _search_sqlite(self, consulta: Query, texto: str) -> tuple[Query, ColumnElement, ColumnElement]:
+        """Filtrar con FTS5, los términos se entrecomillan para que no se interpreten como sintaxis"""
+        terminos = " ".join(f'"{termino}"' for termino in TERMINO_REGEXP.findall(texto))
+        fts = literal_column(self.fts)
+        rango = -func.bm25(fts, *(PESOS[peso] for peso in self.columnas.values()))
+        fragmento = func.snippet(fts, list(self.columnas).index(self.fragmento), MARCA_INICIO, MARCA_FIN, "…", SNIPPET_TOKENS)
+        consulta = consulta.join(self.fts_table, self.fts_table.c.rowid == self.table.c.id).filter(fts.op("MATCH")(terminos))
+        return consulta, rango, html_fragmento(fragmento)
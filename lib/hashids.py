@@ -1,8 +1,12 @@
 """
 Cifrado y descrifado de ID por medio de Hashids
+
+Los codificadores se guardan por salt, así no se construye un Hashids en cada llamada.
+Para los listados use encode_many y decode_many que usan un solo codificador para todos.
 """
 import re
-from typing import Any
+from functools import lru_cache
+from typing import Any, Iterable, Optional
 
 from fastapi import Depends
 from hashids import Hashids
@@ -10,6 +14,30 @@ from hashids import Hashids
 from config.settings import Settings, get_settings
 
 HASHID_REGEXP = re.compile("[0-9a-zA-Z]{8,16}")
+HASHIDS_CACHE_MAXSIZE = 256
+MIN_LENGTH = 8
+
+
+@lru_cache(maxsize=HASHIDS_CACHE_MAXSIZE)
+def get_hashids(salt: str, min_length: int = MIN_LENGTH) -> Hashids:
+    """Codificador de un salt, se guardan los más recientes"""
+    return Hashids(salt=salt, min_length=min_length)
+
+
+def encode_many(ids: Iterable[int], salt: Optional[str] = None) -> list[str]:
+    """Cifrar varios ID con el mismo codificador, por defecto con el salt de la configuración"""
+    encode = get_hashids(get_settings().salt if salt is None else salt).encode
+    return [encode(un_id) for un_id in ids]
+
+
+def decode_many(ids_hasheados: Iterable[str], salt: Optional[str] = None) -> list[Optional[int]]:
+    """Descifrar varios ID con el mismo codificador, None en los que no son válidos"""
+    decode = get_hashids(get_settings().salt if salt is None else salt).decode
+    descifrados = []
+    for un_id_hasheado in ids_hasheados:
+        descifrado = decode(un_id_hasheado) if HASHID_REGEXP.fullmatch(un_id_hasheado) else ()
+        descifrados.append(descifrado[0] if len(descifrado) == 1 else None)
+    return descifrados
 
 
 def cifrar_id(
@@ -17,8 +45,7 @@ def cifrar_id(
     settings: Settings = Depends(get_settings),
 ) -> str:
     """Cifrar ID"""
-    hashids = Hashids(settings.salt, min_length=8)
-    return hashids.encode(un_id)
+    return get_hashids(settings.salt).encode(un_id)
 
 
 def descifrar_id(
@@ -26,9 +53,8 @@ def descifrar_id(
     settings: Settings = Depends(get_settings),
 ) -> Any:
     """Descifrar ID"""
-    hashids = Hashids(settings.salt, min_length=8)
     if HASHID_REGEXP.match(un_id_hasheado):
-        pag_pago_id = hashids.decode(un_id_hasheado)
+        pag_pago_id = get_hashids(settings.salt).decode(un_id_hasheado)
         if len(pag_pago_id) == 1:
             return pag_pago_id[0]
     return None
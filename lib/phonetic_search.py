@@ -0,0 +1,113 @@
+"""
+Búsqueda fonética
+
+La clave fonética de un nombre iguala las letras que suenan igual en español,
+por ejemplo GONZALEZ, GONSALEZ y GONZALES tienen la clave GONSALES,
+así como Y/LL/I, V/B, C/K/Q, Z/S, la H muda y las letras dobles.
+
+Primero se quitan los acentos con la misma tabla de letras (translate), se borra lo que no
+sea una letra de la A a la Z o un espacio y se pasa a mayúsculas, así las dos partes sólo ven ASCII.
+Luego las reglas son expresiones regulares que se aplican en orden, las mismas en Python
+y en la función clave_fonetica de PostgreSQL, así la clave que se busca y la guardada coinciden.
+
+En PostgreSQL la clave es una columna generada con un índice btree con text_pattern_ops,
+la búsqueda toma los nombres cuya clave empieza con la del texto (LIKE 'CLAVE%') y usa el índice.
+El patrón va en la sentencia y no como parámetro, porque con un plan genérico de asyncpg
+LIKE $1 no usa el índice; la clave sólo tiene letras de la A a la Z y espacios.
+
+Las columnas se crean con create_all por medio del evento after_create de la tabla,
+para la base de datos de producción están los archivos de la carpeta migrations.
+En SQLite, para las pruebas locales, la columna es virtual y clave_fonetica
+se agrega a las conexiones con register_sqlite_functions de lib/trigram_search.py
+
+Uso:
+
+    ejemplos_fonetica = PhoneticSearch(Ejemplo.__table__, "nombre")
+
+    consulta = ejemplos_fonetica.search(consulta, safe_string(nombre))
+
+"""
+import re
+from typing import Optional
+
+from sqlalchemy import DDL, Table, event, literal, literal_column
+from sqlalchemy.orm import Query
+
+from .exceptions import MyNotValidParamError
+
+# Letras con acento y sin acento, con translate en Python y en PostgreSQL
+CON_ACENTO = "áàâäãéèêëíìîïóòôöõúùûüñçÁÀÂÄÃÉÈÊËÍÌÎÏÓÒÔÖÕÚÙÛÜÑÇ"
+SIN_ACENTO = "aaaaaeeeeiiiiooooouuuuncAAAAAEEEEIIIIOOOOOUUUUNC"
+ACENTOS = str.maketrans(CON_ACENTO, SIN_ACENTO)
+
+# Lo que se borra después de quitar los acentos, antes de pasar a mayúsculas
+NO_LETRAS = r"[^A-Za-z ]"
+
+# Reglas en orden, con la sintaxis común de re de Python y de regexp_replace de PostgreSQL
+REGLAS = (
+    (r"PH", "F"),
+    (r"X", "KS"),
+    (r"CH", "X"),
+    (r"QU", "K"),
+    (r"G([EI])", r"J\1"),
+    (r"GU([EI])", r"G\1"),
+    (r"C([EI])", r"S\1"),
+    (r"[CQ]", "K"),
+    (r"Z", "S"),
+    (r"V", "B"),
+    (r"W", "U"),
+    (r"H", ""),
+    (r"LL", "I"),
+    (r"Y", "I"),
+    (r"(.)\1+", r"\1"),
+    (r" +", " "),
+)
+NO_LETRAS_COMPILADA = re.compile(NO_LETRAS)
+REGLAS_COMPILADAS = tuple((re.compile(patron), reemplazo) for patron, reemplazo in REGLAS)
+
+
+def clave_fonetica(texto: Optional[str]) -> Optional[str]:
+    """Clave fonética de un texto, la misma que calcula la función clave_fonetica de PostgreSQL"""
+    if texto is None:
+        return None
+    clave = NO_LETRAS_COMPILADA.sub("", texto.translate(ACENTOS)).upper()
+    for patron, reemplazo in REGLAS_COMPILADAS:
+        clave = patron.sub(reemplazo, clave)
+    return clave.strip()
+
+
+def clave_fonetica_sql() -> str:
+    """Sentencia para crear la función clave_fonetica en PostgreSQL"""
+    expresion = f"upper(regexp_replace(translate(texto, '{CON_ACENTO}', '{SIN_ACENTO}'), '{NO_LETRAS}', '', 'g'))"
+    for patron, reemplazo in REGLAS:
+        expresion = f"regexp_replace({expresion}, '{patron}', '{reemplazo}', 'g')"
+    return f"CREATE OR REPLACE FUNCTION clave_fonetica(texto text) RETURNS text LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE AS $$ SELECT btrim({expresion}) $$"
+
+
+class PhoneticSearch:
+    """Columna generada con la clave fonética de una columna de una tabla"""
+
+    def __init__(self, table: Table, columna: str, columna_clave: Optional[str] = None):
+        self.table = table
+        self.columna = columna
+        self.columna_clave = columna_clave or f"{columna}_fonetico"
+        for sentencia in self.postgresql_ddl():
+            event.listen(table, "after_create", DDL(sentencia).execute_if(dialect="postgresql"))
+        sqlite_ddl = f"ALTER TABLE {table.name} ADD COLUMN {self.columna_clave} TEXT GENERATED ALWAYS AS (clave_fonetica({columna})) VIRTUAL"
+        event.listen(table, "after_create", DDL(sqlite_ddl).execute_if(dialect="sqlite"))
+
+    def postgresql_ddl(self, concurrently: bool = False) -> list[str]:
+        """Sentencias para agregar la función, la columna generada y su índice btree para buscar por el inicio"""
+        indice = "CREATE INDEX CONCURRENTLY" if concurrently else "CREATE INDEX"
+        return [
+            clave_fonetica_sql(),
+            f"ALTER TABLE {self.table.name} ADD COLUMN IF NOT EXISTS {self.columna_clave} text GENERATED ALWAYS AS (clave_fonetica({self.columna})) STORED",
+            f"{indice} IF NOT EXISTS {self.table.name}_{self.columna_clave}_idx ON {self.table.name} ({self.columna_clave} text_pattern_ops)",
+        ]
+
+    def search(self, consulta: Query, texto: str) -> Query:
+        """Filtrar la consulta con los nombres cuya clave fonética empieza con la del texto ya limpio"""
+        clave = clave_fonetica(texto)
+        if clave == "":
+            raise MyNotValidParamError("El nombre no tiene letras para la búsqueda fonética")
+        return consulta.filter(literal_column(f"{self.table.name}.{self.columna_clave}").like(literal(f"{clave}%", literal_execute=True)))
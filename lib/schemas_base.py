@@ -3,9 +3,31 @@ Schemas Base
 """
 from pydantic import BaseModel
 
+# Cantidad máxima de registros que se reciben en una operación masiva
+BULK_MAX_ITEMS = 1000
+
 
 class OneBaseOut(BaseModel):
     """OneBaseOut"""
 
     success: bool = True
     message: str = "Success"
+
+
+class BulkItemOut(OneBaseOut):
+    """BulkItemOut, result of each item of a bulk operation"""
+
+    id: int | None = None
+
+
+class BulkOut(OneBaseOut):
+    """BulkOut, result of a bulk operation with one item for each received item, in the same order"""
+
+    items: list[BulkItemOut] = []
+
+    @classmethod
+    def from_results(cls, results: list) -> "BulkOut":
+        """Create from a list with the id of each created record or the exception it had"""
+        items = [BulkItemOut(success=False, message=str(result)) if isinstance(result, Exception) else BulkItemOut(id=result) for result in results]
+        created = sum(1 for item in items if item.success)
+        return cls(message=f"Se crearon {created} de {len(items)} registros", items=items)
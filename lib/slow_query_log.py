@@ -0,0 +1,212 @@
+"""
+Bitácora de consultas lentas
+
+Los eventos del engine miden cada consulta, las que tardan más de SLOW_QUERY_THRESHOLD milisegundos
+se guardan con la sentencia, los parámetros sin datos personales, la ruta de la petición y su plan.
+
+El plan se obtiene al momento en la misma conexión según SLOW_QUERY_EXPLAIN:
+
+- off: no se obtiene
+- plan: EXPLAIN, sin ejecutar de nuevo la consulta
+- analyze: EXPLAIN (ANALYZE, BUFFERS), la ejecuta de nuevo para tener los tiempos reales
+
+Sólo se explican las consultas SELECT, dentro de un SAVEPOINT para que un error
+no deje abortada la transacción de la petición.
+
+Los parámetros conservan los números, fechas y textos de un carácter (como estatus),
+los demás textos se cambian por su longitud; del plan se quitan los textos entre comillas.
+
+Cada worker guarda las últimas en memoria y si se define SLOW_QUERY_LOG_FILE además las escribe,
+una línea JSON por consulta, en ese archivo que rota cada 10 MB y conserva 5 respaldos.
+La ruta GET /v3/consultas_lentas entrega las sentencias que suman más tiempo,
+desde el archivo (todos los workers de la instancia) o desde la memoria del worker.
+
+Uso:
+
+    listen_slow_queries(engine, umbral=1.0, explain="plan")
+
+"""
+import json
+import logging
+import os
+import re
+import time
+from collections import deque
+from datetime import date, datetime
+from datetime import time as dt_time
+from datetime import timedelta
+from decimal import Decimal
+from logging.handlers import RotatingFileHandler
+from typing import Any, Literal, Optional
+
+from sqlalchemy import Engine, event
+
+from .fastapi_server_timing import current_route
+
+ExplainModo = Literal["off", "plan", "analyze"]
+
+SLOW_QUERY_LOG_MAX_BYTES = 10 * 1024 * 1024
+SLOW_QUERY_LOG_BACKUP_COUNT = 5
+REGISTROS_EN_MEMORIA = 1000
+CONSULTA_REGEXP = re.compile(r"^\s*(SELECT|WITH)\b", re.IGNORECASE)
+TEXTO_SQL_REGEXP = re.compile(r"'(?:[^']|'')*'")
+
+logger = logging.getLogger(__name__)
+
+# Escribe las consultas lentas en el archivo, separado para que los avisos de logger no lleguen a él
+bitacora = logging.getLogger(f"{__name__}.registros")
+
+# Últimas consultas lentas de este worker
+registros = deque(maxlen=REGISTROS_EN_MEMORIA)
+
+# Archivo donde se escriben, vacío si sólo se guardan en memoria
+archivo_registros = {"ruta": ""}
+
+
+def redactar_parametro(valor: Any) -> Any:
+    """Conservar un parámetro que no puede tener datos personales, o cambiarlo por su tipo y longitud"""
+    if valor is None or isinstance(valor, (bool, int, float)):
+        return valor
+    if isinstance(valor, (Decimal, date, dt_time, timedelta)):
+        return str(valor)
+    if isinstance(valor, str):
+        return valor if len(valor) <= 1 else f"<str:{len(valor)}>"
+    if isinstance(valor, (bytes, bytearray, memoryview)):
+        return f"<bytes:{len(valor)}>"
+    if isinstance(valor, (list, tuple)):
+        return [redactar_parametro(elemento) for elemento in valor]
+    return f"<{type(valor).__name__}>"
+
+
+def redactar_parametros(parametros: Any) -> Any:
+    """Redactar los parámetros de la consulta, por nombre (dict) o por posición"""
+    if isinstance(parametros, dict):
+        return {nombre: redactar_parametro(valor) for nombre, valor in parametros.items()}
+    if isinstance(parametros, (list, tuple)):
+        return [redactar_parametro(valor) for valor in parametros]
+    return redactar_parametro(parametros)
+
+
+def redactar_plan(plan: str) -> str:
+    """Quitar del plan los textos entre comillas, que son los valores de los filtros"""
+    return TEXTO_SQL_REGEXP.sub("'?'", plan)
+
+
+def explicar(conn, statement: str, parameters: Any, explain: ExplainModo) -> Optional[str]:
+    """Plan de la consulta, en la misma conexión y sin pasar por los eventos del engine"""
+    cursor = conn.connection.cursor()
+    try:
+        if conn.dialect.name == "postgresql":
+            opciones = "ANALYZE, BUFFERS" if explain == "analyze" else "COSTS"
+            cursor.execute("SAVEPOINT slow_query_explain")
+            try:
+                cursor.execute(f"EXPLAIN ({opciones}) {statement}", parameters)
+                filas = cursor.fetchall()
+            except Exception:
+                cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+                raise
+            cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+            return redactar_plan("\n".join(fila[0] for fila in filas))
+        if conn.dialect.name == "sqlite":
+            cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            return redactar_plan("\n".join(fila[3] for fila in cursor.fetchall()))
+        return None
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        logger.warning("No se pudo obtener el plan de una consulta lenta: %s", error)
+        return None
+    finally:
+        cursor.close()
+
+
+def registrar(registro: dict) -> None:
+    """Guardar una consulta lenta en la memoria y en el archivo si está configurado"""
+    registros.append(registro)
+    if archivo_registros["ruta"]:
+        bitacora.info(json.dumps(registro, ensure_ascii=False))
+
+
+def listen_slow_queries(engine: Engine, umbral: float, explain: ExplainModo = "plan") -> None:
+    """Agregar los eventos que guardan las consultas del engine que tardan más de umbral segundos"""
+
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info["slow_query_start"] = time.perf_counter()
+
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        inicio = conn.info.pop("slow_query_start", None)
+        if inicio is None:
+            return
+        duracion = time.perf_counter() - inicio
+        if duracion < umbral:
+            return
+        plan = None
+        if explain != "off" and not executemany and CONSULTA_REGEXP.match(statement) and not context.execution_options.get("stream_results"):
+            plan = explicar(conn, statement, parameters, explain)
+        registrar(
+            {
+                "fecha": datetime.now().isoformat(timespec="seconds"),
+                "duracion_ms": round(duracion * 1000, 1),
+                "sentencia": statement,
+                "parametros": redactar_parametros(parameters),
+                "ruta": current_route(),
+                "plan": plan,
+            }
+        )
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def configure_slow_query_log(ruta: str) -> None:
+    """Escribir las consultas lentas en un archivo que rota, una línea JSON por consulta"""
+    archivo_registros["ruta"] = ruta
+    for handler in bitacora.handlers[:]:
+        bitacora.removeHandler(handler)
+        handler.close()
+    directorio = os.path.dirname(ruta)
+    if directorio:
+        os.makedirs(directorio, exist_ok=True)
+    handler = RotatingFileHandler(ruta, maxBytes=SLOW_QUERY_LOG_MAX_BYTES, backupCount=SLOW_QUERY_LOG_BACKUP_COUNT, encoding="utf-8")
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    bitacora.addHandler(handler)
+    bitacora.setLevel(logging.INFO)
+    bitacora.propagate = False
+
+
+def leer_registros() -> list[dict]:
+    """Consultas lentas del archivo y de sus respaldos, o de la memoria de este worker si no hay archivo"""
+    ruta = archivo_registros["ruta"]
+    if not ruta:
+        return list(registros)
+    resultado = []
+    for archivo in [ruta] + [f"{ruta}.{numero}" for numero in range(1, SLOW_QUERY_LOG_BACKUP_COUNT + 1)]:
+        if not os.path.exists(archivo):
+            continue
+        with open(archivo, encoding="utf-8") as lineas:
+            for linea in lineas:
+                try:
+                    resultado.append(json.loads(linea))
+                except json.JSONDecodeError:
+                    continue  # Línea incompleta por escrituras simultáneas de los workers
+    return resultado
+
+
+def top_consultas_lentas(limite: int = 10) -> list[dict]:
+    """Sentencias que suman más tiempo, con las veces, los tiempos, las rutas y los datos de la más lenta"""
+    sentencias = {}
+    for registro in leer_registros():
+        resumen = sentencias.get(registro["sentencia"])
+        if resumen is None:
+            resumen = sentencias[registro["sentencia"]] = {"sentencia": registro["sentencia"], "cantidad": 0, "total_ms": 0.0, "maximo_ms": 0.0, "rutas": set(), "ultima": registro["fecha"]}
+        resumen["cantidad"] += 1
+        resumen["total_ms"] += registro["duracion_ms"]
+        resumen["ultima"] = max(resumen["ultima"], registro["fecha"])
+        if registro["ruta"]:
+            resumen["rutas"].add(registro["ruta"])
+        if registro["duracion_ms"] >= resumen["maximo_ms"]:
+            resumen.update(maximo_ms=registro["duracion_ms"], parametros=registro["parametros"], plan=registro["plan"])
+    top = sorted(sentencias.values(), key=lambda resumen: resumen["total_ms"], reverse=True)[:limite]
+    for resumen in top:
+        resumen["total_ms"] = round(resumen["total_ms"], 1)
+        resumen["promedio_ms"] = round(resumen["total_ms"] / resumen["cantidad"], 1)
+        resumen["rutas"] = sorted(resumen["rutas"])
+    return top
@@ -0,0 +1,101 @@
+"""
+Búsqueda por trigramas
+
+Los nombres se buscan en la forma mayúscula y sin acentos que entrega safe_string,
+la misma con la que se guardan, así un índice GIN de pg_trgm sobre la columna
+sirve para el LIKE '%TEXTO%' sin recorrer toda la tabla.
+
+Con el modo similar se entregan los parecidos aunque tengan errores de escritura,
+con el operador <<% de strict_word_similarity que también usa el índice,
+ordenados del más parecido al menos.
+
+Los índices se crean con create_all por medio del evento after_create de la tabla,
+para la base de datos de producción están los archivos de la carpeta migrations.
+
+En SQLite, para las pruebas locales, strict_word_similarity y clave_fonetica
+se agregan a las conexiones con register_sqlite_functions.
+
+Uso:
+
+    ejemplos_trigramas = TrigramSearch(Ejemplo.__table__, "nombre")
+
+    nombre = safe_string(nombre)
+    consulta, rango = ejemplos_trigramas.search(consulta, Ejemplo.nombre, nombre, modo, db.get_bind().dialect.name)
+
+"""
+import re
+from typing import Literal, Optional
+
+from sqlalchemy import DDL, Engine, Table, event, func, literal
+from sqlalchemy.orm import InstrumentedAttribute, Query
+from sqlalchemy.sql import ColumnElement
+
+from .phonetic_search import clave_fonetica
+
+# El modo fonetico se hace con lib/phonetic_search.py
+ModoBusqueda = Literal["contiene", "similar", "fonetico"]
+
+# Por defecto de pg_trgm.strict_word_similarity_threshold
+STRICT_WORD_SIMILARITY_THRESHOLD = 0.5
+PALABRA_REGEXP = re.compile(r"[0-9a-z]+")
+
+
+class TrigramSearch:
+    """Índices GIN de trigramas para buscar en las columnas de una tabla"""
+
+    def __init__(self, table: Table, *columnas: str):
+        self.table = table
+        self.columnas = columnas
+        for sentencia in self.postgresql_ddl():
+            event.listen(table, "after_create", DDL(sentencia).execute_if(dialect="postgresql"))
+
+    def postgresql_ddl(self, concurrently: bool = False) -> list[str]:
+        """Sentencias para agregar la extensión pg_trgm y los índices GIN de las columnas"""
+        indice = "CREATE INDEX CONCURRENTLY" if concurrently else "CREATE INDEX"
+        sentencias = ["CREATE EXTENSION IF NOT EXISTS pg_trgm"]
+        for columna in self.columnas:
+            sentencias.append(f"{indice} IF NOT EXISTS {self.table.name}_{columna}_trgm_idx ON {self.table.name} USING gin ({columna} gin_trgm_ops)")
+        return sentencias
+
+    def search(self, consulta: Query, columna: InstrumentedAttribute, texto: str, modo: ModoBusqueda, dialect_name: str) -> tuple[Query, Optional[ColumnElement]]:
+        """Filtrar la consulta con el texto ya limpio, entrega la consulta y el rango (mayor es mejor) con el modo similar"""
+        if modo == "similar":
+            rango = func.strict_word_similarity(texto, columna)
+            if dialect_name == "postgresql":
+                return consulta.filter(literal(texto).op("<<%")(columna)), rango
+            return consulta.filter(rango >= STRICT_WORD_SIMILARITY_THRESHOLD), rango
+        return consulta.filter(columna.like(f"%{texto}%")), None
+
+
+def trigramas(texto: str) -> set[str]:
+    """Trigramas de las palabras como los obtiene pg_trgm, con dos espacios antes y uno después"""
+    resultado = set()
+    for palabra in PALABRA_REGEXP.findall(texto.lower()):
+        palabra = f"  {palabra} "
+        resultado.update(palabra[inicio : inicio + 3] for inicio in range(len(palabra) - 2))
+    return resultado
+
+
+def strict_word_similarity(texto: Optional[str], valor: Optional[str]) -> float:
+    """Mayor similitud entre los trigramas del texto y los de las palabras seguidas del valor"""
+    if texto is None or valor is None:
+        return 0.0
+    buscados = trigramas(texto)
+    palabras = valor.split()
+    mejor = 0.0
+    for inicio in range(len(palabras)):
+        for fin in range(inicio + 1, len(palabras) + 1):
+            extension = trigramas(" ".join(palabras[inicio:fin]))
+            if buscados or extension:
+                mejor = max(mejor, len(buscados & extension) / len(buscados | extension))
+    return mejor
+
+
+def register_sqlite_functions(engine: Engine) -> None:
+    """Agregar strict_word_similarity y clave_fonetica a las conexiones SQLite del engine"""
+
+    def _on_connect(dbapi_connection, connection_record):
+        dbapi_connection.create_function("strict_word_similarity", 2, strict_word_similarity, deterministic=True)
+        dbapi_connection.create_function("clave_fonetica", 1, clave_fonetica, deterministic=True)
+
+    event.listen(engine, "connect", _on_connect)
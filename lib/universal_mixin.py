@@ -1,16 +1,14 @@
 """
 UniversalMixin define las columnas y métodos comunes de todos los modelos
 """
-import re
+from typing import Iterable, Optional
 
-from hashids import Hashids
 from sqlalchemy import Column, DateTime, String
 from sqlalchemy.sql import func
 
 from config.settings import get_settings
 
-settings = get_settings()
-hashids = Hashids(salt=settings.salt, min_length=8)
+from .hashids import HASHID_REGEXP, decode_many, encode_many, get_hashids
 
 
 class UniversalMixin:
@@ -22,15 +20,25 @@ class UniversalMixin:
 
     def encode_id(self):
         """Convertir el ID de entero a cadena"""
-        return hashids.encode(self.id)
+        return get_hashids(get_settings().salt).encode(self.id)
 
     @classmethod
     def decode_id(cls, id_encoded: str):
         """Convertir el ID de entero a cadena"""
-        if re.fullmatch(r"[0-9a-zA-Z]{8,16}", id_encoded) is None:
+        if HASHID_REGEXP.fullmatch(id_encoded) is None:
             return None
-        descifrado = hashids.decode(id_encoded)
+        descifrado = get_hashids(get_settings().salt).decode(id_encoded)
         try:
             return descifrado[0]
         except IndexError:
             return None
+
+    @classmethod
+    def encode_ids(cls, registros: Iterable["UniversalMixin"]) -> list[str]:
+        """Convertir los ID de varios registros de entero a cadena"""
+        return encode_many(registro.id for registro in registros)
+
+    @classmethod
+    def decode_ids(cls, ids_encoded: Iterable[str]) -> list[Optional[int]]:
+        """Convertir varios ID de cadena a entero, None en los que no son válidos"""
+        return decode_many(ids_encoded)
@@ -0,0 +1,13 @@
+-- Búsqueda de texto completo en tesis_jurisprudencias
+--
+-- Columna tsvector generada con la configuración spanish y su índice GIN,
+-- la usa el parámetro q de /v3/tesis_jurisprudencias.
+-- El índice se crea con CONCURRENTLY, ejecute este archivo fuera de una transacción:
+--
+--     psql -h DB_HOST -U DB_USER -d DB_NAME -f migrations/001_tesis_jurisprudencias_busqueda.sql
+--
+-- Agregar la columna reescribe la tabla, hágalo en un horario de poco uso.
+
+ALTER TABLE tesis_jurisprudencias ADD COLUMN IF NOT EXISTS busqueda tsvector GENERATED ALWAYS AS (setweight(to_tsvector('spanish', coalesce(rubro, '')), 'A') || setweight(to_tsvector('spanish', coalesce(titulo, '')), 'B') || setweight(to_tsvector('spanish', coalesce(subtitulo, '')), 'B') || setweight(to_tsvector('spanish', coalesce(texto, '')), 'C') || setweight(to_tsvector('spanish', coalesce(precedentes, '')), 'D')) STORED;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS tesis_jurisprudencias_busqueda_idx ON tesis_jurisprudencias USING gin (busqueda);
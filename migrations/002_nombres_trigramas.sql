@@ -0,0 +1,28 @@
+-- Índices de trigramas para buscar por nombre
+--
+-- Índices GIN de pg_trgm en los nombres de redam, repsvm_agresores, peritos y abogados,
+-- y en los nombres, apellidos y email de usuarios. Los usan el parámetro nombre
+-- (LIKE '%NOMBRE%') y el modo similar (operador <<%) de esos listados.
+-- Los índices se crean con CONCURRENTLY, ejecute este archivo fuera de una transacción:
+--
+--     psql -h DB_HOST -U DB_USER -d DB_NAME -f migrations/002_nombres_trigramas.sql
+--
+-- Crear la extensión pg_trgm requiere un usuario con permiso CREATE en la base de datos.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS redam_nombre_trgm_idx ON redam USING gin (nombre gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS repsvm_agresores_nombre_trgm_idx ON repsvm_agresores USING gin (nombre gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS peritos_nombre_trgm_idx ON peritos USING gin (nombre gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS abogados_nombre_trgm_idx ON abogados USING gin (nombre gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS usuarios_nombres_trgm_idx ON usuarios USING gin (nombres gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS usuarios_apellido_paterno_trgm_idx ON usuarios USING gin (apellido_paterno gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS usuarios_apellido_materno_trgm_idx ON usuarios USING gin (apellido_materno gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS usuarios_email_trgm_idx ON usuarios USING gin (email gin_trgm_ops);
@@ -0,0 +1,30 @@
+-- Claves fonéticas de los nombres
+--
+-- Función clave_fonetica, generada con las reglas de lib/phonetic_search.py,
+-- y columnas nombre_fonetico generadas en redam, repsvm_agresores, peritos y abogados
+-- con índices btree text_pattern_ops para buscar por el inicio de la clave (LIKE 'CLAVE%').
+-- Las usa modo=fonetico de esos listados.
+-- Los índices se crean con CONCURRENTLY, ejecute este archivo fuera de una transacción:
+--
+--     psql -h DB_HOST -U DB_USER -d DB_NAME -f migrations/003_nombres_fonetica.sql
+--
+-- Si cambian las reglas, borre las columnas nombre_fonetico y ejecute de nuevo este archivo
+-- para que se calculen otra vez con la nueva función.
+
+CREATE OR REPLACE FUNCTION clave_fonetica(texto text) RETURNS text LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE AS $$ SELECT btrim(regexp_replace(regexp_replace(regexp_replace(regexp_replace(regexp_replace(regexp_replace(regexp_replace(regexp_replace(regexp_replace(regexp_replace(regexp_replace(regexp_replace(regexp_replace(regexp_replace(regexp_replace(regexp_replace(upper(regexp_replace(translate(texto, 'áàâäãéèêëíìîïóòôöõúùûüñçÁÀÂÄÃÉÈÊËÍÌÎÏÓÒÔÖÕÚÙÛÜÑÇ', 'aaaaaeeeeiiiiooooouuuuncAAAAAEEEEIIIIOOOOOUUUUNC'), '[^A-Za-z ]', '', 'g')), 'PH', 'F', 'g'), 'X', 'KS', 'g'), 'CH', 'X', 'g'), 'QU', 'K', 'g'), 'G([EI])', 'J\1', 'g'), 'GU([EI])', 'G\1', 'g'), 'C([EI])', 'S\1', 'g'), '[CQ]', 'K', 'g'), 'Z', 'S', 'g'), 'V', 'B', 'g'), 'W', 'U', 'g'), 'H', '', 'g'), 'LL', 'I', 'g'), 'Y', 'I', 'g'), '(.)\1+', '\1', 'g'), ' +', ' ', 'g')) $$;
+
+ALTER TABLE redam ADD COLUMN IF NOT EXISTS nombre_fonetico text GENERATED ALWAYS AS (clave_fonetica(nombre)) STORED;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS redam_nombre_fonetico_idx ON redam (nombre_fonetico text_pattern_ops);
+
+ALTER TABLE repsvm_agresores ADD COLUMN IF NOT EXISTS nombre_fonetico text GENERATED ALWAYS AS (clave_fonetica(nombre)) STORED;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS repsvm_agresores_nombre_fonetico_idx ON repsvm_agresores (nombre_fonetico text_pattern_ops);
+
+ALTER TABLE peritos ADD COLUMN IF NOT EXISTS nombre_fonetico text GENERATED ALWAYS AS (clave_fonetica(nombre)) STORED;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS peritos_nombre_fonetico_idx ON peritos (nombre_fonetico text_pattern_ops);
+
+ALTER TABLE abogados ADD COLUMN IF NOT EXISTS nombre_fonetico text GENERATED ALWAYS AS (clave_fonetica(nombre)) STORED;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS abogados_nombre_fonetico_idx ON abogados (nombre_fonetico text_pattern_ops);
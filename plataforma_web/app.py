@@ -1,12 +1,22 @@
 """
 PJECZ Plataforma Web API Key
 """
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from typing import Annotated
+
+from fastapi import Depends, FastAPI, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi_pagination import add_pagination
 
 from config.settings import get_settings
+from lib.database import dispose_async_engine, dispose_engine, get_engine, get_pool_status
+from lib.fastapi_metrics import MetricsMiddleware, metrics_response
+from lib.fastapi_orjson_response import CustomORJSONResponse
+from lib.fastapi_pagination_custom_cursor_page import add_cursor_pagination
+from lib.fastapi_server_timing import ServerTimingMiddleware, configure_request_log
+from lib.slow_query_log import configure_slow_query_log
 
+from .core.permisos.models import Permiso
 from .v3.abogados.paths import abogados
 from .v3.arc_documentos.paths import arc_documentos
 from .v3.arc_juzgados_extintos.paths import arc_juzgados_extintos
@@ -19,6 +29,7 @@ from .v3.bitacoras.paths import bitacoras
 from .v3.boletines.paths import boletines
 from .v3.centros_trabajos.paths import centros_trabajos
 from .v3.cit_dias_inhabiles.paths import cit_dias_inhabiles
+from .v3.consultas_lentas.paths import consultas_lentas
 from .v3.distritos.paths import distritos
 from .v3.domicilios.paths import domicilios
 from .v3.edictos.paths import edictos
@@ -43,6 +54,7 @@ from .v3.peritos_tipos.paths import peritos_tipos
 from .v3.permisos.paths import permisos
 from .v3.redam.paths import redam
 from .v3.repsvm_agresores.paths import repsvm_agresores
+from .v3.respuestas_cache.paths import respuestas_cache
 from .v3.roles.paths import roles
 from .v3.sentencias.paths import sentencias
 from .v3.siga_bitacoras.paths import siga_bitacoras
@@ -50,10 +62,20 @@ from .v3.siga_grabaciones.paths import siga_grabaciones
 from .v3.siga_salas.paths import siga_salas
 from .v3.tesis_jurisprudencias.paths import tesis_jurisprudencias
 from .v3.ubicaciones_expedientes.paths import ubicaciones_expedientes
+from .v3.usuarios.authentications import UsuarioInDB, get_current_active_user
 from .v3.usuarios.paths import usuarios
 from .v3.usuarios_roles.paths import usuarios_roles
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Al arrancar el worker crea el engine y al apagarse libera los pools de conexiones"""
+    get_engine()
+    yield
+    dispose_engine()
+    await dispose_async_engine()
+
+
 def create_app() -> FastAPI:
     """Crea la aplicación FastAPI"""
 
@@ -63,6 +85,8 @@ def create_app() -> FastAPI:
         description="Bienvenido a PJECZ Plataforma Web API Key. Esta API es para trabajar con los datos de Plataforma Web. Se requiere tener una api-key para usarse.",
         docs_url="/docs",
         redoc_url=None,
+        default_response_class=CustomORJSONResponse,
+        lifespan=lifespan,
     )
 
     # CORSMiddleware
@@ -75,6 +99,18 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # MetricsMiddleware, la latencia por router y las peticiones en curso para /metrics
+    app.add_middleware(MetricsMiddleware)
+
+    # ServerTimingMiddleware, al final para que envuelva a los demás y mida toda la petición
+    app.add_middleware(ServerTimingMiddleware)
+    if settings.request_log:
+        configure_request_log()
+
+    # Bitácora de consultas lentas en un archivo que rota
+    if settings.slow_query_log_file:
+        configure_slow_query_log(settings.slow_query_log_file)
+
     # Rutas
     app.include_router(abogados)
     app.include_router(arc_documentos)
@@ -87,6 +123,7 @@ def create_app() -> FastAPI:
     app.include_router(bitacoras)
     app.include_router(boletines)
     app.include_router(centros_trabajos)
+    app.include_router(consultas_lentas)
     app.include_router(cit_dias_inhabiles)
     app.include_router(distritos)
     app.include_router(domicilios)
@@ -112,6 +149,7 @@ def create_app() -> FastAPI:
     app.include_router(permisos)
     app.include_router(redam)
     app.include_router(repsvm_agresores)
+    app.include_router(respuestas_cache)
     app.include_router(roles)
     app.include_router(sentencias)
     app.include_router(siga_bitacoras)
@@ -122,7 +160,8 @@ def create_app() -> FastAPI:
     app.include_router(usuarios_roles)
     app.include_router(ubicaciones_expedientes)
 
-    # Paginación
+    # Paginación, cada listado tiene su version por cursor en /cursor
+    add_cursor_pagination(app)
     add_pagination(app)
 
     # Mensaje de Bienvenida
@@ -131,5 +170,21 @@ def create_app() -> FastAPI:
         """Mensaje de Bienvenida"""
         return {"message": "Bienvenido a PJECZ Plataforma Web API Key. Esta API es para trabajar con los datos de Plataforma Web. Se requiere tener una api-key para usarse."}
 
+    # Estado del pool de conexiones a la base de datos, requiere ADMINISTRAR en bitacoras como /v3/consultas_lentas
+    @app.get("/pool")
+    async def pool(current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)]):
+        """Estado del pool de conexiones a la base de datos de este worker"""
+        if current_user.permissions.get("BITACORAS", 0) < Permiso.ADMINISTRAR:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
+        return get_pool_status()
+
+    # Métricas de Prometheus, de todos los workers si está definido PROMETHEUS_MULTIPROC_DIR, requiere ADMINISTRAR en bitacoras
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics(current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)]):
+        """Métricas de Prometheus"""
+        if current_user.permissions.get("BITACORAS", 0) < Permiso.ADMINISTRAR:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
+        return metrics_response()
+
     # Entregar
     return app
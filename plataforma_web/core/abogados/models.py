@@ -4,6 +4,8 @@ Abogados, modelos
 from sqlalchemy import Column, Date, Integer, String
 
 from lib.database import Base
+from lib.phonetic_search import PhoneticSearch
+from lib.trigram_search import TrigramSearch
 from lib.universal_mixin import UniversalMixin
 
 
@@ -25,3 +27,10 @@ class Abogado(Base, UniversalMixin):
     def __repr__(self):
         """Representación"""
         return f"<Abogado {self.id}>"
+
+
+# Búsqueda por trigramas en el nombre
+abogados_trigramas = TrigramSearch(Abogado.__table__, "nombre")
+
+# Búsqueda fonética en el nombre
+abogados_fonetica = PhoneticSearch(Abogado.__table__, "nombre")
@@ -5,6 +5,8 @@ from sqlalchemy import Column, ForeignKey, Integer, String
 from sqlalchemy.orm import relationship
 
 from lib.database import Base
+from lib.phonetic_search import PhoneticSearch
+from lib.trigram_search import TrigramSearch
 from lib.universal_mixin import UniversalMixin
 
 
@@ -54,3 +56,10 @@ class Perito(Base, UniversalMixin):
     def __repr__(self):
         """Representación"""
         return f"<Perito {self.id}>"
+
+
+# Búsqueda por trigramas en el nombre
+peritos_trigramas = TrigramSearch(Perito.__table__, "nombre")
+
+# Búsqueda fonética en el nombre
+peritos_fonetica = PhoneticSearch(Perito.__table__, "nombre")
@@ -5,6 +5,8 @@ from sqlalchemy import Column, Date, ForeignKey, Integer, String
 from sqlalchemy.orm import relationship
 
 from lib.database import Base
+from lib.phonetic_search import PhoneticSearch
+from lib.trigram_search import TrigramSearch
 from lib.universal_mixin import UniversalMixin
 
 
@@ -65,3 +67,10 @@ class Redam(Base, UniversalMixin):
     def __repr__(self):
         """Representación"""
         return f"<Redam {self.id}>"
+
+
+# Búsqueda por trigramas en el nombre
+redam_trigramas = TrigramSearch(Redam.__table__, "nombre")
+
+# Búsqueda fonética en el nombre
+redam_fonetica = PhoneticSearch(Redam.__table__, "nombre")
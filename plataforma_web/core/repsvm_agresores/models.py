@@ -7,6 +7,8 @@ from sqlalchemy import Boolean, Column, Enum, ForeignKey, Integer, String, Text
 from sqlalchemy.orm import relationship
 
 from lib.database import Base
+from lib.phonetic_search import PhoneticSearch
+from lib.trigram_search import TrigramSearch
 from lib.universal_mixin import UniversalMixin
 
 
@@ -71,3 +73,10 @@ class RepsvmAgresor(Base, UniversalMixin):
     def __repr__(self):
         """Representación"""
         return f"<RepsvmAgresor {self.id}>"
+
+
+# Búsqueda por trigramas en el nombre
+repsvm_agresores_trigramas = TrigramSearch(RepsvmAgresor.__table__, "nombre")
+
+# Búsqueda fonética en el nombre
+repsvm_agresores_fonetica = PhoneticSearch(RepsvmAgresor.__table__, "nombre")
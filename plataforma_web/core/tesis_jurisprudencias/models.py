@@ -4,9 +4,10 @@ Tesis Jurisprudencias, modelos
 from collections import OrderedDict
 
 from sqlalchemy import Column, Date, DateTime, Enum, ForeignKey, Integer, String, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import query_expression, relationship
 
 from lib.database import Base
+from lib.full_text_search import FullTextSearch
 from lib.universal_mixin import UniversalMixin
 
 
@@ -67,6 +68,10 @@ class TesisJurisprudencia(Base, UniversalMixin):
     publicacion_tiempo = Column(DateTime(), nullable=False)
     aplicacion_tiempo = Column(DateTime(), nullable=False)
 
+    # Rango y fragmento de la búsqueda de texto completo, sólo se cargan al buscar
+    busqueda_rango = query_expression()
+    busqueda_fragmento = query_expression()
+
     @property
     def distrito_id(self):
         """Distrito ID"""
@@ -120,3 +125,11 @@ class TesisJurisprudencia(Base, UniversalMixin):
     def __repr__(self):
         """Representación"""
         return f"<TesisJurisprudencia {self.id}>"
+
+
+# Búsqueda de texto completo en el rubro, el título, el texto y los precedentes
+tesis_jurisprudencias_busqueda = FullTextSearch(
+    TesisJurisprudencia.__table__,
+    {"rubro": "A", "titulo": "B", "subtitulo": "B", "texto": "C", "precedentes": "D"},
+    fragmento="texto",
+)
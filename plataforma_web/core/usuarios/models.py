@@ -3,13 +3,16 @@ Usuarios, modelos
 """
 from collections import OrderedDict
 
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, Integer, String
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, Integer, String, func, select
+from sqlalchemy.orm import Session, object_session, relationship
 
 from lib.database import Base
+from lib.trigram_search import TrigramSearch
 from lib.universal_mixin import UniversalMixin
 
+from ..modulos.models import Modulo
 from ..permisos.models import Permiso
+from ..usuarios_roles.models import UsuarioRol
 
 
 class Usuario(Base, UniversalMixin):
@@ -64,9 +67,25 @@ class Usuario(Base, UniversalMixin):
     inv_custodias = relationship("InvCustodia", back_populates="usuario")
     usuarios_roles = relationship("UsuarioRol", back_populates="usuario")
 
-    # Propiedades
-    permisos_consultados = {}
+    # Permisos consultados, se guardan en cada instancia
+    permisos_consultados = None
+
+    @staticmethod
+    def query_permissions(database: Session, usuario_id: int) -> dict:
+        """Consultar en una sola instrucción el nivel máximo de permiso por módulo"""
+        consulta = (
+            select(Modulo.nombre, func.max(Permiso.nivel))
+            .select_from(UsuarioRol)
+            .join(Permiso, Permiso.rol_id == UsuarioRol.rol_id)
+            .join(Modulo, Modulo.id == Permiso.modulo_id)
+            .where(UsuarioRol.usuario_id == usuario_id)
+            .where(UsuarioRol.estatus == "A")
+            .where(Permiso.estatus == "A")
+            .group_by(Modulo.nombre)
+        )
+        return {modulo_nombre: nivel for modulo_nombre, nivel in database.execute(consulta)}
 
+    # Propiedades
     @property
     def nombre(self):
         """Junta nombres, apellido_paterno y apellido materno"""
@@ -115,22 +134,14 @@ class Usuario(Base, UniversalMixin):
     @property
     def permissions(self):
         """Entrega un diccionario con todos los permisos"""
-        if len(self.permisos_consultados) > 0:
-            return self.permisos_consultados
-        self.permisos_consultados = {}
-        for usuario_rol in self.usuarios_roles:
-            if usuario_rol.estatus == "A":
-                for permiso in usuario_rol.rol.permisos:
-                    if permiso.estatus == "A":
-                        etiqueta = permiso.modulo.nombre
-                        if etiqueta not in self.permisos_consultados or permiso.nivel > self.permisos_consultados[etiqueta]:
-                            self.permisos_consultados[etiqueta] = permiso.nivel
+        if self.permisos_consultados is None:
+            self.permisos_consultados = self.query_permissions(object_session(self), self.id)
         return self.permisos_consultados
 
     def can(self, modulo_nombre: str, permission: int):
         """¿Tiene permiso?"""
-        if modulo_nombre in self.permisos:
-            return self.permisos[modulo_nombre] >= permission
+        if modulo_nombre in self.permissions:
+            return self.permissions[modulo_nombre] >= permission
         return False
 
     def can_view(self, modulo_nombre: str):
@@ -152,3 +163,7 @@ class Usuario(Base, UniversalMixin):
     def __repr__(self):
         """Representación"""
         return f"<Usuario {self.email}>"
+
+
+# Búsqueda por trigramas en los nombres, apellidos y email
+usuarios_trigramas = TrigramSearch(Usuario.__table__, "nombres", "apellido_paterno", "apellido_materno", "email")
@@ -6,10 +6,12 @@ from typing import Any
 
 from sqlalchemy.orm import Session
 
+from lib.database import async_variant
 from lib.exceptions import MyIsDeletedError, MyNotExistsError, MyNotValidParamError
 from lib.safe_string import safe_string
+from lib.trigram_search import ModoBusqueda
 
-from ...core.abogados.models import Abogado
+from ...core.abogados.models import Abogado, abogados_fonetica, abogados_trigramas
 
 
 def get_abogados(
@@ -17,8 +19,10 @@ def get_abogados(
     nombre: str = None,
     anio_desde: int = None,
     anio_hasta: int = None,
+    modo: ModoBusqueda = "contiene",
 ) -> Any:
     """Consultar los abogados activos"""
+    rango = None
     consulta = db.query(Abogado)
     if anio_desde is not None:
         if 1925 <= anio_desde <= datetime.now().year:
@@ -34,8 +38,17 @@ def get_abogados(
         nombre = safe_string(nombre)
         if nombre == "":
             raise MyNotValidParamError("El nombre es incorrecto.")
-        consulta = consulta.filter(Abogado.nombre.contains(nombre))
-    return consulta.filter_by(estatus="A").order_by(Abogado.id)
+        if modo == "fonetico":
+            consulta = abogados_fonetica.search(consulta, nombre)
+        else:
+            consulta, rango = abogados_trigramas.search(consulta, Abogado.nombre, nombre, modo, db.get_bind().dialect.name)
+    consulta = consulta.filter_by(estatus="A")
+    if rango is not None:
+        return consulta.order_by(rango.desc(), Abogado.id)
+    return consulta.order_by(Abogado.id)
+
+
+get_abogados_async = async_variant(get_abogados)
 
 
 def get_abogado(db: Session, abogado_id: int) -> Abogado:
@@ -3,17 +3,19 @@ Abogados v3, rutas (paths)
 """
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_pagination.ext.sqlalchemy import paginate
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from lib.database import Session, get_db
+from lib.database import AsyncSession, Session, get_async_db, get_db
 from lib.exceptions import MyAnyError
+from lib.fastapi_conditional import detail_response
 from lib.fastapi_pagination_custom_page import CustomPage
+from lib.fastapi_pagination_custom_paginate import paginate_async
+from lib.trigram_search import ModoBusqueda
 
 from ...core.abogados.models import Abogado
 from ...core.permisos.models import Permiso
 from ..usuarios.authentications import UsuarioInDB, get_current_active_user
-from .crud import create_abogado, delete_abogado, get_abogado, get_abogados, update_abogado
+from .crud import create_abogado, delete_abogado, get_abogado, get_abogados_async, update_abogado
 from .schemas import AbogadoIn, AbogadoOut, OneAbogadoOut
 
 abogados = APIRouter(prefix="/v3/abogados", tags=["abogados"])
@@ -22,8 +24,9 @@ abogados = APIRouter(prefix="/v3/abogados", tags=["abogados"])
 @abogados.get("", response_model=CustomPage[AbogadoOut])
 async def listado_abogados(
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
-    database: Annotated[Session, Depends(get_db)],
+    database: Annotated[AsyncSession, Depends(get_async_db)],
     nombre: str = None,
+    modo: ModoBusqueda = "contiene",
     anio_desde: int = None,
     anio_hasta: int = None,
 ):
@@ -31,19 +34,21 @@ async def listado_abogados(
     if current_user.permissions.get("ABOGADOS", 0) < Permiso.VER:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     try:
-        resultados = get_abogados(
+        resultados = await get_abogados_async(
             db=database,
             nombre=nombre,
+            modo=modo,
             anio_desde=anio_desde,
             anio_hasta=anio_hasta,
         )
     except MyAnyError as error:
         return CustomPage(success=False, message=str(error))
-    return paginate(resultados)
+    return await paginate_async(database, resultados)
 
 
 @abogados.get("/{abogado_id}", response_model=OneAbogadoOut)
 async def detalle_abogado(
+    request: Request,
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
     database: Annotated[Session, Depends(get_db)],
     abogado_id: int,
@@ -55,7 +60,7 @@ async def detalle_abogado(
         abogado = get_abogado(database, abogado_id)
     except MyAnyError as error:
         return OneAbogadoOut(success=False, message=str(error))
-    return OneAbogadoOut.from_orm(abogado)
+    return detail_response(request, abogado, OneAbogadoOut)
 
 
 @abogados.post("", response_model=OneAbogadoOut)
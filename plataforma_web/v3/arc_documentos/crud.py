@@ -3,15 +3,15 @@ Archivo - Documentos v3, CRUD (create, read, update, and delete)
 """
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
+from lib.database import async_variant
 from lib.exceptions import MyIsDeletedError, MyNotExistsError, MyNotValidParamError
 from lib.safe_string import safe_string
 
 from ...core.arc_documentos.models import ArcDocumento
 from ...core.autoridades.models import Autoridad
-from ..autoridades.crud import get_autoridad, get_autoridad_with_clave
-from ..distritos.crud import get_distrito, get_distrito_with_clave
+from ..catalogos import catalogo_autoridades, catalogo_distritos
 
 
 def get_arc_documentos(
@@ -23,18 +23,18 @@ def get_arc_documentos(
     ubicacion: str = None,
 ) -> Any:
     """Consultar los documentos activos"""
-    consulta = db.query(ArcDocumento)
+    consulta = db.query(ArcDocumento).options(joinedload(ArcDocumento.autoridad).joinedload(Autoridad.distrito), joinedload(ArcDocumento.arc_juzgado_origen))
     if autoridad_id is not None:
-        autoridad = get_autoridad(db, autoridad_id)
+        autoridad = catalogo_autoridades.get(db, autoridad_id)
         consulta = consulta.filter_by(autoridad_id=autoridad.id)
     elif autoridad_clave is not None:
-        autoridad = get_autoridad_with_clave(db, autoridad_clave)
+        autoridad = catalogo_autoridades.get_with_clave(db, autoridad_clave)
         consulta = consulta.filter_by(autoridad_id=autoridad.id)
     elif distrito_id is not None:
-        distrito = get_distrito(db, distrito_id)
+        distrito = catalogo_distritos.get(db, distrito_id)
         consulta = consulta.join(Autoridad).filter(Autoridad.distrito_id == distrito.id)
     elif distrito_clave is not None:
-        distrito = get_distrito_with_clave(db, distrito_clave)
+        distrito = catalogo_distritos.get_with_clave(db, distrito_clave)
         consulta = consulta.join(Autoridad).filter(Autoridad.distrito_id == distrito.id)
     if ubicacion is not None:
         ubicacion = safe_string(ubicacion)
@@ -45,6 +45,9 @@ def get_arc_documentos(
     return consulta.filter_by(estatus="A").order_by(ArcDocumento.id)
 
 
+get_arc_documentos_async = async_variant(get_arc_documentos)
+
+
 def get_arc_documento(db: Session, arc_documento_id: int) -> ArcDocumento:
     """Consultar un documento por su id"""
     arc_documento = db.query(ArcDocumento).get(arc_documento_id)
@@ -5,6 +5,7 @@ from typing import Any
 
 from sqlalchemy.orm import Session
 
+from lib.database import async_variant
 from lib.exceptions import MyIsDeletedError, MyNotExistsError
 
 from ...core.arc_juzgados_extintos.models import ArcJuzgadoExtinto
@@ -15,6 +16,9 @@ def get_arc_juzgados_extintos(db: Session) -> Any:
     return db.query(ArcJuzgadoExtinto).filter_by(estatus="A").order_by(ArcJuzgadoExtinto.id)
 
 
+get_arc_juzgados_extintos_async = async_variant(get_arc_juzgados_extintos)
+
+
 def get_arc_juzgado_extinto(db: Session, arc_juzgado_extinto_id: int) -> ArcJuzgadoExtinto:
     """Consultar un juzgado extinto por su id"""
     arc_juzgado_extinto = db.query(ArcJuzgadoExtinto).get(arc_juzgado_extinto_id)
@@ -3,15 +3,15 @@ Archivo - Remesas v3, CRUD (create, read, update, and delete)
 """
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
+from lib.database import async_variant
 from lib.exceptions import MyIsDeletedError, MyNotExistsError, MyNotValidParamError
 from lib.safe_string import safe_string
 
 from ...core.arc_remesas.models import ArcRemesa
 from ...core.autoridades.models import Autoridad
-from ..autoridades.crud import get_autoridad, get_autoridad_with_clave
-from ..distritos.crud import get_distrito, get_distrito_with_clave
+from ..catalogos import catalogo_autoridades, catalogo_distritos
 
 
 def get_arc_remesas(
@@ -23,18 +23,18 @@ def get_arc_remesas(
     estado: str = None,
 ) -> Any:
     """Consultar las remesas activas"""
-    consulta = db.query(ArcRemesa)
+    consulta = db.query(ArcRemesa).options(joinedload(ArcRemesa.autoridad).joinedload(Autoridad.distrito), joinedload(ArcRemesa.usuario_asignado))
     if autoridad_id is not None:
-        autoridad = get_autoridad(db, autoridad_id)
+        autoridad = catalogo_autoridades.get(db, autoridad_id)
         consulta = consulta.filter_by(autoridad_id=autoridad.id)
     elif autoridad_clave is not None:
-        autoridad = get_autoridad_with_clave(db, autoridad_clave)
+        autoridad = catalogo_autoridades.get_with_clave(db, autoridad_clave)
         consulta = consulta.filter_by(autoridad_id=autoridad.id)
     elif distrito_id is not None:
-        distrito = get_distrito(db, distrito_id)
+        distrito = catalogo_distritos.get(db, distrito_id)
         consulta = consulta.join(Autoridad).filter(Autoridad.distrito_id == distrito.id)
     elif distrito_clave is not None:
-        distrito = get_distrito_with_clave(db, distrito_clave)
+        distrito = catalogo_distritos.get_with_clave(db, distrito_clave)
         consulta = consulta.join(Autoridad).filter(Autoridad.distrito_id == distrito.id)
     if estado is not None:
         estado = safe_string(estado)
@@ -45,6 +45,9 @@ def get_arc_remesas(
     return consulta.filter_by(estatus="A").order_by(ArcRemesa.id)
 
 
+get_arc_remesas_async = async_variant(get_arc_remesas)
+
+
 def get_arc_remesa(db: Session, arc_remesa_id: int) -> ArcRemesa:
     """Consultar una remesa por su id"""
     arc_remesa = db.query(ArcRemesa).get(arc_remesa_id)
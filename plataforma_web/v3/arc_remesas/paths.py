@@ -3,16 +3,17 @@ Archivo - Remesas v3, rutas (paths)
 """
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_pagination.ext.sqlalchemy import paginate
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from lib.database import Session, get_db
+from lib.database import AsyncSession, Session, get_async_db, get_db
 from lib.exceptions import MyAnyError
+from lib.fastapi_conditional import detail_response
 from lib.fastapi_pagination_custom_page import CustomPage
+from lib.fastapi_pagination_custom_paginate import paginate_async
 
 from ...core.permisos.models import Permiso
 from ..usuarios.authentications import UsuarioInDB, get_current_active_user
-from .crud import get_arc_remesa, get_arc_remesas
+from .crud import get_arc_remesa, get_arc_remesas_async
 from .schemas import ArcRemesaOut, OneArcRemesaOut
 
 arc_remesas = APIRouter(prefix="/v3/arc_remesas", tags=["archivo"])
@@ -21,7 +22,7 @@ arc_remesas = APIRouter(prefix="/v3/arc_remesas", tags=["archivo"])
 @arc_remesas.get("", response_model=CustomPage[ArcRemesaOut])
 async def listado_arc_remesas(
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     autoridad_id: int = None,
     autoridad_clave: str = None,
     distrito_id: int = None,
@@ -32,7 +33,7 @@ async def listado_arc_remesas(
     if current_user.permissions.get("ARC REMESAS", 0) < Permiso.VER:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     try:
-        resultados = get_arc_remesas(
+        resultados = await get_arc_remesas_async(
             db=db,
             autoridad_id=autoridad_id,
             autoridad_clave=autoridad_clave,
@@ -42,11 +43,12 @@ async def listado_arc_remesas(
         )
     except MyAnyError as error:
         return CustomPage(success=False, message=str(error))
-    return paginate(resultados)
+    return await paginate_async(db, resultados)
 
 
 @arc_remesas.get("/{arc_remesa_id}", response_model=OneArcRemesaOut)
 async def detalle_arc_remesa(
+    request: Request,
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
     db: Annotated[Session, Depends(get_db)],
     arc_remesa_id: int,
@@ -58,4 +60,4 @@ async def detalle_arc_remesa(
         arc_remesa = get_arc_remesa(db, arc_remesa_id)
     except MyAnyError as error:
         return OneArcRemesaOut(success=False, message=str(error))
-    return OneArcRemesaOut.from_orm(arc_remesa)
+    return detail_response(request, arc_remesa, OneArcRemesaOut)
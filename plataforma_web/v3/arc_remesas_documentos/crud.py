@@ -5,6 +5,7 @@ from typing import Any
 
 from sqlalchemy.orm import Session
 
+from lib.database import async_variant
 from lib.exceptions import MyIsDeletedError, MyNotExistsError
 
 from ...core.arc_remesas_documentos.models import ArcRemesaDocumento
@@ -28,6 +29,9 @@ def get_arc_remesas_documentos(
     return consulta.filter_by(estatus="A").order_by(ArcRemesaDocumento.id)
 
 
+get_arc_remesas_documentos_async = async_variant(get_arc_remesas_documentos)
+
+
 def get_arc_remesa_documento(db: Session, arc_remesa_documento_id: int) -> ArcRemesaDocumento:
     """Consultar un documento de una remesa por su id"""
     arc_remesa_documento = db.query(ArcRemesaDocumento).get(arc_remesa_documento_id)
@@ -3,16 +3,17 @@ Archivo - Remesas Documentos v3, rutas (paths)
 """
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_pagination.ext.sqlalchemy import paginate
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from lib.database import Session, get_db
+from lib.database import AsyncSession, Session, get_async_db, get_db
 from lib.exceptions import MyAnyError
+from lib.fastapi_conditional import detail_response
 from lib.fastapi_pagination_custom_page import CustomPage
+from lib.fastapi_pagination_custom_paginate import paginate_async
 
 from ...core.permisos.models import Permiso
 from ..usuarios.authentications import UsuarioInDB, get_current_active_user
-from .crud import get_arc_remesa_documento, get_arc_remesas_documentos
+from .crud import get_arc_remesa_documento, get_arc_remesas_documentos_async
 from .schemas import ArcRemesaDocumentoOut, OneArcRemesaDocumentoOut
 
 arc_remesas_documentos = APIRouter(prefix="/v3/arc_remesas_documentos", tags=["archivo"])
@@ -21,7 +22,7 @@ arc_remesas_documentos = APIRouter(prefix="/v3/arc_remesas_documentos", tags=["a
 @arc_remesas_documentos.get("", response_model=CustomPage[ArcRemesaDocumentoOut])
 async def listado_arc_remesas_documentos(
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     arc_documento_id: int = None,
     arc_remesa_id: int = None,
 ):
@@ -29,18 +30,19 @@ async def listado_arc_remesas_documentos(
     if current_user.permissions.get("ARC REMESAS", 0) < Permiso.VER:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     try:
-        resultados = get_arc_remesas_documentos(
+        resultados = await get_arc_remesas_documentos_async(
             db=db,
             arc_documento_id=arc_documento_id,
             arc_remesa_id=arc_remesa_id,
         )
     except MyAnyError as error:
         return CustomPage(success=False, message=str(error))
-    return paginate(resultados)
+    return await paginate_async(db, resultados)
 
 
 @arc_remesas_documentos.get("/{arc_remesa_documento_id}", response_model=OneArcRemesaDocumentoOut)
 async def detalle_arc_remesa_documento(
+    request: Request,
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
     db: Annotated[Session, Depends(get_db)],
     arc_remesa_documento_id: int,
@@ -52,4 +54,4 @@ async def detalle_arc_remesa_documento(
         arc_remesa_documento = get_arc_remesa_documento(db, arc_remesa_documento_id)
     except MyAnyError as error:
         return OneArcRemesaDocumentoOut(success=False, message=str(error))
-    return OneArcRemesaDocumentoOut.from_orm(arc_remesa_documento)
+    return detail_response(request, arc_remesa_documento, OneArcRemesaDocumentoOut)
@@ -3,15 +3,15 @@ Archivo - Solicitudes v3, CRUD (create, read, update, and delete)
 """
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
+from lib.database import async_variant
 from lib.exceptions import MyIsDeletedError, MyNotExistsError, MyNotValidParamError
 from lib.safe_string import safe_string
 
 from ...core.arc_solicitudes.models import ArcSolicitud
 from ...core.autoridades.models import Autoridad
-from ..autoridades.crud import get_autoridad, get_autoridad_with_clave
-from ..distritos.crud import get_distrito, get_distrito_with_clave
+from ..catalogos import catalogo_autoridades, catalogo_distritos
 
 
 def get_arc_solicitudes(
@@ -23,18 +23,18 @@ def get_arc_solicitudes(
     estado: str = None,
 ) -> Any:
     """Consultar las solicitudes activas"""
-    consulta = db.query(ArcSolicitud)
+    consulta = db.query(ArcSolicitud).options(joinedload(ArcSolicitud.autoridad).joinedload(Autoridad.distrito), joinedload(ArcSolicitud.usuario_asignado))
     if autoridad_id is not None:
-        autoridad = get_autoridad(db, autoridad_id)
+        autoridad = catalogo_autoridades.get(db, autoridad_id)
         consulta = consulta.filter_by(autoridad_id=autoridad.id)
     elif autoridad_clave is not None:
-        autoridad = get_autoridad_with_clave(db, autoridad_clave)
+        autoridad = catalogo_autoridades.get_with_clave(db, autoridad_clave)
         consulta = consulta.filter_by(autoridad_id=autoridad.id)
     elif distrito_id is not None:
-        distrito = get_distrito(db, distrito_id)
+        distrito = catalogo_distritos.get(db, distrito_id)
         consulta = consulta.join(Autoridad).filter(Autoridad.distrito_id == distrito.id)
     elif distrito_clave is not None:
-        distrito = get_distrito_with_clave(db, distrito_clave)
+        distrito = catalogo_distritos.get_with_clave(db, distrito_clave)
         consulta = consulta.join(Autoridad).filter(Autoridad.distrito_id == distrito.id)
     if estado is not None:
         estado = safe_string(estado)
@@ -45,6 +45,9 @@ def get_arc_solicitudes(
     return consulta.filter_by(estatus="A").order_by(ArcSolicitud.id)
 
 
+get_arc_solicitudes_async = async_variant(get_arc_solicitudes)
+
+
 def get_arc_solicitud(db: Session, arc_solicitud_id: int) -> ArcSolicitud:
     """Consultar una solicitud por su id"""
     arc_solicitud = db.query(ArcSolicitud).get(arc_solicitud_id)
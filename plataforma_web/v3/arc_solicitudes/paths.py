@@ -3,16 +3,17 @@ Archivo - Solicitudes v3, rutas (paths)
 """
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_pagination.ext.sqlalchemy import paginate
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from lib.database import Session, get_db
+from lib.database import AsyncSession, Session, get_async_db, get_db
 from lib.exceptions import MyAnyError
+from lib.fastapi_conditional import detail_response
 from lib.fastapi_pagination_custom_page import CustomPage
+from lib.fastapi_pagination_custom_paginate import paginate_async
 
 from ...core.permisos.models import Permiso
 from ..usuarios.authentications import UsuarioInDB, get_current_active_user
-from .crud import get_arc_solicitud, get_arc_solicitudes
+from .crud import get_arc_solicitud, get_arc_solicitudes_async
 from .schemas import ArcSolicitudOut, OneArcSolicitudOut
 
 arc_solicitudes = APIRouter(prefix="/v3/arc_solicitudes", tags=["archivo"])
@@ -21,7 +22,7 @@ arc_solicitudes = APIRouter(prefix="/v3/arc_solicitudes", tags=["archivo"])
 @arc_solicitudes.get("", response_model=CustomPage[ArcSolicitudOut])
 async def listado_arc_solicitudes(
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     autoridad_id: int = None,
     autoridad_clave: str = None,
     distrito_id: int = None,
@@ -32,7 +33,7 @@ async def listado_arc_solicitudes(
     if current_user.permissions.get("ARC SOLICITUDES", 0) < Permiso.VER:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     try:
-        resultados = get_arc_solicitudes(
+        resultados = await get_arc_solicitudes_async(
             db=db,
             autoridad_id=autoridad_id,
             autoridad_clave=autoridad_clave,
@@ -42,11 +43,12 @@ async def listado_arc_solicitudes(
         )
     except MyAnyError as error:
         return CustomPage(success=False, message=str(error))
-    return paginate(resultados)
+    return await paginate_async(db, resultados)
 
 
 @arc_solicitudes.get("/{arc_solicitud_id}", response_model=OneArcSolicitudOut)
 async def detalle_arc_solicitud(
+    request: Request,
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
     db: Annotated[Session, Depends(get_db)],
     arc_solicitud_id: int,
@@ -58,4 +60,4 @@ async def detalle_arc_solicitud(
         arc_solicitud = get_arc_solicitud(db, arc_solicitud_id)
     except MyAnyError as error:
         return OneArcSolicitudOut(success=False, message=str(error))
-    return OneArcSolicitudOut.from_orm(arc_solicitud)
+    return detail_response(request, arc_solicitud, OneArcSolicitudOut)
@@ -4,14 +4,15 @@ Audiencias v3, CRUD (create, read, update, and delete)
 from datetime import date, datetime
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
+from lib.database import async_variant
 from lib.exceptions import MyIsDeletedError, MyNotExistsError, MyNotValidParamError
 
 from ...core.audiencias.models import Audiencia
 from ...core.autoridades.models import Autoridad
-from ..autoridades.crud import get_autoridad, get_autoridad_with_clave
-from ..distritos.crud import get_distrito, get_distrito_with_clave
+from ..autoridades.crud import get_autoridad
+from ..catalogos import catalogo_autoridades, catalogo_distritos
 
 
 def get_audiencias(
@@ -24,18 +25,18 @@ def get_audiencias(
     fecha: date = None,
 ) -> Any:
     """Consultar las audiencias activas"""
-    consulta = db.query(Audiencia)
+    consulta = db.query(Audiencia).options(joinedload(Audiencia.autoridad).joinedload(Autoridad.distrito))
     if autoridad_id is not None:
-        autoridad = get_autoridad(db, autoridad_id)
+        autoridad = catalogo_autoridades.get(db, autoridad_id)
         consulta = consulta.filter_by(autoridad_id=autoridad.id)
     elif autoridad_clave is not None:
-        autoridad = get_autoridad_with_clave(db, autoridad_clave)
+        autoridad = catalogo_autoridades.get_with_clave(db, autoridad_clave)
         consulta = consulta.filter_by(autoridad_id=autoridad.id)
     elif distrito_id is not None:
-        distrito = get_distrito(db, distrito_id)
+        distrito = catalogo_distritos.get(db, distrito_id)
         consulta = consulta.join(Autoridad).filter(Autoridad.distrito_id == distrito.id)
     elif distrito_clave is not None:
-        distrito = get_distrito_with_clave(db, distrito_clave)
+        distrito = catalogo_distritos.get_with_clave(db, distrito_clave)
         consulta = consulta.join(Autoridad).filter(Autoridad.distrito_id == distrito.id)
     if fecha is not None:
         desde = datetime(year=fecha.year, month=fecha.month, day=fecha.day, hour=0, minute=0, second=0)
@@ -48,6 +49,9 @@ def get_audiencias(
     return consulta.filter_by(estatus="A").order_by(Audiencia.id)
 
 
+get_audiencias_async = async_variant(get_audiencias)
+
+
 def get_audiencia(db: Session, audiencia_id: int) -> Audiencia:
     """Consultar una audiencia por su id"""
     audiencia = db.query(Audiencia).get(audiencia_id)
@@ -4,17 +4,18 @@ Audiencias v3, rutas (paths)
 from datetime import date
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_pagination.ext.sqlalchemy import paginate
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from lib.database import Session, get_db
+from lib.database import AsyncSession, Session, get_async_db, get_db
 from lib.exceptions import MyAnyError
+from lib.fastapi_conditional import detail_response
 from lib.fastapi_pagination_custom_page import CustomPage
+from lib.fastapi_pagination_custom_paginate import paginate_async
 
 from ...core.audiencias.models import Audiencia
 from ...core.permisos.models import Permiso
 from ..usuarios.authentications import UsuarioInDB, get_current_active_user
-from .crud import create_audiencia, delete_audiencia, get_audiencia, get_audiencias, update_audiencia
+from .crud import create_audiencia, delete_audiencia, get_audiencia, get_audiencias_async, update_audiencia
 from .schemas import AudienciaIn, AudienciaOut, OneAudienciaOut
 
 audiencias = APIRouter(prefix="/v3/audiencias", tags=["audiencias"])
@@ -23,7 +24,7 @@ audiencias = APIRouter(prefix="/v3/audiencias", tags=["audiencias"])
 @audiencias.get("", response_model=CustomPage[AudienciaOut])
 async def listado_audiencias(
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     autoridad_id: int = None,
     autoridad_clave: str = None,
     distrito_id: int = None,
@@ -35,7 +36,7 @@ async def listado_audiencias(
     if current_user.permissions.get("AUDIENCIAS", 0) < Permiso.VER:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     try:
-        resultados = get_audiencias(
+        resultados = await get_audiencias_async(
             db=db,
             autoridad_id=autoridad_id,
             autoridad_clave=autoridad_clave,
@@ -46,11 +47,12 @@ async def listado_audiencias(
         )
     except MyAnyError as error:
         return CustomPage(success=False, message=str(error))
-    return paginate(resultados)
+    return await paginate_async(db, resultados)
 
 
 @audiencias.get("/{audiencia_id}", response_model=OneAudienciaOut)
 async def detalle_audiencia(
+    request: Request,
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
     db: Annotated[Session, Depends(get_db)],
     audiencia_id: int,
@@ -62,7 +64,7 @@ async def detalle_audiencia(
         audiencia = get_audiencia(db, audiencia_id)
     except MyAnyError as error:
         return OneAudienciaOut(success=False, message=str(error))
-    return OneAudienciaOut.from_orm(audiencia)
+    return detail_response(request, audiencia, OneAudienciaOut)
 
 
 @audiencias.post("", response_model=OneAudienciaOut)
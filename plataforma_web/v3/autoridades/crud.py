@@ -3,14 +3,14 @@ Autoridades v3, CRUD (create, read, update, and delete)
 """
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
-from lib.exceptions import MyIsDeletedError, MyNotExistsError, MyNotValidParamError
+from lib.database import async_variant
+from lib.exceptions import MyAnyError, MyIsDeletedError, MyNotExistsError, MyNotValidParamError
 from lib.safe_string import safe_clave
 
 from ...core.autoridades.models import Autoridad
-from ..distritos.crud import get_distrito, get_distrito_with_clave
-from ..materias.crud import get_materia, get_materia_with_clave
+from ..catalogos import catalogo_distritos, catalogo_materias
 
 
 def get_autoridades(
@@ -27,12 +27,12 @@ def get_autoridades(
     materia_clave: str = None,
 ) -> Any:
     """Consultar los autoridades activos"""
-    consulta = db.query(Autoridad)
+    consulta = db.query(Autoridad).options(joinedload(Autoridad.distrito), joinedload(Autoridad.materia))
     if distrito_id is not None:
-        distrito = get_distrito(db, distrito_id)
+        distrito = catalogo_distritos.get(db, distrito_id)
         consulta = consulta.filter_by(distrito_id=distrito.id)
     elif distrito_clave is not None:
-        distrito = get_distrito_with_clave(db, distrito_clave)
+        distrito = catalogo_distritos.get_with_clave(db, distrito_clave)
         consulta = consulta.filter_by(distrito_id=distrito.id)
     if es_archivo_solicitante is not None:
         consulta = consulta.filter_by(es_archivo_solicitante=es_archivo_solicitante)
@@ -47,14 +47,17 @@ def get_autoridades(
     if es_notaria is not None:
         consulta = consulta.filter_by(es_notaria=es_notaria)
     if materia_id is not None:
-        materia = get_materia(db, materia_id)
+        materia = catalogo_materias.get(db, materia_id)
         consulta = consulta.filter_by(materia_id=materia.id)
     elif materia_clave is not None:
-        materia = get_materia_with_clave(db, materia_clave)
+        materia = catalogo_materias.get_with_clave(db, materia_clave)
         consulta = consulta.filter_by(materia_id=materia.id)
     return consulta.filter_by(estatus="A").order_by(Autoridad.id)
 
 
+get_autoridades_async = async_variant(get_autoridades)
+
+
 def get_autoridad(db: Session, autoridad_id: int) -> Autoridad:
     """Consultar un autoridad por su id"""
     autoridad = db.query(Autoridad).get(autoridad_id)
@@ -65,6 +68,21 @@ def get_autoridad(db: Session, autoridad_id: int) -> Autoridad:
     return autoridad
 
 
+def get_autoridades_with_ids(db: Session, autoridades_ids: set[int]) -> dict[int, Autoridad | MyAnyError]:
+    """Consultar varias autoridades en una sola consulta, entrega cada id con su autoridad o el error que daría get_autoridad"""
+    encontradas = {autoridad.id: autoridad for autoridad in db.query(Autoridad).filter(Autoridad.id.in_(autoridades_ids))}
+    resultados = {}
+    for autoridad_id in autoridades_ids:
+        autoridad = encontradas.get(autoridad_id)
+        if autoridad is None:
+            resultados[autoridad_id] = MyNotExistsError("No existe ese autoridad")
+        elif autoridad.estatus != "A":
+            resultados[autoridad_id] = MyIsDeletedError("No es activo ese autoridad, está eliminado")
+        else:
+            resultados[autoridad_id] = autoridad
+    return resultados
+
+
 def get_autoridad_with_clave(db: Session, autoridad_clave: str) -> Autoridad:
     """Consultar un autoridad por su clave"""
     try:
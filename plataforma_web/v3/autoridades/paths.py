@@ -3,16 +3,18 @@ Autoridades v3, rutas (paths)
 """
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_pagination.ext.sqlalchemy import paginate
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from lib.database import Session, get_db
+from lib.database import AsyncSession, Session, get_async_db, get_db
 from lib.exceptions import MyAnyError
+from lib.fastapi_conditional import detail_response
 from lib.fastapi_pagination_custom_page import CustomPage
+from lib.fastapi_pagination_custom_paginate import paginate_async
 
 from ...core.permisos.models import Permiso
+from ..catalogos import catalogo_autoridades
 from ..usuarios.authentications import UsuarioInDB, get_current_active_user
-from .crud import get_autoridad_with_clave, get_autoridades
+from .crud import get_autoridades_async
 from .schemas import AutoridadOut, OneAutoridadOut
 
 autoridades = APIRouter(prefix="/v3/autoridades", tags=["autoridades"])
@@ -21,7 +23,7 @@ autoridades = APIRouter(prefix="/v3/autoridades", tags=["autoridades"])
 @autoridades.get("", response_model=CustomPage[AutoridadOut])
 async def listado_autoridades(
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     distrito_id: int = None,
     distrito_clave: str = None,
     es_archivo_solicitante: bool = None,
@@ -37,7 +39,7 @@ async def listado_autoridades(
     if current_user.permissions.get("AUTORIDADES", 0) < Permiso.VER:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     try:
-        resultados = get_autoridades(
+        resultados = await get_autoridades_async(
             db=db,
             distrito_id=distrito_id,
             distrito_clave=distrito_clave,
@@ -52,11 +54,12 @@ async def listado_autoridades(
         )
     except MyAnyError as error:
         return CustomPage(success=False, message=str(error))
-    return paginate(resultados)
+    return await paginate_async(db, resultados)
 
 
 @autoridades.get("/{autoridad_clave}", response_model=OneAutoridadOut)
 async def detalle_autoridad(
+    request: Request,
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
     db: Annotated[Session, Depends(get_db)],
     autoridad_clave: str,
@@ -65,7 +68,7 @@ async def detalle_autoridad(
     if current_user.permissions.get("AUTORIDADES", 0) < Permiso.VER:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     try:
-        autoridad = get_autoridad_with_clave(db, autoridad_clave)
+        autoridad = catalogo_autoridades.get_with_clave(db, autoridad_clave)
     except MyAnyError as error:
         return OneAutoridadOut(success=False, message=str(error))
-    return OneAutoridadOut.from_orm(autoridad)
+    return detail_response(request, autoridad, OneAutoridadOut)
@@ -3,8 +3,9 @@ Bitacoras v3, CRUD (create, read, update, and delete)
 """
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
+from lib.database import async_variant
 from lib.exceptions import MyIsDeletedError, MyNotExistsError, MyNotValidParamError
 from lib.safe_string import safe_email
 
@@ -22,7 +23,7 @@ def get_bitacoras(
     usuario_email: str = None,
 ) -> Any:
     """Consultar las bitacoras activas"""
-    consulta = db.query(Bitacora)
+    consulta = db.query(Bitacora).options(joinedload(Bitacora.modulo), joinedload(Bitacora.usuario))
     if modulo_id is not None:
         modulo = get_modulo(db, modulo_id)
         consulta = consulta.filter_by(modulo_id=modulo.id)
@@ -41,6 +42,9 @@ def get_bitacoras(
     return consulta.filter_by(estatus="A").order_by(Bitacora.id.desc())
 
 
+get_bitacoras_async = async_variant(get_bitacoras)
+
+
 def get_bitacora(db: Session, bitacora_id: int) -> Bitacora:
     """Consultar una bitacora por su id"""
     bitacora = db.query(Bitacora).get(bitacora_id)
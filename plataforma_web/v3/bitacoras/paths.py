@@ -3,16 +3,17 @@ Bitacoras v3, rutas (paths)
 """
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_pagination.ext.sqlalchemy import paginate
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from lib.database import Session, get_db
+from lib.database import AsyncSession, Session, get_async_db, get_db
 from lib.exceptions import MyAnyError
+from lib.fastapi_conditional import detail_response
 from lib.fastapi_pagination_custom_page import CustomPage
+from lib.fastapi_pagination_custom_paginate import paginate_async
 
 from ...core.permisos.models import Permiso
 from ..usuarios.authentications import UsuarioInDB, get_current_active_user
-from .crud import get_bitacora, get_bitacoras
+from .crud import get_bitacora, get_bitacoras_async
 from .schemas import BitacoraOut, OneBitacoraOut
 
 bitacoras = APIRouter(prefix="/v3/bitacoras", tags=["usuarios"])
@@ -21,7 +22,7 @@ bitacoras = APIRouter(prefix="/v3/bitacoras", tags=["usuarios"])
 @bitacoras.get("", response_model=CustomPage[BitacoraOut])
 async def listado_bitacoras(
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     modulo_id: int = None,
     modulo_nombre: str = None,
     usuario_id: int = None,
@@ -31,7 +32,7 @@ async def listado_bitacoras(
     if current_user.permissions.get("BITACORAS", 0) < Permiso.VER:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     try:
-        resultados = get_bitacoras(
+        resultados = await get_bitacoras_async(
             db=db,
             modulo_id=modulo_id,
             modulo_nombre=modulo_nombre,
@@ -40,11 +41,12 @@ async def listado_bitacoras(
         )
     except MyAnyError as error:
         return CustomPage(success=False, message=str(error))
-    return paginate(resultados)
+    return await paginate_async(db, resultados)
 
 
 @bitacoras.get("/{bitacora_id}", response_model=OneBitacoraOut)
 async def detalle_bitacora(
+    request: Request,
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
     db: Annotated[Session, Depends(get_db)],
     bitacora_id: int,
@@ -56,4 +58,4 @@ async def detalle_bitacora(
         bitacora = get_bitacora(db, bitacora_id)
     except MyAnyError as error:
         return OneBitacoraOut(success=False, message=str(error))
-    return OneBitacoraOut.from_orm(bitacora)
+    return detail_response(request, bitacora, OneBitacoraOut)
@@ -6,6 +6,7 @@ from typing import Any
 
 from sqlalchemy.orm import Session
 
+from lib.database import async_variant
 from lib.exceptions import MyIsDeletedError, MyNotExistsError, MyNotValidParamError
 from lib.safe_string import safe_string
 
@@ -30,7 +31,10 @@ def get_boletines(
         consulta = consulta.filter(Boletin.envio_programado >= envio_programado_desde)
     if envio_programado_hasta is not None:
         consulta = consulta.filter(Boletin.envio_programado <= envio_programado_hasta)
-    return consulta.filter_by(estatus="A").order_by(Boletin.envio_programado)
+    return consulta.filter_by(estatus="A").order_by(Boletin.envio_programado, Boletin.id)
+
+
+get_boletines_async = async_variant(get_boletines)
 
 
 def get_boletin(db: Session, boletin_id: int) -> Boletin:
@@ -4,17 +4,18 @@ Boletines v3, rutas (paths)
 from datetime import date
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_pagination.ext.sqlalchemy import paginate
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from lib.database import Session, get_db
+from lib.database import AsyncSession, Session, get_async_db, get_db
 from lib.exceptions import MyAnyError
+from lib.fastapi_conditional import detail_response
 from lib.fastapi_pagination_custom_page import CustomPage
+from lib.fastapi_pagination_custom_paginate import paginate_async
 
 from ...core.boletines.models import Boletin
 from ...core.permisos.models import Permiso
 from ..usuarios.authentications import UsuarioInDB, get_current_active_user
-from .crud import create_boletin, delete_boletin, get_boletin, get_boletines, update_boletin
+from .crud import create_boletin, delete_boletin, get_boletin, get_boletines_async, update_boletin
 from .schemas import BoletinIn, BoletinOut, OneBoletinOut
 
 boletines = APIRouter(prefix="/v3/boletines", tags=["boletines"])
@@ -23,7 +24,7 @@ boletines = APIRouter(prefix="/v3/boletines", tags=["boletines"])
 @boletines.get("", response_model=CustomPage[BoletinOut])
 async def listado_boletines(
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     estado: str = None,
     envio_programado_desde: date = None,
     envio_programado_hasta: date = None,
@@ -32,7 +33,7 @@ async def listado_boletines(
     if current_user.permissions.get("BOLETINES", 0) < Permiso.VER:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     try:
-        resultados = get_boletines(
+        resultados = await get_boletines_async(
             db=db,
             estado=estado,
             envio_programado_desde=envio_programado_desde,
@@ -40,11 +41,12 @@ async def listado_boletines(
         )
     except MyAnyError as error:
         return CustomPage(success=False, message=str(error))
-    return paginate(resultados)
+    return await paginate_async(db, resultados)
 
 
 @boletines.get("/{boletin_id}", response_model=OneBoletinOut)
 async def detalle_boletinget_boletin(
+    request: Request,
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
     db: Annotated[Session, Depends(get_db)],
     boletin_id: int,
@@ -56,7 +58,7 @@ async def detalle_boletinget_boletin(
         boletinget_boletin = get_boletin(db, boletin_id)
     except MyAnyError as error:
         return OneBoletinOut(success=False, message=str(error))
-    return OneBoletinOut.from_orm(boletinget_boletin)
+    return detail_response(request, boletinget_boletin, OneBoletinOut)
 
 
 @boletines.post("", response_model=OneBoletinOut)
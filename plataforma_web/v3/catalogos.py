@@ -0,0 +1,218 @@
+"""
+Catalogos v3
+
+Autoridades, distritos, materias, oficinas y salas cambian pocas veces al año,
+por eso se cargan completas una vez por worker en diccionarios por id y por clave.
+Se vuelven a cargar cuando pasan CATALOG_CACHE_TTL segundos, al llamar invalidate_catalogos,
+o cuando se borran las respuestas guardadas de alguna de sus tablas (lib/fastapi_response_cache.py).
+
+Los registros cargados también se guardan en el cache de CACHE_BACKEND, con redis o l1l2
+un worker los toma de ahí en lugar de consultarlos, y cada CACHE_L1_TTL segundos vuelve a revisarlo.
+
+Los registros son inmutables y tienen los mismos campos que el esquema Out,
+incluyendo los de distrito_* y autoridad_*, más el estatus y modificado para los ETag.
+
+Usage:
+
+    from ..catalogos import catalogo_autoridades
+
+    autoridad = catalogo_autoridades.get(db, autoridad_id)
+    autoridad = catalogo_autoridades.get_with_clave(db, autoridad_clave)
+
+"""
+import time
+from datetime import datetime
+from functools import cached_property
+from typing import Callable, Iterable, Type
+
+from pydantic import BaseModel, ConfigDict
+from sqlalchemy.orm import Query, Session, joinedload
+
+from config.settings import get_settings
+from lib.cache import BaseCache, get_cache
+from lib.exceptions import MyIsDeletedError, MyNotExistsError, MyNotValidParamError
+from lib.fastapi_response_cache import on_invalidate
+from lib.safe_string import safe_clave
+
+from ..core.autoridades.models import Autoridad
+from ..core.distritos.models import Distrito
+from ..core.domicilios.models import Domicilio
+from ..core.materias.models import Materia
+from ..core.oficinas.models import Oficina
+from ..core.siga_salas.models import SIGASala
+from .autoridades.schemas import AutoridadOut
+from .distritos.schemas import DistritoOut
+from .materias.schemas import MateriaOut
+from .oficinas.schemas import OficinaOut
+from .siga_salas.schemas import SIGASalaOut
+
+
+class AutoridadRegistro(AutoridadOut):
+    """Autoridad en el catálogo"""
+
+    estatus: str
+    modificado: datetime | None = None
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+class DistritoRegistro(DistritoOut):
+    """Distrito en el catálogo"""
+
+    estatus: str
+    modificado: datetime | None = None
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+class MateriaRegistro(MateriaOut):
+    """Materia en el catálogo"""
+
+    estatus: str
+    modificado: datetime | None = None
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+class OficinaRegistro(OficinaOut):
+    """Oficina en el catálogo"""
+
+    estatus: str
+    modificado: datetime | None = None
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+class SIGASalaRegistro(SIGASalaOut):
+    """Sala en el catálogo"""
+
+    estatus: str
+    modificado: datetime | None = None
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+class Catalogo:
+    """Tabla pequeña cargada en memoria con sus registros por id y por clave"""
+
+    def __init__(self, nombre: str, registro: Type[BaseModel], consultar: Callable[[Session], Query], tablas: Iterable[str]):
+        self.nombre = nombre
+        self.tablas = set(tablas)
+        self.registro = registro
+        self.consultar = consultar
+        self.datos = ({}, {}, 0.0)  # Registros por id, por clave y cuándo caducan, se reemplazan juntos
+
+    @cached_property
+    def cache(self) -> BaseCache:
+        """Cache de los registros, se crea la primera vez que se usa"""
+        return get_cache(f"catalogo:{self.nombre}", maxsize=1, ttl=get_settings().catalog_cache_ttl)
+
+    @cached_property
+    def ttl(self) -> int:
+        """Segundos que duran los registros en memoria, con redis o l1l2 a lo más CACHE_L1_TTL"""
+        settings = get_settings()
+        return settings.catalog_cache_ttl if settings.cache_backend == "local" else min(settings.catalog_cache_ttl, settings.cache_l1_ttl)
+
+    @property
+    def por_id(self) -> dict:
+        """Registros por id"""
+        return self.datos[0]
+
+    @property
+    def por_clave(self) -> dict:
+        """Registros por clave"""
+        return self.datos[1]
+
+    def cargar(self, db: Session) -> None:
+        """Cargar todos los registros si aún no se han cargado o ya caducaron
+
+        No usa un candado: en los listados async la consulta cede el event loop,
+        y otra petición que esperara un candado de hilos lo bloquearía.
+        Si dos peticiones lo cargan al mismo tiempo las dos consultan y gana la última,
+        los datos se reemplazan en una sola asignación.
+        """
+        if self.datos[2] > time.monotonic():
+            return
+        registros = self.cache.get("registros")
+        if registros is None:
+            registros = [self.registro.model_validate(fila) for fila in self.consultar(db)]
+            self.cache.set("registros", registros)
+        self.datos = ({registro.id: registro for registro in registros}, {registro.clave: registro for registro in registros}, time.monotonic() + self.ttl)
+
+    def invalidate(self) -> None:
+        """Volver a cargar en la siguiente consulta"""
+        self.cache.clear()
+        self.datos = ({}, {}, 0.0)
+
+    def validar(self, registro: BaseModel | None) -> BaseModel:
+        """Entregar el registro o levantar los mismos errores que las funciones get_* del crud"""
+        if registro is None:
+            raise MyNotExistsError(f"No existe ese {self.nombre}")
+        if registro.estatus != "A":
+            raise MyIsDeletedError(f"No es activo ese {self.nombre}, está eliminado")
+        return registro
+
+    def get(self, db: Session, registro_id: int) -> BaseModel:
+        """Consultar un registro por su id, si no está en el catálogo se busca en la base de datos"""
+        self.cargar(db)
+        registro = self.por_id.get(registro_id)
+        if registro is None:
+            fila = self.consultar(db).filter_by(id=registro_id).first()
+            registro = None if fila is None else self.registro.model_validate(fila)
+        return self.validar(registro)
+
+    def get_with_clave(self, db: Session, clave: str) -> BaseModel:
+        """Consultar un registro por su clave, si no está en el catálogo se busca en la base de datos"""
+        try:
+            clave = safe_clave(clave)
+        except ValueError as error:
+            raise MyNotValidParamError(str(error)) from error
+        self.cargar(db)
+        registro = self.por_clave.get(clave)
+        if registro is None:
+            fila = self.consultar(db).filter_by(clave=clave).first()
+            registro = None if fila is None else self.registro.model_validate(fila)
+        return self.validar(registro)
+
+
+catalogo_autoridades = Catalogo(
+    nombre="autoridad",
+    registro=AutoridadRegistro,
+    consultar=lambda db: db.query(Autoridad).options(joinedload(Autoridad.distrito), joinedload(Autoridad.materia)),
+    tablas=["autoridades", "distritos", "materias"],
+)
+catalogo_distritos = Catalogo(
+    nombre="distrito",
+    registro=DistritoRegistro,
+    consultar=lambda db: db.query(Distrito),
+    tablas=["distritos"],
+)
+catalogo_materias = Catalogo(
+    nombre="materia",
+    registro=MateriaRegistro,
+    consultar=lambda db: db.query(Materia),
+    tablas=["materias"],
+)
+catalogo_oficinas = Catalogo(
+    nombre="oficina",
+    registro=OficinaRegistro,
+    consultar=lambda db: db.query(Oficina).options(joinedload(Oficina.distrito), joinedload(Oficina.domicilio)),
+    tablas=["oficinas", "distritos", "domicilios"],
+)
+catalogo_siga_salas = Catalogo(
+    nombre="sala",
+    registro=SIGASalaRegistro,
+    consultar=lambda db: db.query(SIGASala).options(joinedload(SIGASala.domicilio).joinedload(Domicilio.distrito)),
+    tablas=["siga_salas", "domicilios", "distritos"],
+)
+
+CATALOGOS = (catalogo_autoridades, catalogo_distritos, catalogo_materias, catalogo_oficinas, catalogo_siga_salas)
+
+
+def invalidate_catalogos() -> None:
+    """Volver a cargar todos los catálogos en su siguiente consulta"""
+    for catalogo in CATALOGOS:
+        catalogo.invalidate()
+
+
+@on_invalidate
+def invalidate_catalogos_tablas(tablas: set[str]) -> None:
+    """Volver a cargar los catálogos que usan alguna de las tablas, así las respuestas guardadas no toman registros viejos"""
+    for catalogo in CATALOGOS:
+        if catalogo.tablas & tablas:
+            catalogo.invalidate()
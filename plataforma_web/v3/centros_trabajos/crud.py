@@ -3,13 +3,14 @@ Centros de Trabajo v3, CRUD (create, read, update, and delete)
 """
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
+from lib.database import async_variant
 from lib.exceptions import MyIsDeletedError, MyNotExistsError, MyNotValidParamError
 from lib.safe_string import safe_clave
 
 from ...core.centros_trabajos.models import CentroTrabajo
-from ..distritos.crud import get_distrito, get_distrito_with_clave
+from ..catalogos import catalogo_distritos
 from ..domicilios.crud import get_domicilio
 
 
@@ -20,12 +21,12 @@ def get_centros_trabajos(
     domicilio_id: int = None,
 ) -> Any:
     """Consultar los centros de trabajos activos"""
-    consulta = db.query(CentroTrabajo)
+    consulta = db.query(CentroTrabajo).options(joinedload(CentroTrabajo.distrito), joinedload(CentroTrabajo.domicilio))
     if distrito_id is not None:
-        distrito = get_distrito(db, distrito_id)
+        distrito = catalogo_distritos.get(db, distrito_id)
         consulta = consulta.filter_by(distrito_id=distrito.id)
     elif distrito_clave is not None:
-        distrito = get_distrito_with_clave(db, distrito_clave)
+        distrito = catalogo_distritos.get_with_clave(db, distrito_clave)
         consulta = consulta.filter_by(distrito_id=distrito.id)
     if domicilio_id is not None:
         domicilio = get_domicilio(db, domicilio_id)
@@ -33,6 +34,9 @@ def get_centros_trabajos(
     return consulta.filter_by(estatus="A").order_by(CentroTrabajo.id)
 
 
+get_centros_trabajos_async = async_variant(get_centros_trabajos)
+
+
 def get_centro_trabajo(db: Session, centro_trabajo_id: int) -> CentroTrabajo:
     """Consultar un centro de trabajo por su id"""
     centro_trabajo = db.query(CentroTrabajo).get(centro_trabajo_id)
@@ -6,6 +6,7 @@ from typing import Any
 
 from sqlalchemy.orm import Session
 
+from lib.database import async_variant
 from lib.exceptions import MyAlreadyExistsError, MyIsDeletedError, MyNotExistsError
 
 from ...core.cit_dias_inhabiles.models import CitDiaInhabil
@@ -25,6 +26,9 @@ def get_cit_dias_inhabiles(
     return consulta.filter_by(estatus="A").order_by(CitDiaInhabil.fecha)
 
 
+get_cit_dias_inhabiles_async = async_variant(get_cit_dias_inhabiles)
+
+
 def get_cit_dia_inhabil(db: Session, cit_dia_inhabil_id: int) -> CitDiaInhabil:
     """Consultar un dia inhabile por su id"""
     cit_dia_inhabil = db.query(CitDiaInhabil).get(cit_dia_inhabil_id)
@@ -4,17 +4,18 @@ Citas Dias Inhabiles v3, rutas (paths)
 from datetime import date
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_pagination.ext.sqlalchemy import paginate
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from lib.database import Session, get_db
+from lib.database import AsyncSession, Session, get_async_db, get_db
 from lib.exceptions import MyAnyError
+from lib.fastapi_conditional import detail_response
 from lib.fastapi_pagination_custom_page import CustomPage
+from lib.fastapi_pagination_custom_paginate import paginate_async
 
 from ...core.cit_dias_inhabiles.models import CitDiaInhabil
 from ...core.permisos.models import Permiso
 from ..usuarios.authentications import UsuarioInDB, get_current_active_user
-from .crud import create_cit_dia_inhabil, delete_cit_dia_inhabil, get_cit_dia_inhabil, get_cit_dias_inhabiles, update_cit_dia_inhabil
+from .crud import create_cit_dia_inhabil, delete_cit_dia_inhabil, get_cit_dia_inhabil, get_cit_dias_inhabiles_async, update_cit_dia_inhabil
 from .schemas import CitDiaInhabilIn, CitDiaInhabilOut, OneCitDiaInhabilOut
 
 cit_dias_inhabiles = APIRouter(prefix="/v3/cit_dias_inhabiles", tags=["citas"])
@@ -23,7 +24,7 @@ cit_dias_inhabiles = APIRouter(prefix="/v3/cit_dias_inhabiles", tags=["citas"])
 @cit_dias_inhabiles.get("", response_model=CustomPage[CitDiaInhabilOut])
 async def listado_cit_dias_inhabiles(
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     fecha_desde: date = None,
     fecha_hasta: date = None,
 ):
@@ -31,18 +32,19 @@ async def listado_cit_dias_inhabiles(
     if current_user.permissions.get("CIT DIAS INHABILES", 0) < Permiso.VER:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     try:
-        resultados = get_cit_dias_inhabiles(
+        resultados = await get_cit_dias_inhabiles_async(
             db=db,
             fecha_desde=fecha_desde,
             fecha_hasta=fecha_hasta,
         )
     except MyAnyError as error:
         return CustomPage(success=False, message=str(error))
-    return paginate(resultados)
+    return await paginate_async(db, resultados)
 
 
 @cit_dias_inhabiles.get("/{cit_dia_inhabil_id}", response_model=OneCitDiaInhabilOut)
 async def detalle_cit_dia_inhabil(
+    request: Request,
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
     db: Annotated[Session, Depends(get_db)],
     cit_dia_inhabil_id: int,
@@ -54,7 +56,7 @@ async def detalle_cit_dia_inhabil(
         cit_dia_inhabil = get_cit_dia_inhabil(db, cit_dia_inhabil_id)
     except MyAnyError as error:
         return OneCitDiaInhabilOut(success=False, message=str(error))
-    return OneCitDiaInhabilOut.from_orm(cit_dia_inhabil)
+    return detail_response(request, cit_dia_inhabil, OneCitDiaInhabilOut)
 
 
 @cit_dias_inhabiles.post("", response_model=OneCitDiaInhabilOut)
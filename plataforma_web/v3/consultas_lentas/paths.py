@@ -0,0 +1,26 @@
+"""
+Consultas Lentas v3, rutas (paths)
+"""
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from lib.slow_query_log import top_consultas_lentas
+
+from ...core.permisos.models import Permiso
+from ..usuarios.authentications import UsuarioInDB, get_current_active_user
+from .schemas import ConsultaLentaOut, ConsultasLentasOut
+
+consultas_lentas = APIRouter(prefix="/v3/consultas_lentas", tags=["consultas lentas"])
+
+
+@consultas_lentas.get("", response_model=ConsultasLentasOut)
+async def listado_consultas_lentas(
+    current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
+    limit: Annotated[int, Query(ge=1, le=100)] = 10,
+):
+    """Sentencias que suman más tiempo en la bitácora de consultas lentas, requiere ADMINISTRAR en bitacoras"""
+    if current_user.permissions.get("BITACORAS", 0) < Permiso.ADMINISTRAR:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
+    items = [ConsultaLentaOut(**resumen) for resumen in top_consultas_lentas(limit)]
+    return ConsultasLentasOut(message=f"Se encontraron {len(items)} sentencias lentas", items=items)
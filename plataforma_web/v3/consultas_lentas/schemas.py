@@ -0,0 +1,28 @@
+"""
+Consultas Lentas v3, esquemas de pydantic
+"""
+from typing import Any
+
+from pydantic import BaseModel
+
+from lib.schemas_base import OneBaseOut
+
+
+class ConsultaLentaOut(BaseModel):
+    """Esquema para entregar una sentencia lenta con sus tiempos y los datos de su ejecución más lenta"""
+
+    sentencia: str
+    cantidad: int
+    total_ms: float
+    promedio_ms: float
+    maximo_ms: float
+    rutas: list[str]
+    ultima: str
+    parametros: Any = None
+    plan: str | None = None
+
+
+class ConsultasLentasOut(OneBaseOut):
+    """Esquema para entregar las sentencias que suman más tiempo"""
+
+    items: list[ConsultaLentaOut] = []
@@ -5,8 +5,7 @@ from typing import Any
 
 from sqlalchemy.orm import Session
 
-from lib.exceptions import MyIsDeletedError, MyNotExistsError, MyNotValidParamError
-from lib.safe_string import safe_clave
+from lib.database import async_variant
 
 from ...core.distritos.models import Distrito
 
@@ -28,25 +27,4 @@ def get_distritos(
     return consulta.filter_by(estatus="A").order_by(Distrito.clave)
 
 
-def get_distrito(db: Session, distrito_id: int) -> Distrito:
-    """Consultar un distrito por su id"""
-    distrito = db.query(Distrito).get(distrito_id)
-    if distrito is None:
-        raise MyNotExistsError("No existe ese distrito")
-    if distrito.estatus != "A":
-        raise MyIsDeletedError("No es activo ese distrito, está eliminado")
-    return distrito
-
-
-def get_distrito_with_clave(db: Session, distrito_clave: str) -> Distrito:
-    """Consultar un distrito por su clave"""
-    try:
-        clave = safe_clave(distrito_clave)
-    except ValueError as error:
-        raise MyNotValidParamError(str(error)) from error
-    distrito = db.query(Distrito).filter_by(clave=clave).first()
-    if distrito is None:
-        raise MyNotExistsError("No existe ese distrito")
-    if distrito.estatus != "A":
-        raise MyIsDeletedError("No es activo ese distrito, está eliminado")
-    return distrito
+get_distritos_async = async_variant(get_distritos)
@@ -3,25 +3,30 @@ Distritos v3, rutas (paths)
 """
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_pagination.ext.sqlalchemy import paginate
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from lib.database import Session, get_db
+from lib.database import AsyncSession, Session, get_async_db, get_db
 from lib.exceptions import MyAnyError
+from lib.fastapi_conditional import detail_response
 from lib.fastapi_pagination_custom_page import CustomPage
+from lib.fastapi_pagination_custom_paginate import paginate_async
+from lib.fastapi_response_cache import ResponseCache
 
 from ...core.permisos.models import Permiso
+from ..catalogos import catalogo_distritos
 from ..usuarios.authentications import UsuarioInDB, get_current_active_user
-from .crud import get_distrito_with_clave, get_distritos
+from .crud import get_distritos_async
 from .schemas import DistritoOut, OneDistritoOut
 
 distritos = APIRouter(prefix="/v3/distritos", tags=["distritos"])
+distritos_cache = ResponseCache("distritos", modulo="DISTRITOS", ttl=3600, tablas=["distritos"])
 
 
 @distritos.get("", response_model=CustomPage[DistritoOut])
+@distritos_cache
 async def listado_distritos(
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     es_distrito_judicial: bool = None,
     es_distrito: bool = None,
     es_jurisdiccional: bool = None,
@@ -30,7 +35,7 @@ async def listado_distritos(
     if current_user.permissions.get("DISTRITOS", 0) < Permiso.VER:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     try:
-        resultados = get_distritos(
+        resultados = await get_distritos_async(
             db=db,
             es_distrito_judicial=es_distrito_judicial,
             es_distrito=es_distrito,
@@ -38,11 +43,13 @@ async def listado_distritos(
         )
     except MyAnyError as error:
         return CustomPage(success=False, message=str(error))
-    return paginate(resultados)
+    return await paginate_async(db, resultados)
 
 
 @distritos.get("/{distrito_clave}", response_model=OneDistritoOut)
+@distritos_cache
 async def detalle_distrito(
+    request: Request,
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
     db: Annotated[Session, Depends(get_db)],
     distrito_clave: str,
@@ -51,7 +58,7 @@ async def detalle_distrito(
     if current_user.permissions.get("DISTRITOS", 0) < Permiso.VER:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     try:
-        distrito = get_distrito_with_clave(db, distrito_clave)
+        distrito = catalogo_distritos.get_with_clave(db, distrito_clave)
     except MyAnyError as error:
         return OneDistritoOut(success=False, message=str(error))
-    return OneDistritoOut.from_orm(distrito)
+    return detail_response(request, distrito, OneDistritoOut)
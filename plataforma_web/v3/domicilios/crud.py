@@ -3,12 +3,13 @@ Domicilios v3, CRUD (create, read, update, and delete)
 """
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
+from lib.database import async_variant
 from lib.exceptions import MyIsDeletedError, MyNotExistsError
 
 from ...core.domicilios.models import Domicilio
-from ..distritos.crud import get_distrito, get_distrito_with_clave
+from ..catalogos import catalogo_distritos
 
 
 def get_domicilios(
@@ -17,16 +18,19 @@ def get_domicilios(
     distrito_clave: str = None,
 ) -> Any:
     """Consultar los domicilios activos"""
-    consulta = db.query(Domicilio)
+    consulta = db.query(Domicilio).options(joinedload(Domicilio.distrito))
     if distrito_id is not None:
-        distrito = get_distrito(db, distrito_id)
+        distrito = catalogo_distritos.get(db, distrito_id)
         consulta = consulta.filter_by(distrito_id=distrito.id)
     elif distrito_clave is not None:
-        distrito = get_distrito_with_clave(db, distrito_clave)
+        distrito = catalogo_distritos.get_with_clave(db, distrito_clave)
         consulta = consulta.filter_by(distrito_id=distrito.id)
     return consulta.filter_by(estatus="A").order_by(Domicilio.id)
 
 
+get_domicilios_async = async_variant(get_domicilios)
+
+
 def get_domicilio(db: Session, domicilio_id: int) -> Domicilio:
     """Consultar un domicilio por su id"""
     domicilio = db.query(Domicilio).get(domicilio_id)
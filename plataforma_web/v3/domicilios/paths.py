@@ -3,16 +3,17 @@ Domicilios v3, rutas (paths)
 """
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_pagination.ext.sqlalchemy import paginate
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from lib.database import Session, get_db
+from lib.database import AsyncSession, Session, get_async_db, get_db
 from lib.exceptions import MyAnyError
+from lib.fastapi_conditional import detail_response
 from lib.fastapi_pagination_custom_page import CustomPage
+from lib.fastapi_pagination_custom_paginate import paginate_async
 
 from ...core.permisos.models import Permiso
 from ..usuarios.authentications import UsuarioInDB, get_current_active_user
-from .crud import get_domicilio, get_domicilios
+from .crud import get_domicilio, get_domicilios_async
 from .schemas import DomicilioOut, OneDomicilioOut
 
 domicilios = APIRouter(prefix="/v3/domicilios", tags=["oficinas"])
@@ -21,7 +22,7 @@ domicilios = APIRouter(prefix="/v3/domicilios", tags=["oficinas"])
 @domicilios.get("", response_model=CustomPage[DomicilioOut])
 async def listado_domicilios(
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     distrito_id: int = None,
     distrito_clave: str = None,
 ):
@@ -29,18 +30,19 @@ async def listado_domicilios(
     if current_user.permissions.get("DOMICILIOS", 0) < Permiso.VER:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     try:
-        resultados = get_domicilios(
+        resultados = await get_domicilios_async(
             db=db,
             distrito_id=distrito_id,
             distrito_clave=distrito_clave,
         )
     except MyAnyError as error:
         return CustomPage(success=False, message=str(error))
-    return paginate(resultados)
+    return await paginate_async(db, resultados)
 
 
 @domicilios.get("/{domicilio_id}", response_model=OneDomicilioOut)
 async def detalle_domicilio(
+    request: Request,
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
     db: Annotated[Session, Depends(get_db)],
     domicilio_id: int,
@@ -52,4 +54,4 @@ async def detalle_domicilio(
         domicilio = get_domicilio(db, domicilio_id)
     except MyAnyError as error:
         return OneDomicilioOut(success=False, message=str(error))
-    return OneDomicilioOut.from_orm(domicilio)
+    return detail_response(request, domicilio, OneDomicilioOut)
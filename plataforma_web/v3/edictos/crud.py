@@ -4,15 +4,16 @@ Edictos v3, CRUD (create, read, update, and delete)
 from datetime import date
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
-from lib.exceptions import MyIsDeletedError, MyNotExistsError, MyNotValidParamError
+from lib.database import async_variant, insert_all
+from lib.exceptions import MyAnyError, MyIsDeletedError, MyNotExistsError, MyNotValidParamError
 from lib.safe_string import safe_expediente
 
 from ...core.autoridades.models import Autoridad
 from ...core.edictos.models import Edicto
-from ..autoridades.crud import get_autoridad, get_autoridad_with_clave
-from ..distritos.crud import get_distrito, get_distrito_with_clave
+from ..autoridades.crud import get_autoridad, get_autoridades_with_ids
+from ..catalogos import catalogo_autoridades, catalogo_distritos
 
 
 def get_edictos(
@@ -28,18 +29,18 @@ def get_edictos(
     fecha_hasta: date = None,
 ) -> Any:
     """Consultar los edictos activos"""
-    consulta = db.query(Edicto)
+    consulta = db.query(Edicto).options(joinedload(Edicto.autoridad).joinedload(Autoridad.distrito))
     if autoridad_id is not None:
-        autoridad = get_autoridad(db, autoridad_id)
+        autoridad = catalogo_autoridades.get(db, autoridad_id)
         consulta = consulta.filter_by(autoridad_id=autoridad.id)
     elif autoridad_clave is not None:
-        autoridad = get_autoridad_with_clave(db, autoridad_clave)
+        autoridad = catalogo_autoridades.get_with_clave(db, autoridad_clave)
         consulta = consulta.filter_by(autoridad_id=autoridad.id)
     elif distrito_id is not None:
-        distrito = get_distrito(db, distrito_id)
+        distrito = catalogo_distritos.get(db, distrito_id)
         consulta = consulta.join(Autoridad).filter(Autoridad.distrito_id == distrito.id)
     elif distrito_clave is not None:
-        distrito = get_distrito_with_clave(db, distrito_clave)
+        distrito = catalogo_distritos.get_with_clave(db, distrito_clave)
         consulta = consulta.join(Autoridad).filter(Autoridad.distrito_id == distrito.id)
     if anio is not None:
         desde = date(year=anio, month=1, day=1)
@@ -61,6 +62,9 @@ def get_edictos(
     return consulta.filter_by(estatus="A").order_by(Edicto.id)
 
 
+get_edictos_async = async_variant(get_edictos)
+
+
 def get_edicto(db: Session, edicto_id: int) -> Edicto:
     """Consultar un edicto por su id"""
     edicto = db.query(Edicto).get(edicto_id)
@@ -86,6 +90,30 @@ def create_edicto(db: Session, edicto: Edicto) -> Edicto:
     return edicto
 
 
+def create_edictos(db: Session, edictos: list[Edicto]) -> list[int | MyAnyError]:
+    """Crear varios edictos en una sola transacción, entrega el id de cada uno o el error que tuvo"""
+
+    # Validar las autoridades con una sola consulta
+    autoridades = get_autoridades_with_ids(db, {edicto.autoridad_id for edicto in edictos})
+
+    # Separar los válidos
+    resultados = []
+    for edicto in edictos:
+        autoridad = autoridades[edicto.autoridad_id]
+        if isinstance(autoridad, MyAnyError):
+            resultados.append(autoridad)
+        else:
+            resultados.append(edicto)
+
+    # Insertar todos juntos y tomar los ids antes del commit, los que rechace la base de datos entregan su error
+    ids = iter(insert_all(db, [resultado for resultado in resultados if not isinstance(resultado, MyAnyError)]))
+    resultados = [resultado if isinstance(resultado, MyAnyError) else next(ids) for resultado in resultados]
+    db.commit()
+
+    # Entregar
+    return resultados
+
+
 def update_edicto(db: Session, edicto_id: int, edicto_in: Edicto) -> Edicto:
     """Modificar un edicto"""
 
@@ -4,17 +4,20 @@ Edictos v3, rutas (paths)
 from datetime import date
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_pagination.ext.sqlalchemy import paginate
+from fastapi import APIRouter, Body, Depends, HTTPException, Request, status
 
-from lib.database import Session, get_db
+from lib.database import AsyncSession, Session, get_async_db, get_db
 from lib.exceptions import MyAnyError
+from lib.fastapi_conditional import detail_response
 from lib.fastapi_pagination_custom_page import CustomPage
+from lib.fastapi_pagination_custom_paginate import paginate_async
+from lib.fastapi_streaming_export import ExportFormat, export_response
+from lib.schemas_base import BULK_MAX_ITEMS, BulkOut, OneBaseOut
 
 from ...core.edictos.models import Edicto
 from ...core.permisos.models import Permiso
 from ..usuarios.authentications import UsuarioInDB, get_current_active_user
-from .crud import create_edicto, delete_edicto, get_edicto, get_edictos, update_edicto
+from .crud import create_edicto, create_edictos, delete_edicto, get_edicto, get_edictos, get_edictos_async, update_edicto
 from .schemas import EdictoIn, EdictoOut, OneEdictoOut
 
 edictos = APIRouter(prefix="/v3/edictos", tags=["edictos"])
@@ -23,7 +26,7 @@ edictos = APIRouter(prefix="/v3/edictos", tags=["edictos"])
 @edictos.get("", response_model=CustomPage[EdictoOut])
 async def listado_edictos(
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     autoridad_id: int = None,
     autoridad_clave: str = None,
     distrito_id: int = None,
@@ -38,7 +41,7 @@ async def listado_edictos(
     if current_user.permissions.get("EDICTOS", 0) < Permiso.VER:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     try:
-        resultados = get_edictos(
+        resultados = await get_edictos_async(
             db=db,
             autoridad_id=autoridad_id,
             autoridad_clave=autoridad_clave,
@@ -52,11 +55,48 @@ async def listado_edictos(
         )
     except MyAnyError as error:
         return CustomPage(success=False, message=str(error))
-    return paginate(resultados)
+    return await paginate_async(db, resultados)
+
+
+@edictos.get("/export")
+async def exportar_edictos(
+    current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
+    db: Annotated[Session, Depends(get_db)],
+    autoridad_id: int = None,
+    autoridad_clave: str = None,
+    distrito_id: int = None,
+    distrito_clave: str = None,
+    anio: int = None,
+    expediente: str = None,
+    fecha: date = None,
+    fecha_desde: date = None,
+    fecha_hasta: date = None,
+    formato: ExportFormat = "ndjson",
+):
+    """Exportar edictos en NDJSON o CSV, con los mismos filtros del listado"""
+    if current_user.permissions.get("EDICTOS", 0) < Permiso.VER:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
+    try:
+        resultados = get_edictos(
+            db=db,
+            autoridad_id=autoridad_id,
+            autoridad_clave=autoridad_clave,
+            distrito_id=distrito_id,
+            distrito_clave=distrito_clave,
+            anio=anio,
+            expediente=expediente,
+            fecha=fecha,
+            fecha_desde=fecha_desde,
+            fecha_hasta=fecha_hasta,
+        )
+    except MyAnyError as error:
+        return OneBaseOut(success=False, message=str(error))
+    return export_response(resultados, EdictoOut, formato, "edictos")
 
 
 @edictos.get("/{edicto_id}", response_model=OneEdictoOut)
 async def detalle_edicto(
+    request: Request,
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
     db: Annotated[Session, Depends(get_db)],
     edicto_id: int,
@@ -68,7 +108,7 @@ async def detalle_edicto(
         edicto = get_edicto(db, edicto_id)
     except MyAnyError as error:
         return OneEdictoOut(success=False, message=str(error))
-    return OneEdictoOut.from_orm(edicto)
+    return detail_response(request, edicto, OneEdictoOut)
 
 
 @edictos.post("", response_model=OneEdictoOut)
@@ -89,6 +129,22 @@ async def crear_edicto(
     return respuesta
 
 
+@edictos.post("/bulk", response_model=BulkOut)
+async def crear_edictos(
+    current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
+    db: Annotated[Session, Depends(get_db)],
+    edictos_in: Annotated[list[EdictoIn], Body(max_length=BULK_MAX_ITEMS)],
+):
+    """Crear varios edictos en una sola transacción, entrega el resultado de cada uno en el mismo orden"""
+    if current_user.permissions.get("EDICTOS", 0) < Permiso.CREAR:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
+    try:
+        resultados = create_edictos(db, [Edicto(**edicto_in.dict()) for edicto_in in edictos_in])
+    except MyAnyError as error:
+        return BulkOut(success=False, message=str(error))
+    return BulkOut.from_results(resultados)
+
+
 @edictos.put("/{edicto_id}", response_model=OneEdictoOut)
 async def modificar_edicto(
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
@@ -3,8 +3,9 @@ Entradas-Salidas v3, CRUD (create, read, update, and delete)
 """
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
+from lib.database import async_variant
 from lib.exceptions import MyIsDeletedError, MyNotExistsError, MyNotValidParamError
 from lib.safe_string import safe_email
 
@@ -19,7 +20,7 @@ def get_entradas_salidas(
     usuario_email: str = None,
 ) -> Any:
     """Consultar las entradas-salidas activas"""
-    consulta = db.query(EntradaSalida)
+    consulta = db.query(EntradaSalida).options(joinedload(EntradaSalida.usuario))
     if usuario_id is not None:
         usuario = get_usuario(db, usuario_id)
         consulta = consulta.filter(usuario == usuario)
@@ -32,6 +33,9 @@ def get_entradas_salidas(
     return consulta.filter_by(estatus="A").order_by(EntradaSalida.id.desc())
 
 
+get_entradas_salidas_async = async_variant(get_entradas_salidas)
+
+
 def get_entrada_salida(db: Session, entrada_salida_id: int) -> EntradaSalida:
     """Consultar una entrada-salida por su id"""
     entrada_salida = db.query(EntradaSalida).get(entrada_salida_id)
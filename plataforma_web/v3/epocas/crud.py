@@ -5,6 +5,7 @@ from typing import Any
 
 from sqlalchemy.orm import Session
 
+from lib.database import async_variant
 from lib.exceptions import MyIsDeletedError, MyNotExistsError
 
 from ...core.epocas.models import Epoca
@@ -15,6 +16,9 @@ def get_epocas(db: Session) -> Any:
     return db.query(Epoca).filter_by(estatus="A").order_by(Epoca.nombre)
 
 
+get_epocas_async = async_variant(get_epocas)
+
+
 def get_epoca(db: Session, epoca_id: int) -> Epoca:
     """Consultar una epoca por su id"""
     epoca = db.query(Epoca).get(epoca_id)
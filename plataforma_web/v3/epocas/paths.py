@@ -3,38 +3,44 @@ Epocas v3, rutas (paths)
 """
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_pagination.ext.sqlalchemy import paginate
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from lib.database import Session, get_db
+from lib.database import AsyncSession, Session, get_async_db, get_db
 from lib.exceptions import MyAnyError
+from lib.fastapi_conditional import detail_response
 from lib.fastapi_pagination_custom_page import CustomPage
+from lib.fastapi_pagination_custom_paginate import paginate_async
+from lib.fastapi_response_cache import ResponseCache
 
 from ...core.permisos.models import Permiso
 from ..usuarios.authentications import UsuarioInDB, get_current_active_user
-from .crud import get_epoca, get_epocas
+from .crud import get_epoca, get_epocas_async
 from .schemas import EpocaOut, OneEpocaOut
 
 epocas = APIRouter(prefix="/v3/epocas", tags=["tesis jurisprudencias"])
+epocas_cache = ResponseCache("epocas", modulo="EPOCAS", ttl=86400, tablas=["epocas"])
 
 
 @epocas.get("", response_model=CustomPage[EpocaOut])
+@epocas_cache
 async def listado_epocas(
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
 ):
     """Listado de epocas"""
     if current_user.permissions.get("EPOCAS", 0) < Permiso.VER:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     try:
-        resultados = get_epocas(db)
+        resultados = await get_epocas_async(db)
     except MyAnyError as error:
         return CustomPage(success=False, message=str(error))
-    return paginate(resultados)
+    return await paginate_async(db, resultados)
 
 
 @epocas.get("/{epoca_id}", response_model=OneEpocaOut)
+@epocas_cache
 async def detalle_epoca(
+    request: Request,
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
     db: Annotated[Session, Depends(get_db)],
     epoca_id: int,
@@ -46,4 +52,4 @@ async def detalle_epoca(
         epoca = get_epoca(db, epoca_id)
     except MyAnyError as error:
         return OneEpocaOut(success=False, message=str(error))
-    return OneEpocaOut.from_orm(epoca)
+    return detail_response(request, epoca, OneEpocaOut)
@@ -3,15 +3,16 @@ Funcionarios v3, CRUD (create, read, update, and delete)
 """
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
+from lib.database import async_variant
 from lib.exceptions import MyIsDeletedError, MyNotExistsError
 
 from ...core.centros_trabajos.models import CentroTrabajo
 from ...core.domicilios.models import Domicilio
 from ...core.funcionarios.models import Funcionario
+from ..catalogos import catalogo_distritos
 from ..centros_trabajos.crud import get_centro_trabajo
-from ..distritos.crud import get_distrito, get_distrito_with_clave
 from ..domicilios.crud import get_domicilio
 
 
@@ -27,15 +28,15 @@ def get_funcionarios(
     en_tesis_jurisprudencias: bool = None,
 ) -> Any:
     """Consultar los funcionarios activos"""
-    consulta = db.query(Funcionario)
+    consulta = db.query(Funcionario).options(joinedload(Funcionario.centro_trabajo))
     if centro_trabajo_id is not None:
         centro_trabajo = get_centro_trabajo(db, centro_trabajo_id)
         consulta = consulta.filter_by(centro_trabajo=centro_trabajo)
     if distrito_id is not None:
-        distrito = get_distrito(db, distrito_id)
+        distrito = catalogo_distritos.get(db, distrito_id)
         consulta = consulta.join(CentroTrabajo).filter_by(distrito_id=distrito.id)
     elif distrito_clave is not None:
-        distrito = get_distrito_with_clave(db, distrito_clave)
+        distrito = catalogo_distritos.get_with_clave(db, distrito_clave)
         consulta = consulta.join(CentroTrabajo).filter_by(distrito_id=distrito.id)
     if domicilio_id is not None:
         domicilio = get_domicilio(db, domicilio_id)
@@ -51,6 +52,9 @@ def get_funcionarios(
     return consulta.filter_by(estatus="A").order_by(Funcionario.id)
 
 
+get_funcionarios_async = async_variant(get_funcionarios)
+
+
 def get_funcionario(db: Session, funcionario_id: int) -> Funcionario:
     """Consultar un funcionario por su id"""
     funcionario = db.query(Funcionario).get(funcionario_id)
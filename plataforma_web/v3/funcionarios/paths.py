@@ -3,16 +3,17 @@ Funcionarios v3, rutas (paths)
 """
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_pagination.ext.sqlalchemy import paginate
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from lib.database import Session, get_db
+from lib.database import AsyncSession, Session, get_async_db, get_db
 from lib.exceptions import MyAnyError
+from lib.fastapi_conditional import detail_response
 from lib.fastapi_pagination_custom_page import CustomPage
+from lib.fastapi_pagination_custom_paginate import paginate_async
 
 from ...core.permisos.models import Permiso
 from ..usuarios.authentications import UsuarioInDB, get_current_active_user
-from .crud import get_funcionario, get_funcionarios
+from .crud import get_funcionario, get_funcionarios_async
 from .schemas import FuncionarioOut, OneFuncionarioOut
 
 funcionarios = APIRouter(prefix="/v3/funcionarios", tags=["funcionarios"])
@@ -21,7 +22,7 @@ funcionarios = APIRouter(prefix="/v3/funcionarios", tags=["funcionarios"])
 @funcionarios.get("", response_model=CustomPage[FuncionarioOut])
 async def listado_funcionarios(
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     centro_trabajo_id: int = None,
     distrito_id: int = None,
     distrito_clave: str = None,
@@ -35,7 +36,7 @@ async def listado_funcionarios(
     if current_user.permissions.get("FUNCIONARIOS", 0) < Permiso.VER:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     try:
-        resultados = get_funcionarios(
+        resultados = await get_funcionarios_async(
             db=db,
             centro_trabajo_id=centro_trabajo_id,
             distrito_id=distrito_id,
@@ -48,11 +49,12 @@ async def listado_funcionarios(
         )
     except MyAnyError as error:
         return CustomPage(success=False, message=str(error))
-    return paginate(resultados)
+    return await paginate_async(db, resultados)
 
 
 @funcionarios.get("/{funcionario_id}", response_model=OneFuncionarioOut)
 async def detalle_funcionario(
+    request: Request,
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
     db: Annotated[Session, Depends(get_db)],
     funcionario_id: int,
@@ -64,4 +66,4 @@ async def detalle_funcionario(
         funcionario = get_funcionario(db, funcionario_id)
     except MyAnyError as error:
         return OneFuncionarioOut(success=False, message=str(error))
-    return OneFuncionarioOut.from_orm(funcionario)
+    return detail_response(request, funcionario, OneFuncionarioOut)
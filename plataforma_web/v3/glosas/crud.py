@@ -4,15 +4,16 @@ Glosas v3, CRUD (create, read, update, and delete)
 from datetime import date
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
+from lib.database import async_variant
 from lib.exceptions import MyIsDeletedError, MyNotExistsError, MyNotValidParamError
 from lib.safe_string import safe_expediente
 
 from ...core.autoridades.models import Autoridad
 from ...core.glosas.models import Glosa
-from ..autoridades.crud import get_autoridad, get_autoridad_with_clave
-from ..distritos.crud import get_distrito, get_distrito_with_clave
+from ..autoridades.crud import get_autoridad
+from ..catalogos import catalogo_autoridades, catalogo_distritos
 
 
 def get_glosas(
@@ -28,18 +29,18 @@ def get_glosas(
     fecha_hasta: date = None,
 ) -> Any:
     """Consultar los glosas activas"""
-    consulta = db.query(Glosa)
+    consulta = db.query(Glosa).options(joinedload(Glosa.autoridad).joinedload(Autoridad.distrito))
     if autoridad_id is not None:
-        autoridad = get_autoridad(db, autoridad_id)
+        autoridad = catalogo_autoridades.get(db, autoridad_id)
         consulta = consulta.filter_by(autoridad_id=autoridad.id)
     elif autoridad_clave is not None:
-        autoridad = get_autoridad_with_clave(db, autoridad_clave)
+        autoridad = catalogo_autoridades.get_with_clave(db, autoridad_clave)
         consulta = consulta.filter_by(autoridad_id=autoridad.id)
     elif distrito_id is not None:
-        distrito = get_distrito(db, distrito_id)
+        distrito = catalogo_distritos.get(db, distrito_id)
         consulta = consulta.join(Autoridad).filter(Autoridad.distrito_id == distrito.id)
     elif distrito_clave is not None:
-        distrito = get_distrito_with_clave(db, distrito_clave)
+        distrito = catalogo_distritos.get_with_clave(db, distrito_clave)
         consulta = consulta.join(Autoridad).filter(Autoridad.distrito_id == distrito.id)
     if expediente is not None:
         try:
@@ -61,6 +62,9 @@ def get_glosas(
     return consulta.filter_by(estatus="A").order_by(Glosa.id)
 
 
+get_glosas_async = async_variant(get_glosas)
+
+
 def get_glosa(db: Session, glosa_id: int) -> Glosa:
     """Consultar un glosa por su id"""
     glosa = db.query(Glosa).get(glosa_id)
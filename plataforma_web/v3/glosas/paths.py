@@ -4,17 +4,20 @@ Glosas v3, rutas (paths)
 from datetime import date
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_pagination.ext.sqlalchemy import paginate
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from lib.database import Session, get_db
+from lib.database import AsyncSession, Session, get_async_db, get_db
 from lib.exceptions import MyAnyError
+from lib.fastapi_conditional import detail_response
 from lib.fastapi_pagination_custom_page import CustomPage
+from lib.fastapi_pagination_custom_paginate import paginate_async
+from lib.fastapi_streaming_export import ExportFormat, export_response
+from lib.schemas_base import OneBaseOut
 
 from ...core.glosas.models import Glosa
 from ...core.permisos.models import Permiso
 from ..usuarios.authentications import UsuarioInDB, get_current_active_user
-from .crud import create_glosa, delete_glosa, get_glosa, get_glosas, update_glosa
+from .crud import create_glosa, delete_glosa, get_glosa, get_glosas, get_glosas_async, update_glosa
 from .schemas import GlosaIn, GlosaOut, OneGlosaOut
 
 glosas = APIRouter(prefix="/v3/glosas", tags=["glosas"])
@@ -23,7 +26,7 @@ glosas = APIRouter(prefix="/v3/glosas", tags=["glosas"])
 @glosas.get("", response_model=CustomPage[GlosaOut])
 async def listado_glosas(
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     autoridad_id: int = None,
     autoridad_clave: str = None,
     distrito_id: int = None,
@@ -38,7 +41,7 @@ async def listado_glosas(
     if current_user.permissions.get("GLOSAS", 0) < Permiso.VER:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     try:
-        resultados = get_glosas(
+        resultados = await get_glosas_async(
             db=db,
             autoridad_id=autoridad_id,
             autoridad_clave=autoridad_clave,
@@ -52,11 +55,48 @@ async def listado_glosas(
         )
     except MyAnyError as error:
         return CustomPage(success=False, message=str(error))
-    return paginate(resultados)
+    return await paginate_async(db, resultados)
+
+
+@glosas.get("/export")
+async def exportar_glosas(
+    current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
+    db: Annotated[Session, Depends(get_db)],
+    autoridad_id: int = None,
+    autoridad_clave: str = None,
+    distrito_id: int = None,
+    distrito_clave: str = None,
+    expediente: str = None,
+    anio: int = None,
+    fecha: date = None,
+    fecha_desde: date = None,
+    fecha_hasta: date = None,
+    formato: ExportFormat = "ndjson",
+):
+    """Exportar glosas en NDJSON o CSV, con los mismos filtros del listado"""
+    if current_user.permissions.get("GLOSAS", 0) < Permiso.VER:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
+    try:
+        resultados = get_glosas(
+            db=db,
+            autoridad_id=autoridad_id,
+            autoridad_clave=autoridad_clave,
+            distrito_id=distrito_id,
+            distrito_clave=distrito_clave,
+            expediente=expediente,
+            anio=anio,
+            fecha=fecha,
+            fecha_desde=fecha_desde,
+            fecha_hasta=fecha_hasta,
+        )
+    except MyAnyError as error:
+        return OneBaseOut(success=False, message=str(error))
+    return export_response(resultados, GlosaOut, formato, "glosas")
 
 
 @glosas.get("/{glosa_id}", response_model=OneGlosaOut)
 async def detalle_glosa(
+    request: Request,
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
     db: Annotated[Session, Depends(get_db)],
     glosa_id: int,
@@ -68,7 +108,7 @@ async def detalle_glosa(
         glosa = get_glosa(db, glosa_id)
     except MyAnyError as error:
         return OneGlosaOut(success=False, message=str(error))
-    return OneGlosaOut.from_orm(glosa)
+    return detail_response(request, glosa, OneGlosaOut)
 
 
 @glosas.post("", response_model=OneGlosaOut)
@@ -5,6 +5,7 @@ from typing import Any
 
 from sqlalchemy.orm import Session
 
+from lib.database import async_variant
 from lib.exceptions import MyIsDeletedError, MyNotExistsError
 
 from ...core.inv_categorias.models import InvCategoria
@@ -15,6 +16,9 @@ def get_inv_categorias(db: Session) -> Any:
     return db.query(InvCategoria).filter_by(estatus="A").order_by(InvCategoria.nombre)
 
 
+get_inv_categorias_async = async_variant(get_inv_categorias)
+
+
 def get_inv_categoria(db: Session, inv_categoria_id: int) -> InvCategoria:
     """Consultar un categoria por su id"""
     inv_categoria = db.query(InvCategoria).get(inv_categoria_id)
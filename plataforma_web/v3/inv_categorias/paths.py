@@ -3,38 +3,44 @@ Inventarios Categorias v3, rutas (paths)
 """
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_pagination.ext.sqlalchemy import paginate
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from lib.database import Session, get_db
+from lib.database import AsyncSession, Session, get_async_db, get_db
 from lib.exceptions import MyAnyError
+from lib.fastapi_conditional import detail_response
 from lib.fastapi_pagination_custom_page import CustomPage
+from lib.fastapi_pagination_custom_paginate import paginate_async
+from lib.fastapi_response_cache import ResponseCache
 
 from ...core.permisos.models import Permiso
 from ..usuarios.authentications import UsuarioInDB, get_current_active_user
-from .crud import get_inv_categoria, get_inv_categorias
+from .crud import get_inv_categoria, get_inv_categorias_async
 from .schemas import InvCategoriaOut, OneInvCategoriaOut
 
 inv_categorias = APIRouter(prefix="/v3/inv_categorias", tags=["inventarios"])
+inv_categorias_cache = ResponseCache("inv_categorias", modulo="INV CATEGORIAS", ttl=3600, tablas=["inv_categorias"])
 
 
 @inv_categorias.get("", response_model=CustomPage[InvCategoriaOut])
+@inv_categorias_cache
 async def listado_inv_categorias(
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
 ):
     """Listado de categorias"""
     if current_user.permissions.get("INV CATEGORIAS", 0) < Permiso.VER:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     try:
-        resultados = get_inv_categorias(db)
+        resultados = await get_inv_categorias_async(db)
     except MyAnyError as error:
         return CustomPage(success=False, message=str(error))
-    return paginate(resultados)
+    return await paginate_async(db, resultados)
 
 
 @inv_categorias.get("/{inv_categoria_id}", response_model=OneInvCategoriaOut)
+@inv_categorias_cache
 async def detalle_inv_categoria(
+    request: Request,
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
     db: Annotated[Session, Depends(get_db)],
     inv_categoria_id: int,
@@ -46,4 +52,4 @@ async def detalle_inv_categoria(
         inv_categoria = get_inv_categoria(db, inv_categoria_id)
     except MyAnyError as error:
         return OneInvCategoriaOut(success=False, message=str(error))
-    return OneInvCategoriaOut.from_orm(inv_categoria)
+    return detail_response(request, inv_categoria, OneInvCategoriaOut)
@@ -3,8 +3,9 @@ Inventarios Componentes v3, CRUD (create, read, update, and delete)
 """
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
+from lib.database import async_variant
 from lib.exceptions import MyIsDeletedError, MyNotExistsError
 from lib.safe_string import safe_string
 
@@ -20,7 +21,7 @@ def get_inv_componentes(
     generacion: str = None,
 ) -> Any:
     """Consultar los componentes activos"""
-    consulta = db.query(InvComponente)
+    consulta = db.query(InvComponente).options(joinedload(InvComponente.inv_categoria), joinedload(InvComponente.inv_equipo))
     if inv_categoria_id is not None:
         inv_categoria = get_inv_categoria(db, inv_categoria_id=inv_categoria_id)
         consulta = consulta.filter(InvComponente.inv_categoria == inv_categoria)
@@ -34,6 +35,9 @@ def get_inv_componentes(
     return consulta.filter_by(estatus="A").order_by(InvComponente.id.desc())
 
 
+get_inv_componentes_async = async_variant(get_inv_componentes)
+
+
 def get_inv_componente(db: Session, inv_componente_id: int) -> InvComponente:
     """Consultar un componente por su id"""
     inv_componente = db.query(InvComponente).get(inv_componente_id)
@@ -3,16 +3,17 @@ Inventarios Componentes v3, rutas (paths)
 """
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_pagination.ext.sqlalchemy import paginate
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from lib.database import Session, get_db
+from lib.database import AsyncSession, Session, get_async_db, get_db
 from lib.exceptions import MyAnyError
+from lib.fastapi_conditional import detail_response
 from lib.fastapi_pagination_custom_page import CustomPage
+from lib.fastapi_pagination_custom_paginate import paginate_async
 
 from ...core.permisos.models import Permiso
 from ..usuarios.authentications import UsuarioInDB, get_current_active_user
-from .crud import get_inv_componente, get_inv_componentes
+from .crud import get_inv_componente, get_inv_componentes_async
 from .schemas import InvComponenteOut, OneInvComponenteOut
 
 inv_componentes = APIRouter(prefix="/v3/inv_componentes", tags=["inventarios"])
@@ -21,7 +22,7 @@ inv_componentes = APIRouter(prefix="/v3/inv_componentes", tags=["inventarios"])
 @inv_componentes.get("", response_model=CustomPage[InvComponenteOut])
 async def listado_inv_componentes(
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     generacion: str = None,
     inv_categoria_id: int = None,
     inv_equipo_id: int = None,
@@ -30,7 +31,7 @@ async def listado_inv_componentes(
     if current_user.permissions.get("INV COMPONENTES", 0) < Permiso.VER:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     try:
-        resultados = get_inv_componentes(
+        resultados = await get_inv_componentes_async(
             db=db,
             generacion=generacion,
             inv_categoria_id=inv_categoria_id,
@@ -38,11 +39,12 @@ async def listado_inv_componentes(
         )
     except MyAnyError as error:
         return CustomPage(success=False, message=str(error))
-    return paginate(resultados)
+    return await paginate_async(db, resultados)
 
 
 @inv_componentes.get("/{inv_componente_id}", response_model=OneInvComponenteOut)
 async def detalle_inv_componente(
+    request: Request,
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
     db: Annotated[Session, Depends(get_db)],
     inv_componente_id: int,
@@ -54,4 +56,4 @@ async def detalle_inv_componente(
         inv_componente = get_inv_componente(db, inv_componente_id)
     except MyAnyError as error:
         return OneInvComponenteOut(success=False, message=str(error))
-    return OneInvComponenteOut.from_orm(inv_componente)
+    return detail_response(request, inv_componente, OneInvComponenteOut)
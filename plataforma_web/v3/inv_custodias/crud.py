@@ -4,15 +4,15 @@ Inventarios Custodias v3, CRUD (create, read, update, and delete)
 from datetime import date
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
+from lib.database import async_variant
 from lib.exceptions import MyIsDeletedError, MyNotExistsError
 
 from ...core.inv_custodias.models import InvCustodia
 from ...core.oficinas.models import Oficina
 from ...core.usuarios.models import Usuario
-from ..distritos.crud import get_distrito, get_distrito_with_clave
-from ..oficinas.crud import get_oficina, get_oficina_with_clave
+from ..catalogos import catalogo_distritos, catalogo_oficinas
 from ..usuarios.crud import get_usuario, get_usuario_with_email
 
 
@@ -28,29 +28,29 @@ def get_inv_custodias(
     usuario_email: str = None,
 ) -> Any:
     """Consultar los custodias activos"""
-    consulta = db.query(InvCustodia)
+    consulta = db.query(InvCustodia).options(joinedload(InvCustodia.usuario).joinedload(Usuario.oficina).joinedload(Oficina.distrito), joinedload(InvCustodia.usuario).joinedload(Usuario.oficina).joinedload(Oficina.domicilio))
     if fecha_desde is not None:
         consulta = consulta.filter(InvCustodia.fecha >= fecha_desde)
     if fecha_hasta is not None:
         consulta = consulta.filter(InvCustodia.fecha <= fecha_hasta)
     if oficina_id is not None:
-        oficina = get_oficina(db, oficina_id)
+        oficina = catalogo_oficinas.get(db, oficina_id)
         consulta = consulta.join(Usuario)
-        consulta = consulta.filter(Usuario.oficina == oficina)
+        consulta = consulta.filter(Usuario.oficina_id == oficina.id)
     elif oficina_clave is not None:
-        oficina = get_oficina_with_clave(db, oficina_clave)
+        oficina = catalogo_oficinas.get_with_clave(db, oficina_clave)
         consulta = consulta.join(Usuario)
-        consulta = consulta.filter(Usuario.oficina == oficina)
+        consulta = consulta.filter(Usuario.oficina_id == oficina.id)
     elif distrito_id is not None:
-        distrito = get_distrito(db, distrito_id)
+        distrito = catalogo_distritos.get(db, distrito_id)
         consulta = consulta.join(Usuario)
         consulta = consulta.join(Oficina)
-        consulta = consulta.filter(Oficina.distrito == distrito)
+        consulta = consulta.filter(Oficina.distrito_id == distrito.id)
     elif distrito_clave is not None:
-        distrito = get_distrito_with_clave(db, distrito_clave)
+        distrito = catalogo_distritos.get_with_clave(db, distrito_clave)
         consulta = consulta.join(Usuario)
         consulta = consulta.join(Oficina)
-        consulta = consulta.filter(Oficina.distrito == distrito)
+        consulta = consulta.filter(Oficina.distrito_id == distrito.id)
     if usuario_id is not None:
         usuario = get_usuario(db, usuario_id=usuario_id)
         consulta = consulta.filter(InvCustodia.usuario == usuario)
@@ -60,6 +60,9 @@ def get_inv_custodias(
     return consulta.filter_by(estatus="A").order_by(InvCustodia.id)
 
 
+get_inv_custodias_async = async_variant(get_inv_custodias)
+
+
 def get_inv_custodia(db: Session, inv_custodia_id: int) -> InvCustodia:
     """Consultar un custodia por su id"""
     inv_custodia = db.query(InvCustodia).get(inv_custodia_id)
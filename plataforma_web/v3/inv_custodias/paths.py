@@ -4,16 +4,17 @@ Inventarios Custodias v3, rutas (paths)
 from datetime import date
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_pagination.ext.sqlalchemy import paginate
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from lib.database import Session, get_db
+from lib.database import AsyncSession, Session, get_async_db, get_db
 from lib.exceptions import MyAnyError
+from lib.fastapi_conditional import detail_response
 from lib.fastapi_pagination_custom_page import CustomPage
+from lib.fastapi_pagination_custom_paginate import paginate_async
 
 from ...core.permisos.models import Permiso
 from ..usuarios.authentications import UsuarioInDB, get_current_active_user
-from .crud import get_inv_custodia, get_inv_custodias
+from .crud import get_inv_custodia, get_inv_custodias_async
 from .schemas import InvCustodiaOut, OneInvCustodiaOut
 
 inv_custodias = APIRouter(prefix="/v3/inv_custodias", tags=["inventarios"])
@@ -22,7 +23,7 @@ inv_custodias = APIRouter(prefix="/v3/inv_custodias", tags=["inventarios"])
 @inv_custodias.get("", response_model=CustomPage[InvCustodiaOut])
 async def listado_inv_custodias(
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     distrito_id: int = None,
     distrito_clave: str = None,
     fecha_desde: date = None,
@@ -36,7 +37,7 @@ async def listado_inv_custodias(
     if current_user.permissions.get("INV CUSTODIAS", 0) < Permiso.VER:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     try:
-        resultados = get_inv_custodias(
+        resultados = await get_inv_custodias_async(
             db=db,
             distrito_id=distrito_id,
             distrito_clave=distrito_clave,
@@ -49,11 +50,12 @@ async def listado_inv_custodias(
         )
     except MyAnyError as error:
         return CustomPage(success=False, message=str(error))
-    return paginate(resultados)
+    return await paginate_async(db, resultados)
 
 
 @inv_custodias.get("/{inv_custodia_id}", response_model=OneInvCustodiaOut)
 async def detalle_inv_custodia(
+    request: Request,
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
     db: Annotated[Session, Depends(get_db)],
     inv_custodia_id: int,
@@ -65,4 +67,4 @@ async def detalle_inv_custodia(
         inv_custodia = get_inv_custodia(db, inv_custodia_id)
     except MyAnyError as error:
         return OneInvCustodiaOut(success=False, message=str(error))
-    return OneInvCustodiaOut.from_orm(inv_custodia)
+    return detail_response(request, inv_custodia, OneInvCustodiaOut)
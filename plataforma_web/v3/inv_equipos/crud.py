@@ -5,20 +5,22 @@ from datetime import date, datetime
 from typing import Any
 
 import pytz
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload, selectinload
 
+from lib.database import async_variant
 from lib.exceptions import MyIsDeletedError, MyNotExistsError
 from lib.safe_string import safe_string
 
+from ...core.inv_componentes.models import InvComponente
 from ...core.inv_custodias.models import InvCustodia
 from ...core.inv_equipos.models import InvEquipo
+from ...core.inv_modelos.models import InvModelo
 from ...core.oficinas.models import Oficina
 from ...core.usuarios.models import Usuario
-from ..distritos.crud import get_distrito, get_distrito_with_clave
+from ..catalogos import catalogo_distritos, catalogo_oficinas
 from ..inv_custodias.crud import get_inv_custodia
 from ..inv_modelos.crud import get_inv_modelo
 from ..inv_redes.crud import get_inv_red
-from ..oficinas.crud import get_oficina, get_oficina_with_clave
 
 
 def get_inv_equipos(
@@ -39,7 +41,13 @@ def get_inv_equipos(
 ) -> Any:
     """Consultar los equipos activos"""
     servidor_huso_horario = pytz.utc
-    consulta = db.query(InvEquipo)
+    consulta = db.query(InvEquipo).options(
+        joinedload(InvEquipo.inv_custodia).joinedload(InvCustodia.usuario).joinedload(Usuario.oficina).joinedload(Oficina.distrito),
+        joinedload(InvEquipo.inv_custodia).joinedload(InvCustodia.usuario).joinedload(Usuario.oficina).joinedload(Oficina.domicilio),
+        joinedload(InvEquipo.inv_modelo).joinedload(InvModelo.inv_marca),
+        joinedload(InvEquipo.inv_red),
+        selectinload(InvEquipo.inv_componentes).joinedload(InvComponente.inv_categoria),
+    )
     if creado is not None:
         desde_dt = datetime(year=creado.year, month=creado.month, day=creado.day, hour=0, minute=0, second=0).astimezone(servidor_huso_horario)
         hasta_dt = datetime(year=creado.year, month=creado.month, day=creado.day, hour=23, minute=59, second=59).astimezone(servidor_huso_horario)
@@ -64,27 +72,27 @@ def get_inv_equipos(
         inv_red = get_inv_red(db, inv_red_id)
         consulta = consulta.filter(InvEquipo.inv_red == inv_red)
     if oficina_id is not None:
-        oficina = get_oficina(db, oficina_id)
+        oficina = catalogo_oficinas.get(db, oficina_id)
         consulta = consulta.join(InvCustodia)
         consulta = consulta.join(Usuario)
-        consulta = consulta.filter(Usuario.oficina == oficina)
+        consulta = consulta.filter(Usuario.oficina_id == oficina.id)
     elif oficina_clave is not None:
-        oficina = get_oficina_with_clave(db, oficina_clave)
+        oficina = catalogo_oficinas.get_with_clave(db, oficina_clave)
         consulta = consulta.join(InvCustodia)
         consulta = consulta.join(Usuario)
-        consulta = consulta.filter(Usuario.oficina == oficina)
+        consulta = consulta.filter(Usuario.oficina_id == oficina.id)
     elif distrito_id is not None:
-        distrito = get_distrito(db, distrito_id)
+        distrito = catalogo_distritos.get(db, distrito_id)
         consulta = consulta.join(InvCustodia)
         consulta = consulta.join(Usuario)
         consulta = consulta.join(Oficina)
-        consulta = consulta.filter(Oficina.distrito == distrito)
+        consulta = consulta.filter(Oficina.distrito_id == distrito.id)
     elif distrito_clave is not None:
-        distrito = get_distrito_with_clave(db, distrito_clave)
+        distrito = catalogo_distritos.get_with_clave(db, distrito_clave)
         consulta = consulta.join(InvCustodia)
         consulta = consulta.join(Usuario)
         consulta = consulta.join(Oficina)
-        consulta = consulta.filter(Oficina.distrito == distrito)
+        consulta = consulta.filter(Oficina.distrito_id == distrito.id)
     if tipo is not None:
         tipo = safe_string(tipo)
         if tipo in InvEquipo.TIPOS:
@@ -92,6 +100,9 @@ def get_inv_equipos(
     return consulta.filter_by(estatus="A").order_by(InvEquipo.id)
 
 
+get_inv_equipos_async = async_variant(get_inv_equipos)
+
+
 def get_inv_equipo(db: Session, inv_equipo_id: int) -> InvEquipo:
     """Consultar un equipo por su id"""
     inv_equipo = db.query(InvEquipo).get(inv_equipo_id)
@@ -4,16 +4,17 @@ Inventarios Equipos v3, rutas (paths)
 from datetime import date
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_pagination.ext.sqlalchemy import paginate
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from lib.database import Session, get_db
+from lib.database import AsyncSession, Session, get_async_db, get_db
 from lib.exceptions import MyAnyError
+from lib.fastapi_conditional import detail_response
 from lib.fastapi_pagination_custom_page import CustomPage
+from lib.fastapi_pagination_custom_paginate import paginate_async
 
 from ...core.permisos.models import Permiso
 from ..usuarios.authentications import UsuarioInDB, get_current_active_user
-from .crud import get_inv_equipo, get_inv_equipos
+from .crud import get_inv_equipo, get_inv_equipos_async
 from .schemas import InvEquipoOut, OneInvEquipoOut
 
 inv_equipos = APIRouter(prefix="/v3/inv_equipos", tags=["inventarios"])
@@ -22,7 +23,7 @@ inv_equipos = APIRouter(prefix="/v3/inv_equipos", tags=["inventarios"])
 @inv_equipos.get("", response_model=CustomPage[InvEquipoOut])
 async def listado_inv_equipos(
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     creado: date = None,
     creado_desde: date = None,
     creado_hasta: date = None,
@@ -41,7 +42,7 @@ async def listado_inv_equipos(
     if current_user.permissions.get("INV EQUIPOS", 0) < Permiso.VER:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     try:
-        resultados = get_inv_equipos(
+        resultados = await get_inv_equipos_async(
             db=db,
             creado=creado,
             creado_desde=creado_desde,
@@ -59,11 +60,12 @@ async def listado_inv_equipos(
         )
     except MyAnyError as error:
         return CustomPage(success=False, message=str(error))
-    return paginate(resultados)
+    return await paginate_async(db, resultados)
 
 
 @inv_equipos.get("/{inv_equipo_id}", response_model=OneInvEquipoOut)
 async def detalle_inv_equipo(
+    request: Request,
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
     db: Annotated[Session, Depends(get_db)],
     inv_equipo_id: int,
@@ -75,4 +77,4 @@ async def detalle_inv_equipo(
         inv_equipo = get_inv_equipo(db, inv_equipo_id)
     except MyAnyError as error:
         return OneInvEquipoOut(success=False, message=str(error))
-    return OneInvEquipoOut.from_orm(inv_equipo)
+    return detail_response(request, inv_equipo, OneInvEquipoOut)
@@ -5,6 +5,7 @@ from typing import Any
 
 from sqlalchemy.orm import Session
 
+from lib.database import async_variant
 from lib.exceptions import MyIsDeletedError, MyNotExistsError
 
 from ...core.inv_marcas.models import InvMarca
@@ -15,6 +16,9 @@ def get_inv_marcas(db: Session) -> Any:
     return db.query(InvMarca).filter_by(estatus="A").order_by(InvMarca.nombre)
 
 
+get_inv_marcas_async = async_variant(get_inv_marcas)
+
+
 def get_inv_marca(db: Session, inv_marca_id: int) -> InvMarca:
     """Consultar un marca por su id"""
     inv_marca = db.query(InvMarca).get(inv_marca_id)
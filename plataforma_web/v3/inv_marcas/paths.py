@@ -3,38 +3,44 @@ Inventarios Marcas v3, rutas (paths)
 """
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_pagination.ext.sqlalchemy import paginate
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from lib.database import Session, get_db
+from lib.database import AsyncSession, Session, get_async_db, get_db
 from lib.exceptions import MyAnyError
+from lib.fastapi_conditional import detail_response
 from lib.fastapi_pagination_custom_page import CustomPage
+from lib.fastapi_pagination_custom_paginate import paginate_async
+from lib.fastapi_response_cache import ResponseCache
 
 from ...core.permisos.models import Permiso
 from ..usuarios.authentications import UsuarioInDB, get_current_active_user
-from .crud import get_inv_marca, get_inv_marcas
+from .crud import get_inv_marca, get_inv_marcas_async
 from .schemas import InvMarcaOut, OneInvMarcaOut
 
 inv_marcas = APIRouter(prefix="/v3/inv_marcas", tags=["inventarios"])
+inv_marcas_cache = ResponseCache("inv_marcas", modulo="INV MARCAS", ttl=3600, tablas=["inv_marcas"])
 
 
 @inv_marcas.get("", response_model=CustomPage[InvMarcaOut])
+@inv_marcas_cache
 async def listado_inv_marcas(
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
 ):
     """Listado de marcas"""
     if current_user.permissions.get("INV MARCAS", 0) < Permiso.VER:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     try:
-        resultados = get_inv_marcas(db)
+        resultados = await get_inv_marcas_async(db)
     except MyAnyError as error:
         return CustomPage(success=False, message=str(error))
-    return paginate(resultados)
+    return await paginate_async(db, resultados)
 
 
 @inv_marcas.get("/{inv_marca_id}", response_model=OneInvMarcaOut)
+@inv_marcas_cache
 async def detalle_inv_marca(
+    request: Request,
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
     db: Annotated[Session, Depends(get_db)],
     inv_marca_id: int,
@@ -46,4 +52,4 @@ async def detalle_inv_marca(
         inv_marca = get_inv_marca(db, inv_marca_id)
     except MyAnyError as error:
         return OneInvMarcaOut(success=False, message=str(error))
-    return OneInvMarcaOut.from_orm(inv_marca)
+    return detail_response(request, inv_marca, OneInvMarcaOut)
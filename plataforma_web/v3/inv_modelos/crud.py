@@ -3,8 +3,9 @@ Inventarios Modelos v3, CRUD (create, read, update, and delete)
 """
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, contains_eager
 
+from lib.database import async_variant
 from lib.exceptions import MyIsDeletedError, MyNotExistsError
 
 from ...core.inv_marcas.models import InvMarca
@@ -21,8 +22,11 @@ def get_inv_modelos(
     if inv_marca_id:
         inv_marca = get_inv_marca(db, inv_marca_id=inv_marca_id)
         consulta = consulta.filter(InvModelo.inv_marca == inv_marca)
-    consulta = consulta.join(InvMarca)
-    return consulta.filter_by(estatus="A").order_by(InvMarca.nombre, InvModelo.descripcion)
+    consulta = consulta.join(InvMarca).options(contains_eager(InvModelo.inv_marca))
+    return consulta.filter_by(estatus="A").order_by(InvMarca.nombre, InvModelo.descripcion, InvModelo.id)
+
+
+get_inv_modelos_async = async_variant(get_inv_modelos)
 
 
 def get_inv_modelo(db: Session, inv_modelo_id: int) -> InvModelo:
@@ -3,16 +3,17 @@ Inventarios Modelos v3, rutas (paths)
 """
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_pagination.ext.sqlalchemy import paginate
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from lib.database import Session, get_db
+from lib.database import AsyncSession, Session, get_async_db, get_db
 from lib.exceptions import MyAnyError
+from lib.fastapi_conditional import detail_response
 from lib.fastapi_pagination_custom_page import CustomPage
+from lib.fastapi_pagination_custom_paginate import paginate_async
 
 from ...core.permisos.models import Permiso
 from ..usuarios.authentications import UsuarioInDB, get_current_active_user
-from .crud import get_inv_modelo, get_inv_modelos
+from .crud import get_inv_modelo, get_inv_modelos_async
 from .schemas import InvModeloOut, OneInvModeloOut
 
 inv_modelos = APIRouter(prefix="/v3/inv_modelos", tags=["inventarios"])
@@ -21,24 +22,25 @@ inv_modelos = APIRouter(prefix="/v3/inv_modelos", tags=["inventarios"])
 @inv_modelos.get("", response_model=CustomPage[InvModeloOut])
 async def listado_inv_modelos(
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     inv_marca_id: int = None,
 ):
     """Listado de modelos"""
     if current_user.permissions.get("INV MODELOS", 0) < Permiso.VER:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     try:
-        resultados = get_inv_modelos(
+        resultados = await get_inv_modelos_async(
             db=db,
             inv_marca_id=inv_marca_id,
         )
     except MyAnyError as error:
         return CustomPage(success=False, message=str(error))
-    return paginate(resultados)
+    return await paginate_async(db, resultados)
 
 
 @inv_modelos.get("/{inv_modelo_id}", response_model=OneInvModeloOut)
 async def detalle_inv_modelo(
+    request: Request,
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
     db: Annotated[Session, Depends(get_db)],
     inv_modelo_id: int,
@@ -50,4 +52,4 @@ async def detalle_inv_modelo(
         inv_modelo = get_inv_modelo(db, inv_modelo_id)
     except MyAnyError as error:
         return OneInvModeloOut(success=False, message=str(error))
-    return OneInvModeloOut.from_orm(inv_modelo)
+    return detail_response(request, inv_modelo, OneInvModeloOut)
@@ -5,6 +5,7 @@ from typing import Any
 
 from sqlalchemy.orm import Session
 
+from lib.database import async_variant
 from lib.exceptions import MyIsDeletedError, MyNotExistsError
 
 from ...core.inv_redes.models import InvRed
@@ -15,6 +16,9 @@ def get_inv_redes(db: Session) -> Any:
     return db.query(InvRed).filter_by(estatus="A").order_by(InvRed.nombre)
 
 
+get_inv_redes_async = async_variant(get_inv_redes)
+
+
 def get_inv_red(db: Session, inv_red_id: int) -> InvRed:
     """Consultar una red por su id"""
     inv_red = db.query(InvRed).get(inv_red_id)
@@ -3,16 +3,17 @@ Inventarios Redes v3, rutas (paths)
 """
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_pagination.ext.sqlalchemy import paginate
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from lib.database import Session, get_db
+from lib.database import AsyncSession, Session, get_async_db, get_db
 from lib.exceptions import MyAnyError
+from lib.fastapi_conditional import detail_response
 from lib.fastapi_pagination_custom_page import CustomPage
+from lib.fastapi_pagination_custom_paginate import paginate_async
 
 from ...core.permisos.models import Permiso
 from ..usuarios.authentications import UsuarioInDB, get_current_active_user
-from .crud import get_inv_red, get_inv_redes
+from .crud import get_inv_red, get_inv_redes_async
 from .schemas import InvRedOut, OneInvRedOut
 
 inv_redes = APIRouter(prefix="/v3/inv_redes", tags=["inventarios"])
@@ -21,20 +22,21 @@ inv_redes = APIRouter(prefix="/v3/inv_redes", tags=["inventarios"])
 @inv_redes.get("", response_model=CustomPage[InvRedOut])
 async def listado_inv_redes(
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
 ):
     """Listado de redes"""
     if current_user.permissions.get("INV REDES", 0) < Permiso.VER:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     try:
-        resultados = get_inv_redes(db)
+        resultados = await get_inv_redes_async(db)
     except MyAnyError as error:
         return CustomPage(success=False, message=str(error))
-    return paginate(resultados)
+    return await paginate_async(db, resultados)
 
 
 @inv_redes.get("/{inv_red_id}", response_model=OneInvRedOut)
 async def detalle_inv_red(
+    request: Request,
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
     db: Annotated[Session, Depends(get_db)],
     inv_red_id: int,
@@ -46,4 +48,4 @@ async def detalle_inv_red(
         inv_red = get_inv_red(db, inv_red_id)
     except MyAnyError as error:
         return OneInvRedOut(success=False, message=str(error))
-    return OneInvRedOut.from_orm(inv_red)
+    return detail_response(request, inv_red, OneInvRedOut)
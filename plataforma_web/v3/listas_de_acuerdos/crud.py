@@ -4,14 +4,15 @@ Listas de Acuerdos v3, CRUD (create, read, update, and delete)
 from datetime import date
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
-from lib.exceptions import MyIsDeletedError, MyNotExistsError
+from lib.database import async_variant, insert_all
+from lib.exceptions import MyAnyError, MyIsDeletedError, MyNotExistsError
 
 from ...core.autoridades.models import Autoridad
 from ...core.listas_de_acuerdos.models import ListaDeAcuerdo
-from ..autoridades.crud import get_autoridad, get_autoridad_with_clave
-from ..distritos.crud import get_distrito, get_distrito_with_clave
+from ..autoridades.crud import get_autoridad, get_autoridades_with_ids
+from ..catalogos import catalogo_autoridades, catalogo_distritos
 
 
 def get_listas_de_acuerdos(
@@ -26,18 +27,18 @@ def get_listas_de_acuerdos(
     fecha_hasta: date = None,
 ) -> Any:
     """Consultar los listas de acuerdos activos"""
-    consulta = db.query(ListaDeAcuerdo)
+    consulta = db.query(ListaDeAcuerdo).options(joinedload(ListaDeAcuerdo.autoridad).joinedload(Autoridad.distrito))
     if autoridad_id is not None:
-        autoridad = get_autoridad(db, autoridad_id)
+        autoridad = catalogo_autoridades.get(db, autoridad_id)
         consulta = consulta.filter_by(autoridad_id=autoridad.id)
     elif autoridad_clave is not None:
-        autoridad = get_autoridad_with_clave(db, autoridad_clave)
+        autoridad = catalogo_autoridades.get_with_clave(db, autoridad_clave)
         consulta = consulta.filter_by(autoridad_id=autoridad.id)
     elif distrito_id is not None:
-        distrito = get_distrito(db, distrito_id)
+        distrito = catalogo_distritos.get(db, distrito_id)
         consulta = consulta.join(Autoridad).filter(Autoridad.distrito_id == distrito.id)
     elif distrito_clave is not None:
-        distrito = get_distrito_with_clave(db, distrito_clave)
+        distrito = catalogo_distritos.get_with_clave(db, distrito_clave)
         consulta = consulta.join(Autoridad).filter(Autoridad.distrito_id == distrito.id)
     if anio is not None:
         desde = date(year=anio, month=1, day=1)
@@ -53,6 +54,9 @@ def get_listas_de_acuerdos(
     return consulta.filter_by(estatus="A").order_by(ListaDeAcuerdo.id)
 
 
+get_listas_de_acuerdos_async = async_variant(get_listas_de_acuerdos)
+
+
 def get_lista_de_acuerdo(db: Session, lista_de_acuerdo_id: int) -> ListaDeAcuerdo:
     """Consultar un lista de acuerdo por su id"""
     lista_de_acuerdo = db.query(ListaDeAcuerdo).get(lista_de_acuerdo_id)
@@ -78,6 +82,30 @@ def create_lista_de_acuerdo(db: Session, lista_de_acuerdo: ListaDeAcuerdo) -> Li
     return lista_de_acuerdo
 
 
+def create_listas_de_acuerdos(db: Session, listas_de_acuerdos: list[ListaDeAcuerdo]) -> list[int | MyAnyError]:
+    """Crear varias listas de acuerdos en una sola transacción, entrega el id de cada una o el error que tuvo"""
+
+    # Validar las autoridades con una sola consulta
+    autoridades = get_autoridades_with_ids(db, {lista_de_acuerdo.autoridad_id for lista_de_acuerdo in listas_de_acuerdos})
+
+    # Separar las válidas
+    resultados = []
+    for lista_de_acuerdo in listas_de_acuerdos:
+        autoridad = autoridades[lista_de_acuerdo.autoridad_id]
+        if isinstance(autoridad, MyAnyError):
+            resultados.append(autoridad)
+        else:
+            resultados.append(lista_de_acuerdo)
+
+    # Insertar todas juntas y tomar los ids antes del commit, los que rechace la base de datos entregan su error
+    ids = iter(insert_all(db, [resultado for resultado in resultados if not isinstance(resultado, MyAnyError)]))
+    resultados = [resultado if isinstance(resultado, MyAnyError) else next(ids) for resultado in resultados]
+    db.commit()
+
+    # Entregar
+    return resultados
+
+
 def update_lista_de_acuerdo(db: Session, lista_de_acuerdo_id: int, lista_de_acuerdo_in: ListaDeAcuerdo) -> ListaDeAcuerdo:
     """Modificar una lista de acuerdos"""
 
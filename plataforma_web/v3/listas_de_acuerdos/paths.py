@@ -4,17 +4,20 @@ Listas de Acuerdos v3, rutas (paths)
 from datetime import date
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_pagination.ext.sqlalchemy import paginate
+from fastapi import APIRouter, Body, Depends, HTTPException, Request, status
 
-from lib.database import Session, get_db
+from lib.database import AsyncSession, Session, get_async_db, get_db
 from lib.exceptions import MyAnyError
+from lib.fastapi_conditional import detail_response
 from lib.fastapi_pagination_custom_page import CustomPage
+from lib.fastapi_pagination_custom_paginate import paginate_async
+from lib.fastapi_streaming_export import ExportFormat, export_response
+from lib.schemas_base import BULK_MAX_ITEMS, BulkOut, OneBaseOut
 
 from ...core.listas_de_acuerdos.models import ListaDeAcuerdo
 from ...core.permisos.models import Permiso
 from ..usuarios.authentications import UsuarioInDB, get_current_active_user
-from .crud import create_lista_de_acuerdo, delete_lista_de_acuerdo, get_lista_de_acuerdo, get_listas_de_acuerdos, update_lista_de_acuerdo
+from .crud import create_lista_de_acuerdo, create_listas_de_acuerdos, delete_lista_de_acuerdo, get_lista_de_acuerdo, get_listas_de_acuerdos, get_listas_de_acuerdos_async, update_lista_de_acuerdo
 from .schemas import ListaDeAcuerdoIn, ListaDeAcuerdoOut, OneListaDeAcuerdoOut
 
 listas_de_acuerdos = APIRouter(prefix="/v3/listas_de_acuerdos", tags=["listas de acuerdos"])
@@ -23,7 +26,7 @@ listas_de_acuerdos = APIRouter(prefix="/v3/listas_de_acuerdos", tags=["listas de
 @listas_de_acuerdos.get("", response_model=CustomPage[ListaDeAcuerdoOut])
 async def listado_listas_de_acuerdos(
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     autoridad_id: int = None,
     autoridad_clave: str = None,
     distrito_id: int = None,
@@ -37,7 +40,7 @@ async def listado_listas_de_acuerdos(
     if current_user.permissions.get("LISTAS DE ACUERDOS", 0) < Permiso.VER:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     try:
-        resultados = get_listas_de_acuerdos(
+        resultados = await get_listas_de_acuerdos_async(
             db=db,
             autoridad_id=autoridad_id,
             autoridad_clave=autoridad_clave,
@@ -50,11 +53,46 @@ async def listado_listas_de_acuerdos(
         )
     except MyAnyError as error:
         return CustomPage(success=False, message=str(error))
-    return paginate(resultados)
+    return await paginate_async(db, resultados)
+
+
+@listas_de_acuerdos.get("/export")
+async def exportar_listas_de_acuerdos(
+    current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
+    db: Annotated[Session, Depends(get_db)],
+    autoridad_id: int = None,
+    autoridad_clave: str = None,
+    distrito_id: int = None,
+    distrito_clave: str = None,
+    anio: int = None,
+    fecha: date = None,
+    fecha_desde: date = None,
+    fecha_hasta: date = None,
+    formato: ExportFormat = "ndjson",
+):
+    """Exportar listas de acuerdos en NDJSON o CSV, con los mismos filtros del listado"""
+    if current_user.permissions.get("LISTAS DE ACUERDOS", 0) < Permiso.VER:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
+    try:
+        resultados = get_listas_de_acuerdos(
+            db=db,
+            autoridad_id=autoridad_id,
+            autoridad_clave=autoridad_clave,
+            distrito_id=distrito_id,
+            distrito_clave=distrito_clave,
+            anio=anio,
+            fecha=fecha,
+            fecha_desde=fecha_desde,
+            fecha_hasta=fecha_hasta,
+        )
+    except MyAnyError as error:
+        return OneBaseOut(success=False, message=str(error))
+    return export_response(resultados, ListaDeAcuerdoOut, formato, "listas_de_acuerdos")
 
 
 @listas_de_acuerdos.get("/{lista_de_acuerdo_id}", response_model=OneListaDeAcuerdoOut)
 async def detalle_lista_de_acuerdo(
+    request: Request,
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
     db: Annotated[Session, Depends(get_db)],
     lista_de_acuerdo_id: int,
@@ -66,7 +104,7 @@ async def detalle_lista_de_acuerdo(
         lista_de_acuerdo = get_lista_de_acuerdo(db, lista_de_acuerdo_id)
     except MyAnyError as error:
         return OneListaDeAcuerdoOut(success=False, message=str(error))
-    return OneListaDeAcuerdoOut.from_orm(lista_de_acuerdo)
+    return detail_response(request, lista_de_acuerdo, OneListaDeAcuerdoOut)
 
 
 @listas_de_acuerdos.post("", response_model=OneListaDeAcuerdoOut)
@@ -87,6 +125,22 @@ async def crear_lista_de_acuerdo(
     return respuesta
 
 
+@listas_de_acuerdos.post("/bulk", response_model=BulkOut)
+async def crear_listas_de_acuerdos(
+    current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
+    db: Annotated[Session, Depends(get_db)],
+    listas_de_acuerdos_in: Annotated[list[ListaDeAcuerdoIn], Body(max_length=BULK_MAX_ITEMS)],
+):
+    """Crear varias listas de acuerdos en una sola transacción, entrega el resultado de cada una en el mismo orden"""
+    if current_user.permissions.get("LISTAS DE ACUERDOS", 0) < Permiso.CREAR:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
+    try:
+        resultados = create_listas_de_acuerdos(db, [ListaDeAcuerdo(**lista_de_acuerdo_in.dict()) for lista_de_acuerdo_in in listas_de_acuerdos_in])
+    except MyAnyError as error:
+        return BulkOut(success=False, message=str(error))
+    return BulkOut.from_results(resultados)
+
+
 @listas_de_acuerdos.put("/{lista_de_acuerdo_id}", response_model=OneListaDeAcuerdoOut)
 async def modificar_lista_de_acuerdo(
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
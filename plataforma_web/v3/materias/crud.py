@@ -5,6 +5,7 @@ from typing import Any
 
 from sqlalchemy.orm import Session
 
+from lib.database import async_variant
 from lib.exceptions import MyIsDeletedError, MyNotExistsError, MyNotValidParamError
 from lib.safe_string import safe_clave
 
@@ -16,6 +17,9 @@ def get_materias(db: Session) -> Any:
     return db.query(Materia).filter_by(estatus="A").order_by(Materia.id)
 
 
+get_materias_async = async_variant(get_materias)
+
+
 def get_materia(db: Session, materia_id: int) -> Materia:
     """Consultar un materia por su id"""
     materia = db.query(Materia).get(materia_id)
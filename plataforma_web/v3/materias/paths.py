@@ -3,38 +3,45 @@ Materias v3, rutas (paths)
 """
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_pagination.ext.sqlalchemy import paginate
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from lib.database import Session, get_db
+from lib.database import AsyncSession, Session, get_async_db, get_db
 from lib.exceptions import MyAnyError
+from lib.fastapi_conditional import detail_response
 from lib.fastapi_pagination_custom_page import CustomPage
+from lib.fastapi_pagination_custom_paginate import paginate_async
+from lib.fastapi_response_cache import ResponseCache
 
 from ...core.permisos.models import Permiso
+from ..catalogos import catalogo_materias
 from ..usuarios.authentications import UsuarioInDB, get_current_active_user
-from .crud import get_materia_with_clave, get_materias
+from .crud import get_materias_async
 from .schemas import MateriaOut, OneMateriaOut
 
 materias = APIRouter(prefix="/v3/materias", tags=["materias"])
+materias_cache = ResponseCache("materias", modulo="MATERIAS", ttl=3600, tablas=["materias"])
 
 
 @materias.get("", response_model=CustomPage[MateriaOut])
+@materias_cache
 async def listado_materias(
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
 ):
     """Listado de materias"""
     if current_user.permissions.get("MATERIAS", 0) < Permiso.VER:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     try:
-        resultados = get_materias(db)
+        resultados = await get_materias_async(db)
     except MyAnyError as error:
         return CustomPage(success=False, message=str(error))
-    return paginate(resultados)
+    return await paginate_async(db, resultados)
 
 
 @materias.get("/{materia_clave}", response_model=OneMateriaOut)
+@materias_cache
 async def detalle_materia(
+    request: Request,
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
     db: Annotated[Session, Depends(get_db)],
     materia_clave: str,
@@ -43,7 +50,7 @@ async def detalle_materia(
     if current_user.permissions.get("MATERIAS", 0) < Permiso.VER:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     try:
-        materia = get_materia_with_clave(db, materia_clave)
+        materia = catalogo_materias.get_with_clave(db, materia_clave)
     except MyAnyError as error:
         return OneMateriaOut(success=False, message=str(error))
-    return OneMateriaOut.from_orm(materia)
+    return detail_response(request, materia, OneMateriaOut)
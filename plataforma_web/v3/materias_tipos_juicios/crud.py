@@ -3,12 +3,13 @@ Materias-Tipos de Juicios v3, CRUD (create, read, update, and delete)
 """
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
-from lib.exceptions import MyIsDeletedError, MyNotExistsError
+from lib.database import async_variant
+from lib.exceptions import MyAnyError, MyIsDeletedError, MyNotExistsError
 
 from ...core.materias_tipos_juicios.models import MateriaTipoJuicio
-from ..materias.crud import get_materia, get_materia_with_clave
+from ..catalogos import catalogo_materias
 
 
 def get_materias_tipos_juicios(
@@ -17,14 +18,17 @@ def get_materias_tipos_juicios(
     materia_clave: str = None,
 ) -> Any:
     """Consultar los materias-tipos de juicios activos"""
-    consulta = db.query(MateriaTipoJuicio)
+    consulta = db.query(MateriaTipoJuicio).options(joinedload(MateriaTipoJuicio.materia))
     if materia_id is not None:
-        materia = get_materia(db, materia_id)
+        materia = catalogo_materias.get(db, materia_id)
         consulta = consulta.filter_by(materia_id=materia.id)
     elif materia_clave is not None:
-        materia = get_materia_with_clave(db, materia_clave)
+        materia = catalogo_materias.get_with_clave(db, materia_clave)
         consulta = consulta.filter_by(materia_id=materia.id)
-    return consulta.filter_by(estatus="A").order_by(MateriaTipoJuicio.descripcion)
+    return consulta.filter_by(estatus="A").order_by(MateriaTipoJuicio.descripcion, MateriaTipoJuicio.id)
+
+
+get_materias_tipos_juicios_async = async_variant(get_materias_tipos_juicios)
 
 
 def get_materia_tipo_juicio(db: Session, materia_tipo_juicio_id: int) -> MateriaTipoJuicio:
@@ -35,3 +39,18 @@ def get_materia_tipo_juicio(db: Session, materia_tipo_juicio_id: int) -> Materia
     if materia_tipo_juicio.estatus != "A":
         raise MyIsDeletedError("No es activo ese materia-tipo de juicio, está eliminado")
     return materia_tipo_juicio
+
+
+def get_materias_tipos_juicios_with_ids(db: Session, materias_tipos_juicios_ids: set[int]) -> dict[int, MateriaTipoJuicio | MyAnyError]:
+    """Consultar varios materias-tipos de juicios en una sola consulta, entrega cada id con su materia-tipo de juicio o el error que daría get_materia_tipo_juicio"""
+    encontrados = {materia_tipo_juicio.id: materia_tipo_juicio for materia_tipo_juicio in db.query(MateriaTipoJuicio).filter(MateriaTipoJuicio.id.in_(materias_tipos_juicios_ids))}
+    resultados = {}
+    for materia_tipo_juicio_id in materias_tipos_juicios_ids:
+        materia_tipo_juicio = encontrados.get(materia_tipo_juicio_id)
+        if materia_tipo_juicio is None:
+            resultados[materia_tipo_juicio_id] = MyNotExistsError("No existe ese materia-tipo de juicio")
+        elif materia_tipo_juicio.estatus != "A":
+            resultados[materia_tipo_juicio_id] = MyIsDeletedError("No es activo ese materia-tipo de juicio, está eliminado")
+        else:
+            resultados[materia_tipo_juicio_id] = materia_tipo_juicio
+    return resultados
@@ -3,25 +3,29 @@ Materias-Tipos de Juicios v3, rutas (paths)
 """
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_pagination.ext.sqlalchemy import paginate
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from lib.database import Session, get_db
+from lib.database import AsyncSession, Session, get_async_db, get_db
 from lib.exceptions import MyAnyError
+from lib.fastapi_conditional import detail_response
 from lib.fastapi_pagination_custom_page import CustomPage
+from lib.fastapi_pagination_custom_paginate import paginate_async
+from lib.fastapi_response_cache import ResponseCache
 
 from ...core.permisos.models import Permiso
 from ..usuarios.authentications import UsuarioInDB, get_current_active_user
-from .crud import get_materia_tipo_juicio, get_materias_tipos_juicios
+from .crud import get_materia_tipo_juicio, get_materias_tipos_juicios_async
 from .schemas import MateriaTipoJuicioOut, OneMateriaTipoJuicioOut
 
 materias_tipos_juicios = APIRouter(prefix="/v3/materias_tipos_juicios", tags=["materias"])
+materias_tipos_juicios_cache = ResponseCache("materias_tipos_juicios", modulo="MATERIAS TIPOS JUICIOS", ttl=3600, tablas=["materias_tipos_juicios", "materias"])
 
 
 @materias_tipos_juicios.get("", response_model=CustomPage[MateriaTipoJuicioOut])
+@materias_tipos_juicios_cache
 async def listado_materias_tipos_juicios(
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     materia_id: int = None,
     materia_clave: str = None,
 ):
@@ -29,18 +33,20 @@ async def listado_materias_tipos_juicios(
     if current_user.permissions.get("MATERIAS TIPOS JUICIOS", 0) < Permiso.VER:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     try:
-        resultados = get_materias_tipos_juicios(
+        resultados = await get_materias_tipos_juicios_async(
             db=db,
             materia_id=materia_id,
             materia_clave=materia_clave,
         )
     except MyAnyError as error:
         return CustomPage(success=False, message=str(error))
-    return paginate(resultados)
+    return await paginate_async(db, resultados)
 
 
 @materias_tipos_juicios.get("/{materia_tipo_juicio_id}", response_model=OneMateriaTipoJuicioOut)
+@materias_tipos_juicios_cache
 async def detalle_materia_tipo_juicio(
+    request: Request,
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
     db: Annotated[Session, Depends(get_db)],
     materia_tipo_juicio_id: int,
@@ -52,4 +58,4 @@ async def detalle_materia_tipo_juicio(
         materia_tipo_juicio = get_materia_tipo_juicio(db, materia_tipo_juicio_id)
     except MyAnyError as error:
         return OneMateriaTipoJuicioOut(success=False, message=str(error))
-    return OneMateriaTipoJuicioOut.from_orm(materia_tipo_juicio)
+    return detail_response(request, materia_tipo_juicio, OneMateriaTipoJuicioOut)
@@ -5,6 +5,7 @@ from typing import Any
 
 from sqlalchemy.orm import Session
 
+from lib.database import async_variant
 from lib.exceptions import MyIsDeletedError, MyNotExistsError, MyNotValidParamError
 from lib.safe_string import safe_string
 
@@ -16,6 +17,9 @@ def get_modulos(db: Session) -> Any:
     return db.query(Modulo).filter_by(estatus="A").order_by(Modulo.nombre)
 
 
+get_modulos_async = async_variant(get_modulos)
+
+
 def get_modulo(db: Session, modulo_id: int) -> Modulo:
     """Consultar un modulo por su id"""
     modulo = db.query(Modulo).get(modulo_id)
@@ -3,38 +3,44 @@ Modulos v3, rutas (paths)
 """
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_pagination.ext.sqlalchemy import paginate
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from lib.database import Session, get_db
+from lib.database import AsyncSession, Session, get_async_db, get_db
 from lib.exceptions import MyAnyError
+from lib.fastapi_conditional import detail_response
 from lib.fastapi_pagination_custom_page import CustomPage
+from lib.fastapi_pagination_custom_paginate import paginate_async
+from lib.fastapi_response_cache import ResponseCache
 
 from ...core.permisos.models import Permiso
 from ..usuarios.authentications import UsuarioInDB, get_current_active_user
-from .crud import get_modulo, get_modulos
+from .crud import get_modulo, get_modulos_async
 from .schemas import ModuloOut, OneModuloOut
 
 modulos = APIRouter(prefix="/v3/modulos", tags=["usuarios"])
+modulos_cache = ResponseCache("modulos", modulo="MODULOS", ttl=600, tablas=["modulos"])
 
 
 @modulos.get("", response_model=CustomPage[ModuloOut])
+@modulos_cache
 async def listado_modulos(
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
 ):
     """Listado de modulos"""
     if current_user.permissions.get("MODULOS", 0) < Permiso.VER:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     try:
-        resultados = get_modulos(db)
+        resultados = await get_modulos_async(db)
     except MyAnyError as error:
         return CustomPage(success=False, message=str(error))
-    return paginate(resultados)
+    return await paginate_async(db, resultados)
 
 
 @modulos.get("/{modulo_id}", response_model=OneModuloOut)
+@modulos_cache
 async def detalle_modulo(
+    request: Request,
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
     db: Annotated[Session, Depends(get_db)],
     modulo_id: int,
@@ -46,4 +52,4 @@ async def detalle_modulo(
         modulo = get_modulo(db, modulo_id)
     except MyAnyError as error:
         return OneModuloOut(success=False, message=str(error))
-    return OneModuloOut.from_orm(modulo)
+    return detail_response(request, modulo, OneModuloOut)
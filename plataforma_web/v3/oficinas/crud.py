@@ -3,13 +3,12 @@ Oficinas v3, CRUD (create, read, update, and delete)
 """
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
-from lib.exceptions import MyIsDeletedError, MyNotExistsError, MyNotValidParamError
-from lib.safe_string import safe_clave
+from lib.database import async_variant
 
 from ...core.oficinas.models import Oficina
-from ..distritos.crud import get_distrito, get_distrito_with_clave
+from ..catalogos import catalogo_distritos
 from ..domicilios.crud import get_domicilio
 
 
@@ -21,12 +20,12 @@ def get_oficinas(
     es_jurisdiccional: bool = None,
 ) -> Any:
     """Consultar las oficinas activas"""
-    consulta = db.query(Oficina)
+    consulta = db.query(Oficina).options(joinedload(Oficina.distrito), joinedload(Oficina.domicilio))
     if distrito_id is not None:
-        distrito = get_distrito(db, distrito_id)
+        distrito = catalogo_distritos.get(db, distrito_id)
         consulta = consulta.filter_by(distrito_id=distrito.id)
     elif distrito_clave is not None:
-        distrito = get_distrito_with_clave(db, distrito_clave)
+        distrito = catalogo_distritos.get_with_clave(db, distrito_clave)
         consulta = consulta.filter_by(distrito_id=distrito.id)
     if domicilio_id is not None:
         domicilio = get_domicilio(db, domicilio_id)
@@ -36,25 +35,4 @@ def get_oficinas(
     return consulta.filter_by(estatus="A").order_by(Oficina.clave)
 
 
-def get_oficina(db: Session, oficina_id: int) -> Oficina:
-    """Consultar una oficina por su id"""
-    oficina = db.query(Oficina).get(oficina_id)
-    if oficina is None:
-        raise MyNotExistsError("No existe ese oficina")
-    if oficina.estatus != "A":
-        raise MyIsDeletedError("No es activo ese oficina, está eliminado")
-    return oficina
-
-
-def get_oficina_with_clave(db: Session, oficina_clave: str) -> Oficina:
-    """Consultar una oficina por su clave"""
-    try:
-        clave = safe_clave(oficina_clave)
-    except ValueError as error:
-        raise MyNotValidParamError(str(error)) from error
-    oficina = db.query(Oficina).filter_by(clave=clave).first()
-    if oficina is None:
-        raise MyNotExistsError("No existe ese oficina")
-    if oficina.estatus != "A":
-        raise MyIsDeletedError("No es activo ese oficina, está eliminado")
-    return oficina
+get_oficinas_async = async_variant(get_oficinas)
@@ -3,16 +3,18 @@ Oficinas v3, rutas (paths)
 """
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_pagination.ext.sqlalchemy import paginate
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from lib.database import Session, get_db
+from lib.database import AsyncSession, Session, get_async_db, get_db
 from lib.exceptions import MyAnyError
+from lib.fastapi_conditional import detail_response
 from lib.fastapi_pagination_custom_page import CustomPage
+from lib.fastapi_pagination_custom_paginate import paginate_async
 
 from ...core.permisos.models import Permiso
+from ..catalogos import catalogo_oficinas
 from ..usuarios.authentications import UsuarioInDB, get_current_active_user
-from .crud import get_oficina_with_clave, get_oficinas
+from .crud import get_oficinas_async
 from .schemas import OficinaOut, OneOficinaOut
 
 oficinas = APIRouter(prefix="/v3/oficinas", tags=["oficinas"])
@@ -21,7 +23,7 @@ oficinas = APIRouter(prefix="/v3/oficinas", tags=["oficinas"])
 @oficinas.get("", response_model=CustomPage[OficinaOut])
 async def listado_oficinas(
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     distrito_id: int = None,
     distrito_clave: str = None,
     domicilio_id: int = None,
@@ -31,7 +33,7 @@ async def listado_oficinas(
     if current_user.permissions.get("OFICINAS", 0) < Permiso.VER:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     try:
-        resultados = get_oficinas(
+        resultados = await get_oficinas_async(
             db=db,
             distrito_id=distrito_id,
             distrito_clave=distrito_clave,
@@ -40,11 +42,12 @@ async def listado_oficinas(
         )
     except MyAnyError as error:
         return CustomPage(success=False, message=str(error))
-    return paginate(resultados)
+    return await paginate_async(db, resultados)
 
 
 @oficinas.get("/{oficina_clave}", response_model=OneOficinaOut)
 async def detalle_oficina(
+    request: Request,
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
     db: Annotated[Session, Depends(get_db)],
     oficina_clave: str,
@@ -53,7 +56,7 @@ async def detalle_oficina(
     if current_user.permissions.get("OFICINAS", 0) < Permiso.VER:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     try:
-        oficina = get_oficina_with_clave(db, oficina_clave)
+        oficina = catalogo_oficinas.get_with_clave(db, oficina_clave)
     except MyAnyError as error:
         return OneOficinaOut(success=False, message=str(error))
-    return OneOficinaOut.from_orm(oficina)
+    return detail_response(request, oficina, OneOficinaOut)
@@ -3,13 +3,15 @@ Peritos v3, CRUD (create, read, update, and delete)
 """
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
+from lib.database import async_variant
 from lib.exceptions import MyIsDeletedError, MyNotExistsError, MyNotValidParamError
 from lib.safe_string import safe_string
+from lib.trigram_search import ModoBusqueda
 
-from ...core.peritos.models import Perito
-from ..distritos.crud import get_distrito, get_distrito_with_clave
+from ...core.peritos.models import Perito, peritos_fonetica, peritos_trigramas
+from ..catalogos import catalogo_distritos
 from ..peritos_tipos.crud import get_perito_tipo
 
 
@@ -19,24 +21,35 @@ def get_peritos(
     distrito_clave: str = None,
     nombre: str = None,
     perito_tipo_id: int = None,
+    modo: ModoBusqueda = "contiene",
 ) -> Any:
     """Consultar los peritos activos"""
-    consulta = db.query(Perito)
+    rango = None
+    consulta = db.query(Perito).options(joinedload(Perito.distrito), joinedload(Perito.perito_tipo))
     if distrito_id is not None:
-        distrito = get_distrito(db, distrito_id)
+        distrito = catalogo_distritos.get(db, distrito_id)
         consulta = consulta.filter_by(distrito_id=distrito.id)
     elif distrito_clave is not None:
-        distrito = get_distrito_with_clave(db, distrito_clave)
+        distrito = catalogo_distritos.get_with_clave(db, distrito_clave)
         consulta = consulta.filter_by(distrito_id=distrito.id)
     if nombre is not None:
         nombre = safe_string(nombre)
         if nombre == "":
             raise MyNotValidParamError("El nombre no es válido")
-        consulta = consulta.filter(Perito.nombre.contains(nombre))
+        if modo == "fonetico":
+            consulta = peritos_fonetica.search(consulta, nombre)
+        else:
+            consulta, rango = peritos_trigramas.search(consulta, Perito.nombre, nombre, modo, db.get_bind().dialect.name)
     if perito_tipo_id is not None:
         perito_tipo = get_perito_tipo(db, perito_tipo_id)
         consulta = consulta.filter_by(perito_tipo_id=perito_tipo.id)
-    return consulta.filter_by(estatus="A").order_by(Perito.nombre)
+    consulta = consulta.filter_by(estatus="A")
+    if rango is not None:
+        return consulta.order_by(rango.desc(), Perito.id)
+    return consulta.order_by(Perito.nombre, Perito.id)
+
+
+get_peritos_async = async_variant(get_peritos)
 
 
 def get_perito(db: Session, perito_id: int) -> Perito:
@@ -3,16 +3,18 @@ Peritos v3, rutas (paths)
 """
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_pagination.ext.sqlalchemy import paginate
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from lib.database import Session, get_db
+from lib.database import AsyncSession, Session, get_async_db, get_db
 from lib.exceptions import MyAnyError
+from lib.fastapi_conditional import detail_response
 from lib.fastapi_pagination_custom_page import CustomPage
+from lib.fastapi_pagination_custom_paginate import paginate_async
+from lib.trigram_search import ModoBusqueda
 
 from ...core.permisos.models import Permiso
 from ..usuarios.authentications import UsuarioInDB, get_current_active_user
-from .crud import get_perito, get_peritos
+from .crud import get_perito, get_peritos_async
 from .schemas import OnePeritoOut, PeritoOut
 
 peritos = APIRouter(prefix="/v3/peritos", tags=["peritos"])
@@ -21,30 +23,33 @@ peritos = APIRouter(prefix="/v3/peritos", tags=["peritos"])
 @peritos.get("", response_model=CustomPage[PeritoOut])
 async def listado_peritos(
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     distrito_id: int = None,
     distrito_clave: str = None,
     nombre: str = None,
+    modo: ModoBusqueda = "contiene",
     perito_tipo_id: int = None,
 ):
     """Listado de peritos"""
     if current_user.permissions.get("PERITOS", 0) < Permiso.VER:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     try:
-        resultados = get_peritos(
+        resultados = await get_peritos_async(
             db=db,
             distrito_id=distrito_id,
             distrito_clave=distrito_clave,
             nombre=nombre,
+            modo=modo,
             perito_tipo_id=perito_tipo_id,
         )
     except MyAnyError as error:
         return CustomPage(success=False, message=str(error))
-    return paginate(resultados)
+    return await paginate_async(db, resultados)
 
 
 @peritos.get("/{perito_id}", response_model=OnePeritoOut)
 async def detalle_perito(
+    request: Request,
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
     db: Annotated[Session, Depends(get_db)],
     perito_id: int,
@@ -56,4 +61,4 @@ async def detalle_perito(
         perito = get_perito(db, perito_id)
     except MyAnyError as error:
         return OnePeritoOut(success=False, message=str(error))
-    return OnePeritoOut.from_orm(perito)
+    return detail_response(request, perito, OnePeritoOut)
@@ -5,6 +5,7 @@ from typing import Any
 
 from sqlalchemy.orm import Session
 
+from lib.database import async_variant
 from lib.exceptions import MyIsDeletedError, MyNotExistsError
 
 from ...core.peritos_tipos.models import PeritoTipo
@@ -15,6 +16,9 @@ def get_peritos_tipos(db: Session) -> Any:
     return db.query(PeritoTipo).filter_by(estatus="A").order_by(PeritoTipo.nombre)
 
 
+get_peritos_tipos_async = async_variant(get_peritos_tipos)
+
+
 def get_perito_tipo(db: Session, perito_tipo_id: int) -> PeritoTipo:
     """Consultar un tipo de perito por su id"""
     perito_tipo = db.query(PeritoTipo).get(perito_tipo_id)
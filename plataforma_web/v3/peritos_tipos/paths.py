@@ -3,38 +3,44 @@ Peritos - Tipos v3, rutas (paths)
 """
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_pagination.ext.sqlalchemy import paginate
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from lib.database import Session, get_db
+from lib.database import AsyncSession, Session, get_async_db, get_db
 from lib.exceptions import MyAnyError
+from lib.fastapi_conditional import detail_response
 from lib.fastapi_pagination_custom_page import CustomPage
+from lib.fastapi_pagination_custom_paginate import paginate_async
+from lib.fastapi_response_cache import ResponseCache
 
 from ...core.permisos.models import Permiso
 from ..usuarios.authentications import UsuarioInDB, get_current_active_user
-from .crud import get_perito_tipo, get_peritos_tipos
+from .crud import get_perito_tipo, get_peritos_tipos_async
 from .schemas import OnePeritoTipoOut, PeritoTipoOut
 
 peritos_tipos = APIRouter(prefix="/v3/peritos_tipos", tags=["peritos"])
+peritos_tipos_cache = ResponseCache("peritos_tipos", modulo="PERITOS TIPOS", ttl=3600, tablas=["peritos_tipos"])
 
 
 @peritos_tipos.get("", response_model=CustomPage[PeritoTipoOut])
+@peritos_tipos_cache
 async def listado_peritos_tipos(
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
 ):
     """Listado de tipos de peritos"""
     if current_user.permissions.get("PERITOS TIPOS", 0) < Permiso.VER:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     try:
-        resultados = get_peritos_tipos(db)
+        resultados = await get_peritos_tipos_async(db)
     except MyAnyError as error:
         return CustomPage(success=False, message=str(error))
-    return paginate(resultados)
+    return await paginate_async(db, resultados)
 
 
 @peritos_tipos.get("/{perito_tipo_id}", response_model=OnePeritoTipoOut)
+@peritos_tipos_cache
 async def detalle_perito_tipo(
+    request: Request,
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
     db: Annotated[Session, Depends(get_db)],
     perito_tipo_id: int,
@@ -46,4 +52,4 @@ async def detalle_perito_tipo(
         perito_tipo = get_perito_tipo(db, perito_tipo_id)
     except MyAnyError as error:
         return OnePeritoTipoOut(success=False, message=str(error))
-    return OnePeritoTipoOut.from_orm(perito_tipo)
+    return detail_response(request, perito_tipo, OnePeritoTipoOut)
@@ -3,8 +3,9 @@ Permisos v3, CRUD (create, read, update, and delete)
 """
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
+from lib.database import async_variant
 from lib.exceptions import MyIsDeletedError, MyNotExistsError
 
 from ...core.permisos.models import Permiso
@@ -20,7 +21,7 @@ def get_permisos(
     rol_nombre: str = None,
 ) -> Any:
     """Consultar los permisos activos"""
-    consulta = db.query(Permiso)
+    consulta = db.query(Permiso).options(joinedload(Permiso.modulo), joinedload(Permiso.rol))
     if modulo_id is not None:
         modulo = get_modulo(db, modulo_id)
         consulta = consulta.filter(modulo == modulo)
@@ -36,6 +37,9 @@ def get_permisos(
     return consulta.filter_by(estatus="A").order_by(Permiso.id)
 
 
+get_permisos_async = async_variant(get_permisos)
+
+
 def get_permiso(db: Session, permiso_id: int) -> Permiso:
     """Consultar un permiso por su id"""
     permiso = db.query(Permiso).get(permiso_id)
@@ -3,16 +3,17 @@ Permisos v3, rutas (paths)
 """
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_pagination.ext.sqlalchemy import paginate
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from lib.database import Session, get_db
+from lib.database import AsyncSession, Session, get_async_db, get_db
 from lib.exceptions import MyAnyError
+from lib.fastapi_conditional import detail_response
 from lib.fastapi_pagination_custom_page import CustomPage
+from lib.fastapi_pagination_custom_paginate import paginate_async
 
 from ...core.permisos.models import Permiso
 from ..usuarios.authentications import UsuarioInDB, get_current_active_user
-from .crud import get_permiso, get_permisos
+from .crud import get_permiso, get_permisos_async
 from .schemas import OnePermisoOut, PermisoOut
 
 permisos = APIRouter(prefix="/v3/permisos", tags=["usuarios"])
@@ -21,7 +22,7 @@ permisos = APIRouter(prefix="/v3/permisos", tags=["usuarios"])
 @permisos.get("", response_model=CustomPage[PermisoOut])
 async def listado_permisos(
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     modulo_id: int = None,
     modulo_nombre: str = None,
     rol_id: int = None,
@@ -31,7 +32,7 @@ async def listado_permisos(
     if current_user.permissions.get("PERMISOS", 0) < Permiso.VER:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     try:
-        resultados = get_permisos(
+        resultados = await get_permisos_async(
             db=db,
             modulo_id=modulo_id,
             modulo_nombre=modulo_nombre,
@@ -39,11 +40,12 @@ async def listado_permisos(
         )
     except MyAnyError as error:
         return CustomPage(success=False, message=str(error))
-    return paginate(resultados)
+    return await paginate_async(db, resultados)
 
 
 @permisos.get("/{permiso_id}", response_model=OnePermisoOut)
 async def detalle_permiso(
+    request: Request,
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
     db: Annotated[Session, Depends(get_db)],
     permiso_id: int,
@@ -55,4 +57,4 @@ async def detalle_permiso(
         permiso = get_permiso(db, permiso_id)
     except MyAnyError as error:
         return OnePermisoOut(success=False, message=str(error))
-    return OnePermisoOut.from_orm(permiso)
+    return detail_response(request, permiso, OnePermisoOut)
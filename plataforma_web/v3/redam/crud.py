@@ -3,15 +3,16 @@ REDAM (Registro Estatal de Deudores Alimentarios Morosos) v3, CRUD (create, read
 """
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
+from lib.database import async_variant
 from lib.exceptions import MyIsDeletedError, MyNotExistsError, MyNotValidParamError
 from lib.safe_string import safe_expediente, safe_string
+from lib.trigram_search import ModoBusqueda
 
 from ...core.autoridades.models import Autoridad
-from ...core.redam.models import Redam
-from ..autoridades.crud import get_autoridad, get_autoridad_with_clave
-from ..distritos.crud import get_distrito, get_distrito_with_clave
+from ...core.redam.models import Redam, redam_fonetica, redam_trigramas
+from ..catalogos import catalogo_autoridades, catalogo_distritos
 
 
 def get_redams(
@@ -22,33 +23,44 @@ def get_redams(
     distrito_clave: str = None,
     nombre: str = None,
     expediente: str = None,
+    modo: ModoBusqueda = "contiene",
 ) -> Any:
     """Consultar los deudores alimenticios morosos activos"""
-    consulta = db.query(Redam)
+    rango = None
+    consulta = db.query(Redam).options(joinedload(Redam.autoridad).joinedload(Autoridad.distrito))
     if autoridad_id is not None:
-        autoridad = get_autoridad(db, autoridad_id)
+        autoridad = catalogo_autoridades.get(db, autoridad_id)
         consulta = consulta.filter_by(autoridad_id=autoridad.id)
     elif autoridad_clave is not None:
-        autoridad = get_autoridad_with_clave(db, autoridad_clave)
+        autoridad = catalogo_autoridades.get_with_clave(db, autoridad_clave)
         consulta = consulta.filter_by(autoridad_id=autoridad.id)
     elif distrito_id is not None:
-        distrito = get_distrito(db, distrito_id)
+        distrito = catalogo_distritos.get(db, distrito_id)
         consulta = consulta.join(Autoridad).filter(Autoridad.distrito_id == distrito.id)
     elif distrito_clave is not None:
-        distrito = get_distrito_with_clave(db, distrito_clave)
+        distrito = catalogo_distritos.get_with_clave(db, distrito_clave)
         consulta = consulta.join(Autoridad).filter(Autoridad.distrito_id == distrito.id)
     if nombre is not None:
         nombre = safe_string(nombre)
         if nombre == "":
             raise MyNotValidParamError("El nombre no es válido")
-        consulta = consulta.filter(Redam.nombre.contains(nombre))
+        if modo == "fonetico":
+            consulta = redam_fonetica.search(consulta, nombre)
+        else:
+            consulta, rango = redam_trigramas.search(consulta, Redam.nombre, nombre, modo, db.get_bind().dialect.name)
     if expediente is not None:
         try:
             expediente = safe_expediente(expediente)
         except (IndexError, ValueError) as error:
             raise MyNotValidParamError("El expediente no es válido") from error
         consulta = consulta.filter_by(expediente=expediente)
-    return consulta.filter_by(estatus="A").order_by(Redam.id)
+    consulta = consulta.filter_by(estatus="A")
+    if rango is not None:
+        return consulta.order_by(rango.desc(), Redam.id)
+    return consulta.order_by(Redam.id)
+
+
+get_redams_async = async_variant(get_redams)
 
 
 def get_redam(db: Session, redam_id: int) -> Redam:
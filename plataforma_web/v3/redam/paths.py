@@ -3,16 +3,18 @@ REDAM (Registro Estatal de Deudores Alimentarios Morosos) v3, rutas (paths)
 """
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_pagination.ext.sqlalchemy import paginate
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from lib.database import Session, get_db
+from lib.database import AsyncSession, Session, get_async_db, get_db
 from lib.exceptions import MyAnyError
+from lib.fastapi_conditional import detail_response
 from lib.fastapi_pagination_custom_page import CustomPage
+from lib.fastapi_pagination_custom_paginate import paginate_async
+from lib.trigram_search import ModoBusqueda
 
 from ...core.permisos.models import Permiso
 from ..usuarios.authentications import UsuarioInDB, get_current_active_user
-from .crud import get_redam, get_redams
+from .crud import get_redam, get_redams_async
 from .schemas import OneRedamOut, RedamOut
 
 redam = APIRouter(prefix="/v3/redam", tags=["redam"])
@@ -21,34 +23,37 @@ redam = APIRouter(prefix="/v3/redam", tags=["redam"])
 @redam.get("", response_model=CustomPage[RedamOut])
 async def listado_redams(
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     autoridad_id: int = None,
     autoridad_clave: str = None,
     distrito_id: int = None,
     distrito_clave: str = None,
     nombre: str = None,
+    modo: ModoBusqueda = "contiene",
     expediente: str = None,
 ):
     """Listado de Deudores Alimentarios Morosos"""
     if current_user.permissions.get("REDAMS", 0) < Permiso.VER:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     try:
-        resultados = get_redams(
+        resultados = await get_redams_async(
             db=db,
             autoridad_id=autoridad_id,
             autoridad_clave=autoridad_clave,
             distrito_id=distrito_id,
             distrito_clave=distrito_clave,
             nombre=nombre,
+            modo=modo,
             expediente=expediente,
         )
     except MyAnyError as error:
         return CustomPage(success=False, message=str(error))
-    return paginate(resultados)
+    return await paginate_async(db, resultados)
 
 
 @redam.get("/{redam_id}", response_model=OneRedamOut)
 async def detalle_redam(
+    request: Request,
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
     db: Annotated[Session, Depends(get_db)],
     redam_id: int,
@@ -60,4 +65,4 @@ async def detalle_redam(
         deudor = get_redam(db, redam_id)
     except MyAnyError as error:
         return OneRedamOut(success=False, message=str(error))
-    return OneRedamOut.from_orm(deudor)
+    return detail_response(request, deudor, OneRedamOut)
@@ -3,13 +3,15 @@ REPSVM Agresores v3, CRUD (create, read, update, and delete)
 """
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
+from lib.database import async_variant
 from lib.exceptions import MyIsDeletedError, MyNotExistsError, MyNotValidParamError
 from lib.safe_string import safe_string
+from lib.trigram_search import ModoBusqueda
 
-from ...core.repsvm_agresores.models import RepsvmAgresor
-from ..distritos.crud import get_distrito, get_distrito_with_clave
+from ...core.repsvm_agresores.models import RepsvmAgresor, repsvm_agresores_fonetica, repsvm_agresores_trigramas
+from ..catalogos import catalogo_distritos
 
 
 def get_repsvm_agresores(
@@ -17,21 +19,32 @@ def get_repsvm_agresores(
     distrito_id: int = None,
     distrito_clave: str = None,
     nombre: str = None,
+    modo: ModoBusqueda = "contiene",
 ) -> Any:
     """Consultar los agresores activos"""
-    consulta = db.query(RepsvmAgresor)
+    rango = None
+    consulta = db.query(RepsvmAgresor).options(joinedload(RepsvmAgresor.distrito))
     if distrito_id is not None:
-        distrito = get_distrito(db, distrito_id)
+        distrito = catalogo_distritos.get(db, distrito_id)
         consulta = consulta.filter_by(distrito_id=distrito.id)
     elif distrito_clave is not None:
-        distrito = get_distrito_with_clave(db, distrito_clave)
+        distrito = catalogo_distritos.get_with_clave(db, distrito_clave)
         consulta = consulta.filter_by(distrito_id=distrito.id)
     if nombre is not None:
         nombre = safe_string(nombre)
         if nombre == "":
             raise MyNotValidParamError("El nombre no es válido")
-        consulta = consulta.filter(RepsvmAgresor.nombre.contains(nombre))
-    return consulta.filter_by(estatus="A").order_by(RepsvmAgresor.id)
+        if modo == "fonetico":
+            consulta = repsvm_agresores_fonetica.search(consulta, nombre)
+        else:
+            consulta, rango = repsvm_agresores_trigramas.search(consulta, RepsvmAgresor.nombre, nombre, modo, db.get_bind().dialect.name)
+    consulta = consulta.filter_by(estatus="A")
+    if rango is not None:
+        return consulta.order_by(rango.desc(), RepsvmAgresor.id)
+    return consulta.order_by(RepsvmAgresor.id)
+
+
+get_repsvm_agresores_async = async_variant(get_repsvm_agresores)
 
 
 def get_repsvm_agresor(db: Session, repsvm_agresor_id: int) -> RepsvmAgresor:
@@ -3,16 +3,18 @@ REPSVM Agresores v3, rutas (paths)
 """
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_pagination.ext.sqlalchemy import paginate
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from lib.database import Session, get_db
+from lib.database import AsyncSession, Session, get_async_db, get_db
 from lib.exceptions import MyAnyError
+from lib.fastapi_conditional import detail_response
 from lib.fastapi_pagination_custom_page import CustomPage
+from lib.fastapi_pagination_custom_paginate import paginate_async
+from lib.trigram_search import ModoBusqueda
 
 from ...core.permisos.models import Permiso
 from ..usuarios.authentications import UsuarioInDB, get_current_active_user
-from .crud import get_repsvm_agresor, get_repsvm_agresores
+from .crud import get_repsvm_agresor, get_repsvm_agresores_async
 from .schemas import OneRepsvmAgresorOut, RepsvmAgresorOut
 
 repsvm_agresores = APIRouter(prefix="/v3/repsvm_agresores", tags=["repsvm agresores"])
@@ -21,28 +23,31 @@ repsvm_agresores = APIRouter(prefix="/v3/repsvm_agresores", tags=["repsvm agreso
 @repsvm_agresores.get("", response_model=CustomPage[RepsvmAgresorOut])
 async def listado_repsvm_agresores(
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     distrito_id: int = None,
     distrito_clave: str = None,
     nombre: str = None,
+    modo: ModoBusqueda = "contiene",
 ):
     """Listado de agresores"""
     if current_user.permissions.get("REPSVM AGRESORES", 0) < Permiso.VER:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     try:
-        resultados = get_repsvm_agresores(
+        resultados = await get_repsvm_agresores_async(
             db=db,
             distrito_id=distrito_id,
             distrito_clave=distrito_clave,
             nombre=nombre,
+            modo=modo,
         )
     except MyAnyError as error:
         return CustomPage(success=False, message=str(error))
-    return paginate(resultados)
+    return await paginate_async(db, resultados)
 
 
 @repsvm_agresores.get("/{repsvm_agresor_id}", response_model=OneRepsvmAgresorOut)
 async def detalle_repsvm_agresor(
+    request: Request,
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
     db: Annotated[Session, Depends(get_db)],
     repsvm_agresor_id: int,
@@ -54,4 +59,4 @@ async def detalle_repsvm_agresor(
         repsvm_agresor = get_repsvm_agresor(db, repsvm_agresor_id)
     except MyAnyError as error:
         return OneRepsvmAgresorOut(success=False, message=str(error))
-    return OneRepsvmAgresorOut.from_orm(repsvm_agresor)
+    return detail_response(request, repsvm_agresor, OneRepsvmAgresorOut)
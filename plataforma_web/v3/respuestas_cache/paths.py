@@ -0,0 +1,41 @@
+"""
+Respuestas Cache v3, rutas (paths)
+"""
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from lib.fastapi_response_cache import response_caches
+from lib.schemas_base import OneBaseOut
+
+from ...core.permisos.models import Permiso
+from ..usuarios.authentications import UsuarioInDB, get_current_active_user
+
+respuestas_cache = APIRouter(prefix="/v3/cache", tags=["cache"])
+
+
+@respuestas_cache.delete("", response_model=OneBaseOut)
+async def borrar_respuestas_cache(
+    current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
+):
+    """Borrar las respuestas guardadas de todos los catálogos, requiere ADMINISTRAR en todos"""
+    for response_cache in response_caches.values():
+        if current_user.permissions.get(response_cache.modulo, 0) < Permiso.ADMINISTRAR:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
+    cantidad = sum(response_cache.invalidate() for response_cache in response_caches.values())
+    return OneBaseOut(success=True, message=f"Se borraron {cantidad} respuestas guardadas")
+
+
+@respuestas_cache.delete("/{nombre}", response_model=OneBaseOut)
+async def borrar_respuestas_cache_catalogo(
+    current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
+    nombre: str,
+):
+    """Borrar las respuestas guardadas de un catálogo, por ejemplo distritos"""
+    response_cache = response_caches.get(nombre)
+    if response_cache is None:
+        return OneBaseOut(success=False, message="No existe ese catálogo con respuestas guardadas")
+    if current_user.permissions.get(response_cache.modulo, 0) < Permiso.ADMINISTRAR:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
+    cantidad = response_cache.invalidate()
+    return OneBaseOut(success=True, message=f"Se borraron {cantidad} respuestas guardadas de {nombre}")
@@ -5,6 +5,7 @@ from typing import Any
 
 from sqlalchemy.orm import Session
 
+from lib.database import async_variant
 from lib.exceptions import MyIsDeletedError, MyNotExistsError
 
 from ...core.roles.models import Rol
@@ -15,6 +16,9 @@ def get_roles(db: Session) -> Any:
     return db.query(Rol).filter_by(estatus="A").order_by(Rol.nombre)
 
 
+get_roles_async = async_variant(get_roles)
+
+
 def get_rol(db: Session, rol_id: int) -> Rol:
     """Consultar un rol por su id"""
     rol = db.query(Rol).get(rol_id)
@@ -3,38 +3,44 @@ Roles v3, rutas (paths)
 """
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_pagination.ext.sqlalchemy import paginate
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from lib.database import Session, get_db
+from lib.database import AsyncSession, Session, get_async_db, get_db
 from lib.exceptions import MyAnyError
+from lib.fastapi_conditional import detail_response
 from lib.fastapi_pagination_custom_page import CustomPage
+from lib.fastapi_pagination_custom_paginate import paginate_async
+from lib.fastapi_response_cache import ResponseCache
 
 from ...core.permisos.models import Permiso
 from ..usuarios.authentications import UsuarioInDB, get_current_active_user
-from .crud import get_rol, get_roles
+from .crud import get_rol, get_roles_async
 from .schemas import OneRolOut, RolOut
 
 roles = APIRouter(prefix="/v3/roles", tags=["usuarios"])
+roles_cache = ResponseCache("roles", modulo="ROLES", ttl=600, tablas=["roles"])
 
 
 @roles.get("", response_model=CustomPage[RolOut])
+@roles_cache
 async def listado_roles(
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
 ):
     """Listado de roles"""
     if current_user.permissions.get("ROLES", 0) < Permiso.VER:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     try:
-        resultados = get_roles(db)
+        resultados = await get_roles_async(db)
     except MyAnyError as error:
         return CustomPage(success=False, message=str(error))
-    return paginate(resultados)
+    return await paginate_async(db, resultados)
 
 
 @roles.get("/{rol_id}", response_model=OneRolOut)
+@roles_cache
 async def detalle_rol(
+    request: Request,
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
     db: Annotated[Session, Depends(get_db)],
     rol_id: int,
@@ -46,4 +52,4 @@ async def detalle_rol(
         rol = get_rol(db, rol_id)
     except MyAnyError as error:
         return OneRolOut(success=False, message=str(error))
-    return OneRolOut.from_orm(rol)
+    return detail_response(request, rol, OneRolOut)
@@ -4,16 +4,18 @@ Sentencias v3, CRUD (create, read, update, and delete)
 from datetime import date
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
-from lib.exceptions import MyIsDeletedError, MyNotExistsError, MyNotValidParamError
+from lib.database import async_variant, insert_all
+from lib.exceptions import MyAnyError, MyIsDeletedError, MyNotExistsError, MyNotValidParamError
 from lib.safe_string import safe_expediente
 
 from ...core.autoridades.models import Autoridad
+from ...core.materias_tipos_juicios.models import MateriaTipoJuicio
 from ...core.sentencias.models import Sentencia
-from ..autoridades.crud import get_autoridad, get_autoridad_with_clave
-from ..distritos.crud import get_distrito, get_distrito_with_clave
-from ..materias_tipos_juicios.crud import get_materia_tipo_juicio
+from ..autoridades.crud import get_autoridad, get_autoridades_with_ids
+from ..catalogos import catalogo_autoridades, catalogo_distritos
+from ..materias_tipos_juicios.crud import get_materia_tipo_juicio, get_materias_tipos_juicios_with_ids
 
 
 def get_sentencias(
@@ -31,18 +33,18 @@ def get_sentencias(
     sentencia: str = None,
 ) -> Any:
     """Consultar los sentencias activos"""
-    consulta = db.query(Sentencia)
+    consulta = db.query(Sentencia).options(joinedload(Sentencia.autoridad).joinedload(Autoridad.distrito), joinedload(Sentencia.materia_tipo_juicio).joinedload(MateriaTipoJuicio.materia))
     if autoridad_id is not None:
-        autoridad = get_autoridad(db, autoridad_id)
+        autoridad = catalogo_autoridades.get(db, autoridad_id)
         consulta = consulta.filter_by(autoridad_id=autoridad.id)
     elif autoridad_clave is not None:
-        autoridad = get_autoridad_with_clave(db, autoridad_clave)
+        autoridad = catalogo_autoridades.get_with_clave(db, autoridad_clave)
         consulta = consulta.filter_by(autoridad_id=autoridad.id)
     elif distrito_id is not None:
-        distrito = get_distrito(db, distrito_id)
+        distrito = catalogo_distritos.get(db, distrito_id)
         consulta = consulta.join(Autoridad).filter(Autoridad.distrito_id == distrito.id)
     elif distrito_clave is not None:
-        distrito = get_distrito_with_clave(db, distrito_clave)
+        distrito = catalogo_distritos.get_with_clave(db, distrito_clave)
         consulta = consulta.join(Autoridad).filter(Autoridad.distrito_id == distrito.id)
     if anio is not None:
         desde = date(year=anio, month=1, day=1)
@@ -73,6 +75,9 @@ def get_sentencias(
     return consulta.filter_by(estatus="A").order_by(Sentencia.id)
 
 
+get_sentencias_async = async_variant(get_sentencias)
+
+
 def get_sentencia(db: Session, sentencia_id: int) -> Sentencia:
     """Consultar un sentencia por su id"""
     sentencia = db.query(Sentencia).get(sentencia_id)
@@ -101,6 +106,34 @@ def create_sentencia(db: Session, sentencia: Sentencia) -> Sentencia:
     return sentencia
 
 
+def create_sentencias(db: Session, sentencias: list[Sentencia]) -> list[int | MyAnyError]:
+    """Crear varias sentencias en una sola transacción, entrega el id de cada una o el error que tuvo"""
+
+    # Validar autoridades y materias_tipos_juicios con una consulta para cada una
+    autoridades = get_autoridades_with_ids(db, {sentencia.autoridad_id for sentencia in sentencias})
+    materias_tipos_juicios = get_materias_tipos_juicios_with_ids(db, {sentencia.materia_tipo_juicio_id for sentencia in sentencias})
+
+    # Separar las válidas
+    resultados = []
+    for sentencia in sentencias:
+        autoridad = autoridades[sentencia.autoridad_id]
+        materia_tipo_juicio = materias_tipos_juicios[sentencia.materia_tipo_juicio_id]
+        if isinstance(autoridad, MyAnyError):
+            resultados.append(autoridad)
+        elif isinstance(materia_tipo_juicio, MyAnyError):
+            resultados.append(materia_tipo_juicio)
+        else:
+            resultados.append(sentencia)
+
+    # Insertar todas juntas y tomar los ids antes del commit, los que rechace la base de datos entregan su error
+    ids = iter(insert_all(db, [resultado for resultado in resultados if not isinstance(resultado, MyAnyError)]))
+    resultados = [resultado if isinstance(resultado, MyAnyError) else next(ids) for resultado in resultados]
+    db.commit()
+
+    # Entregar
+    return resultados
+
+
 def update_sentencia(db: Session, sentencia_id: int, sentencia_in: Sentencia) -> Sentencia:
     """Modificar una sentencia"""
 
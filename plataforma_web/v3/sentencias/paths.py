@@ -4,17 +4,20 @@ Sentencias v3, rutas (paths)
 from datetime import date
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_pagination.ext.sqlalchemy import paginate
+from fastapi import APIRouter, Body, Depends, HTTPException, Request, status
 
-from lib.database import Session, get_db
+from lib.database import AsyncSession, Session, get_async_db, get_db
 from lib.exceptions import MyAnyError
+from lib.fastapi_conditional import detail_response
 from lib.fastapi_pagination_custom_page import CustomPage
+from lib.fastapi_pagination_custom_paginate import paginate_async
+from lib.fastapi_streaming_export import ExportFormat, export_response
+from lib.schemas_base import BULK_MAX_ITEMS, BulkOut, OneBaseOut
 
 from ...core.permisos.models import Permiso
 from ...core.sentencias.models import Sentencia
 from ..usuarios.authentications import UsuarioInDB, get_current_active_user
-from .crud import create_sentencia, delete_sentencia, get_sentencia, get_sentencias, update_sentencia
+from .crud import create_sentencia, create_sentencias, delete_sentencia, get_sentencia, get_sentencias, get_sentencias_async, update_sentencia
 from .schemas import OneSentenciaOut, SentenciaIn, SentenciaOut
 
 sentencias = APIRouter(prefix="/v3/sentencias", tags=["sentencias"])
@@ -23,7 +26,7 @@ sentencias = APIRouter(prefix="/v3/sentencias", tags=["sentencias"])
 @sentencias.get("", response_model=CustomPage[SentenciaOut])
 async def listado_sentencias(
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     anio: int = None,
     autoridad_id: int = None,
     autoridad_clave: str = None,
@@ -38,7 +41,7 @@ async def listado_sentencias(
     if current_user.permissions.get("SENTENCIAS", 0) < Permiso.VER:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     try:
-        resultados = get_sentencias(
+        resultados = await get_sentencias_async(
             db=db,
             anio=anio,
             autoridad_id=autoridad_id,
@@ -52,11 +55,52 @@ async def listado_sentencias(
         )
     except MyAnyError as error:
         return CustomPage(success=False, message=str(error))
-    return paginate(resultados)
+    return await paginate_async(db, resultados)
+
+
+@sentencias.get("/export")
+async def exportar_sentencias(
+    current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
+    db: Annotated[Session, Depends(get_db)],
+    anio: int = None,
+    autoridad_id: int = None,
+    autoridad_clave: str = None,
+    distrito_id: int = None,
+    distrito_clave: str = None,
+    expediente: str = None,
+    fecha: date = None,
+    fecha_desde: date = None,
+    fecha_hasta: date = None,
+    materia_tipo_juicio_id: int = None,
+    sentencia: str = None,
+    formato: ExportFormat = "ndjson",
+):
+    """Exportar sentencias en NDJSON o CSV, con los mismos filtros del listado"""
+    if current_user.permissions.get("SENTENCIAS", 0) < Permiso.VER:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
+    try:
+        resultados = get_sentencias(
+            db=db,
+            anio=anio,
+            autoridad_id=autoridad_id,
+            autoridad_clave=autoridad_clave,
+            distrito_id=distrito_id,
+            distrito_clave=distrito_clave,
+            expediente=expediente,
+            fecha=fecha,
+            fecha_desde=fecha_desde,
+            fecha_hasta=fecha_hasta,
+            materia_tipo_juicio_id=materia_tipo_juicio_id,
+            sentencia=sentencia,
+        )
+    except MyAnyError as error:
+        return OneBaseOut(success=False, message=str(error))
+    return export_response(resultados, SentenciaOut, formato, "sentencias")
 
 
 @sentencias.get("/{sentencia_id}", response_model=OneSentenciaOut)
 async def detalle_sentencia(
+    request: Request,
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
     db: Annotated[Session, Depends(get_db)],
     sentencia_id: int,
@@ -68,7 +112,7 @@ async def detalle_sentencia(
         sentencia = get_sentencia(db, sentencia_id)
     except MyAnyError as error:
         return OneSentenciaOut(success=False, message=str(error))
-    return OneSentenciaOut.from_orm(sentencia)
+    return detail_response(request, sentencia, OneSentenciaOut)
 
 
 @sentencias.post("", response_model=OneSentenciaOut)
@@ -89,6 +133,22 @@ async def crear_sentencia(
     return respuesta
 
 
+@sentencias.post("/bulk", response_model=BulkOut)
+async def crear_sentencias(
+    current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
+    db: Annotated[Session, Depends(get_db)],
+    sentencias_in: Annotated[list[SentenciaIn], Body(max_length=BULK_MAX_ITEMS)],
+):
+    """Crear varias sentencias en una sola transacción, entrega el resultado de cada una en el mismo orden"""
+    if current_user.permissions.get("SENTENCIAS", 0) < Permiso.CREAR:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
+    try:
+        resultados = create_sentencias(db, [Sentencia(**sentencia_in.dict()) for sentencia_in in sentencias_in])
+    except MyAnyError as error:
+        return BulkOut(success=False, message=str(error))
+    return BulkOut.from_results(resultados)
+
+
 @sentencias.put("/{sentencia_id}", response_model=OneSentenciaOut)
 async def modificar_sentencia(
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
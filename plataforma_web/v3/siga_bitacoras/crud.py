@@ -3,13 +3,14 @@ SIGA Bitacoras v3, CRUD (create, read, update, and delete)
 """
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
+from lib.database import async_variant
 from lib.exceptions import MyIsDeletedError, MyNotExistsError, MyNotValidParamError
 from lib.safe_string import safe_string
 
 from ...core.siga_bitacoras.models import SIGABitacora
-from ..siga_salas.crud import get_siga_sala, get_siga_sala_with_clave
+from ..catalogos import catalogo_siga_salas
 
 
 def get_siga_bitacoras(
@@ -20,7 +21,7 @@ def get_siga_bitacoras(
     siga_sala_clave: str = None,
 ) -> Any:
     """Consultar los bitacoras activos"""
-    consulta = db.query(SIGABitacora)
+    consulta = db.query(SIGABitacora).options(joinedload(SIGABitacora.siga_sala))
     if accion is not None:
         accion = safe_string(accion)
         if accion in SIGABitacora.ACCIONES:
@@ -34,14 +35,17 @@ def get_siga_bitacoras(
         else:
             raise MyNotValidParamError("No es un estado válido")
     if siga_sala_id is not None:
-        siga_sala = get_siga_sala(db, siga_sala_id)
+        siga_sala = catalogo_siga_salas.get(db, siga_sala_id)
         consulta = consulta.filter_by(siga_sala_id=siga_sala.id)
     elif siga_sala_clave is not None:
-        siga_sala = get_siga_sala_with_clave(db, siga_sala_clave)
+        siga_sala = catalogo_siga_salas.get_with_clave(db, siga_sala_clave)
         consulta = consulta.filter_by(siga_sala_id=siga_sala.id)
     return consulta.filter_by(estatus="A").order_by(SIGABitacora.id.desc())
 
 
+get_siga_bitacoras_async = async_variant(get_siga_bitacoras)
+
+
 def get_siga_bitacora(db: Session, siga_bitacora_id: int) -> SIGABitacora:
     """Consultar un bitacora por su id"""
     siga_bitacora = db.query(SIGABitacora).get(siga_bitacora_id)
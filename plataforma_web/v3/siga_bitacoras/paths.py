@@ -3,16 +3,17 @@ SIGA Bitacoras v3, rutas (paths)
 """
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_pagination.ext.sqlalchemy import paginate
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from lib.database import Session, get_db
+from lib.database import AsyncSession, Session, get_async_db, get_db
 from lib.exceptions import MyAnyError
+from lib.fastapi_conditional import detail_response
 from lib.fastapi_pagination_custom_page import CustomPage
+from lib.fastapi_pagination_custom_paginate import paginate_async
 
 from ...core.permisos.models import Permiso
 from ..usuarios.authentications import UsuarioInDB, get_current_active_user
-from .crud import get_siga_bitacora, get_siga_bitacoras
+from .crud import get_siga_bitacora, get_siga_bitacoras_async
 from .schemas import OneSIGABitacoraOut, SIGABitacoraOut
 
 siga_bitacoras = APIRouter(prefix="/v3/siga_bitacoras", tags=["siga"])
@@ -21,7 +22,7 @@ siga_bitacoras = APIRouter(prefix="/v3/siga_bitacoras", tags=["siga"])
 @siga_bitacoras.get("", response_model=CustomPage[SIGABitacoraOut])
 async def listado_siga_bitacoras(
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     accion: str = None,
     estado: str = None,
     siga_sala_id: int = None,
@@ -31,7 +32,7 @@ async def listado_siga_bitacoras(
     if current_user.permissions.get("SIGA SALAS", 0) < Permiso.VER:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     try:
-        resultados = get_siga_bitacoras(
+        resultados = await get_siga_bitacoras_async(
             db=db,
             accion=accion,
             estado=estado,
@@ -40,11 +41,12 @@ async def listado_siga_bitacoras(
         )
     except MyAnyError as error:
         return CustomPage(success=False, message=str(error))
-    return paginate(resultados)
+    return await paginate_async(db, resultados)
 
 
 @siga_bitacoras.get("/{siga_bitacora_id}", response_model=OneSIGABitacoraOut)
 async def detalle_siga_bitacora(
+    request: Request,
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
     db: Annotated[Session, Depends(get_db)],
     siga_bitacora_id: int,
@@ -56,4 +58,4 @@ async def detalle_siga_bitacora(
         siga_bitacora = get_siga_bitacora(db, siga_bitacora_id)
     except MyAnyError as error:
         return OneSIGABitacoraOut(success=False, message=str(error))
-    return OneSIGABitacoraOut.from_orm(siga_bitacora)
+    return detail_response(request, siga_bitacora, OneSIGABitacoraOut)
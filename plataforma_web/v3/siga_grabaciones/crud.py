@@ -4,14 +4,15 @@ SIGA Grabaciones v3, CRUD (create, read, update, and delete)
 import re
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
+from lib.database import async_variant
 from lib.exceptions import MyIsDeletedError, MyNotExistsError, MyNotValidParamError
 
 from ...core.autoridades.models import Autoridad
 from ...core.siga_grabaciones.models import SIGAGrabacion
 from ..autoridades.crud import get_autoridad, get_autoridad_with_clave
-from ..distritos.crud import get_distrito, get_distrito_with_clave
+from ..catalogos import catalogo_autoridades, catalogo_distritos, catalogo_materias, catalogo_siga_salas
 from ..materias.crud import get_materia, get_materia_with_clave
 from ..siga_salas.crud import get_siga_sala, get_siga_sala_with_clave
 
@@ -30,34 +31,37 @@ def get_siga_grabaciones(
     siga_sala_clave: str = None,
 ) -> Any:
     """Consultar las grabaciones activas"""
-    consulta = db.query(SIGAGrabacion)
+    consulta = db.query(SIGAGrabacion).options(joinedload(SIGAGrabacion.autoridad).joinedload(Autoridad.distrito), joinedload(SIGAGrabacion.materia), joinedload(SIGAGrabacion.siga_sala))
     if autoridad_id is not None:
-        autoridad = get_autoridad(db, autoridad_id)
+        autoridad = catalogo_autoridades.get(db, autoridad_id)
         consulta = consulta.filter_by(autoridad_id=autoridad.id)
     elif autoridad_clave is not None:
-        autoridad = get_autoridad_with_clave(db, autoridad_clave)
+        autoridad = catalogo_autoridades.get_with_clave(db, autoridad_clave)
         consulta = consulta.filter_by(autoridad_id=autoridad.id)
     elif distrito_id is not None:
-        distrito = get_distrito(db, distrito_id)
+        distrito = catalogo_distritos.get(db, distrito_id)
         consulta = consulta.join(Autoridad).filter(Autoridad.distrito_id == distrito.id)
     elif distrito_clave is not None:
-        distrito = get_distrito_with_clave(db, distrito_clave)
+        distrito = catalogo_distritos.get_with_clave(db, distrito_clave)
         consulta = consulta.join(Autoridad).filter(Autoridad.distrito_id == distrito.id)
     if siga_sala_id is not None:
-        siga_sala = get_siga_sala(db, siga_sala_id)
+        siga_sala = catalogo_siga_salas.get(db, siga_sala_id)
         consulta = consulta.filter_by(siga_sala_id=siga_sala.id)
     elif siga_sala_clave is not None:
-        siga_sala = get_siga_sala_with_clave(db, siga_sala_clave)
+        siga_sala = catalogo_siga_salas.get_with_clave(db, siga_sala_clave)
         consulta = consulta.filter_by(siga_sala_id=siga_sala.id)
     if materia_id is not None:
-        materia = get_materia(db, materia_id)
+        materia = catalogo_materias.get(db, materia_id)
         consulta = consulta.filter_by(materia_id=materia.id)
     elif materia_clave is not None:
-        materia = get_materia_with_clave(db, materia_clave)
+        materia = catalogo_materias.get_with_clave(db, materia_clave)
         consulta = consulta.filter_by(materia_id=materia.id)
     return consulta.filter_by(estatus="A").order_by(SIGAGrabacion.id.desc())
 
 
+get_siga_grabaciones_async = async_variant(get_siga_grabaciones)
+
+
 def get_siga_grabacion(db: Session, siga_grabacion_id: int) -> SIGAGrabacion:
     """Consultar una grabacion por su id"""
     siga_grabacion = db.query(SIGAGrabacion).get(siga_grabacion_id)
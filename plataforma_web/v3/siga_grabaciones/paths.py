@@ -3,12 +3,13 @@ SIGA Grabaciones v3, rutas (paths)
 """
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_pagination.ext.sqlalchemy import paginate
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from lib.database import Session, get_db
+from lib.database import AsyncSession, Session, get_async_db, get_db
 from lib.exceptions import MyAnyError
+from lib.fastapi_conditional import detail_response
 from lib.fastapi_pagination_custom_page import CustomPage
+from lib.fastapi_pagination_custom_paginate import paginate_async
 
 from ...core.permisos.models import Permiso
 from ...core.siga_grabaciones.models import SIGAGrabacion
@@ -16,7 +17,7 @@ from ..autoridades.crud import get_autoridad_with_clave
 from ..materias.crud import get_materia_with_clave
 from ..siga_salas.crud import get_siga_sala_with_clave
 from ..usuarios.authentications import UsuarioInDB, get_current_active_user
-from .crud import create_siga_grabacion, get_siga_grabacion, get_siga_grabacion_with_archivo_nombre, get_siga_grabaciones
+from .crud import create_siga_grabacion, get_siga_grabacion, get_siga_grabacion_with_archivo_nombre, get_siga_grabaciones_async
 from .schemas import OneSIGAGrabacionOut, SIGAGrabacionIn, SIGAGrabacionOut
 
 siga_grabaciones = APIRouter(prefix="/v3/siga_grabaciones", tags=["siga"])
@@ -25,7 +26,7 @@ siga_grabaciones = APIRouter(prefix="/v3/siga_grabaciones", tags=["siga"])
 @siga_grabaciones.get("", response_model=CustomPage[SIGAGrabacionOut])
 async def listado_siga_grabaciones(
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     autoridad_id: int = None,
     autoridad_clave: str = None,
     distrito_id: int = None,
@@ -39,7 +40,7 @@ async def listado_siga_grabaciones(
     if current_user.permissions.get("SIGA GRABACIONES", 0) < Permiso.VER:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     try:
-        resultados = get_siga_grabaciones(
+        resultados = await get_siga_grabaciones_async(
             db=db,
             autoridad_id=autoridad_id,
             autoridad_clave=autoridad_clave,
@@ -52,7 +53,7 @@ async def listado_siga_grabaciones(
         )
     except MyAnyError as error:
         return CustomPage(success=False, message=str(error))
-    return paginate(resultados)
+    return await paginate_async(db, resultados)
 
 
 @siga_grabaciones.get("/archivo_nombre/{archivo_nombre}", response_model=OneSIGAGrabacionOut)
@@ -73,6 +74,7 @@ async def detalle_siga_grabacion_con_archivo_nombre(
 
 @siga_grabaciones.get("/{siga_grabacion_id}", response_model=OneSIGAGrabacionOut)
 async def detalle_siga_grabacion(
+    request: Request,
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
     db: Annotated[Session, Depends(get_db)],
     siga_grabacion_id: int,
@@ -84,7 +86,7 @@ async def detalle_siga_grabacion(
         siga_grabacion = get_siga_grabacion(db, siga_grabacion_id)
     except MyAnyError as error:
         return OneSIGAGrabacionOut(success=False, message=str(error))
-    return OneSIGAGrabacionOut.from_orm(siga_grabacion)
+    return detail_response(request, siga_grabacion, OneSIGAGrabacionOut)
 
 
 @siga_grabaciones.post("", response_model=OneSIGAGrabacionOut)
@@ -3,14 +3,16 @@ SIGA Salas v3, CRUD (create, read, update, and delete)
 """
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
+from lib.database import async_variant
 from lib.exceptions import MyIsDeletedError, MyNotExistsError, MyNotValidParamError
 from lib.safe_string import safe_clave, safe_string
 
+from ...core.domicilios.models import Domicilio
 from ...core.oficinas.models import Oficina
 from ...core.siga_salas.models import SIGASala
-from ..distritos.crud import get_distrito, get_distrito_with_clave
+from ..catalogos import catalogo_distritos
 from ..domicilios.crud import get_domicilio
 
 
@@ -22,12 +24,12 @@ def get_siga_salas(
     estado: str = None,
 ) -> Any:
     """Consultar las salas activas"""
-    consulta = db.query(SIGASala)
+    consulta = db.query(SIGASala).options(joinedload(SIGASala.domicilio).joinedload(Domicilio.distrito))
     if distrito_id is not None:
-        distrito = get_distrito(db, distrito_id)
+        distrito = catalogo_distritos.get(db, distrito_id)
         consulta = consulta.filter_by(distrito_id=distrito.id)
     elif distrito_clave is not None:
-        distrito = get_distrito_with_clave(db, distrito_clave)
+        distrito = catalogo_distritos.get_with_clave(db, distrito_clave)
         consulta = consulta.filter_by(distrito_id=distrito.id)
     if domicilio_id is not None:
         domicilio = get_domicilio(db, domicilio_id)
@@ -41,6 +43,9 @@ def get_siga_salas(
     return consulta.filter_by(estatus="A").order_by(SIGASala.clave)
 
 
+get_siga_salas_async = async_variant(get_siga_salas)
+
+
 def get_siga_sala(db: Session, siga_sala_id: int) -> SIGASala:
     """Consultar una sala por su id"""
     siga_sala = db.query(SIGASala).get(siga_sala_id)
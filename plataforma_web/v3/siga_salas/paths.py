@@ -3,25 +3,30 @@ SIGA Salas v3, rutas (paths)
 """
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_pagination.ext.sqlalchemy import paginate
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from lib.database import Session, get_db
+from lib.database import AsyncSession, Session, get_async_db, get_db
 from lib.exceptions import MyAnyError
+from lib.fastapi_conditional import detail_response
 from lib.fastapi_pagination_custom_page import CustomPage
+from lib.fastapi_pagination_custom_paginate import paginate_async
+from lib.fastapi_response_cache import ResponseCache
 
 from ...core.permisos.models import Permiso
+from ..catalogos import catalogo_siga_salas
 from ..usuarios.authentications import UsuarioInDB, get_current_active_user
-from .crud import get_siga_sala_with_clave, get_siga_salas
+from .crud import get_siga_salas_async
 from .schemas import OneSIGASalaOut, SIGASalaOut
 
 siga_salas = APIRouter(prefix="/v3/siga_salas", tags=["siga"])
+siga_salas_cache = ResponseCache("siga_salas", modulo="SIGA SALAS", ttl=3600, tablas=["siga_salas", "domicilios", "distritos"])
 
 
 @siga_salas.get("", response_model=CustomPage[SIGASalaOut])
+@siga_salas_cache
 async def listado_siga_salas(
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     distrito_id: int = None,
     distrito_clave: str = None,
     domicilio_id: int = None,
@@ -31,7 +36,7 @@ async def listado_siga_salas(
     if current_user.permissions.get("SIGA SALAS", 0) < Permiso.VER:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     try:
-        resultados = get_siga_salas(
+        resultados = await get_siga_salas_async(
             db=db,
             distrito_id=distrito_id,
             distrito_clave=distrito_clave,
@@ -40,11 +45,13 @@ async def listado_siga_salas(
         )
     except MyAnyError as error:
         return CustomPage(success=False, message=str(error))
-    return paginate(resultados)
+    return await paginate_async(db, resultados)
 
 
 @siga_salas.get("/{siga_sala_clave}", response_model=OneSIGASalaOut)
+@siga_salas_cache
 async def detalle_siga_sala(
+    request: Request,
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
     db: Annotated[Session, Depends(get_db)],
     siga_sala_clave: str,
@@ -53,7 +60,7 @@ async def detalle_siga_sala(
     if current_user.permissions.get("SIGA SALAS", 0) < Permiso.VER:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     try:
-        siga_sala = get_siga_sala_with_clave(db, siga_sala_clave)
+        siga_sala = catalogo_siga_salas.get_with_clave(db, siga_sala_clave)
     except MyAnyError as error:
         return OneSIGASalaOut(success=False, message=str(error))
-    return OneSIGASalaOut.from_orm(siga_sala)
+    return detail_response(request, siga_sala, OneSIGASalaOut)
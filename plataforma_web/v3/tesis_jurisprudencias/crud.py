@@ -3,16 +3,16 @@ Tesis Jurisprudencias v3, CRUD (create, read, update, and delete)
 """
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload, with_expression
 
-from lib.exceptions import MyIsDeletedError, MyNotExistsError
+from lib.database import async_variant
+from lib.exceptions import MyIsDeletedError, MyNotExistsError, MyNotValidParamError
+from lib.full_text_search import safe_search_text
 
 from ...core.autoridades.models import Autoridad
-from ...core.tesis_jurisprudencias.models import TesisJurisprudencia
-from ..autoridades.crud import get_autoridad, get_autoridad_with_clave
-from ..distritos.crud import get_distrito, get_distrito_with_clave
+from ...core.tesis_jurisprudencias.models import TesisJurisprudencia, tesis_jurisprudencias_busqueda
+from ..catalogos import catalogo_autoridades, catalogo_distritos, catalogo_materias
 from ..epocas.crud import get_epoca
-from ..materias.crud import get_materia, get_materia_with_clave
 
 
 def get_tesis_jurisprudencias(
@@ -24,31 +24,43 @@ def get_tesis_jurisprudencias(
     epoca_id: int = None,
     materia_id: int = None,
     materia_clave: str = None,
+    q: str = None,
 ) -> Any:
-    """Consultar los tesis jurisprudencias activos"""
-    consulta = db.query(TesisJurisprudencia)
+    """Consultar los tesis jurisprudencias activos, con q se buscan en el rubro, título, texto y precedentes"""
+    consulta = db.query(TesisJurisprudencia).options(joinedload(TesisJurisprudencia.autoridad).joinedload(Autoridad.distrito), joinedload(TesisJurisprudencia.epoca), joinedload(TesisJurisprudencia.materia))
     if autoridad_id is not None:
-        autoridad = get_autoridad(db, autoridad_id)
+        autoridad = catalogo_autoridades.get(db, autoridad_id)
         consulta = consulta.filter_by(autoridad_id=autoridad.id)
     elif autoridad_clave is not None:
-        autoridad = get_autoridad_with_clave(db, autoridad_clave)
+        autoridad = catalogo_autoridades.get_with_clave(db, autoridad_clave)
         consulta = consulta.filter_by(autoridad_id=autoridad.id)
     elif distrito_id is not None:
-        distrito = get_distrito(db, distrito_id)
+        distrito = catalogo_distritos.get(db, distrito_id)
         consulta = consulta.join(Autoridad).filter(Autoridad.distrito_id == distrito.id)
     elif distrito_clave is not None:
-        distrito = get_distrito_with_clave(db, distrito_clave)
+        distrito = catalogo_distritos.get_with_clave(db, distrito_clave)
         consulta = consulta.join(Autoridad).filter(Autoridad.distrito_id == distrito.id)
     if epoca_id is not None:
         epoca = get_epoca(db, epoca_id)
         consulta = consulta.filter_by(epoca_id=epoca.id)
     if materia_id is not None:
-        materia = get_materia(db, materia_id)
+        materia = catalogo_materias.get(db, materia_id)
         consulta = consulta.filter_by(materia_id=materia.id)
     elif materia_clave is not None:
-        materia = get_materia_with_clave(db, materia_clave)
+        materia = catalogo_materias.get_with_clave(db, materia_clave)
         consulta = consulta.filter_by(materia_id=materia.id)
-    return consulta.filter_by(estatus="A").order_by(TesisJurisprudencia.id)
+    consulta = consulta.filter_by(estatus="A")
+    if q is not None:
+        texto = safe_search_text(q)
+        if texto is None:
+            raise MyNotValidParamError("El texto a buscar debe tener al menos una palabra de tres letras")
+        consulta, rango, fragmento = tesis_jurisprudencias_busqueda.search(consulta, texto, db.get_bind().dialect.name)
+        consulta = consulta.options(with_expression(TesisJurisprudencia.busqueda_rango, rango), with_expression(TesisJurisprudencia.busqueda_fragmento, fragmento))
+        return consulta.order_by(rango.desc(), TesisJurisprudencia.id)
+    return consulta.order_by(TesisJurisprudencia.id)
+
+
+get_tesis_jurisprudencias_async = async_variant(get_tesis_jurisprudencias)
 
 
 def get_tesis_jurisprudencia(db: Session, tesis_jurisprudencia_id: int) -> TesisJurisprudencia:
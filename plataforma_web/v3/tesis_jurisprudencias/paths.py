@@ -3,16 +3,17 @@ Tesis Jurisprudencias v3, rutas (paths)
 """
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_pagination.ext.sqlalchemy import paginate
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from lib.database import Session, get_db
+from lib.database import AsyncSession, Session, get_async_db, get_db
 from lib.exceptions import MyAnyError
+from lib.fastapi_conditional import detail_response
 from lib.fastapi_pagination_custom_page import CustomPage
+from lib.fastapi_pagination_custom_paginate import paginate_async
 
 from ...core.permisos.models import Permiso
 from ..usuarios.authentications import UsuarioInDB, get_current_active_user
-from .crud import get_tesis_jurisprudencia, get_tesis_jurisprudencias
+from .crud import get_tesis_jurisprudencia, get_tesis_jurisprudencias_async
 from .schemas import OneTesisJurisprudenciaOut, TesisJurisprudenciaOut
 
 tesis_jurisprudencias = APIRouter(prefix="/v3/tesis_jurisprudencias", tags=["tesis jurisprudencias"])
@@ -21,7 +22,7 @@ tesis_jurisprudencias = APIRouter(prefix="/v3/tesis_jurisprudencias", tags=["tes
 @tesis_jurisprudencias.get("", response_model=CustomPage[TesisJurisprudenciaOut])
 async def listado_tesis_jurisprudencias(
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     autoridad_id: int = None,
     autoridad_clave: str = None,
     distrito_id: int = None,
@@ -29,12 +30,13 @@ async def listado_tesis_jurisprudencias(
     epoca_id: int = None,
     materia_id: int = None,
     materia_clave: str = None,
+    q: str = None,
 ):
     """Listado de tesis jurisprudencias"""
     if current_user.permissions.get("TESIS JURISPRUDENCIAS", 0) < Permiso.VER:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     try:
-        resultados = get_tesis_jurisprudencias(
+        resultados = await get_tesis_jurisprudencias_async(
             db=db,
             autoridad_id=autoridad_id,
             autoridad_clave=autoridad_clave,
@@ -43,14 +45,16 @@ async def listado_tesis_jurisprudencias(
             epoca_id=epoca_id,
             materia_id=materia_id,
             materia_clave=materia_clave,
+            q=q,
         )
     except MyAnyError as error:
         return CustomPage(success=False, message=str(error))
-    return paginate(resultados)
+    return await paginate_async(db, resultados)
 
 
 @tesis_jurisprudencias.get("/{tesis_jurisprudencia_id}", response_model=OneTesisJurisprudenciaOut)
 async def detalle_tesisjurisprudencia(
+    request: Request,
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
     db: Annotated[Session, Depends(get_db)],
     tesis_jurisprudencia_id: int,
@@ -62,4 +66,4 @@ async def detalle_tesisjurisprudencia(
         tesisjurisprudencia = get_tesis_jurisprudencia(db, tesis_jurisprudencia_id)
     except MyAnyError as error:
         return OneTesisJurisprudenciaOut(success=False, message=str(error))
-    return OneTesisJurisprudenciaOut.from_orm(tesisjurisprudencia)
+    return detail_response(request, tesisjurisprudencia, OneTesisJurisprudenciaOut)
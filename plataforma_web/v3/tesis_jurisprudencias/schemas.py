@@ -39,6 +39,8 @@ class TesisJurisprudenciaOut(BaseModel):
     aprobacion_fecha: date | None
     publicacion_tiempo: datetime | None
     aplicacion_tiempo: datetime | None
+    busqueda_rango: float | None = None
+    busqueda_fragmento: str | None = None
     model_config = ConfigDict(from_attributes=True)
 
 
@@ -3,13 +3,15 @@ Ubicaciones de Expedientes v3, CRUD (create, read, update, and delete)
 """
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
+from lib.database import async_variant
 from lib.exceptions import MyIsDeletedError, MyNotExistsError, MyNotValidParamError
 from lib.safe_string import safe_expediente
 
+from ...core.autoridades.models import Autoridad
 from ...core.ubicaciones_expedientes.models import UbicacionExpediente
-from ..autoridades.crud import get_autoridad, get_autoridad_with_clave
+from ..catalogos import catalogo_autoridades
 
 
 def get_ubicaciones_expedientes(
@@ -19,12 +21,12 @@ def get_ubicaciones_expedientes(
     expediente: str = None,
 ) -> Any:
     """Consultar las ubicaciones de expedientes activas"""
-    consulta = db.query(UbicacionExpediente)
+    consulta = db.query(UbicacionExpediente).options(joinedload(UbicacionExpediente.autoridad).joinedload(Autoridad.distrito))
     if autoridad_id is not None:
-        autoridad = get_autoridad(db, autoridad_id)
+        autoridad = catalogo_autoridades.get(db, autoridad_id)
         consulta = consulta.filter_by(autoridad_id=autoridad.id)
     elif autoridad_clave is not None:
-        autoridad = get_autoridad_with_clave(db, autoridad_clave)
+        autoridad = catalogo_autoridades.get_with_clave(db, autoridad_clave)
         consulta = consulta.filter_by(autoridad_id=autoridad.id)
     if expediente is not None:
         try:
@@ -35,6 +37,9 @@ def get_ubicaciones_expedientes(
     return consulta.filter_by(estatus="A").order_by(UbicacionExpediente.id)
 
 
+get_ubicaciones_expedientes_async = async_variant(get_ubicaciones_expedientes)
+
+
 def get_ubicacion_expediente(db: Session, ubicacion_expediente_id: int) -> UbicacionExpediente:
     """Consultar una ubicacion de expediente por su id"""
     ubicacion_expediente = db.query(UbicacionExpediente).get(ubicacion_expediente_id)
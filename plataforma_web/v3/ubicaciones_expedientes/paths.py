@@ -3,16 +3,17 @@ Ubicaciones de Expedientes v3, rutas (paths)
 """
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_pagination.ext.sqlalchemy import paginate
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from lib.database import Session, get_db
+from lib.database import AsyncSession, Session, get_async_db, get_db
 from lib.exceptions import MyAnyError
+from lib.fastapi_conditional import detail_response
 from lib.fastapi_pagination_custom_page import CustomPage
+from lib.fastapi_pagination_custom_paginate import paginate_async
 
 from ...core.permisos.models import Permiso
 from ..usuarios.authentications import UsuarioInDB, get_current_active_user
-from .crud import get_ubicacion_expediente, get_ubicaciones_expedientes
+from .crud import get_ubicacion_expediente, get_ubicaciones_expedientes_async
 from .schemas import OneUbicacionExpedienteOut, UbicacionExpedienteOut
 
 ubicaciones_expedientes = APIRouter(prefix="/v3/ubicaciones_expedientes", tags=["ubicaciones de expedientes"])
@@ -21,7 +22,7 @@ ubicaciones_expedientes = APIRouter(prefix="/v3/ubicaciones_expedientes", tags=[
 @ubicaciones_expedientes.get("", response_model=CustomPage[UbicacionExpedienteOut])
 async def listado_ubicaciones_expedientes(
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     autoridad_id: int = None,
     autoridad_clave: str = None,
     expediente: str = None,
@@ -30,7 +31,7 @@ async def listado_ubicaciones_expedientes(
     if current_user.permissions.get("UBICACIONES EXPEDIENTES", 0) < Permiso.VER:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     try:
-        resultados = get_ubicaciones_expedientes(
+        resultados = await get_ubicaciones_expedientes_async(
             db=db,
             autoridad_id=autoridad_id,
             autoridad_clave=autoridad_clave,
@@ -38,11 +39,12 @@ async def listado_ubicaciones_expedientes(
         )
     except MyAnyError as error:
         return CustomPage(success=False, message=str(error))
-    return paginate(resultados)
+    return await paginate_async(db, resultados)
 
 
 @ubicaciones_expedientes.get("/{ubicacion_expediente_id}", response_model=OneUbicacionExpedienteOut)
 async def detalle_ubicacion_expediente(
+    request: Request,
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
     db: Annotated[Session, Depends(get_db)],
     ubicacion_expediente_id: int,
@@ -54,4 +56,4 @@ async def detalle_ubicacion_expediente(
         ubicacion_expediente = get_ubicacion_expediente(db, ubicacion_expediente_id)
     except MyAnyError as error:
         return OneUbicacionExpedienteOut(success=False, message=str(error))
-    return OneUbicacionExpedienteOut.from_orm(ubicacion_expediente)
+    return detail_response(request, ubicacion_expediente, OneUbicacionExpedienteOut)
@@ -1,33 +1,73 @@
 """
 Autentificaciones
+
+Los usuarios autentificados se guardan en un cache en memoria con la api_key completa como llave,
+así las peticiones repetidas de un mismo cliente no consultan la base de datos.
+Cada entrada dura a lo más AUTH_CACHE_TTL segundos y nunca más allá de api_key_expiracion.
+No se guardan la contraseña cifrada ni el api_key, que no se usan después de autentificar, así no quedan en Redis.
+Al confirmar cambios en las tablas de los usuarios, sus roles y permisos se olvidan todas las autentificaciones.
+
+Se consulta con la sesión asíncrona de get_async_db, la misma que usan los listados en la petición,
+así no se ocupa además una conexión de psycopg2 ni se bloquea el event loop cuando no está en el cache.
 """
 import re
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 from fastapi import Depends, HTTPException
 from fastapi.security.api_key import APIKeyHeader
-from hashids import Hashids
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from starlette.status import HTTP_403_FORBIDDEN
 from unidecode import unidecode
 
-from lib.database import get_db
+from config.settings import get_settings
+from lib.cache import BaseCache, get_cache
+from lib.database import AsyncSession, get_async_db
 from lib.exceptions import MyAuthenticationError
+from lib.fastapi_metrics import record_auth_failure
+from lib.fastapi_response_cache import on_invalidate
+from lib.hashids import get_hashids
 
+from ...core.autoridades.models import Autoridad
 from ...core.usuarios.models import Usuario
 from .schemas import UsuarioInDB
 
-API_KEY_REGEXP = r"^\w+\.\w+\.\w+$"
+API_KEY_REGEXP = re.compile(r"^\w+\.\w+\.\w+$")
 X_API_KEY = APIKeyHeader(name="X-Api-Key")
 
+# Tablas de las que se toman los datos del usuario autentificado
+AUTH_TABLAS = {"usuarios", "usuarios_roles", "roles", "permisos", "modulos", "autoridades", "distritos", "oficinas"}
+
+
+@lru_cache()
+def get_auth_cache() -> BaseCache:
+    """Cache de autentificaciones, se crea la primera vez que se usa"""
+    settings = get_settings()
+    return get_cache("auth", maxsize=settings.auth_cache_maxsize, ttl=settings.auth_cache_ttl)
+
+
+def invalidate_auth_cache(api_key: str = None) -> None:
+    """Olvidar un api_key del cache de autentificaciones, o todos si no se especifica"""
+    if api_key is None:
+        get_auth_cache().clear()
+    else:
+        get_auth_cache().delete(unidecode(api_key))
+
+
+@on_invalidate
+def invalidate_auth_cache_tablas(tablas: set[str]) -> None:
+    """Olvidar todas las autentificaciones cuando cambia alguna de las tablas del usuario"""
+    if AUTH_TABLAS & tablas:
+        invalidate_auth_cache()
+
 
 def get_user(
     usuario_id: int,
-    database: Session = Depends(get_db),
+    database: Session,
 ) -> Optional[UsuarioInDB]:
     """Consultar un usuario por su id"""
-    usuario = database.query(Usuario).get(usuario_id)
+    usuario = database.query(Usuario).options(joinedload(Usuario.autoridad).joinedload(Autoridad.distrito), joinedload(Usuario.oficina)).get(usuario_id)
     if usuario:
         return UsuarioInDB(
             id=usuario.id,
@@ -60,16 +100,11 @@ def get_user(
     return None
 
 
-def authenticate_user(
+def validate_user(
     api_key: str,
     database: Session,
 ) -> UsuarioInDB:
-    """Autentificar un usuario por su api_key"""
-
-    # Validar con expresion regular
-    api_key = unidecode(api_key)
-    if re.match(API_KEY_REGEXP, api_key) is None:
-        raise MyAuthenticationError("No paso la validacion por expresion regular")
+    """Consultar y validar el usuario de un api_key"""
 
     # Separar el id, el email y la cadena aleatoria del api_key
     api_key_id, api_key_email, _ = api_key.split(".")
@@ -89,7 +124,7 @@ def authenticate_user(
         raise MyAuthenticationError("No es igual la api_key al dato en la base de datos")
 
     # Validar el email
-    if api_key_email != Hashids(salt=usuario.email, min_length=8).encode(1):
+    if api_key_email != get_hashids(usuario.email).encode(1):
         raise MyAuthenticationError("No coincide el correo electronico")
 
     # Validar el tiempo de expiracion
@@ -104,16 +139,40 @@ def authenticate_user(
     return usuario
 
 
+def authenticate_user(
+    api_key: str,
+    database: Session,
+) -> UsuarioInDB:
+    """Autentificar un usuario por su api_key"""
+
+    # Validar con expresion regular
+    api_key = unidecode(api_key)
+    if API_KEY_REGEXP.match(api_key) is None:
+        raise MyAuthenticationError("No paso la validacion por expresion regular")
+
+    # Consultar el cache, si esta se omite la base de datos
+    usuario = get_auth_cache().get(api_key)
+    if usuario is None:
+        usuario = validate_user(api_key, database).model_copy(update={"hashed_password": "", "api_key": ""})
+
+        # Guardar en el cache, sin la contraseña cifrada ni el api_key y sin que dure más que la vigencia del api_key
+        get_auth_cache().set(api_key, usuario, ttl=(usuario.api_key_expiracion - datetime.now()).total_seconds())
+
+    # Entregar
+    return usuario
+
+
 async def get_current_active_user(
     api_key: str = Depends(X_API_KEY),
-    database: Session = Depends(get_db),
+    database: AsyncSession = Depends(get_async_db),
 ) -> UsuarioInDB:
     """Obtener el usuario activo actual"""
 
-    # Try-except
+    # Try-except, la sesión síncrona de run_sync sólo toma una conexión si el api_key no está en el cache
     try:
-        usuario = authenticate_user(api_key, database)
+        usuario = await database.run_sync(lambda db: authenticate_user(api_key, db))
     except MyAuthenticationError as error:
+        record_auth_failure(str(error))
         raise HTTPException(status_code=HTTP_403_FORBIDDEN, detail=str(error)) from error
 
     # Entregar
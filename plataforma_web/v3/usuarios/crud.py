@@ -3,14 +3,15 @@ Usuarios v3, CRUD (create, read, update, and delete)
 """
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
+from lib.database import async_variant
 from lib.exceptions import MyIsDeletedError, MyNotExistsError, MyNotValidParamError
 from lib.safe_string import safe_email, safe_string
 
+from ...core.autoridades.models import Autoridad
 from ...core.usuarios.models import Usuario
-from ..autoridades.crud import get_autoridad, get_autoridad_with_clave
-from ..oficinas.crud import get_oficina, get_oficina_with_clave
+from ..catalogos import catalogo_autoridades, catalogo_oficinas
 
 
 def get_usuarios(
@@ -26,7 +27,7 @@ def get_usuarios(
     workspace: str = None,
 ) -> Any:
     """Consultar los usuarios activos"""
-    consulta = db.query(Usuario)
+    consulta = db.query(Usuario).options(joinedload(Usuario.autoridad).joinedload(Autoridad.distrito), joinedload(Usuario.oficina))
     if apellido_paterno is not None:
         apellido_paterno = safe_string(apellido_paterno)
         if apellido_paterno != "":
@@ -36,10 +37,10 @@ def get_usuarios(
         if apellido_materno != "":
             consulta = consulta.filter(Usuario.apellido_materno.contains(apellido_materno))
     if autoridad_id is not None:
-        autoridad = get_autoridad(db, autoridad_id)
+        autoridad = catalogo_autoridades.get(db, autoridad_id)
         consulta = consulta.filter_by(autoridad_id=autoridad.id)
     elif autoridad_clave is not None:
-        autoridad = get_autoridad_with_clave(db, autoridad_clave)
+        autoridad = catalogo_autoridades.get_with_clave(db, autoridad_clave)
         consulta = consulta.filter_by(autoridad_id=autoridad.id)
     if email is not None:
         try:
@@ -52,10 +53,10 @@ def get_usuarios(
         if nombres != "":
             consulta = consulta.filter(Usuario.nombres.contains(nombres))
     if oficina_id is not None:
-        oficina = get_oficina(db, oficina_id)
+        oficina = catalogo_oficinas.get(db, oficina_id)
         consulta = consulta.filter_by(oficina_id=oficina.id)
     elif oficina_clave is not None:
-        oficina = get_oficina_with_clave(db, oficina_clave)
+        oficina = catalogo_oficinas.get_with_clave(db, oficina_clave)
         consulta = consulta.filter_by(oficina_id=oficina.id)
     if workspace is not None:
         workspace = safe_string(workspace)
@@ -66,6 +67,9 @@ def get_usuarios(
     return consulta.filter_by(estatus="A").order_by(Usuario.email)
 
 
+get_usuarios_async = async_variant(get_usuarios)
+
+
 def get_usuario(db: Session, usuario_id: int) -> Usuario:
     """Consultar un usuario por su id"""
     usuario = db.query(Usuario).get(usuario_id)
@@ -3,16 +3,17 @@ Usuarios v3, rutas (paths)
 """
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_pagination.ext.sqlalchemy import paginate
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from lib.database import Session, get_db
+from lib.database import AsyncSession, Session, get_async_db, get_db
 from lib.exceptions import MyAnyError
+from lib.fastapi_conditional import detail_response
 from lib.fastapi_pagination_custom_page import CustomPage
+from lib.fastapi_pagination_custom_paginate import paginate_async
 
 from ...core.permisos.models import Permiso
 from ..usuarios.authentications import UsuarioInDB, get_current_active_user
-from .crud import get_usuario_with_email, get_usuarios
+from .crud import get_usuario_with_email, get_usuarios_async
 from .schemas import OneUsuarioOut, UsuarioOut
 
 usuarios = APIRouter(prefix="/v3/usuarios", tags=["usuarios"])
@@ -21,7 +22,7 @@ usuarios = APIRouter(prefix="/v3/usuarios", tags=["usuarios"])
 @usuarios.get("", response_model=CustomPage[UsuarioOut])
 async def listado_usuarios(
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     apellido_paterno: str = None,
     apellido_materno: str = None,
     autoridad_id: int = None,
@@ -36,7 +37,7 @@ async def listado_usuarios(
     if current_user.permissions.get("USUARIOS", 0) < Permiso.VER:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     try:
-        resultados = get_usuarios(
+        resultados = await get_usuarios_async(
             db=db,
             apellido_paterno=apellido_paterno,
             apellido_materno=apellido_materno,
@@ -50,11 +51,12 @@ async def listado_usuarios(
         )
     except MyAnyError as error:
         return CustomPage(success=False, message=str(error))
-    return paginate(resultados)
+    return await paginate_async(db, resultados)
 
 
 @usuarios.get("/{email}", response_model=OneUsuarioOut)
 async def detalle_usuario(
+    request: Request,
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
     db: Annotated[Session, Depends(get_db)],
     email: str,
@@ -66,4 +68,4 @@ async def detalle_usuario(
         usuario = get_usuario_with_email(db, email)
     except MyAnyError as error:
         return OneUsuarioOut(success=False, message=str(error))
-    return OneUsuarioOut.from_orm(usuario)
+    return detail_response(request, usuario, OneUsuarioOut)
@@ -3,8 +3,9 @@ Usuarios-Roles v3, CRUD (create, read, update, and delete)
 """
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
+from lib.database import async_variant
 from lib.exceptions import MyIsDeletedError, MyNotExistsError
 
 from ...core.usuarios_roles.models import UsuarioRol
@@ -20,7 +21,7 @@ def get_usuarios_roles(
     usuario_email: str = None,
 ) -> Any:
     """Consultar los usuarios-roles activos"""
-    consulta = db.query(UsuarioRol)
+    consulta = db.query(UsuarioRol).options(joinedload(UsuarioRol.rol), joinedload(UsuarioRol.usuario))
     if rol_id is not None:
         rol = get_rol(db, rol_id)
         consulta = consulta.filter(rol == rol)
@@ -36,6 +37,9 @@ def get_usuarios_roles(
     return consulta.filter_by(estatus="A").order_by(UsuarioRol.id)
 
 
+get_usuarios_roles_async = async_variant(get_usuarios_roles)
+
+
 def get_usuario_rol(db: Session, usuario_rol_id: int) -> UsuarioRol:
     """Consultar un usuario-rol por su id"""
     usuario_rol = db.query(UsuarioRol).get(usuario_rol_id)
@@ -3,16 +3,17 @@ Usuarios-Roles v3, rutas (paths)
 """
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_pagination.ext.sqlalchemy import paginate
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from lib.database import Session, get_db
+from lib.database import AsyncSession, Session, get_async_db, get_db
 from lib.exceptions import MyAnyError
+from lib.fastapi_conditional import detail_response
 from lib.fastapi_pagination_custom_page import CustomPage
+from lib.fastapi_pagination_custom_paginate import paginate_async
 
 from ...core.permisos.models import Permiso
 from ..usuarios.authentications import UsuarioInDB, get_current_active_user
-from .crud import get_usuario_rol, get_usuarios_roles
+from .crud import get_usuario_rol, get_usuarios_roles_async
 from .schemas import OneUsuarioRolOut, UsuarioRolOut
 
 usuarios_roles = APIRouter(prefix="/v3/usuarios_roles", tags=["usuarios"])
@@ -21,7 +22,7 @@ usuarios_roles = APIRouter(prefix="/v3/usuarios_roles", tags=["usuarios"])
 @usuarios_roles.get("", response_model=CustomPage[UsuarioRolOut])
 async def listado_usuarios_roles(
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     rol_id: int = None,
     rol_nombre: str = None,
     usuario_id: int = None,
@@ -31,7 +32,7 @@ async def listado_usuarios_roles(
     if current_user.permissions.get("USUARIOS ROLES", 0) < Permiso.VER:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     try:
-        resultados = get_usuarios_roles(
+        resultados = await get_usuarios_roles_async(
             db=db,
             rol_id=rol_id,
             rol_nombre=rol_nombre,
@@ -40,11 +41,12 @@ async def listado_usuarios_roles(
         )
     except MyAnyError as error:
         return CustomPage(success=False, message=str(error))
-    return paginate(resultados)
+    return await paginate_async(db, resultados)
 
 
 @usuarios_roles.get("/{usuario_rol_id}", response_model=OneUsuarioRolOut)
 async def detalle_usuario_rol(
+    request: Request,
     current_user: Annotated[UsuarioInDB, Depends(get_current_active_user)],
     db: Annotated[Session, Depends(get_db)],
     usuario_rol_id: int,
@@ -56,4 +58,4 @@ async def detalle_usuario_rol(
         usuario_rol = get_usuario_rol(db, usuario_rol_id)
     except MyAnyError as error:
         return OneUsuarioRolOut(success=False, message=str(error))
-    return OneUsuarioRolOut.from_orm(usuario_rol)
+    return detail_response(request, usuario_rol, OneUsuarioRolOut)
@@ -0,0 +1,154 @@
+"""
+Local database
+
+Base de datos SQLite en un archivo temporal con todas las tablas de los modelos,
+para las pruebas que no necesitan un servidor corriendo.
+Se usa con un engine síncrono y otro asíncrono con aiosqlite.
+
+Con el URL de un PostgreSQL de pruebas usa esa base de datos con psycopg2 y asyncpg,
+como en producción; borra y crea sus tablas. Las pruebas que lo necesitan lo toman
+de la variable de entorno TEST_POSTGRESQL_URL y se omiten si no está definida.
+"""
+import os
+import random
+import tempfile
+from datetime import date, datetime, time, timedelta
+from types import SimpleNamespace
+
+os.environ.setdefault("DB_PORT", "5432")
+os.environ.setdefault("ORIGINS", "*")
+os.environ.setdefault("SALT", "pruebas")
+
+# pylint: disable=wrong-import-position
+from fastapi.testclient import TestClient
+from sqlalchemy import JSON, Boolean, Date, DateTime, Enum, Float, Integer, Interval, Numeric, String, Text, Time, create_engine, event, insert, make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool, StaticPool
+
+from lib.database import Base, get_async_db, get_db
+from lib.fastapi_pagination_custom_paginate import get_count_cache
+from lib.fastapi_response_cache import response_caches
+from lib.fastapi_server_timing import listen_sql_timing
+from lib.trigram_search import register_sqlite_functions
+from plataforma_web.app import create_app  # Carga todos los modelos
+from plataforma_web.core.permisos.models import Permiso
+from plataforma_web.v3.catalogos import invalidate_catalogos
+from plataforma_web.v3.usuarios.authentications import get_current_active_user
+
+
+class TodosLosPermisos(dict):
+    """Permisos con el mismo nivel para cualquier módulo"""
+
+    def __init__(self, nivel: int):
+        super().__init__()
+        self.nivel = nivel
+
+    def get(self, key, default=None):
+        return self.nivel
+
+    def __getitem__(self, key):
+        return self.nivel
+
+
+def fake_value(column, numero: int):
+    """Valor de prueba para una columna según su tipo"""
+    tipo = column.type
+    if column.name == "estatus":
+        return "A"
+    if isinstance(tipo, JSON):
+        return {"texto": numero}
+    if isinstance(tipo, Interval):
+        return timedelta(minutes=numero)
+    if isinstance(tipo, Enum):
+        return tipo.enums[0]
+    if isinstance(tipo, Boolean):
+        return True
+    if isinstance(tipo, DateTime):
+        return datetime(2023, 1, 1) + timedelta(hours=numero)
+    if isinstance(tipo, Date):
+        return date(2023, 1, 1) + timedelta(days=numero)
+    if isinstance(tipo, Time):
+        return time(9, 0)
+    if isinstance(tipo, Integer):
+        return numero
+    if isinstance(tipo, (Numeric, Float)):
+        return 1.0
+    if isinstance(tipo, String) and not isinstance(tipo, Text):
+        return f"{column.name[:4].upper()}{numero}"[: tipo.length or 16]
+    return f"Texto {numero}"
+
+
+class LocalDatabase:
+    """Engines SQLite que cuentan las consultas ejecutadas"""
+
+    def __init__(self, url: str = ""):
+        if url:
+            self.engine = create_engine(make_url(url).set(drivername="postgresql+psycopg2"))
+            self.async_engine = create_async_engine(make_url(url).set(drivername="postgresql+asyncpg"), poolclass=NullPool)
+            Base.metadata.drop_all(self.engine)
+        else:
+            self.directorio = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+            archivo = os.path.join(self.directorio.name, "pruebas.sqlite")
+            self.engine = create_engine(f"sqlite:///{archivo}", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+            self.async_engine = create_async_engine(f"sqlite+aiosqlite:///{archivo}", poolclass=NullPool)
+            register_sqlite_functions(self.engine)
+            register_sqlite_functions(self.async_engine.sync_engine)
+        listen_sql_timing(self.engine)
+        listen_sql_timing(self.async_engine.sync_engine)
+        Base.metadata.create_all(self.engine)
+        invalidate_catalogos()
+        get_count_cache().clear()
+        for response_cache in response_caches.values():
+            response_cache.invalidate()
+        self.session_local = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        self.async_session_local = async_sessionmaker(autoflush=False, expire_on_commit=False, bind=self.async_engine)
+        self.queries = 0
+        self.statements = []
+        event.listen(self.engine, "before_cursor_execute", self._count)
+        event.listen(self.async_engine.sync_engine, "before_cursor_execute", self._count)
+
+    def _count(self, conn, cursor, statement, *args, **kwargs):
+        """Contar cada consulta y guardar las últimas"""
+        self.queries += 1
+        self.statements = self.statements[-999:] + [statement]
+
+    def seed(self, cantidad: int = 30, semilla: int = 0):
+        """Insertar la cantidad de registros en cada tabla, con claves foráneas al azar"""
+        azar = random.Random(semilla)
+        with self.engine.begin() as conn:
+            for table in Base.metadata.sorted_tables:
+                rows = []
+                for numero in range(1, cantidad + 1):
+                    row = {}
+                    for column in table.columns:
+                        if column.primary_key:
+                            row[column.name] = numero
+                        elif column.foreign_keys:
+                            row[column.name] = azar.randint(1, cantidad)
+                        else:
+                            row[column.name] = fake_value(column, numero)
+                    rows.append(row)
+                conn.execute(insert(table), rows)
+
+    def get_db(self):
+        """Sesión para reemplazar la dependencia get_db"""
+        db = self.session_local()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def get_async_db(self):
+        """Sesión asíncrona para reemplazar la dependencia get_async_db"""
+        async with self.async_session_local() as db:
+            yield db
+
+    def client(self, nivel: int = Permiso.ADMINISTRAR) -> TestClient:
+        """Cliente de la aplicación con esta base de datos y un usuario con el nivel dado en todos los módulos"""
+        usuario = SimpleNamespace(id=1, email="pruebas@pjecz.gob.mx", permissions=TodosLosPermisos(nivel))
+        app = create_app()
+        app.dependency_overrides[get_db] = self.get_db
+        app.dependency_overrides[get_async_db] = self.get_async_db
+        app.dependency_overrides[get_current_active_user] = lambda: usuario
+        return TestClient(app)
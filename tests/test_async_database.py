@@ -0,0 +1,82 @@
+"""
+Unit tests for the async database
+
+The listings and the authentication must use the async session from get_async_db and not the sync one.
+"""
+import unittest
+from datetime import datetime, timedelta
+
+from fastapi.routing import APIRoute
+
+from tests.local_database import LocalDatabase
+
+# pylint: disable=wrong-import-position,wrong-import-order
+from lib.database import get_db  # isort: skip
+from lib.fastapi_pagination_custom_page import CustomPage  # isort: skip
+from lib.hashids import get_hashids  # isort: skip
+from plataforma_web.core.usuarios.models import Usuario  # isort: skip
+from plataforma_web.v3.usuarios.authentications import get_auth_cache, get_current_active_user, invalidate_auth_cache  # isort: skip
+
+
+def get_db_no_usar():
+    """Dependencia síncrona que no deben usar los listados"""
+    raise AssertionError("El listado usó get_db")
+
+
+class TestAsyncDatabase(unittest.TestCase):
+    """Tests for the async database"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create and seed the local database"""
+        cls.database = LocalDatabase()
+        cls.database.seed(cantidad=10)
+        cls.client = cls.database.client()
+        cls.client.app.dependency_overrides[get_db] = get_db_no_usar
+
+    def test_listings_use_async_session(self):
+        """Test that every listing responds without the sync session"""
+        rutas = [route.path for route in self.client.app.routes if isinstance(route, APIRoute) and route.response_model is not None and issubclass(route.response_model, CustomPage)]
+        self.assertGreater(len(rutas), 40)
+        for ruta in rutas:
+            with self.subTest(ruta=ruta):
+                response = self.client.get(ruta)
+                self.assertEqual(response.status_code, 200)
+                self.assertIn("success", response.json())
+
+    def test_error_in_crud(self):
+        """Test that the errors of the crud functions are returned as unsuccessful pages"""
+        response = self.client.get("/v3/sentencias", params={"autoridad_clave": "NO EXISTE"})
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.json()["success"])
+
+    def test_authentication_uses_async_session(self):
+        """Test that an api_key and its permissions are validated with the async session"""
+        usuario = Usuario(id=3, email="EMAI3")
+        api_key = f"{usuario.encode_id()}.{get_hashids(usuario.email).encode(1)}.aleatorio"
+        with self.database.engine.begin() as conn:
+            conn.exec_driver_sql("UPDATE usuarios SET api_key = ?, api_key_expiracion = ? WHERE id = 3", (api_key, datetime.now() + timedelta(days=1)))
+            conn.exec_driver_sql("UPDATE usuarios_roles SET usuario_id = 3, rol_id = 1 WHERE id = 1")
+            conn.exec_driver_sql("UPDATE permisos SET rol_id = 1, modulo_id = 1, nivel = 1 WHERE id = 1")
+            conn.exec_driver_sql("UPDATE modulos SET nombre = 'DISTRITOS' WHERE id = 1")
+        invalidate_auth_cache()
+        client = self.database.client()
+        client.app.dependency_overrides[get_db] = get_db_no_usar
+        del client.app.dependency_overrides[get_current_active_user]
+        response = client.get("/v3/distritos", headers={"X-Api-Key": api_key})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()["success"])
+        self.assertEqual(get_auth_cache().get(api_key).hashed_password, "")
+        self.assertEqual(get_auth_cache().get(api_key).api_key, "")
+        response = client.get("/v3/distritos", headers={"X-Api-Key": api_key.replace("aleatorio", "otro")})
+        self.assertEqual(response.status_code, 403)
+        with self.database.session_local() as db:
+            db.get(Usuario, 3).estatus = "B"
+            db.commit()
+        self.assertIsNone(get_auth_cache().get(api_key))
+        response = client.get("/v3/distritos", headers={"X-Api-Key": api_key})
+        self.assertEqual(response.status_code, 403)
+
+
+if __name__ == "__main__":
+    unittest.main()
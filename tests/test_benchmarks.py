@@ -0,0 +1,174 @@
+"""
+Micro-benchmarks of the crud functions and the serialization
+
+Calls the crud functions of plataforma_web/v3 with a session of the local database,
+filled by tests/synthetic_data.py with 0.001 of the volumes of production, and fetches a page.
+Then validates and encodes the page with the Out schema, like the listings do.
+
+Each stage is measured in its own way:
+
+- wall time, p50 and p95 of REPETICIONES runs after a warm up run
+- queries, the SQL statements of a run (in serializacion they are lazy loads)
+- peak_kib, the memory allocated at most during a run, measured apart with tracemalloc
+
+Fails when the queries grow over tests/benchmark_baseline.json. With the BENCHMARK=1 environment variable
+it also fails when a p50 goes over its value multiplied by its threshold (or the BENCHMARK_THRESHOLD
+environment variable) plus tolerance_ms, the times depend on the machine.
+
+To see the results and to save them as the new baseline run:
+
+    python3 -m tests.test_benchmarks
+    python3 -m tests.test_benchmarks --guardar
+
+"""
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+import unittest
+from pathlib import Path
+from typing import Any, Callable
+
+from tests.local_database import LocalDatabase
+from tests.synthetic_data import generar, volumenes
+
+# pylint: disable=wrong-import-position,wrong-import-order
+from lib.fastapi_pagination_custom_page import items_adapter  # isort: skip
+from plataforma_web.v3.audiencias.crud import get_audiencias  # isort: skip
+from plataforma_web.v3.audiencias.schemas import AudienciaOut  # isort: skip
+from plataforma_web.v3.bitacoras.crud import get_bitacoras  # isort: skip
+from plataforma_web.v3.bitacoras.schemas import BitacoraOut  # isort: skip
+from plataforma_web.v3.edictos.crud import get_edictos  # isort: skip
+from plataforma_web.v3.edictos.schemas import EdictoOut  # isort: skip
+from plataforma_web.v3.inv_equipos.crud import get_inv_equipos  # isort: skip
+from plataforma_web.v3.inv_equipos.schemas import InvEquipoOut  # isort: skip
+from plataforma_web.v3.listas_de_acuerdos.crud import get_listas_de_acuerdos  # isort: skip
+from plataforma_web.v3.listas_de_acuerdos.schemas import ListaDeAcuerdoOut  # isort: skip
+from plataforma_web.v3.sentencias.crud import get_sentencias  # isort: skip
+from plataforma_web.v3.sentencias.schemas import SentenciaOut  # isort: skip
+from plataforma_web.v3.siga_grabaciones.crud import get_siga_grabaciones  # isort: skip
+from plataforma_web.v3.siga_grabaciones.schemas import SIGAGrabacionOut  # isort: skip
+from plataforma_web.v3.tesis_jurisprudencias.crud import get_tesis_jurisprudencias  # isort: skip
+from plataforma_web.v3.tesis_jurisprudencias.schemas import TesisJurisprudenciaOut  # isort: skip
+from plataforma_web.v3.usuarios.crud import get_usuarios  # isort: skip
+from plataforma_web.v3.usuarios.schemas import UsuarioOut  # isort: skip
+
+BASELINE_FILE = Path(__file__).with_name("benchmark_baseline.json")
+ESCALA = 0.001
+LIMITE = 100
+REPETICIONES = 15
+
+# Nombre, función del crud, sus parámetros y el esquema de la página
+CASOS = [
+    ("sentencias", get_sentencias, {}, SentenciaOut),
+    ("sentencias_distrito", get_sentencias, {"distrito_id": 1}, SentenciaOut),
+    ("siga_grabaciones", get_siga_grabaciones, {}, SIGAGrabacionOut),
+    ("inv_equipos", get_inv_equipos, {}, InvEquipoOut),
+    ("inv_equipos_distrito", get_inv_equipos, {"distrito_id": 1}, InvEquipoOut),
+    ("listas_de_acuerdos", get_listas_de_acuerdos, {}, ListaDeAcuerdoOut),
+    ("edictos", get_edictos, {}, EdictoOut),
+    ("audiencias", get_audiencias, {}, AudienciaOut),
+    ("bitacoras", get_bitacoras, {}, BitacoraOut),
+    ("usuarios", get_usuarios, {}, UsuarioOut),
+    ("tesis_jurisprudencias_q", get_tesis_jurisprudencias, {"q": "amparo"}, TesisJurisprudenciaOut),
+]
+
+
+def medir(database: LocalDatabase, etapa: Callable[[], Any]) -> dict:
+    """Wall time, queries and peak of the memory of a stage"""
+    etapa()  # Calentar los catálogos, los caches y los adaptadores de pydantic
+    tiempos = []
+    queries = 0
+    for _ in range(REPETICIONES):
+        antes = database.queries
+        inicio = time.perf_counter()
+        etapa()
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+        queries = database.queries - antes
+    tracemalloc.start()
+    try:
+        etapa()
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "p50_ms": round(statistics.median(tiempos), 3),
+        "p95_ms": round(statistics.quantiles(tiempos, n=20)[-1], 3),
+        "queries": queries,
+        "peak_kib": round(pico / 1024, 1),
+    }
+
+
+def run_benchmarks() -> dict:
+    """Fill a local database and measure the crud and the serializacion of every case"""
+    database = LocalDatabase()
+    generar(database.engine, volumenes(ESCALA))
+    resultados = {}
+    for nombre, crud, parametros, schema in CASOS:
+        adapter = items_adapter(schema)
+        estado = {}
+        with database.session_local() as db:
+
+            def consultar():
+                db.expunge_all()  # pylint: disable=cell-var-from-loop
+                estado["items"] = crud(db, **parametros).limit(LIMITE).all()  # pylint: disable=cell-var-from-loop
+
+            def serializar():
+                adapter.dump_json(adapter.validate_python(estado["items"], from_attributes=True))  # pylint: disable=cell-var-from-loop
+
+            resultados[f"{nombre}.crud"] = medir(database, consultar)
+            resultados[f"{nombre}.serializacion"] = medir(database, serializar)
+            resultados[f"{nombre}.crud"]["items"] = len(estado["items"])
+    database.engine.dispose()
+    return resultados
+
+
+class TestBenchmarks(unittest.TestCase):
+    """Tests for the regressions of the crud functions and the serialization"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Measure once for all the tests"""
+        cls.resultados = run_benchmarks()
+        with open(BASELINE_FILE, encoding="utf-8") as archivo:
+            cls.baseline = json.load(archivo)
+
+    def test_every_benchmark_has_baseline(self):
+        """Test that the baseline has every benchmark, run with --guardar after adding one"""
+        self.assertEqual(sorted(self.resultados), sorted(self.baseline["benchmarks"]))
+
+    @unittest.skipUnless(os.getenv("BENCHMARK"), "Requires BENCHMARK=1")
+    def test_p50(self):
+        """Test that the p50 of each benchmark is under its baseline with the threshold"""
+        threshold = float(os.getenv("BENCHMARK_THRESHOLD", self.baseline["threshold"]))
+        for nombre, resultado in self.resultados.items():
+            if nombre not in self.baseline["benchmarks"]:
+                continue
+            with self.subTest(benchmark=nombre):
+                limite = self.baseline["benchmarks"][nombre]["p50_ms"] * threshold + self.baseline["tolerance_ms"]
+                self.assertLess(resultado["p50_ms"], limite, f"{nombre} p50 de {resultado['p50_ms']:.2f} ms supera {limite:.2f} ms")
+
+    def test_queries(self):
+        """Test that no benchmark makes more queries than its baseline"""
+        for nombre, resultado in self.resultados.items():
+            if nombre not in self.baseline["benchmarks"]:
+                continue
+            with self.subTest(benchmark=nombre):
+                self.assertLessEqual(resultado["queries"], self.baseline["benchmarks"][nombre]["queries"] + self.baseline["queries_threshold"])
+
+
+if __name__ == "__main__":
+    mediciones = run_benchmarks()
+    print(f"{'benchmark':40} {'p50 ms':>9} {'p95 ms':>9} {'queries':>8} {'peak KiB':>9}")
+    for benchmark, medicion in mediciones.items():
+        print(f"{benchmark:40} {medicion['p50_ms']:9.2f} {medicion['p95_ms']:9.2f} {medicion['queries']:8} {medicion['peak_kib']:9.1f}")
+    if "--guardar" in sys.argv:
+        with open(BASELINE_FILE, encoding="utf-8") as archivo:
+            anterior = json.load(archivo)
+        anterior["benchmarks"] = mediciones
+        with open(BASELINE_FILE, "w", encoding="utf-8") as archivo:
+            json.dump(anterior, archivo, indent=2)
+            archivo.write("\n")
+        print(f"Se guardó {BASELINE_FILE}")
@@ -0,0 +1,96 @@
+"""
+Unit tests for the bulk creation of sentencias, edictos and listas de acuerdos
+"""
+import unittest
+
+from tests.local_database import LocalDatabase
+
+
+class TestBulkCreate(unittest.TestCase):
+    """Tests for the bulk routes"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create and seed the local database, autoridad 30 is deleted"""
+        cls.database = LocalDatabase()
+        cls.database.seed(cantidad=30)
+        with cls.database.engine.begin() as conn:
+            conn.exec_driver_sql("UPDATE autoridades SET estatus = 'B' WHERE id = 30")
+        cls.client = cls.database.client()
+
+    def post_bulk(self, ruta: str, registros: list) -> tuple:
+        """Send the records and return the data and the number of queries"""
+        self.database.queries = 0
+        self.database.statements = []
+        response = self.client.post(ruta, json=registros)
+        self.assertEqual(response.status_code, 200)
+        return response.json(), self.database.queries
+
+    def test_edictos(self):
+        """Test that the valid edictos are created and the invalid ones report their error"""
+        edicto = {"fecha": "2023-06-01", "descripcion": "EDICTO", "expediente": "1/2023", "numero_publicacion": "1", "archivo": "edicto.pdf", "url": "https://"}
+        registros = [{**edicto, "autoridad_id": autoridad_id} for autoridad_id in (1, 2, 999, 30, 3)]
+        data, consultas = self.post_bulk("/v3/edictos/bulk", registros)
+        self.assertTrue(data["success"])
+        self.assertEqual([item["success"] for item in data["items"]], [True, True, False, False, True])
+        self.assertEqual(data["items"][2]["message"], "No existe ese autoridad")
+        self.assertEqual(data["items"][3]["message"], "No es activo ese autoridad, está eliminado")
+        for item in data["items"]:
+            if item["success"]:
+                detalle = self.client.get(f"/v3/edictos/{item['id']}").json()
+                self.assertEqual(detalle["descripcion"], "EDICTO")
+        self.assertLessEqual(consultas, 6)
+
+    def test_sentencias(self):
+        """Test that the sentencias validate autoridad and materia_tipo_juicio"""
+        sentencia = {
+            "sentencia": "1/2023",
+            "sentencia_fecha": "2023-06-01",
+            "expediente": "1/2023",
+            "fecha": "2023-06-01",
+            "descripcion": "SENTENCIA",
+            "es_perspectiva_genero": False,
+            "archivo": "sentencia.pdf",
+            "url": "https://",
+        }
+        registros = [
+            {**sentencia, "autoridad_id": 1, "materia_tipo_juicio_id": 1},
+            {**sentencia, "autoridad_id": 1, "materia_tipo_juicio_id": 999},
+            {**sentencia, "autoridad_id": 2, "materia_tipo_juicio_id": 2},
+        ]
+        data, _ = self.post_bulk("/v3/sentencias/bulk", registros)
+        self.assertEqual([item["success"] for item in data["items"]], [True, False, True])
+        self.assertEqual(data["message"], "Se crearon 2 de 3 registros")
+
+    def test_rejected_by_database(self):
+        """Test that a record rejected by a constraint of the database reports its error and the others are created"""
+        lista = {"autoridad_id": 1, "fecha": "2023-06-01", "descripcion": "LISTA", "archivo": "lista.pdf", "url": "https://"}
+        registros = [lista, {**lista, "descripcion": None}, {**lista, "autoridad_id": 999}, lista]
+        data, _ = self.post_bulk("/v3/listas_de_acuerdos/bulk", registros)
+        self.assertEqual([item["success"] for item in data["items"]], [True, False, False, True])
+        self.assertEqual(data["items"][1]["message"], "No se pudo guardar porque no cumple una restricción de la base de datos")
+        self.assertEqual(data["message"], "Se crearon 2 de 4 registros")
+        for item in (data["items"][0], data["items"][3]):
+            self.assertEqual(self.client.get(f"/v3/listas_de_acuerdos/{item['id']}").json()["descripcion"], "LISTA")
+
+    def test_many_records_same_number_of_queries(self):
+        """Test that the validation queries do not grow with the number of records
+
+        SQLite inserts one row per statement to return the ids in order, PostgreSQL inserts them in batches.
+        """
+        lista = {"fecha": "2023-06-01", "descripcion": "LISTA", "archivo": "lista.pdf", "url": "https://"}
+        self.post_bulk("/v3/listas_de_acuerdos/bulk", [{**lista, "autoridad_id": 1}] * 2)
+        pocas = [consulta for consulta in self.database.statements if not consulta.startswith("INSERT")]
+        data, _ = self.post_bulk("/v3/listas_de_acuerdos/bulk", [{**lista, "autoridad_id": numero % 29 + 1} for numero in range(200)])
+        muchas = [consulta for consulta in self.database.statements if not consulta.startswith("INSERT")]
+        self.assertEqual(data["message"], "Se crearon 200 de 200 registros")
+        self.assertEqual(len(pocas), len(muchas))
+
+    def test_too_many_records(self):
+        """Test that more than the maximum of records is rejected"""
+        response = self.client.post("/v3/listas_de_acuerdos/bulk", json=[{"autoridad_id": 1}] * 1001)
+        self.assertEqual(response.status_code, 422)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+"""
+Unit tests for the caches
+
+The shared backend is tested with fakeredis as a stand-in of the Redis server,
+each client of the same FakeServer plays the role of a gunicorn worker.
+"""
+import time
+import unittest
+from unittest import mock
+
+import fakeredis
+import redis
+
+from tests.local_database import LocalDatabase
+
+# pylint: disable=wrong-import-position,wrong-import-order
+from lib.cache import RedisCache, TTLCache, TwoLevelCache, get_cache  # isort: skip
+from lib.fastapi_response_cache import response_caches  # isort: skip
+from plataforma_web.v3.usuarios.schemas import UsuarioInDB  # isort: skip
+
+
+class TestTTLCache(unittest.TestCase):
+    """Tests for the local cache"""
+
+    def test_lru_and_ttl(self):
+        """Test that the least recently used entry is removed and the entries expire"""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        cache.set("d", 4, ttl=0.01)
+        time.sleep(0.02)
+        self.assertIsNone(cache.get("d"))
+
+
+class TestRedisCache(unittest.TestCase):
+    """Tests for the shared cache"""
+
+    def setUp(self):
+        """Start a new stand-in server"""
+        self.server = fakeredis.FakeServer()
+
+    def worker(self) -> redis.Redis:
+        """Client of the stand-in server, like the one of a worker"""
+        return fakeredis.FakeRedis(server=self.server)
+
+    def test_shared_between_workers(self):
+        """Test that a value saved by a worker is read by another"""
+        campos = {nombre: None for nombre, campo in UsuarioInDB.model_fields.items() if campo.is_required()}
+        campos.update(id=1, email="pruebas@pjecz.gob.mx", username="pruebas", permissions={"SENTENCIAS": 1}, hashed_password="", disabled=False, api_key="a.b.c", api_key_expiracion="2030-01-01T00:00:00")
+        usuario = UsuarioInDB(**campos)
+        RedisCache(self.worker(), "auth", ttl=60).set("llave", usuario)
+        self.assertEqual(RedisCache(self.worker(), "auth", ttl=60).get("llave"), usuario)
+        self.assertIsNone(RedisCache(self.worker(), "otro", ttl=60).get("llave"))
+
+    def test_ttl_delete_and_clear(self):
+        """Test the expiration, the delete and that clear only removes its own prefix"""
+        cache = RedisCache(self.worker(), "uno", ttl=60)
+        otro = RedisCache(self.worker(), "dos", ttl=60)
+        cache.set("a", 1, ttl=120)
+        self.assertLessEqual(self.worker().pttl(cache._llave("a")), 60000)  # pylint: disable=protected-access
+        cache.set("b", 2)
+        otro.set("a", 3)
+        cache.delete("b")
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(len(cache), 1)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(otro.get("a"), 3)
+
+    def test_unreadable_value(self):
+        """Test that a value that cannot be unpickled is a miss and is removed"""
+        cache = RedisCache(self.worker(), "auth", ttl=60)
+        self.worker().set(cache._llave("a"), b"no es pickle")  # pylint: disable=protected-access
+        with self.assertLogs("lib.cache", level="WARNING"):
+            self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 0)
+
+    def test_unavailable(self):
+        """Test that without a Redis server the cache does not fail"""
+        cache = RedisCache(redis.Redis(port=1, socket_connect_timeout=0.1), "caido", ttl=60)
+        cache.set("a", 1)
+        self.assertIsNone(cache.get("a"))
+        cache.delete("a")
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+
+class TestTwoLevelCache(unittest.TestCase):
+    """Tests for the two level cache"""
+
+    def setUp(self):
+        """Start a new stand-in server"""
+        self.server = fakeredis.FakeServer()
+
+    def worker(self) -> TwoLevelCache:
+        """Two level cache of a worker"""
+        return TwoLevelCache(TTLCache(maxsize=10, ttl=5), RedisCache(fakeredis.FakeRedis(server=self.server), "totales", ttl=60))
+
+    def test_local_hit_and_shared_fallback(self):
+        """Test that the local hits do not reach the shared tier, and the shared hits fill the local one"""
+        primero, segundo = self.worker(), self.worker()
+        primero.set("a", 1)
+        self.assertEqual(segundo.get("a"), 1)
+        self.assertEqual(segundo.local.get("a"), 1)
+        segundo.compartido.client.flushall()
+        self.assertEqual(segundo.get("a"), 1)
+        primero.clear()
+        self.assertIsNone(primero.get("a"))
+
+    def test_get_cache(self):
+        """Test that get_cache builds the cache of CACHE_BACKEND"""
+        settings = mock.Mock(cache_backend="local", cache_l1_ttl=5)
+        with mock.patch("lib.cache.get_settings", return_value=settings), mock.patch("lib.cache.get_redis_client", return_value=fakeredis.FakeRedis(server=self.server)):
+            self.assertIsInstance(get_cache("a"), TTLCache)
+            cache = get_cache("a", ttl=3600, compartido=True)
+            self.assertIsInstance(cache, TTLCache)
+            self.assertEqual(cache.ttl, 5)
+            settings.cache_backend = "redis"
+            self.assertIsInstance(get_cache("a"), RedisCache)
+            self.assertIsInstance(get_cache("a", maxsize=0), TTLCache)
+            settings.cache_backend = "l1l2"
+            cache = get_cache("a", ttl=60)
+            self.assertIsInstance(cache, TwoLevelCache)
+            self.assertEqual(cache.local.ttl, 5)
+            self.assertIsInstance(get_cache("a", compartido=True), RedisCache)
+
+
+class TestSharedResponses(unittest.TestCase):
+    """Tests for the caches of the application on the shared backend"""
+
+    def test_response_cache_between_workers(self):
+        """Test that a response kept by a worker is served by another without queries"""
+        server = fakeredis.FakeServer()
+        database = LocalDatabase()
+        database.seed(cantidad=5)
+        client = database.client()
+        response_cache = response_caches["epocas"]
+        invalidated = mock.patch.object(response_cache, "invalidated", RedisCache(fakeredis.FakeRedis(server=server), "response_invalidated:epocas", ttl=5))
+        invalidated.start()
+        self.addCleanup(invalidated.stop)
+        with mock.patch.object(response_cache, "cache", RedisCache(fakeredis.FakeRedis(server=server), "response:epocas", ttl=60)):
+            primera = client.get("/v3/epocas")
+        with mock.patch.object(response_cache, "cache", RedisCache(fakeredis.FakeRedis(server=server), "response:epocas", ttl=60)):
+            database.queries = 0
+            segunda = client.get("/v3/epocas")
+            self.assertEqual(database.queries, 0)
+        self.assertEqual(segunda.content, primera.content)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+"""
+Unit tests for the catalogs of autoridades, distritos, materias, oficinas and salas
+"""
+import asyncio
+import threading
+import unittest
+
+from tests.local_database import LocalDatabase
+
+# pylint: disable=wrong-import-position,wrong-import-order
+from plataforma_web.v3.catalogos import invalidate_catalogos  # isort: skip
+from plataforma_web.v3.sentencias.crud import get_sentencias_async  # isort: skip
+
+
+class TestCatalogos(unittest.TestCase):
+    """Tests for the catalogs"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create and seed the local database, autoridad 30 is deleted"""
+        cls.database = LocalDatabase()
+        cls.database.seed(cantidad=30)
+        with cls.database.engine.begin() as conn:
+            conn.exec_driver_sql("UPDATE autoridades SET estatus = 'B' WHERE id = 30")
+        cls.client = cls.database.client()
+
+    def get_queries(self, ruta: str, parametros: dict = None) -> tuple:
+        """Request a route and return the data and the number of queries"""
+        self.database.queries = 0
+        response = self.client.get(ruta, params=parametros)
+        self.assertEqual(response.status_code, 200)
+        return response.json(), self.database.queries
+
+    def test_filters_do_not_query_the_catalogs(self):
+        """Test that after the first load the filters only run the listing query"""
+        for parametros in ({"autoridad_clave": "CLAV3"}, {"distrito_id": 2}, {"distrito_clave": "CLAV2"}):
+            with self.subTest(parametros=parametros):
+                self.get_queries("/v3/sentencias", parametros)
+                _, consultas = self.get_queries("/v3/sentencias", {**parametros, "total": "none"})
+                self.assertEqual(consultas, 1)
+
+    def test_inventory_filters(self):
+        """Test that the inventory listings filter by the oficina and distrito of the catalogs"""
+        for ruta in ("/v3/inv_equipos", "/v3/inv_custodias"):
+            for parametros in ({"oficina_id": 2}, {"oficina_clave": "CLAV2"}, {"distrito_id": 2}, {"distrito_clave": "CLAV2"}):
+                with self.subTest(ruta=ruta, parametros=parametros):
+                    data, _ = self.get_queries(ruta, parametros)
+                    self.assertTrue(data["success"])
+
+    def test_errors(self):
+        """Test that the catalogs give the same errors as the crud"""
+        data, _ = self.get_queries("/v3/sentencias", {"autoridad_id": 30})
+        self.assertEqual(data["message"], "No es activo ese autoridad, está eliminado")
+        data, _ = self.get_queries("/v3/sentencias", {"autoridad_id": 999})
+        self.assertEqual(data["message"], "No existe ese autoridad")
+        data, _ = self.get_queries("/v3/sentencias", {"autoridad_clave": "no válida"})
+        self.assertFalse(data["success"])
+
+    def test_details(self):
+        """Test that the details of the catalogs have the denormalized fields"""
+        data, _ = self.get_queries("/v3/autoridades/CLAV5")
+        self.assertTrue(data["success"])
+        self.assertEqual(data["id"], 5)
+        self.assertIsNotNone(data["distrito_clave"])
+        self.assertIsNotNone(data["materia_nombre"])
+        data, _ = self.get_queries("/v3/siga_salas/CLAV5")
+        self.assertIsNotNone(data["distrito_clave"])
+        data, _ = self.get_queries("/v3/oficinas/CLAV5")
+        self.assertIsNotNone(data["domicilio_edificio"])
+        self.get_queries("/v3/distritos/CLAV5")
+        data, consultas = self.get_queries("/v3/distritos/CLAV6")
+        self.assertEqual(data["id"], 6)
+        self.assertEqual(consultas, 0)
+
+    def test_concurrent_async_load(self):
+        """Test that two async listings loading the same expired catalog do not block the event loop"""
+
+        async def consultar():
+            async with self.database.async_session_local() as db:
+                consulta = await get_sentencias_async(db, autoridad_id=1)
+                return await db.run_sync(lambda _: consulta.limit(5).all())
+
+        async def concurrentes():
+            return await asyncio.wait_for(asyncio.gather(consultar(), consultar()), timeout=10)
+
+        resultados = []
+        invalidate_catalogos()
+        hilo = threading.Thread(target=lambda: resultados.append(asyncio.run(concurrentes())), daemon=True)
+        hilo.start()
+        hilo.join(timeout=15)
+        self.assertFalse(hilo.is_alive(), "El event loop quedó bloqueado al cargar el catálogo")
+        self.assertEqual(len(resultados), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
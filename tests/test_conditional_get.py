@@ -0,0 +1,88 @@
+"""
+Unit tests for the conditional GET
+
+The details and the listings have ETag and answer 304 when the client already has them.
+"""
+import unittest
+from datetime import datetime
+
+from sqlalchemy import text
+
+from tests.local_database import LocalDatabase
+
+
+class TestConditionalGet(unittest.TestCase):
+    """Tests for the conditional GET"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create and seed the local database"""
+        cls.database = LocalDatabase()
+        cls.database.seed(cantidad=20)
+        cls.client = cls.database.client()
+
+    def modify(self, tabla: str, registro_id: int, **campos):
+        """Change the modificado and the given fields of a record"""
+        asignaciones = ", ".join(f"{campo} = :{campo}" for campo in ["modificado", *campos])
+        with self.database.engine.begin() as conn:
+            conn.execute(text(f"UPDATE {tabla} SET {asignaciones} WHERE id = :id"), {"modificado": datetime(2024, 1, 1, 12), "id": registro_id, **campos})
+
+    def test_detail(self):
+        """Test the ETag and Last-Modified of a detail"""
+        response = self.client.get("/v3/abogados/3")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()["success"])
+        etag = response.headers["etag"]
+        last_modified = response.headers["last-modified"]
+        self.assertTrue(etag.startswith('W/"'))
+        response = self.client.get("/v3/abogados/3", headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response.headers["etag"], etag)
+        response = self.client.get("/v3/abogados/3", headers={"If-Modified-Since": last_modified})
+        self.assertEqual(response.status_code, 304)
+        response = self.client.get("/v3/abogados/3", headers={"If-Modified-Since": "Sat, 01 Jan 2000 00:00:00 GMT"})
+        self.assertEqual(response.status_code, 200)
+        self.modify("abogados", 3, nombre="OTRO NOMBRE")
+        response = self.client.get("/v3/abogados/3", headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers["etag"], etag)
+
+    def test_detail_related_rows(self):
+        """Test that a change in a related row shown in the detail changes the ETag and Last-Modified"""
+        response = self.client.get("/v3/sentencias/4")
+        self.assertEqual(response.status_code, 200)
+        etag = response.headers["etag"]
+        last_modified = response.headers["last-modified"]
+        self.modify("autoridades", response.json()["autoridad_id"], descripcion="OTRA DESCRIPCION")
+        response = self.client.get("/v3/sentencias/4", headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["autoridad_descripcion"], "OTRA DESCRIPCION")
+        response = self.client.get("/v3/sentencias/4", headers={"If-Modified-Since": last_modified})
+        self.assertEqual(response.status_code, 200)
+
+    def test_catalog_detail(self):
+        """Test that the details from the catalogs also have ETag"""
+        response = self.client.get("/v3/distritos/CLAV2")
+        self.assertEqual(response.status_code, 200)
+        response = self.client.get("/v3/distritos/CLAV2", headers={"If-None-Match": response.headers["etag"]})
+        self.assertEqual(response.status_code, 304)
+
+    def test_listing(self):
+        """Test the ETag of a page of a listing"""
+        response = self.client.get("/v3/peritos", params={"limit": 5})
+        self.assertEqual(response.status_code, 200)
+        etag = response.headers["etag"]
+        ids = [item["id"] for item in response.json()["items"]]
+        response = self.client.get("/v3/peritos", params={"limit": 5}, headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+        response = self.client.get("/v3/peritos", params={"limit": 5, "offset": 5}, headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.modify("peritos", ids[-1], nombre="OTRO NOMBRE")
+        response = self.client.get("/v3/peritos", params={"limit": 5}, headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers["etag"], etag)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+Unit tests for the cursor pagination
+
+Walking a listing by cursor must return every record once.
+"""
+import unittest
+
+from sqlakeyset import select_page
+from sqlalchemy import text
+
+from tests.local_database import LocalDatabase
+
+# pylint: disable=wrong-import-position,wrong-import-order
+from lib.fastapi_pagination_custom_paginate import keyset_query  # isort: skip
+from plataforma_web.core.epocas.models import Epoca  # isort: skip
+
+# Listados con distintos ordenamientos
+RUTAS = [
+    "/v3/bitacoras/cursor",
+    "/v3/distritos/cursor",
+    "/v3/inv_modelos/cursor",
+    "/v3/peritos/cursor",
+    "/v3/sentencias/cursor",
+]
+
+
+class TestCursorPagination(unittest.TestCase):
+    """Tests for the cursor pagination"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create and seed the local database"""
+        cls.database = LocalDatabase()
+        cls.database.seed(cantidad=60)
+        cls.client = cls.database.client()
+
+    def test_walk_listings(self):
+        """Test that walking by cursor returns every record once"""
+        for ruta in RUTAS:
+            with self.subTest(ruta=ruta):
+                ids = []
+                parametros = {"limit": 10}
+                while True:
+                    response = self.client.get(ruta, params=parametros)
+                    self.assertEqual(response.status_code, 200)
+                    data = response.json()
+                    self.assertTrue(data["success"])
+                    ids += [item["id"] for item in data["items"]]
+                    if data["next_cursor"] is None:
+                        break
+                    parametros["cursor"] = data["next_cursor"]
+                self.assertEqual(len(ids), 60)
+                self.assertEqual(len(set(ids)), 60)
+
+    def test_ties_between_pages(self):
+        """Test that the rows with the same value in a column that is not unique are neither skipped nor repeated"""
+        with self.database.engine.begin() as conn:
+            conn.execute(text("UPDATE epocas SET estatus = CASE WHEN id % 3 = 0 THEN 'B' ELSE 'A' END"))
+        db = self.database.session_local()
+        try:
+            consulta = keyset_query(db.query(Epoca).order_by(Epoca.estatus))
+            ids = []
+            page = select_page(db, consulta.statement, per_page=7)
+            while True:
+                ids += [fila[0].id for fila in page]
+                if not page.paging.has_next:
+                    break
+                page = select_page(db, consulta.statement, per_page=7, page=page.paging.bookmark_next)
+        finally:
+            db.rollback()
+            db.close()
+            with self.database.engine.begin() as conn:
+                conn.execute(text("UPDATE epocas SET estatus = 'A'"))
+        self.assertEqual(ids, [numero for numero in range(1, 61) if numero % 3] + [numero for numero in range(1, 61) if numero % 3 == 0])
+
+    def test_filters(self):
+        """Test that the cursor route accepts the same filters"""
+        response = self.client.get("/v3/sentencias/cursor", params={"autoridad_id": 3})
+        self.assertEqual(response.status_code, 200)
+        for item in response.json()["items"]:
+            self.assertEqual(item["autoridad_id"], 3)
+
+    def test_invalid_cursor(self):
+        """Test that an invalid cursor is rejected"""
+        response = self.client.get("/v3/sentencias/cursor", params={"cursor": "no-es-un-cursor"})
+        self.assertEqual(response.status_code, 422)
+
+
+if __name__ == "__main__":
+    unittest.main()
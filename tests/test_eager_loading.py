@@ -0,0 +1,93 @@
+"""
+Unit tests for the eager loading of the listings
+
+Each listing must serialize a page with the same number of queries,
+no matter how many items it has.
+"""
+import importlib
+import unittest
+
+from tests.local_database import LocalDatabase
+
+# Listado, función que consulta, esquema que entrega y cantidad de consultas esperada
+LISTADOS = [
+    ("abogados", "get_abogados", "AbogadoOut", 1),
+    ("arc_documentos", "get_arc_documentos", "ArcDocumentoOut", 1),
+    ("arc_juzgados_extintos", "get_arc_juzgados_extintos", "ArcJuzgadoExtintoOut", 1),
+    ("arc_remesas", "get_arc_remesas", "ArcRemesaOut", 1),
+    ("arc_remesas_documentos", "get_arc_remesas_documentos", "ArcRemesaDocumentoOut", 1),
+    ("arc_solicitudes", "get_arc_solicitudes", "ArcSolicitudOut", 1),
+    ("audiencias", "get_audiencias", "AudienciaOut", 1),
+    ("autoridades", "get_autoridades", "AutoridadOut", 1),
+    ("bitacoras", "get_bitacoras", "BitacoraOut", 1),
+    ("boletines", "get_boletines", "BoletinOut", 1),
+    ("centros_trabajos", "get_centros_trabajos", "CentroTrabajoOut", 1),
+    ("cit_dias_inhabiles", "get_cit_dias_inhabiles", "CitDiaInhabilOut", 1),
+    ("distritos", "get_distritos", "DistritoOut", 1),
+    ("domicilios", "get_domicilios", "DomicilioOut", 1),
+    ("edictos", "get_edictos", "EdictoOut", 1),
+    ("entradas_salidas", "get_entradas_salidas", "EntradaSalidaOut", 1),
+    ("epocas", "get_epocas", "EpocaOut", 1),
+    ("funcionarios", "get_funcionarios", "FuncionarioOut", 1),
+    ("glosas", "get_glosas", "GlosaOut", 1),
+    ("inv_categorias", "get_inv_categorias", "InvCategoriaOut", 1),
+    ("inv_componentes", "get_inv_componentes", "InvComponenteOut", 1),
+    ("inv_custodias", "get_inv_custodias", "InvCustodiaOut", 1),
+    ("inv_equipos", "get_inv_equipos", "InvEquipoOut", 2),
+    ("inv_marcas", "get_inv_marcas", "InvMarcaOut", 1),
+    ("inv_modelos", "get_inv_modelos", "InvModeloOut", 1),
+    ("inv_redes", "get_inv_redes", "InvRedOut", 1),
+    ("listas_de_acuerdos", "get_listas_de_acuerdos", "ListaDeAcuerdoOut", 1),
+    ("materias", "get_materias", "MateriaOut", 1),
+    ("materias_tipos_juicios", "get_materias_tipos_juicios", "MateriaTipoJuicioOut", 1),
+    ("modulos", "get_modulos", "ModuloOut", 1),
+    ("oficinas", "get_oficinas", "OficinaOut", 1),
+    ("peritos", "get_peritos", "PeritoOut", 1),
+    ("peritos_tipos", "get_peritos_tipos", "PeritoTipoOut", 1),
+    ("permisos", "get_permisos", "PermisoOut", 1),
+    ("redam", "get_redams", "RedamOut", 1),
+    ("repsvm_agresores", "get_repsvm_agresores", "RepsvmAgresorOut", 1),
+    ("roles", "get_roles", "RolOut", 1),
+    ("sentencias", "get_sentencias", "SentenciaOut", 1),
+    ("siga_bitacoras", "get_siga_bitacoras", "SIGABitacoraOut", 1),
+    ("siga_grabaciones", "get_siga_grabaciones", "SIGAGrabacionOut", 1),
+    ("siga_salas", "get_siga_salas", "SIGASalaOut", 1),
+    ("tesis_jurisprudencias", "get_tesis_jurisprudencias", "TesisJurisprudenciaOut", 1),
+    ("ubicaciones_expedientes", "get_ubicaciones_expedientes", "UbicacionExpedienteOut", 1),
+    ("usuarios", "get_usuarios", "UsuarioOut", 1),
+    ("usuarios_roles", "get_usuarios_roles", "UsuarioRolOut", 1),
+]
+
+
+class TestEagerLoading(unittest.TestCase):
+    """Tests for the number of queries of the listings"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create and seed the local database"""
+        cls.database = LocalDatabase()
+        cls.database.seed(cantidad=40)
+
+    def count_queries(self, listado: str, funcion: str, esquema: str, limite: int) -> int:
+        """Count the queries to get and serialize a page of a listing"""
+        crud = importlib.import_module(f"plataforma_web.v3.{listado}.crud")
+        schemas = importlib.import_module(f"plataforma_web.v3.{listado}.schemas")
+        with self.database.session_local() as db:
+            consulta = getattr(crud, funcion)(db=db)
+            self.database.queries = 0
+            items = consulta.limit(limite).all()
+            self.assertEqual(len(items), limite)
+            for item in items:
+                getattr(schemas, esquema).model_validate(item)
+            return self.database.queries
+
+    def test_listings_query_count(self):
+        """Test that pages of 10 and 40 items use the expected number of queries"""
+        for listado, funcion, esquema, esperadas in LISTADOS:
+            with self.subTest(listado=listado):
+                self.assertEqual(self.count_queries(listado, funcion, esquema, 10), esperadas)
+                self.assertEqual(self.count_queries(listado, funcion, esquema, 40), esperadas)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+"""
+Unit tests for the full text search
+
+The local database uses the SQLite FTS5 fallback of lib/full_text_search.py
+"""
+import unittest
+
+from sqlalchemy import text
+
+from tests.local_database import LocalDatabase
+
+# pylint: disable=wrong-import-position,wrong-import-order
+from lib.full_text_search import safe_search_text  # isort: skip
+from plataforma_web.core.tesis_jurisprudencias.models import tesis_jurisprudencias_busqueda  # isort: skip
+
+
+class TestTesisJurisprudenciasSearch(unittest.TestCase):
+    """Tests for the q parameter of the tesis jurisprudencias"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create and seed the local database with some texts"""
+        cls.database = LocalDatabase()
+        cls.database.seed(cantidad=20)
+        with cls.database.engine.begin() as conn:
+            conn.execute(text("UPDATE tesis_jurisprudencias SET rubro = 'Amparo directo en materia penal', texto = 'El juicio de amparo procede contra sentencias definitivas en materia penal' WHERE id = 3"))
+            conn.execute(text("UPDATE tesis_jurisprudencias SET texto = 'Se menciona el amparo una sola vez' WHERE id = 7"))
+            conn.execute(text("UPDATE tesis_jurisprudencias SET texto = 'Otra materia' WHERE id = 1"))
+            conn.execute(text("UPDATE tesis_jurisprudencias SET texto = '<script>alert(1)</script> & \"suplencia\" de la queja' WHERE id = 9"))
+        cls.client = cls.database.client()
+
+    def test_ranking_and_snippet(self):
+        """Test that the results are ordered by relevance and have the highlighted snippet"""
+        response = self.client.get("/v3/tesis_jurisprudencias", params={"q": "amparo"})
+        self.assertEqual(response.status_code, 200)
+        items = response.json()["items"]
+        self.assertEqual([item["id"] for item in items], [3, 7])
+        self.assertGreater(items[0]["busqueda_rango"], items[1]["busqueda_rango"])
+        self.assertIn("<mark>amparo</mark>", items[0]["busqueda_fragmento"])
+        self.assertEqual(response.json()["total"], 2)
+
+    def test_snippet_is_escaped(self):
+        """Test that the text of the snippet is escaped for HTML and only the matches are marked"""
+        response = self.client.get("/v3/tesis_jurisprudencias", params={"q": "suplencia"})
+        fragmento = response.json()["items"][0]["busqueda_fragmento"]
+        self.assertEqual(fragmento, "&lt;script&gt;alert(1)&lt;/script&gt; &amp; &quot;<mark>suplencia</mark>&quot; de la queja")
+
+    def test_cursor_by_id(self):
+        """Test that the cursor pagination of a search goes by id instead of the rank"""
+        response = self.client.get("/v3/tesis_jurisprudencias", params={"q": "materia"})
+        self.assertEqual([item["id"] for item in response.json()["items"]], [3, 1])
+        response = self.client.get("/v3/tesis_jurisprudencias/cursor", params={"q": "materia", "limit": 1})
+        self.assertEqual([item["id"] for item in response.json()["items"]], [1])
+        siguiente = self.client.get("/v3/tesis_jurisprudencias/cursor", params={"q": "materia", "limit": 1, "cursor": response.json()["next_cursor"]})
+        self.assertEqual([item["id"] for item in siguiente.json()["items"]], [3])
+        self.assertIn("<mark>materia</mark>", siguiente.json()["items"][0]["busqueda_fragmento"])
+
+    def test_all_the_words(self):
+        """Test that all the words must be found, without taking accents into account"""
+        response = self.client.get("/v3/tesis_jurisprudencias", params={"q": "ámparo PENAL"})
+        self.assertEqual([item["id"] for item in response.json()["items"]], [3])
+
+    def test_without_q(self):
+        """Test that without q the listing is the same as before"""
+        response = self.client.get("/v3/tesis_jurisprudencias")
+        self.assertEqual(response.json()["total"], 20)
+        self.assertIsNone(response.json()["items"][0]["busqueda_rango"])
+
+    def test_not_valid(self):
+        """Test that a text without words is rejected and the FTS5 syntax is not interpreted"""
+        self.assertIsNone(safe_search_text(' "* a '))
+        self.assertEqual(safe_search_text("  amparo   directo "), "amparo directo")
+        response = self.client.get("/v3/tesis_jurisprudencias", params={"q": "*"})
+        self.assertFalse(response.json()["success"])
+        response = self.client.get("/v3/tesis_jurisprudencias", params={"q": 'amparo" (penal* '})
+        self.assertEqual([item["id"] for item in response.json()["items"]], [3])
+
+    def test_postgresql_ddl(self):
+        """Test the statements of the tsvector column and its GIN index"""
+        columna, indice = tesis_jurisprudencias_busqueda.postgresql_ddl(concurrently=True)
+        self.assertIn("setweight(to_tsvector('spanish', coalesce(rubro, '')), 'A')", columna)
+        self.assertIn("GENERATED ALWAYS AS", columna)
+        self.assertTrue(indice.startswith("CREATE INDEX CONCURRENTLY"))
+        self.assertIn("USING gin (busqueda)", indice)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+"""
+Unit tests for the Hashids codecs
+"""
+import unittest
+
+from hashids import Hashids
+
+from tests.local_database import LocalDatabase  # pylint: disable=unused-import
+
+# pylint: disable=wrong-import-position,wrong-import-order
+from lib.hashids import cifrar_id, decode_many, descifrar_id, encode_many, get_hashids  # isort: skip
+from plataforma_web.core.abogados.models import Abogado  # isort: skip
+from config.settings import get_settings  # isort: skip
+
+
+class TestHashids(unittest.TestCase):
+    """Tests for the Hashids codecs"""
+
+    def test_codec_per_salt(self):
+        """Test that the codecs are kept by salt and give the same IDs as a new Hashids"""
+        self.assertIs(get_hashids("uno"), get_hashids("uno"))
+        self.assertIsNot(get_hashids("uno"), get_hashids("dos"))
+        self.assertEqual(get_hashids("uno").encode(123), Hashids(salt="uno", min_length=8).encode(123))
+
+    def test_many(self):
+        """Test encode_many and decode_many with the salt of the settings"""
+        ids = [1, 2, 30, 4000]
+        encoded = encode_many(ids)
+        self.assertEqual(encoded, [cifrar_id(un_id, get_settings()) for un_id in ids])
+        self.assertEqual(decode_many(encoded), ids)
+        self.assertEqual(decode_many(["corto", "!!!!!!!!!!", encoded[0], "X" * 17]), [None, None, 1, None])
+        self.assertEqual(descifrar_id(encoded[2], get_settings()), 30)
+
+    def test_universal_mixin(self):
+        """Test the methods of the models"""
+        abogados = [Abogado(id=un_id) for un_id in (5, 6, 7)]
+        encoded = Abogado.encode_ids(abogados)
+        self.assertEqual(encoded, [abogado.encode_id() for abogado in abogados])
+        self.assertEqual(Abogado.decode_ids(encoded), [5, 6, 7])
+        self.assertEqual(Abogado.decode_id(encoded[1]), 6)
+        self.assertIsNone(Abogado.decode_id("no-valido"))
+
+
+if __name__ == "__main__":
+    unittest.main()
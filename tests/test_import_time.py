@@ -0,0 +1,80 @@
+"""
+Unit tests for the start time
+
+Imports plataforma_web.app and calls create_app in a new interpreter with -X importtime,
+like a worker that starts, and checks that the modules of lazy_modules in tests/import_time_baseline.json
+are not imported. With the BENCHMARK=1 environment variable it also compares the times with the baseline,
+the times depend on the machine.
+
+To see the breakdown by package run:
+
+    python3 -m tests.test_import_time
+
+"""
+import json
+import os
+import subprocess
+import sys
+import unittest
+from collections import Counter
+from pathlib import Path
+
+BASELINE_FILE = Path(__file__).with_name("import_time_baseline.json")
+
+# Imports modules in local mode, then measures create_app, and prints the times in JSON
+WORKER = """
+import json, sys, time
+inicio = time.perf_counter()
+from plataforma_web.app import create_app
+importado = time.perf_counter()
+create_app()
+creado = time.perf_counter()
+print(json.dumps({"import_ms": (importado - inicio) * 1000, "create_app_ms": (creado - importado) * 1000, "modules": sorted(sys.modules)}))
+"""
+
+
+def measure_start() -> dict:
+    """Start a new interpreter in local mode and return its times and the breakdown of the imports"""
+    env = {**os.environ, "DB_PORT": "5432", "ORIGINS": "*", "SALT": "pruebas", "PROJECT_ID": ""}
+    resultado = subprocess.run([sys.executable, "-X", "importtime", "-c", WORKER], capture_output=True, check=True, cwd=Path(__file__).parent.parent, env=env, text=True)
+    medicion = json.loads(resultado.stdout.strip().splitlines()[-1])
+    packages = Counter()
+    for renglon in resultado.stderr.splitlines():
+        if not renglon.startswith("import time:") or "self [us]" in renglon:
+            continue
+        propio, _, nombre = renglon.removeprefix("import time:").split("|")
+        packages[nombre.strip().split(".")[0]] += int(propio)
+    medicion["packages_ms"] = {nombre: microsegundos / 1000 for nombre, microsegundos in packages.most_common()}
+    return medicion
+
+
+class TestImportTime(unittest.TestCase):
+    """Tests for the start time of a worker"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Measure the start once for all the tests"""
+        cls.medicion = measure_start()
+        with open(BASELINE_FILE, encoding="utf-8") as archivo:
+            cls.baseline = json.load(archivo)
+
+    def test_no_cloud_sdk_in_local_mode(self):
+        """Test that the Google Cloud and cryptography libraries are not imported without PROJECT_ID"""
+        for prefijo in self.baseline["lazy_modules"]:
+            cargados = [modulo for modulo in self.medicion["modules"] if modulo == prefijo or modulo.startswith(f"{prefijo}.")]
+            self.assertEqual(cargados, [], f"{prefijo} se importa al iniciar")
+
+    @unittest.skipUnless(os.getenv("BENCHMARK"), "Requires BENCHMARK=1")
+    def test_budget(self):
+        """Test that importing the app and create_app are under the baseline with the threshold"""
+        threshold = float(os.getenv("IMPORT_TIME_THRESHOLD", self.baseline["threshold"]))
+        for tiempo in ("import_ms", "create_app_ms"):
+            limite = self.baseline[tiempo] * threshold
+            self.assertLess(self.medicion[tiempo], limite, f"{tiempo} de {self.medicion[tiempo]:.0f} ms supera {limite:.0f} ms")
+
+
+if __name__ == "__main__":
+    resultados = measure_start()
+    print(f"import plataforma_web.app: {resultados['import_ms']:.0f} ms, create_app: {resultados['create_app_ms']:.0f} ms")
+    for package, milisegundos in list(resultados["packages_ms"].items())[:20]:
+        print(f"{milisegundos:10.1f} ms  {package}")
@@ -0,0 +1,111 @@
+"""
+Unit tests for the Prometheus metrics
+
+The aggregation between workers is tested with two processes writing in the same PROMETHEUS_MULTIPROC_DIR
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import fakeredis
+from prometheus_client import REGISTRY, CollectorRegistry, multiprocess
+
+from tests.local_database import LocalDatabase
+
+# pylint: disable=wrong-import-position,wrong-import-order
+from lib.cache import RedisCache, TTLCache, TwoLevelCache  # isort: skip
+from plataforma_web.core.permisos.models import Permiso  # isort: skip
+from plataforma_web.v3.usuarios.authentications import get_current_active_user  # isort: skip
+
+WORKER = """
+from lib.fastapi_metrics import record_auth_failure, requests_in_progress
+record_auth_failure("No se pudo descifrar el ID")
+requests_in_progress.inc()
+"""
+
+
+def sample(nombre: str, **labels) -> float:
+    """Value of a sample of the registry of this process, zero if it does not exist yet"""
+    return REGISTRY.get_sample_value(nombre, labels) or 0.0
+
+
+class TestMetrics(unittest.TestCase):
+    """Tests for /metrics and MetricsMiddleware"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create and seed the local database"""
+        cls.database = LocalDatabase()
+        cls.database.seed(cantidad=20)
+        cls.client = cls.database.client()
+
+    def test_request_duration(self):
+        """Test that the latency is observed by router, method and status"""
+        antes = sample("http_request_duration_seconds_count", router="inv_equipos", method="GET", status="200")
+        self.client.get("/v3/inv_equipos")
+        self.assertEqual(sample("http_request_duration_seconds_count", router="inv_equipos", method="GET", status="200"), antes + 1)
+        self.assertEqual(sample("http_requests_in_progress"), 0)
+
+    def test_metrics_route(self):
+        """Test that /metrics has the text format of Prometheus"""
+        self.client.get("/v3/distritos")
+        response = self.client.get("/metrics")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("text/plain"))
+        self.assertIn('http_request_duration_seconds_bucket{le="0.005",method="GET",router="distritos",status="200"}', response.text)
+        self.assertIn("# TYPE db_pool_checked_out gauge", response.text)
+
+    def test_routes_require_permission(self):
+        """Test that /metrics and /pool require ADMINISTRAR in bitacoras and an api_key"""
+        for ruta in ("/metrics", "/pool"):
+            with self.subTest(ruta=ruta):
+                self.assertEqual(self.client.get(ruta).status_code, 200)
+                self.assertEqual(self.database.client(nivel=Permiso.VER).get(ruta).status_code, 403)
+                client = self.database.client()
+                del client.app.dependency_overrides[get_current_active_user]
+                self.assertEqual(client.get(ruta).status_code, 403)
+
+    def test_auth_failures(self):
+        """Test that the failed authentications are counted by reason"""
+        client = self.database.client()
+        del client.app.dependency_overrides[get_current_active_user]
+        motivo = "No paso la validacion por expresion regular"
+        antes = sample("auth_failures_total", reason=motivo)
+        response = client.get("/v3/distritos", headers={"X-Api-Key": "no-es-una-api-key"})
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(sample("auth_failures_total", reason=motivo), antes + 1)
+
+    def test_cache_requests(self):
+        """Test that the hits and misses are counted once per get"""
+        cache = TTLCache(maxsize=10, ttl=60, nombre="prueba_local")
+        cache.get("a")
+        cache.set("a", 1)
+        cache.get("a")
+        self.assertEqual(sample("cache_requests_total", cache="prueba_local", result="miss"), 1)
+        self.assertEqual(sample("cache_requests_total", cache="prueba_local", result="hit"), 1)
+        compartido = RedisCache(fakeredis.FakeRedis(server=fakeredis.FakeServer()), "prueba_l1l2", ttl=60)
+        cache = TwoLevelCache(TTLCache(maxsize=10, ttl=5), compartido)
+        cache.get("a")
+        compartido.set("a", 1)
+        cache.get("a")
+        cache.get("a")
+        self.assertEqual(sample("cache_requests_total", cache="prueba_l1l2", result="miss"), 1)
+        self.assertEqual(sample("cache_requests_total", cache="prueba_l1l2", result="hit"), 2)
+
+    def test_multiprocess(self):
+        """Test that the values of two workers are added up"""
+        with tempfile.TemporaryDirectory() as directorio:
+            env = {**os.environ, "DB_PORT": "5432", "ORIGINS": "*", "SALT": "pruebas", "PROJECT_ID": "", "PROMETHEUS_MULTIPROC_DIR": directorio}
+            for _ in range(2):
+                subprocess.run([sys.executable, "-c", WORKER], check=True, cwd=Path(__file__).parent.parent, env=env)
+            registry = CollectorRegistry()
+            multiprocess.MultiProcessCollector(registry, path=directorio)
+            self.assertEqual(registry.get_sample_value("auth_failures_total", {"reason": "No se pudo descifrar el ID"}), 2)
+            self.assertEqual(registry.get_sample_value("http_requests_in_progress"), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
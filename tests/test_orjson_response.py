@@ -0,0 +1,62 @@
+"""
+Unit tests for the orjson response
+
+The listings must keep the same JSON that FastAPI gives from the response_model.
+"""
+import unittest
+
+from fastapi.routing import APIRoute
+
+from tests.local_database import LocalDatabase
+
+# pylint: disable=wrong-import-position,wrong-import-order
+from lib.fastapi_pagination_custom_page import CustomPage  # isort: skip
+from plataforma_web.v3.sentencias.crud import get_sentencias  # isort: skip
+from plataforma_web.v3.sentencias.schemas import SentenciaOut  # isort: skip
+
+LLAVES = ["success", "message", "total", "items", "limit", "offset"]
+
+
+class TestORJSONResponse(unittest.TestCase):
+    """Tests for the orjson response"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create and seed the local database"""
+        cls.database = LocalDatabase()
+        cls.database.seed(cantidad=20)
+        cls.client = cls.database.client()
+
+    def test_same_json_as_response_model(self):
+        """Test that the page is the same as the one serialized from the response_model"""
+        response = self.client.get("/v3/sentencias", params={"limit": 3, "offset": 2})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["content-type"], "application/json")
+        with self.database.session_local() as db:
+            consulta = get_sentencias(db=db)
+            filas = consulta.offset(2).limit(3).all()
+            esperado = CustomPage[SentenciaOut](success=True, message="Success", total=consulta.count(), items=filas, limit=3, offset=2).model_dump(mode="json")
+        self.assertEqual(response.json(), esperado)
+        self.assertEqual(list(response.json()), LLAVES)
+
+    def test_every_listing_keeps_the_keys(self):
+        """Test that every listing has the keys of the README"""
+        rutas = [route.path for route in self.client.app.routes if isinstance(route, APIRoute) and route.response_model is not None and issubclass(route.response_model, CustomPage)]
+        for ruta in rutas:
+            with self.subTest(ruta=ruta):
+                data = self.client.get(ruta).json()
+                if data["success"] and data["items"]:
+                    self.assertEqual(list(data), LLAVES)
+
+    def test_empty_and_error_pages(self):
+        """Test the pages without items and with an error"""
+        data = self.client.get("/v3/sentencias", params={"offset": 100}).json()
+        self.assertTrue(data["success"])
+        self.assertEqual(data["items"], [])
+        data = self.client.get("/v3/sentencias", params={"autoridad_clave": "NO EXISTE"}).json()
+        self.assertFalse(data["success"])
+        self.assertEqual(data["items"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+"""
+Unit tests for the response cache
+
+The read-only catalogs keep their responses by path, query string and permission level,
+in the shared backend played by fakeredis.
+"""
+import unittest
+from unittest import mock
+
+import fakeredis
+
+from tests.local_database import LocalDatabase
+
+# pylint: disable=wrong-import-position,wrong-import-order
+from lib.cache import RedisCache, get_cache  # isort: skip
+from lib.fastapi_response_cache import response_caches  # isort: skip
+from plataforma_web.core.distritos.models import Distrito  # isort: skip
+from plataforma_web.core.permisos.models import Permiso  # isort: skip
+from plataforma_web.v3.catalogos import catalogo_distritos  # isort: skip
+
+
+class TestResponseCache(unittest.TestCase):
+    """Tests for the response cache"""
+
+    def setUp(self):
+        """Create and seed a local database for every test"""
+        self.database = LocalDatabase()
+        self.database.seed(cantidad=10)
+        self.client = self.database.client()
+        self.server = fakeredis.FakeServer()
+        for nombre, response_cache in response_caches.items():
+            for atributo, prefijo in (("cache", "response"), ("invalidated", "response_invalidated")):
+                patcher = mock.patch.object(response_cache, atributo, RedisCache(fakeredis.FakeRedis(server=self.server), f"{prefijo}:{nombre}", ttl=60))
+                patcher.start()
+                self.addCleanup(patcher.stop)
+
+    def get_queries(self, ruta: str, parametros: dict = None, client=None) -> tuple:
+        """Request the route and return the response and the number of queries"""
+        self.database.queries = 0
+        response = (client or self.client).get(ruta, params=parametros)
+        return response, self.database.queries
+
+    def test_hit(self):
+        """Test that the second request does not query the database"""
+        for ruta in ("/v3/distritos", "/v3/epocas", "/v3/epocas/2", "/v3/materias_tipos_juicios"):
+            with self.subTest(ruta=ruta):
+                primera, consultas = self.get_queries(ruta)
+                self.assertGreater(consultas, 0)
+                segunda, consultas = self.get_queries(ruta)
+                self.assertEqual(consultas, 0)
+                self.assertEqual(segunda.content, primera.content)
+                self.assertEqual(segunda.headers["etag"], primera.headers["etag"])
+
+    def test_query_string_and_level(self):
+        """Test that other query strings and other permission levels are kept apart"""
+        self.get_queries("/v3/distritos")
+        _, consultas = self.get_queries("/v3/distritos", {"limit": 5})
+        self.assertGreater(consultas, 0)
+        _, consultas = self.get_queries("/v3/distritos", client=self.database.client(nivel=Permiso.VER))
+        self.assertGreater(consultas, 0)
+        response, _ = self.get_queries("/v3/distritos", client=self.database.client(nivel=0))
+        self.assertEqual(response.status_code, 403)
+
+    def test_not_modified(self):
+        """Test that a kept response answers If-None-Match with 304"""
+        response, _ = self.get_queries("/v3/roles")
+        response = self.client.get("/v3/roles", headers={"If-None-Match": response.headers["etag"]})
+        self.assertEqual(response.status_code, 304)
+
+    def test_commit_invalidates(self):
+        """Test that a commit on the table of the router removes its responses"""
+        self.get_queries("/v3/distritos")
+        with self.database.session_local() as db:
+            db.get(Distrito, 1).nombre = "NUEVO NOMBRE"
+            db.commit()
+        response, consultas = self.get_queries("/v3/distritos")
+        self.assertGreater(consultas, 0)
+        self.assertEqual(response.json()["items"][0]["nombre"], "NUEVO NOMBRE")
+
+    def test_invalidate_catalogs(self):
+        """Test that the catalogs of the tables load again and no response is kept right after an invalidation"""
+        self.get_queries("/v3/siga_salas")
+        catalogo_distritos.datos = ({}, {}, float("inf"))
+        self.client.delete("/v3/cache/distritos")
+        self.assertEqual(catalogo_distritos.datos[2], 0.0)
+        self.get_queries("/v3/distritos")
+        _, consultas = self.get_queries("/v3/distritos")
+        self.assertGreater(consultas, 0)
+        _, consultas = self.get_queries("/v3/siga_salas")
+        self.assertEqual(consultas, 0)
+
+    def test_delete_route(self):
+        """Test the route that removes the kept responses"""
+        self.get_queries("/v3/distritos")
+        self.get_queries("/v3/epocas")
+        response = self.database.client(nivel=Permiso.VER).delete("/v3/cache/distritos")
+        self.assertEqual(response.status_code, 403)
+        response = self.client.delete("/v3/cache/distritos")
+        self.assertEqual(response.json(), {"success": True, "message": "Se borraron 1 respuestas guardadas de distritos"})
+        _, consultas = self.get_queries("/v3/epocas")
+        self.assertEqual(consultas, 0)
+        self.assertFalse(self.client.delete("/v3/cache/no_existe").json()["success"])
+        self.assertTrue(self.client.delete("/v3/cache").json()["success"])
+        _, consultas = self.get_queries("/v3/epocas")
+        self.assertGreater(consultas, 0)
+
+    def test_local_backend(self):
+        """Test that with CACHE_BACKEND local every worker keeps the responses for up to CACHE_L1_TTL seconds"""
+        settings = mock.Mock(cache_backend="local", cache_l1_ttl=5)
+        with mock.patch("lib.cache.get_settings", return_value=settings):
+            cache = get_cache("response:distritos", maxsize=256, ttl=3600, compartido=True)
+        self.assertEqual(cache.ttl, 5)
+        with mock.patch.object(response_caches["distritos"], "cache", cache):
+            self.get_queries("/v3/distritos")
+            _, consultas = self.get_queries("/v3/distritos")
+        self.assertEqual(consultas, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
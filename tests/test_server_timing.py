@@ -0,0 +1,70 @@
+"""
+Unit tests for the Server-Timing header and the log line of each request
+"""
+import json
+import re
+import unittest
+
+from tests.local_database import LocalDatabase
+
+# pylint: disable=wrong-import-position,wrong-import-order
+from lib.fastapi_server_timing import RequestTiming, ServerTimingMiddleware, router_name  # isort: skip
+from plataforma_web.v3.inv_equipos.paths import listado_inv_equipos  # isort: skip
+
+SERVER_TIMING_REGEXP = re.compile(r'db;dur=[0-9.]+;desc="(\d+) queries", pool;dur=[0-9.]+, serialize;dur=[0-9.]+, total;dur=[0-9.]+')
+
+
+class TestServerTiming(unittest.TestCase):
+    """Tests for ServerTimingMiddleware"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create and seed the local database"""
+        cls.database = LocalDatabase()
+        cls.database.seed(cantidad=20)
+        cls.client = cls.database.client()
+
+    def test_header(self):
+        """Test that the header has the queries of the request"""
+        antes = self.database.queries
+        response = self.client.get("/v3/inv_equipos")
+        self.assertEqual(response.status_code, 200)
+        coincidencia = SERVER_TIMING_REGEXP.fullmatch(response.headers["Server-Timing"])
+        self.assertIsNotNone(coincidencia)
+        self.assertEqual(int(coincidencia.group(1)), self.database.queries - antes)
+        self.assertGreater(int(coincidencia.group(1)), 0)
+
+    def test_outermost(self):
+        """Test that ServerTimingMiddleware wraps the other middlewares"""
+        self.assertIs(self.client.app.user_middleware[0].cls, ServerTimingMiddleware)
+
+    def test_header_without_database(self):
+        """Test that the routes without the database have the header with zero queries"""
+        response = self.client.get("/")
+        self.assertTrue(response.headers["Server-Timing"].startswith('db;dur=0.0;desc="0 queries"'))
+
+    def test_log_line(self):
+        """Test that the log line is JSON tagged with the router"""
+        with self.assertLogs("lib.fastapi_server_timing", level="INFO") as registros:
+            self.client.get("/v3/inv_equipos", params={"limit": 5})
+        linea = json.loads(registros.records[-1].getMessage())
+        self.assertEqual(linea["router"], "inv_equipos")
+        self.assertEqual(linea["method"], "GET")
+        self.assertEqual(linea["path"], "/v3/inv_equipos")
+        self.assertEqual(linea["status"], 200)
+        self.assertGreaterEqual(linea["queries"], linea["distinct"])
+        self.assertGreaterEqual(linea["total_ms"], linea["db_ms"])
+
+    def test_router_name(self):
+        """Test the name of the router from the endpoint"""
+        self.assertEqual(router_name({"endpoint": listado_inv_equipos}), "inv_equipos")
+        self.assertIsNone(router_name({}))
+
+    def test_request_timing_header(self):
+        """Test the format of the header"""
+        timing = RequestTiming(queries=3, db=0.0124, pool=0.0003, serialize=0.0032)
+        self.assertEqual(timing.header(0.0201), 'db;dur=12.4;desc="3 queries", pool;dur=0.3, serialize;dur=3.2, total;dur=20.1')
+
+
+if __name__ == "__main__":
+    unittest.main()
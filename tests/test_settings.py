@@ -0,0 +1,114 @@
+"""
+Unit tests for the settings
+
+The secrets are loaded from a fake of the Secret Manager client.
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+from cryptography.fernet import Fernet
+
+from tests.local_database import LocalDatabase  # pylint: disable=unused-import
+
+# pylint: disable=wrong-import-position,wrong-import-order
+from config import settings as settings_module  # isort: skip
+from config.settings import SECRETS, GoogleSecretProvider, load_secrets  # isort: skip
+
+
+class FakeSecretManagerClient:
+    """Fake of SecretManagerServiceClient that answers with the name of the secret after a delay"""
+
+    def __init__(self, demora: float = 0.05):
+        self.demora = demora
+        self.consultas = []
+        self._lock = threading.Lock()
+
+    def secret_version_path(self, project, secret, version):
+        return f"projects/{project}/secrets/{secret}/versions/{version}"
+
+    def access_secret_version(self, name):
+        time.sleep(self.demora)
+        with self._lock:
+            self.consultas.append(name)
+        secret = name.split("/")[3]
+        return SimpleNamespace(payload=SimpleNamespace(data=f"valor de {secret}".encode("UTF-8")))
+
+
+# Imports the application in cloud mode with a secret provider that fails if it is used
+IMPORT_APP = """
+from config import settings
+
+def get_secret_provider():
+    raise AssertionError("Se consultaron los secretos al importar")
+
+settings.get_secret_provider = get_secret_provider
+import plataforma_web.app
+print(settings.get_settings.cache_info().currsize)
+"""
+
+
+class TestSecrets(unittest.TestCase):
+    """Tests for the secrets"""
+
+    def setUp(self):
+        """Fake client and provider"""
+        self.client = FakeSecretManagerClient()
+        self.provider = GoogleSecretProvider("proyecto", "prefijo", client=self.client)
+        self.directorio = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(self.directorio.cleanup)
+
+    def test_get_many_is_concurrent(self):
+        """Test that all the secrets are fetched at the same time with one client"""
+        inicio = time.monotonic()
+        secrets = self.provider.get_many(list(SECRETS))
+        self.assertLess(time.monotonic() - inicio, self.client.demora * len(SECRETS) / 2)
+        self.assertEqual(len(self.client.consultas), len(SECRETS))
+        self.assertEqual(secrets["salt"], "valor de prefijo_salt")
+
+    def test_encrypted_cache(self):
+        """Test that the secrets are kept encrypted on disk and read back on the next start"""
+        archivo = os.path.join(self.directorio.name, "secrets.bin")
+        llave = Fernet.generate_key().decode()
+        with mock.patch.multiple(settings_module, SECRETS_CACHE_FILE=archivo, SECRETS_CACHE_KEY=llave, SECRETS_CACHE_TTL=60):
+            primera = load_secrets(self.provider, ["db_pass", "salt"])
+            with open(archivo, "rb") as contenido:
+                self.assertNotIn(b"valor de", contenido.read())
+            segunda = load_secrets(self.provider, ["db_pass", "salt"])
+        self.assertEqual(primera, segunda)
+        self.assertEqual(len(self.client.consultas), 2)
+
+    def test_encrypted_cache_with_other_key(self):
+        """Test that a cache file that can not be decrypted is fetched again"""
+        archivo = os.path.join(self.directorio.name, "secrets.bin")
+        with mock.patch.multiple(settings_module, SECRETS_CACHE_FILE=archivo, SECRETS_CACHE_KEY=Fernet.generate_key().decode()):
+            load_secrets(self.provider, ["salt"])
+        with mock.patch.multiple(settings_module, SECRETS_CACHE_FILE=archivo, SECRETS_CACHE_KEY=Fernet.generate_key().decode()):
+            self.assertEqual(load_secrets(self.provider, ["salt"]), {"salt": "valor de prefijo_salt"})
+        self.assertEqual(len(self.client.consultas), 2)
+
+    def test_get_settings_only_missing(self):
+        """Test that get_settings only fetches the secrets that are not in the environment"""
+        with mock.patch.object(settings_module, "PROJECT_ID", "proyecto"), mock.patch.object(settings_module, "get_secret_provider", return_value=self.provider):
+            settings = settings_module.get_settings.__wrapped__()
+        self.assertEqual(settings.db_host, os.environ.get("DB_HOST", "valor de prefijo_db_host"))
+        self.assertEqual(settings.salt, os.environ["SALT"])
+        self.assertNotIn("projects/proyecto/secrets/prefijo_salt/versions/latest", self.client.consultas)
+
+    def test_import_app_without_secrets(self):
+        """Test that importing the application does not fetch the secrets, they wait for create_app"""
+        env = {**os.environ, "PROJECT_ID": "proyecto"}
+        resultado = subprocess.run([sys.executable, "-c", IMPORT_APP], capture_output=True, check=False, cwd=Path(__file__).parent.parent, env=env, text=True)
+        self.assertEqual(resultado.returncode, 0, resultado.stderr)
+        self.assertEqual(resultado.stdout.strip(), "0")
+
+
+if __name__ == "__main__":
+    unittest.main()
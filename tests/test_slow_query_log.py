@@ -0,0 +1,91 @@
+"""
+Unit tests for the slow query log
+
+The local database records every query with a threshold of zero, the plans come from EXPLAIN QUERY PLAN of SQLite
+"""
+import json
+import os
+import tempfile
+import unittest
+
+from tests.local_database import LocalDatabase
+
+# pylint: disable=wrong-import-position,wrong-import-order
+from lib import slow_query_log  # isort: skip
+from lib.slow_query_log import configure_slow_query_log, leer_registros, listen_slow_queries, redactar_parametros, redactar_plan, registros  # isort: skip
+from plataforma_web.core.permisos.models import Permiso  # isort: skip
+
+
+class TestSlowQueryLog(unittest.TestCase):
+    """Tests for the slow query log and GET /v3/consultas_lentas"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create and seed the local database, every query is slow"""
+        cls.database = LocalDatabase()
+        cls.database.seed(cantidad=20)
+        listen_slow_queries(cls.database.engine, 0)
+        listen_slow_queries(cls.database.async_engine.sync_engine, 0)
+        cls.client = cls.database.client()
+
+    def setUp(self):
+        """Start without records"""
+        registros.clear()
+
+    def test_records(self):
+        """Test that the queries are recorded with the route, the redacted parameters and the plan"""
+        self.client.get("/v3/bitacoras", params={"usuario_email": "juan.perez"})
+        self.client.get("/v3/inv_equipos/3")
+        rutas = {registro["ruta"] for registro in registros}
+        self.assertIn("GET /v3/bitacoras", rutas)
+        self.assertIn("GET /v3/inv_equipos/{inv_equipo_id}", rutas)
+        self.assertNotIn("juan", json.dumps(list(registros)))
+        consultas = [registro for registro in registros if registro["sentencia"].lstrip().startswith("SELECT")]
+        self.assertTrue(consultas)
+        for registro in consultas:
+            self.assertRegex(registro["plan"], r"SCAN|SEARCH")
+
+    def test_top(self):
+        """Test that the admin route adds up the times by statement"""
+        for _ in range(3):
+            self.client.get("/v3/inv_equipos", params={"limit": 5})
+        response = self.client.get("/v3/consultas_lentas", params={"limit": 3})
+        self.assertEqual(response.status_code, 200)
+        items = response.json()["items"]
+        self.assertLessEqual(len(items), 3)
+        self.assertEqual([item["total_ms"] for item in items], sorted((item["total_ms"] for item in items), reverse=True))
+        self.assertTrue(any(item["cantidad"] >= 3 and "GET /v3/inv_equipos" in item["rutas"] for item in items))
+
+    def test_forbidden(self):
+        """Test that the admin route requires ADMINISTRAR"""
+        response = self.database.client(nivel=Permiso.VER).get("/v3/consultas_lentas")
+        self.assertEqual(response.status_code, 403)
+
+    def test_log_file(self):
+        """Test that with a file the records are read from it"""
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "slow_queries.log")
+            configure_slow_query_log(ruta)
+            try:
+                self.client.get("/v3/inv_equipos/cursor")
+                registros.clear()
+                self.assertTrue(leer_registros())
+                self.assertTrue(all(registro["ruta"] == "GET /v3/inv_equipos/cursor" for registro in leer_registros()))
+            finally:
+                for handler in slow_query_log.bitacora.handlers[:]:
+                    slow_query_log.bitacora.removeHandler(handler)
+                    handler.close()
+                slow_query_log.archivo_registros["ruta"] = ""
+
+    def test_redact(self):
+        """Test that the texts are redacted and the other values are kept"""
+        self.assertEqual(
+            redactar_parametros({"email_1": "%juan@pjecz.gob.mx%", "estatus_1": "A", "id_1": 3, "lista": ("SLT", 4)}),
+            {"email_1": "<str:19>", "estatus_1": "A", "id_1": 3, "lista": ["<str:3>", 4]},
+        )
+        self.assertEqual(redactar_parametros(("GONZALEZ", None, 1.5)), ["<str:8>", None, 1.5])
+        self.assertEqual(redactar_plan("Filter: ((email)::text ~~* '%juan''s%'::text)"), "Filter: ((email)::text ~~* '?'::text)")
+
+
+if __name__ == "__main__":
+    unittest.main()
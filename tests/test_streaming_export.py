@@ -0,0 +1,62 @@
+"""
+Unit tests for the streaming export of sentencias, edictos, glosas and listas de acuerdos
+"""
+import csv
+import io
+import json
+import unittest
+
+from tests.local_database import LocalDatabase
+
+RECURSOS = ["edictos", "glosas", "listas_de_acuerdos", "sentencias"]
+
+
+class TestStreamingExport(unittest.TestCase):
+    """Tests for the export routes"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create and seed the local database"""
+        cls.database = LocalDatabase()
+        cls.database.seed(cantidad=40)
+        cls.client = cls.database.client()
+
+    def test_ndjson(self):
+        """Test that every record is exported as one JSON object per line"""
+        for recurso in RECURSOS:
+            with self.subTest(recurso=recurso):
+                response = self.client.get(f"/v3/{recurso}/export")
+                self.assertEqual(response.status_code, 200)
+                self.assertTrue(response.headers["content-type"].startswith("application/x-ndjson"))
+                registros = [json.loads(linea) for linea in response.text.splitlines()]
+                self.assertEqual([registro["id"] for registro in registros], list(range(1, 41)))
+
+    def test_csv(self):
+        """Test that every record is exported as a CSV row with a header"""
+        for recurso in RECURSOS:
+            with self.subTest(recurso=recurso):
+                response = self.client.get(f"/v3/{recurso}/export", params={"formato": "csv"})
+                self.assertEqual(response.status_code, 200)
+                self.assertTrue(response.headers["content-type"].startswith("text/csv"))
+                renglones = list(csv.DictReader(io.StringIO(response.text)))
+                self.assertEqual(len(renglones), 40)
+                self.assertIn("autoridad_clave", renglones[0])
+
+    def test_filters(self):
+        """Test that the export accepts the filters of the listing"""
+        response = self.client.get("/v3/sentencias/export", params={"autoridad_id": 3})
+        listado = self.client.get("/v3/sentencias", params={"autoridad_id": 3, "limit": 1})
+        registros = [json.loads(linea) for linea in response.text.splitlines()]
+        self.assertEqual(len(registros), listado.json()["total"])
+        for registro in registros:
+            self.assertEqual(registro["autoridad_id"], 3)
+
+    def test_invalid_filter(self):
+        """Test that a filter that does not exist returns success false"""
+        response = self.client.get("/v3/edictos/export", params={"autoridad_id": 999})
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.json()["success"])
+
+
+if __name__ == "__main__":
+    unittest.main()
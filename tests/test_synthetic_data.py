@@ -0,0 +1,92 @@
+"""
+Unit tests for the synthetic data generator
+"""
+import os
+import re
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+
+from sqlalchemy import create_engine, func, select, text
+
+from tests.local_database import LocalDatabase
+from tests.synthetic_data import PRODUCCION, generar, main, volumenes
+
+# pylint: disable=wrong-import-position,wrong-import-order
+from lib.database import Base  # isort: skip
+from lib.safe_string import CURP_REGEXP  # isort: skip
+
+
+class TestSyntheticData(unittest.TestCase):
+    """Tests for the generator with the volumes of production times 0.001"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Fill the local database"""
+        cls.database = LocalDatabase()
+        cls.cantidades = volumenes(0.001)
+        generar(cls.database.engine, cls.cantidades)
+
+    def test_volumes(self):
+        """Test that every table has its volume, the catalogs are not scaled"""
+        self.assertEqual(self.cantidades["bitacoras"], 5000)
+        self.assertEqual(self.cantidades["distritos"], PRODUCCION["distritos"])
+        with self.database.engine.connect() as conn:
+            for table in Base.metadata.sorted_tables:
+                with self.subTest(tabla=table.name):
+                    self.assertEqual(conn.execute(select(func.count()).select_from(table)).scalar(), self.cantidades[table.name])
+
+    def test_foreign_keys(self):
+        """Test that every foreign key points to an existing row"""
+        with self.database.engine.connect() as conn:
+            for table in Base.metadata.sorted_tables:
+                for column in table.columns:
+                    for foreign_key in column.foreign_keys:
+                        with self.subTest(columna=f"{table.name}.{column.name}"):
+                            padre = foreign_key.column
+                            huerfanos = select(func.count()).select_from(table.outerjoin(padre.table, column == padre)).where(column.is_not(None), padre.is_(None))
+                            self.assertEqual(conn.execute(huerfanos).scalar(), 0)
+
+    def test_distributions(self):
+        """Test the soft deleted rows, the skew of the parents and the dates that grow with the id"""
+        with self.database.engine.connect() as conn:
+            bajas = conn.execute(text("SELECT count(*) FROM bitacoras WHERE estatus = 'B'")).scalar()
+            self.assertTrue(0.02 * 5000 < bajas < 0.08 * 5000)
+            cuarto = self.cantidades["autoridades"] // 4
+            primeros = conn.execute(text("SELECT count(*) FROM sentencias WHERE autoridad_id <= :cuarto"), {"cuarto": cuarto}).scalar()
+            self.assertGreater(primeros, self.cantidades["sentencias"] * 0.4)
+            fechas = conn.execute(text("SELECT creado FROM sentencias ORDER BY id")).scalars().all()
+            self.assertEqual(fechas, sorted(fechas))
+            for curp in conn.execute(text("SELECT curp FROM funcionarios")).scalars():
+                self.assertRegex(curp, CURP_REGEXP)
+
+    def test_api(self):
+        """Test that the listings skip the soft deleted rows"""
+        with self.database.engine.connect() as conn:
+            activos = conn.execute(text("SELECT count(*) FROM sentencias WHERE estatus = 'A'")).scalar()
+        response = self.database.client().get("/v3/sentencias")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["total"], activos)
+
+
+class TestSyntheticDataMain(unittest.TestCase):
+    """Tests for the command line"""
+
+    def test_main(self):
+        """Test that --recrear can run twice on the same SQLite file"""
+        with tempfile.TemporaryDirectory() as directorio:
+            url = f"sqlite:///{os.path.join(directorio, 'sintetica.sqlite')}"
+            for _ in range(2):
+                with redirect_stdout(StringIO()) as salida:
+                    main(["--url", url, "--recrear", "--escala", "0.0001", "--volumen", "usuarios=7"])
+            self.assertRegex(salida.getvalue(), re.compile(r"^usuarios: 7 registros", re.MULTILINE))
+            engine = create_engine(url)
+            with engine.connect() as conn:
+                self.assertEqual(conn.execute(text("SELECT count(*) FROM usuarios")).scalar(), 7)
+                self.assertEqual(conn.execute(text("SELECT count(*) FROM bitacoras")).scalar(), 500)
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+"""
+Unit tests for the trigram search
+
+The local database has strict_word_similarity from lib/trigram_search.py
+"""
+import unittest
+
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import asyncpg
+
+from tests.local_database import LocalDatabase
+
+# pylint: disable=wrong-import-position,wrong-import-order
+from lib.trigram_search import strict_word_similarity  # isort: skip
+from plataforma_web.core.redam.models import Redam, redam_trigramas  # isort: skip
+
+
+class TestTrigramSearch(unittest.TestCase):
+    """Tests for the nombre and modo parameters"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create and seed the local database with some names"""
+        cls.database = LocalDatabase()
+        cls.database.seed(cantidad=20)
+        nombres = {3: "JUAN GONZALEZ PEREZ", 5: "MARIA GONSALEZ RUIZ", 9: "PEDRO GONZALES"}
+        with cls.database.engine.begin() as conn:
+            for tabla in ("redam", "repsvm_agresores", "peritos", "abogados"):
+                for registro_id, nombre in nombres.items():
+                    conn.execute(text(f"UPDATE {tabla} SET nombre = :nombre WHERE id = :id"), {"nombre": nombre, "id": registro_id})
+        cls.client = cls.database.client()
+
+    def test_contains(self):
+        """Test that the name is searched in the form of safe_string"""
+        for ruta in ("/v3/redam", "/v3/repsvm_agresores", "/v3/peritos", "/v3/abogados"):
+            with self.subTest(ruta=ruta):
+                response = self.client.get(ruta, params={"nombre": "  gonzález "})
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual([item["id"] for item in response.json()["items"]], [3])
+
+    def test_similar(self):
+        """Test that the similar mode finds the spelling variants ordered by similarity"""
+        for ruta in ("/v3/redam", "/v3/repsvm_agresores", "/v3/peritos", "/v3/abogados"):
+            with self.subTest(ruta=ruta):
+                response = self.client.get(ruta, params={"nombre": "Gonzalez", "modo": "similar"})
+                self.assertEqual([item["id"] for item in response.json()["items"]], [3, 9, 5])
+
+    def test_not_valid_mode(self):
+        """Test that an unknown mode is rejected"""
+        response = self.client.get("/v3/redam", params={"nombre": "GONZALEZ", "modo": "otro"})
+        self.assertEqual(response.status_code, 422)
+
+    def test_strict_word_similarity(self):
+        """Test the similarity of the words like pg_trgm"""
+        self.assertEqual(strict_word_similarity("GONZALEZ", "JUAN GONZALEZ PEREZ"), 1.0)
+        self.assertEqual(strict_word_similarity("GONZALEZ", "MARIA GONSALEZ RUIZ"), 0.5)
+        self.assertEqual(strict_word_similarity("GONZALEZ", None), 0.0)
+
+    def test_postgresql(self):
+        """Test that PostgreSQL uses the operators that the GIN index supports"""
+        database = self.database.session_local()
+        self.addCleanup(database.close)
+        consulta, rango = redam_trigramas.search(database.query(Redam), Redam.nombre, "GONZALEZ", "similar", "postgresql")
+        self.assertIn("<<% redam.nombre", str(consulta.statement.compile(dialect=asyncpg.dialect())))
+        self.assertIsNotNone(rango)
+        consulta, rango = redam_trigramas.search(database.query(Redam), Redam.nombre, "GONZALEZ", "contiene", "postgresql")
+        self.assertIn("redam.nombre LIKE", str(consulta.statement.compile(dialect=asyncpg.dialect())))
+        self.assertIsNone(rango)
+        self.assertIn("CREATE INDEX CONCURRENTLY IF NOT EXISTS redam_nombre_trgm_idx ON redam USING gin (nombre gin_trgm_ops)", redam_trigramas.postgresql_ddl(concurrently=True))
+
+
+if __name__ == "__main__":
+    unittest.main()